@@ -0,0 +1,152 @@
+"""
+Compares a stage, info and download cycle with and without shared Boto3
+clients.
+
+Each cycle makes the Amazon S3 and Systems Manager requests that Startifact
+makes in every region. "fresh" creates a new session and client for every
+operation as Startifact used to; "shared" gets them from a
+:class:`startifact.client_registry.ClientRegistry`.
+
+Requests are sent to a local stand-in that delays every new connection to stand
+in for the TCP and TLS handshakes with a distant region. No requests are sent to
+Amazon Web Services.
+
+Usage:
+
+    python benchmarks/client_registry.py
+"""
+
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from os import environ
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Any, Callable, List, Tuple
+
+from boto3.session import Session
+
+from startifact.client_registry import ClientRegistry
+
+Operation = Tuple[str, Callable[[Any], Any]]
+
+REGIONS = ["eu-west-1", "eu-west-2", "us-east-1"]
+
+CYCLE: List[Operation] = [
+    # Stage
+    ("ssm", lambda c: c.get_parameter(Name="/bucket")),
+    ("s3", lambda c: c.head_object(Bucket="bucket", Key="SugarWater@1.2.3")),
+    ("s3", lambda c: c.put_object(Bucket="bucket", Key="SugarWater@1.2.3")),
+    ("s3", lambda c: c.put_object(Bucket="bucket", Key="SugarWater@1.2.3/meta")),
+    ("ssm", lambda c: c.put_parameter(Name="/latest", Value="1.2.3")),
+    # Info
+    ("ssm", lambda c: c.get_parameter(Name="/latest")),
+    ("s3", lambda c: c.get_object(Bucket="bucket", Key="SugarWater@1.2.3/meta")),
+    # Download
+    ("ssm", lambda c: c.get_parameter(Name="/latest")),
+    ("s3", lambda c: c.head_object(Bucket="bucket", Key="SugarWater@1.2.3")),
+    ("s3", lambda c: c.get_object(Bucket="bucket", Key="SugarWater@1.2.3")),
+]
+
+
+class StandIn(BaseHTTPRequestHandler):
+    handshake = 0.05
+    latency = 0.005
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        sleep(self.handshake)
+
+    def do_GET(self) -> None:
+        self.respond(b"{}")
+
+    def do_HEAD(self) -> None:
+        self.respond(b"")
+
+    def do_POST(self) -> None:
+        self.read_body()
+        self.respond(
+            dumps({"Parameter": {"Name": "/p", "Value": "1.2.3"}}).encode(),
+            content_type="application/x-amz-json-1.1",
+        )
+
+    def do_PUT(self) -> None:
+        self.read_body()
+        self.respond(b"")
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def read_body(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def respond(
+        self,
+        body: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Type", content_type)
+        self.send_header("ETag", '"benchmark"')
+        self.end_headers()
+
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+def fresh(region: str, service: str) -> Any:
+    return Session(region_name=region).client(service)
+
+
+def measure(get_client: Callable[[str, str], Any], cycles: int) -> float:
+    start = perf_counter()
+
+    for _ in range(cycles):
+        for region in REGIONS:
+            for service, operation in CYCLE:
+                operation(get_client(region, service))
+
+    return (perf_counter() - start) / cycles
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--cycles", default=5, type=int)
+    parser.add_argument("--handshake", default=50, help="ms", type=int)
+    args = parser.parse_args()
+
+    StandIn.handshake = args.handshake / 1000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    # Fresh clients drop their connections without closing them.
+    setattr(server, "handle_error", lambda *_: None)
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    environ["AWS_ACCESS_KEY_ID"] = "benchmark"
+    environ["AWS_ENDPOINT_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    environ["AWS_SECRET_ACCESS_KEY"] = "benchmark"
+
+    registry = ClientRegistry()
+
+    def shared(region: str, service: str) -> Any:
+        return registry.session(region).client(service)
+
+    # Warm up botocore's loaders so that neither mode pays for them.
+    measure(fresh, 1)
+
+    requests = len(REGIONS) * len(CYCLE)
+    print(f"{len(REGIONS)} regions, {requests} requests per cycle,", end=" ")
+    print(f"{args.handshake} ms per new connection\n")
+    print(f"{'clients':<10}{'per cycle (s)':>15}")
+
+    for name, get_client in [("fresh", fresh), ("shared", shared)]:
+        print(f"{name:<10}{measure(get_client, args.cycles):>15.3f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Measures how long Startifact takes to import, and which heavy dependencies each
+import pulls in.
+
+Every measurement runs in a new interpreter with ``-X importtime`` so that
+nothing is already imported. The median cumulative import time of each target
+is reported. Exits with a non-zero code if a target that should be light imports
+a heavy dependency, or if ``--budget`` is exceeded.
+
+Usage:
+
+    python benchmarks/import_time.py
+"""
+
+from argparse import ArgumentParser
+from re import match
+from statistics import median
+from subprocess import run
+from sys import executable
+from typing import Dict, List, Tuple
+
+HEAVY = ["asking", "boto3", "botocore"]
+
+TARGETS: List[Tuple[str, bool]] = [
+    # (module, may import heavy dependencies)
+    ("startifact", False),
+    ("startifact.cli", False),
+    ("startifact.tasks", False),
+    ("startifact.session", True),
+]
+
+
+def measure(module: str) -> Tuple[int, List[str]]:
+    """
+    Imports a module in a new interpreter.
+
+    :returns: Cumulative import time in microseconds, and the heavy
+        dependencies that were imported.
+    """
+
+    result = run(
+        [executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    cumulative: Dict[str, int] = {}
+
+    for line in result.stderr.splitlines():
+        if m := match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", line):
+            cumulative[m.group(2)] = int(m.group(1))
+
+    return cumulative[module], [h for h in HEAVY if h in cumulative]
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--budget", help="ms for light targets", type=float)
+    parser.add_argument("--runs", default=9, type=int)
+    args = parser.parse_args()
+
+    failed = False
+
+    print(f"{'module':<22}{'median (ms)':>12}  heavy dependencies")
+
+    for module, may_be_heavy in TARGETS:
+        times: List[int] = []
+        heavy: List[str] = []
+
+        for _ in range(args.runs):
+            elapsed, heavy = measure(module)
+            times.append(elapsed)
+
+        elapsed_ms = median(times) / 1000
+        print(f"{module:<22}{elapsed_ms:>12.1f}  {', '.join(heavy) or '-'}")
+
+        if may_be_heavy:
+            continue
+
+        if heavy or (args.budget and elapsed_ms > args.budget):
+            failed = True
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Measures ranged download throughput against a local Amazon S3 stand-in.
+
+The stand-in serves a single object over HTTP and throttles every connection to
+a fixed bandwidth after a fixed latency, like a congested path to a distant
+region. Throughput should therefore scale with concurrency until the machine
+runs out of bandwidth or cores. No requests are sent to Amazon Web Services.
+
+Usage:
+
+    python benchmarks/ranged_download.py
+"""
+
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import urandom
+from pathlib import Path
+from re import match
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Optional, Tuple
+
+from boto3.session import Session
+from botocore.config import Config
+
+from startifact.ranged_download import RangedDownload
+
+CHUNK_SIZE = 64 * 1024
+CONCURRENCIES = [1, 2, 4, 8, 16]
+MIB = 1024 * 1024
+
+
+class StandIn(BaseHTTPRequestHandler):
+    body = b""
+    bytes_per_second = 16 * MIB
+    latency = 0.02
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        start, end = self.get_range() or (0, len(self.body) - 1)
+        self.send_response(206 if self.headers.get("Range") else 200)
+        self.send_headers(end - start + 1)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.body)}")
+        self.end_headers()
+
+        sleep(self.latency)
+
+        for offset in range(start, end + 1, CHUNK_SIZE):
+            stop = min(offset + CHUNK_SIZE, end + 1)
+            chunk = self.body[offset:stop]
+            self.wfile.write(chunk)
+            sleep(len(chunk) / self.bytes_per_second)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_headers(len(self.body))
+        self.end_headers()
+
+    def get_range(self) -> Optional[Tuple[int, int]]:
+        if m := match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", "")):
+            return int(m.group(1)), int(m.group(2))
+        return None
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def send_headers(self, length: int) -> None:
+        self.send_header("Content-Length", str(length))
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("ETag", '"benchmark"')
+
+
+def measure(
+    endpoint: str,
+    concurrency: int,
+    part_size: int,
+    path: Path,
+) -> float:
+    session = Session(
+        aws_access_key_id="benchmark",
+        aws_secret_access_key="benchmark",
+        region_name="eu-west-1",
+    )
+
+    config = Config(
+        max_pool_connections=max(CONCURRENCIES),
+        s3={"addressing_style": "path"},
+    )
+
+    client = session.client("s3", config=config, endpoint_url=endpoint)
+
+    start = perf_counter()
+
+    RangedDownload(
+        bucket="benchmark",
+        client=client,
+        concurrency=concurrency,
+        key="artifact",
+        part_size=part_size,
+        path=path,
+        region="eu-west-1",
+    ).download()
+
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--part-size", default=4, help="MiB", type=int)
+    parser.add_argument("--size", default=128, help="MiB", type=int)
+    args = parser.parse_args()
+
+    StandIn.body = urandom(args.size * MIB)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+
+    per_connection = StandIn.bytes_per_second / MIB
+    print(f"{args.size} MiB object, {args.part_size} MiB ranges,", end=" ")
+    print(f"{per_connection:.0f} MiB/s per connection\n")
+    print(f"{'concurrency':<12}{'wall (s)':>10}{'MiB/s':>10}")
+
+    with TemporaryDirectory() as temp:
+        path = Path(temp) / "artifact"
+
+        for concurrency in CONCURRENCIES:
+            elapsed = measure(endpoint, concurrency, args.part_size * MIB, path)
+            assert path.read_bytes() == StandIn.body
+            print(f"{concurrency:<12}{elapsed:>10.3f}{args.size / elapsed:>10.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
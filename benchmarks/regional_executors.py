@@ -0,0 +1,126 @@
+"""
+Compares the wall time and peak memory of the regional executors.
+
+Each regional process builds the Boto3 S3 and SSM clients that a real regional
+stager builds, then sleeps to stand in for the Amazon Web Services round trips.
+No requests are sent to Amazon Web Services.
+
+Peak memory is the highest total resident set size of the benchmark process and
+all of its children, sampled from ``/proc``, so this benchmark runs only on
+Linux.
+
+Usage:
+
+    python benchmarks/regional_executors.py
+"""
+
+from argparse import ArgumentParser
+from multiprocessing import active_children
+from os import getpid
+from subprocess import run
+from sys import executable
+from threading import Event, Thread
+from time import perf_counter, sleep
+from typing import Dict, List, Type
+
+from boto3.session import Session
+
+from startifact.regional_executors import (
+    ProcessRegionalExecutor,
+    RegionalExecutor,
+    ThreadRegionalExecutor,
+)
+from startifact.regional_process import RegionalProcess
+
+EXECUTORS: Dict[str, Type[RegionalExecutor]] = {
+    "process": ProcessRegionalExecutor,
+    "thread": ThreadRegionalExecutor,
+}
+
+LATENCY = 0.2
+REGION_COUNTS = [3, 10, 25]
+
+
+class BenchmarkProcess(RegionalProcess):
+    def operate(self) -> None:
+        self._session.client("s3")
+        self._session.client("ssm")
+        sleep(LATENCY)
+
+
+def get_rss_kib(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except FileNotFoundError:
+        pass
+    return 0
+
+
+def measure_once(executor_name: str, regions: int) -> None:
+    peak_kib = 0
+    stop = Event()
+
+    def sample() -> None:
+        nonlocal peak_kib
+        while not stop.is_set():
+            pids = [getpid()] + [int(c.pid or 0) for c in active_children()]
+            peak_kib = max(peak_kib, sum(get_rss_kib(pid) for pid in pids))
+            sleep(0.005)
+
+    sampler = Thread(target=sample)
+    sampler.start()
+
+    start = perf_counter()
+
+    with EXECUTORS[executor_name](max_workers=regions) as executor:
+        for index in range(regions):
+            session = Session(region_name=f"eu-west-{index}")
+            executor.submit(BenchmarkProcess(read_only=True, session=session))
+
+        while executor.in_progress:
+            executor.wait()
+
+    elapsed = perf_counter() - start
+
+    stop.set()
+    sampler.join()
+
+    print(f"{executor_name},{regions},{elapsed:.3f},{peak_kib / 1024:.1f}")
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--executor", choices=list(EXECUTORS))
+    parser.add_argument("--regions", type=int)
+    args = parser.parse_args()
+
+    if args.executor:
+        measure_once(args.executor, args.regions)
+        return
+
+    # Measure each combination in a fresh interpreter so that peak memory
+    # isn't inherited from earlier runs.
+
+    print(f"{'executor':<10}{'regions':>8}{'wall (s)':>10}{'peak RSS (MiB)':>16}")
+
+    for regions in REGION_COUNTS:
+        for executor_name in EXECUTORS:
+            cmd: List[str] = [
+                executable,
+                __file__,
+                "--executor",
+                executor_name,
+                "--regions",
+                str(regions),
+            ]
+
+            output = run(cmd, capture_output=True, check=True, text=True)
+            name, count, elapsed, peak = output.stdout.strip().split(",")
+            print(f"{name:<10}{count:>8}{elapsed:>10}{peak:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,7 +44,7 @@ setup(
     install_requires=[
         "ansiscape~=1.0",
         "asking~=1.0",
-        "boto3~=1.20",
+        "boto3~=1.36",
         "cline~=1.2",
         "semver~=2.13",
     ],
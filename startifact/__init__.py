@@ -1,12 +1,15 @@
 import importlib.resources as pkg_resources
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from startifact.artifact import Artifact
-from startifact.artifact_downloader import ArtifactDownloader
-from startifact.bucket_names import BucketNames
-from startifact.configuration_loader import ConfigurationLoader
-from startifact.latest_version_loader import LatestVersionLoader
-from startifact.metadata_loader import MetadataLoader
-from startifact.session import Session
+if TYPE_CHECKING:
+    from startifact.artifact import Artifact
+    from startifact.artifact_downloader import ArtifactDownloader
+    from startifact.bucket_names import BucketNames
+    from startifact.configuration_loader import ConfigurationLoader
+    from startifact.latest_version_loader import LatestVersionLoader
+    from startifact.metadata_loader import MetadataLoader
+    from startifact.session import Session
 
 with pkg_resources.open_text(__package__, "VERSION") as t:
     __version__ = t.readline().strip()
@@ -14,6 +17,40 @@ with pkg_resources.open_text(__package__, "VERSION") as t:
     Startifact package version.
     """
 
+_modules: Dict[str, str] = {
+    "Artifact": "startifact.artifact",
+    "ArtifactDownloader": "startifact.artifact_downloader",
+    "BucketNames": "startifact.bucket_names",
+    "ConfigurationLoader": "startifact.configuration_loader",
+    "LatestVersionLoader": "startifact.latest_version_loader",
+    "MetadataLoader": "startifact.metadata_loader",
+    "Session": "startifact.session",
+}
+"""
+Module that defines each public class.
+"""
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_modules})
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a public class on first use.
+
+    Public classes import Boto3, so importing them eagerly would slow down
+    everything that imports this package, like ``startifact --version``.
+    """
+
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_modules[name]), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "Artifact",
     "ArtifactDownloader",
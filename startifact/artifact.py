@@ -4,11 +4,17 @@ from typing import IO, Dict, List, Optional
 
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.artifact_cache import ArtifactCache
 from startifact.artifact_downloader import ArtifactDownloader
 from startifact.artifacts import make_key, make_metadata_key
 from startifact.bucket_names import BucketNames
+from startifact.client_registry import ClientRegistry
+from startifact.constants import DEFAULT_HEDGE_DELAY, DEFAULT_PART_CONCURRENCY
 from startifact.latest_version_loader import LatestVersionLoader
 from startifact.metadata_loader import MetadataLoader
+from startifact.parameters import ParameterBatcher
+from startifact.region_ranker import RegionRanker
+from startifact.resolution_plan import ResolutionPlan
 
 
 @dataclass
@@ -35,17 +41,42 @@ class Artifact:
     :param out: Output writer.
     :param project: Project.
     :param regions: Amazon Web Services regions to operate in.
+    :param artifact_cache:
+        Optional :class:`startifact.artifact_cache.ArtifactCache` to restore
+        previously-downloaded artifacts from. Defaults to always downloading.
     :param artifact_downloader:
         Optional :class:`ArtifactDownloader`. Defaults to creating a new
         downloader.
     :param bucket_key_prefix: Optional bucket key prefix.
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param concurrency:
+        Maximum number of regions to query at the same time. Defaults to every
+        region.
+    :param hedge_delay:
+        Seconds to wait for a region to answer before also querying the next
+        region when discovering where to download from or reading metadata.
     :param latest_version_loader:
         Optional :class:`LatestVersionLoader`. Defaults to creating a new
         loader.
     :param metadata_loader:
         Optional :class:`MetadataLoader`. Defaults to creating a new loader.
+    :param parameter_batcher:
+        Optional :class:`startifact.parameters.ParameterBatcher` to coalesce
+        Systems Manager reads with.
     :param parameter_name_prefix:
         Optional Systems Manager parameter name prefix.
+    :param part_concurrency:
+        Maximum number of byte ranges to download at the same time.
+    :param part_size:
+        Optional size of each byte range to download, in bytes.
+    :param region_ranker:
+        Optional :class:`startifact.region_ranker.RegionRanker` to order and
+        measure regions with. Defaults to an in-memory ranker.
+    :param stripe:
+        Download different byte ranges from every region that holds the
+        artifact at the same time. Defaults to downloading from one region.
     :param version:
         Optional version. Defaults to discovering the latest version.
     """
@@ -56,14 +87,24 @@ class Artifact:
         out: IO[str],
         project: str,
         regions: List[str],
+        artifact_cache: Optional[ArtifactCache] = None,
         artifact_downloader: Optional[ArtifactDownloader] = None,
         bucket_key_prefix: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+        concurrency: Optional[int] = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
         latest_version_loader: Optional[LatestVersionLoader] = None,
         metadata_loader: Optional[MetadataLoader] = None,
+        parameter_batcher: Optional[ParameterBatcher] = None,
         parameter_name_prefix: Optional[str] = None,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        part_size: Optional[int] = None,
+        region_ranker: Optional[RegionRanker] = None,
+        stripe: bool = False,
         version: Optional[VersionInfo] = None,
     ) -> None:
 
+        self._artifact_cache = artifact_cache
         self._cached_artifact_downloader = artifact_downloader
         self._cached_key: Optional[str] = None
         self._cached_metadata_key: Optional[str] = None
@@ -73,11 +114,19 @@ class Artifact:
         self._cached_latest_loader = latest_version_loader
         self._cached_metadata: Optional[Dict[str, str]] = None
         self._cached_version = version
+        self._clients = clients or ClientRegistry()
+        self._concurrency = concurrency
+        self._hedge_delay = hedge_delay
         self._logger = getLogger("startifact")
         self._out = out
+        self._parameter_batcher = parameter_batcher
         self._parameter_name_prefix = parameter_name_prefix
+        self._part_concurrency = part_concurrency
+        self._part_size = part_size
         self._project = project
+        self._region_ranker = region_ranker or RegionRanker()
         self._regions = regions
+        self._stripe = stripe
 
     def __contains__(self, key: str) -> bool:
         return key in self.metadata_loader.loaded
@@ -88,6 +137,23 @@ class Artifact:
     def __len__(self) -> int:
         return len(self.metadata_loader.loaded)
 
+    @property
+    def bucket_names(self) -> BucketNames:
+        return self._bucket_names
+
+    @property
+    def clients(self) -> ClientRegistry:
+        return self._clients
+
+    @property
+    def concurrency(self) -> Optional[int]:
+        """
+        Gets the maximum number of regions to query at the same time, or
+        ``None`` for every region.
+        """
+
+        return self._concurrency
+
     @property
     def downloader(self) -> ArtifactDownloader:
         """
@@ -96,17 +162,29 @@ class Artifact:
 
         if not self._cached_artifact_downloader:
             self._cached_artifact_downloader = ArtifactDownloader(
+                artifact_cache=self._artifact_cache,
                 bucket_names=self._bucket_names,
+                clients=self._clients,
+                concurrency=self._concurrency,
+                hedge_delay=self._hedge_delay,
                 key=self.key,
                 metadata_loader=self.metadata_loader,
                 out=self._out,
+                part_concurrency=self._part_concurrency,
+                part_size=self._part_size,
                 project=self._project,
+                region_ranker=self._region_ranker,
                 regions=self._regions,
+                stripe=self._stripe,
                 version=self.version,
             )
 
         return self._cached_artifact_downloader
 
+    @property
+    def hedge_delay(self) -> float:
+        return self._hedge_delay
+
     @property
     def key(self) -> str:
         """
@@ -125,9 +203,13 @@ class Artifact:
     def latest_version_loader(self) -> LatestVersionLoader:
         if self._cached_latest_loader is None:
             self._cached_latest_loader = LatestVersionLoader(
+                batcher=self._parameter_batcher,
+                clients=self._clients,
+                concurrency=self._concurrency,
                 out=self._out,
                 parameter_name_prefix=self._parameter_name_prefix,
                 project=self._project,
+                region_ranker=self._region_ranker,
                 regions=self._regions,
             )
         return self._cached_latest_loader
@@ -147,12 +229,54 @@ class Artifact:
         if self._cached_metadata_loader is None:
             self._cached_metadata_loader = MetadataLoader(
                 bucket_names=self._bucket_names,
+                clients=self._clients,
+                concurrency=self._concurrency,
+                hedge_delay=self._hedge_delay,
                 key=self.metadata_key,
+                region_ranker=self._region_ranker,
                 regions=self._regions,
             )
 
         return self._cached_metadata_loader
 
+    @property
+    def project(self) -> str:
+        return self._project
+
+    @property
+    def region_ranker(self) -> RegionRanker:
+        return self._region_ranker
+
+    @property
+    def regions(self) -> List[str]:
+        return self._regions
+
+    def resolve(self, download: bool = False, metadata: bool = False) -> None:
+        """
+        Resolves the artifact's version, and optionally where to download it
+        from and its metadata, in a single concurrent pass rather than one
+        pass over the regions for each.
+
+        .. code-block:: python
+
+            from pathlib import Path
+            from startifact import Session
+
+            session = Session()
+            artifact = session.get("SugarWater")
+            artifact.resolve(download=True, metadata=True)
+
+            artifact.downloader.download(Path("downloads"), load_filename=True)
+
+        Anything that can't be resolved in the single pass is resolved again
+        on demand.
+
+        :param download: Discover a region to download the artifact from.
+        :param metadata: Load the artifact's metadata.
+        """
+
+        ResolutionPlan(self, download=download, metadata=metadata).resolve()
+
     @property
     def version(self) -> VersionInfo:
         """
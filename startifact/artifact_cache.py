@@ -0,0 +1,242 @@
+import sys
+from hashlib import sha256
+from logging import getLogger
+from os import link, replace, utime
+from pathlib import Path
+from secrets import token_hex
+from shutil import copyfile
+from tempfile import mkstemp
+from time import time
+from typing import List, Tuple
+
+from startifact.constants import DEFAULT_ARTIFACT_CACHE_SIZE
+
+if sys.platform == "linux":
+    from fcntl import ioctl
+
+FICLONE = 0x40049409
+"""
+Linux ioctl request to clone (reflink) a file.
+"""
+
+
+class ArtifactCache:
+    """
+    Local cache of downloaded artifacts.
+
+    Entries are keyed by the artifact's S3 key and ETag, so a changed object
+    is never served from the cache. Entries are populated by renaming complete
+    files into place, so concurrent processes never see a partial entry. The
+    least recently used entries are evicted when the cache grows beyond its
+    maximum size.
+
+    Hits are served by reflink where possible, otherwise by copy, so the
+    restored artifact is the user's own file to modify.
+
+    :param directory: Cache directory.
+    :param hardlink:
+        Serve hits by hardlink where possible. The restored artifact then
+        shares the cache entry's file, so it's read-only and must not be
+        modified. Defaults to reflinking or copying.
+    :param max_size: Maximum total size of the cache in bytes.
+    """
+
+    INCOMING_MAX_AGE = 3600.0
+    """
+    Seconds after which an untouched temporary file is assumed to have been
+    abandoned by a killed process and is deleted.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        hardlink: bool = False,
+        max_size: int = DEFAULT_ARTIFACT_CACHE_SIZE,
+    ) -> None:
+
+        self._directory = directory
+        self._hardlink = hardlink
+        self._logger = getLogger("startifact")
+        self._max_size = max_size
+
+    def commit(self, temporary: Path, key: str, etag: str) -> None:
+        """
+        Moves a completely downloaded artifact into the cache.
+
+        :param temporary: Path returned by :meth:`make_temporary_path`.
+        :param key: S3 key.
+        :param etag: S3 ETag.
+        """
+
+        temporary.chmod(0o444)
+        replace(temporary, self.make_path(key, etag))
+        self.evict()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def evict(self) -> None:
+        """
+        Deletes the least recently used entries until the cache fits within its
+        maximum size, and deletes abandoned temporary files.
+        """
+
+        self.evict_incoming()
+
+        entries: List[Tuple[float, int, Path]] = []
+
+        for path in self.entries_directory.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self._max_size:
+                return
+
+            self._logger.debug("Evicting %s from the artifact cache.", path)
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def evict_incoming(self) -> None:
+        """
+        Deletes temporary files that haven't been touched for
+        :attr:`INCOMING_MAX_AGE` seconds.
+        """
+
+        oldest = time() - self.INCOMING_MAX_AGE
+
+        for path in self.incoming_directory.iterdir():
+            try:
+                if path.stat().st_mtime < oldest:
+                    self._logger.debug("Deleting abandoned %s.", path)
+                    path.unlink(missing_ok=True)
+            except FileNotFoundError:
+                # Committed or deleted by another process.
+                continue
+
+    @property
+    def entries_directory(self) -> Path:
+        path = self._directory / "entries"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get(self, key: str, etag: str, path: Path) -> bool:
+        """
+        Restores an artifact from the cache.
+
+        :param key: S3 key.
+        :param etag: S3 ETag.
+        :param path: Path to restore to.
+        :returns: ``True`` if the artifact was restored.
+        """
+
+        entry = self.make_path(key, etag)
+
+        try:
+            # Record the hit for LRU eviction.
+            utime(entry)
+        except FileNotFoundError:
+            self._logger.debug("%s (%s) is not cached.", key, etag)
+            return False
+
+        # Restore beside the path then move into place, so that whatever is
+        # already at the path survives a failed restore.
+        temporary = path.with_name(f".{path.name}.{token_hex(4)}.part")
+
+        try:
+            how = self.restore(entry, temporary)
+            replace(temporary, path)
+
+        except FileNotFoundError:
+            # Evicted by another process.
+            return False
+
+        finally:
+            temporary.unlink(missing_ok=True)
+
+        self._logger.debug("Restored %s by %s.", key, how)
+        return True
+
+    @property
+    def incoming_directory(self) -> Path:
+        path = self._directory / "incoming"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def make_path(self, key: str, etag: str) -> Path:
+        """
+        Gets the path of a cache entry.
+
+        :param key: S3 key.
+        :param etag: S3 ETag.
+        """
+
+        name = sha256(f"{key}\0{etag}".encode("utf-8")).hexdigest()
+        return self.entries_directory / name
+
+    def make_temporary_path(self) -> Path:
+        """
+        Creates a temporary file in the cache to download into.
+
+        The file is on the same file system as the cache entries so that it can
+        be committed by renaming.
+        """
+
+        fd, name = mkstemp(dir=self.incoming_directory)
+        Path(name).chmod(0o644)
+
+        with open(fd, "wb"):
+            pass
+
+        return Path(name)
+
+    @staticmethod
+    def reflink(source: Path, destination: Path) -> bool:
+        """
+        Attempts to clone a file without copying its data.
+
+        :returns: ``True`` if the file was cloned.
+        """
+
+        if sys.platform != "linux":
+            return False
+
+        with open(source, "rb") as s, open(destination, "wb") as d:
+            try:
+                ioctl(d.fileno(), FICLONE, s.fileno())
+                return True
+            except OSError:
+                pass
+
+        destination.unlink(missing_ok=True)
+        return False
+
+    def restore(self, entry: Path, destination: Path) -> str:
+        """
+        Restores a cache entry to a new file.
+
+        :returns: How the entry was restored.
+        :raises FileNotFoundError: if the entry has been evicted.
+        """
+
+        if self._hardlink:
+            try:
+                link(entry, destination)
+                return "hardlink"
+            except FileNotFoundError:
+                raise
+            except OSError:
+                pass
+
+        if self.reflink(entry, destination):
+            return "reflink"
+
+        copyfile(entry, destination)
+        return "copy"
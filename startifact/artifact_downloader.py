@@ -1,22 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from pathlib import Path
-from typing import IO, List, Optional, Tuple
+from typing import IO, Any, Dict, List, Optional, Tuple
 
 from ansiscape import yellow
 from ansiscape.checks import should_emit_codes
 from boto3.session import Session
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.artifact_cache import ArtifactCache
 from startifact.bucket_names import BucketNames
-from startifact.constants import DELIVERED_EMOJI
-from startifact.exceptions import CannotDiscoverExistence, NoRegionsAvailable
+from startifact.client_registry import ClientRegistry
+from startifact.constants import (
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_PART_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    DELIVERED_EMOJI,
+)
+from startifact.download_source import DownloadSource
+from startifact.exceptions import NoRegionsAvailable
+from startifact.hedge import hedge
 from startifact.metadata_loader import MetadataLoader
-from startifact.s3 import exists
+from startifact.ranged_download import RangedDownload
+from startifact.region_ranker import RegionRanker
+from startifact.s3 import head
+from startifact.striped_download import StripedDownload
 
 
 class ArtifactDownloader:
     """
     Discovers artifacts across regions and allows them to be downloaded.
+
+    :param artifact_cache:
+        Optional :class:`startifact.artifact_cache.ArtifactCache` to restore
+        previously-downloaded artifacts from. Defaults to always downloading.
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param concurrency:
+        Maximum number of regions to query at the same time during discovery.
+        Defaults to every region.
+    :param hedge_delay:
+        Seconds to wait for a region to answer during discovery before also
+        querying the next region. Defaults to half a second.
+    :param part_concurrency:
+        Maximum number of byte ranges to download at the same time.
+    :param part_size:
+        Size of each byte range to download, in bytes. Defaults to 64 MiB.
+    :param region_ranker:
+        Optional :class:`startifact.region_ranker.RegionRanker` to order and
+        measure the regions with. Defaults to an in-memory ranker.
+    :param stripe:
+        Download different byte ranges from every region that holds the
+        artifact at the same time. Defaults to downloading from one region.
     """
 
     def __init__(
@@ -28,17 +64,34 @@ class ArtifactDownloader:
         project: str,
         regions: List[str],
         version: VersionInfo,
+        artifact_cache: Optional[ArtifactCache] = None,
+        clients: Optional[ClientRegistry] = None,
+        concurrency: Optional[int] = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        part_size: Optional[int] = None,
+        region_ranker: Optional[RegionRanker] = None,
+        stripe: bool = False,
     ) -> None:
 
+        self._artifact_cache = artifact_cache
         self._bucket_names = bucket_names
         self._cached_bucket: Optional[str] = None
         self._cached_region: Optional[str] = None
+        self._clients = clients or ClientRegistry()
+        self._concurrency = max(1, concurrency or len(regions))
+        self._heads: Dict[str, Dict[str, Any]] = {}
+        self._hedge_delay = hedge_delay
         self._key = key
         self._logger = getLogger("startifact")
         self._metadata_loader = metadata_loader
         self._out = out
+        self._part_concurrency = part_concurrency
+        self._part_size = part_size or DEFAULT_PART_SIZE
         self._project = project
+        self._region_ranker = region_ranker or RegionRanker()
         self._regions = regions
+        self._stripe = stripe
         self._version = version
 
     @property
@@ -54,26 +107,78 @@ class ArtifactDownloader:
         Discovers any available region from which the artifact can be
         downloaded.
 
+        Regions are queried as :func:`startifact.hedge.hedge` describes, and
+        the first region to confirm the artifact's existence wins.
+
         :returns: Tuple describing the bucket and region.
         """
 
         if self._cached_bucket and self._cached_region:
             return self._cached_bucket, self._cached_region
 
-        for region in self._regions:
-            session = Session(region_name=region)
+        found = hedge(
+            self.discover_in,
+            self._region_ranker.rank(self._regions),
+            lambda f: f is not None,
+            concurrency=self._concurrency,
+            delay=self._hedge_delay,
+        )
+
+        if found is None:
+            raise NoRegionsAvailable(self._regions)
+
+        self._cached_bucket, self._cached_region = found
+        return found
+
+    def discover_all(self) -> List[Tuple[str, str]]:
+        """
+        Discovers every available region from which the artifact can be
+        downloaded.
+
+        :returns: Tuples describing the bucket and region, fastest first.
+        """
+
+        regions = self._region_ranker.rank(self._regions)
+
+        with ThreadPoolExecutor(
+            max_workers=self._concurrency,
+            thread_name_prefix="startifact",
+        ) as executor:
+            found = [f for f in executor.map(self.discover_in, regions) if f]
+
+        if not found:
+            raise NoRegionsAvailable(self._regions)
+
+        self._logger.debug("%s is available in %s.", self._key, found)
+        return found
+
+    def discover_in(self, region: str) -> Optional[Tuple[str, str]]:
+        """
+        Checks if the artifact can be downloaded from a region.
+
+        :param region: Region.
+        :returns: Tuple describing the bucket and region if the artifact exists.
+        """
+
+        self._logger.debug("Querying %s for %s…", region, self._key)
+
+        try:
+            session = self._clients.session(region)
             bucket = self._bucket_names.get(session)
 
-            try:
-                if exists(bucket, self._key, session):
-                    self._cached_bucket = bucket
-                    self._cached_region = region
-                    return self._cached_bucket, self._cached_region
+            with self._region_ranker.measure(region):
+                response = head(bucket, self._key, session)
+
+            if response is not None:
+                # Keep the response so that downloads needn't ask again.
+                self._heads[region] = response
+                self._metadata_loader.use_object_metadata(response.get("Metadata", {}))
+                return bucket, region
 
-            except CannotDiscoverExistence:
-                pass
+        except Exception as ex:
+            self._logger.warning("Failed to query %s: %s", region, ex)
 
-        raise NoRegionsAvailable(self._regions)
+        return None
 
     def download(
         self,
@@ -90,6 +195,9 @@ class ArtifactDownloader:
 
         try:
             if load_filename:
+                # Discovery might find the metadata on the artifact object.
+                self.discover()
+
                 self._logger.debug(
                     "Will use original filename from metadata: %s",
                     self._metadata_loader.loaded,
@@ -100,25 +208,23 @@ class ArtifactDownloader:
 
             posix = path.as_posix()
 
-            self._logger.debug(
-                "Downloading %s/%s in %s to %s",
-                self.bucket,
-                self.key,
-                self.region,
-                posix,
-            )
-
-            session = session or Session(region_name=self.region)
+            if self._artifact_cache:
+                regions = self.download_cached(path, self._artifact_cache, session)
+            else:
+                regions = self.download_to(path, session)
 
-            s3 = session.client("s3")  # pyright: reportUnknownMemberType=false
-            s3.download_file(Bucket=self.bucket, Filename=posix, Key=self.key)
-
-            region = yellow(self.region) if should_emit_codes() else self.region
+            region = ", ".join(
+                str(yellow(r)) if should_emit_codes() else r for r in regions
+            )
             path_fmt = yellow(posix) if should_emit_codes() else posix
             project = yellow(self.project) if should_emit_codes() else self.project
             version = yellow(str(self.version)) if should_emit_codes() else self.version
 
-            msg = f"Downloaded {project} {version} from {region} to {path_fmt}.\n"
+            if regions:
+                msg = f"Downloaded {project} {version} from {region} to {path_fmt}.\n"
+            else:
+                msg = f"Restored {project} {version} from the cache to {path_fmt}.\n"
+
             self._out.write(DELIVERED_EMOJI)
             self._out.write(" ")
             self._out.write(msg)
@@ -134,6 +240,130 @@ class ArtifactDownloader:
 
             raise
 
+    def download_cached(
+        self,
+        path: Path,
+        cache: ArtifactCache,
+        session: Optional[Session] = None,
+    ) -> List[str]:
+        """
+        Restores the artifact from a cache, or downloads it into the cache
+        first.
+
+        :param path: Path and filename to download to.
+        :param cache: Artifact cache.
+        :returns: Regions downloaded from, or an empty list if the artifact was
+            restored from the cache.
+        """
+
+        session = session or self._clients.session(self.region)
+
+        # Discovery has usually described the object already.
+        response = self._heads.get(self.region, None)
+        response = response or head(self.bucket, self.key, session)
+
+        if not response or not (etag := response.get("ETag", None)):
+            self._logger.debug("Can't cache %s without an ETag.", self.key)
+            return self.download_to(path, session)
+
+        if cache.get(self.key, etag, path):
+            return []
+
+        temporary = cache.make_temporary_path()
+
+        try:
+            regions = self.download_to(temporary, session)
+            cache.commit(temporary, self.key, etag)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+        if not cache.get(self.key, etag, path):
+            # Evicted already, so the cache is too small to hold it.
+            return self.download_to(path, session)
+
+        return regions
+
+    def download_striped(self, path: Path) -> List[str]:
+        """
+        Downloads the artifact from every region that holds it at the same
+        time.
+
+        :param path: Path and filename to download to.
+        :returns: Regions downloaded from.
+        """
+
+        sources = [
+            DownloadSource(
+                bucket=bucket,
+                client=self._clients.session(region).client("s3"),
+                etag=self._heads.get(region, {}).get("ETag", None),
+                region=region,
+                size=self._heads.get(region, {}).get("ContentLength", None),
+            )
+            for bucket, region in self.discover_all()
+        ]
+
+        self._logger.debug(
+            "Downloading %s from %s to %s",
+            self.key,
+            [s.region for s in sources],
+            path.as_posix(),
+        )
+
+        StripedDownload(
+            concurrency=self._part_concurrency,
+            key=self.key,
+            part_size=self._part_size,
+            path=path,
+            sources=sources,
+        ).download()
+
+        return [s.region for s in sources]
+
+    def download_to(self, path: Path, session: Optional[Session] = None) -> List[str]:
+        """
+        Downloads the artifact from S3.
+
+        :param path: Path and filename to download to.
+        :returns: Regions downloaded from.
+        """
+
+        if self._stripe:
+            return self.download_striped(path)
+
+        self._logger.debug(
+            "Downloading %s/%s in %s to %s",
+            self.bucket,
+            self.key,
+            self.region,
+            path.as_posix(),
+        )
+
+        session = session or self._clients.session(self.region)
+        head = self._heads.get(self.region, {})
+
+        RangedDownload(
+            bucket=self.bucket,
+            client=session.client("s3"),  # pyright: reportUnknownMemberType=false
+            concurrency=self._part_concurrency,
+            etag=head.get("ETag", None),
+            key=self.key,
+            part_size=self._part_size,
+            path=path,
+            region=self.region,
+            size=head.get("ContentLength", None),
+        ).download()
+
+        return [self.region]
+
+    @property
+    def is_located(self) -> bool:
+        """
+        Checks if a region to download the artifact from is already known.
+        """
+
+        return bool(self._cached_bucket and self._cached_region)
+
     @property
     def region(self) -> str:
         """
@@ -150,6 +380,18 @@ class ArtifactDownloader:
     def project(self) -> str:
         return self._project
 
+    def use_location(self, bucket: str, region: str) -> None:
+        """
+        Takes a region that's already known to hold the artifact, so that it
+        doesn't need to be discovered.
+
+        :param bucket: Bucket name.
+        :param region: Region.
+        """
+
+        self._cached_bucket = bucket
+        self._cached_region = region
+
     @property
     def version(self) -> VersionInfo:
         return self._version
@@ -1,12 +1,24 @@
-from typing import Optional
+from base64 import b64decode, b64encode
+from json import loads
+from typing import Dict, Optional, cast
 
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.constants import MAX_OBJECT_METADATA_SIZE, OBJECT_METADATA_NAME
+
 
 def make_fqn(project: str, version: VersionInfo) -> str:
     return f"{project}@{version}"
 
 
+def make_index_key(project: str, prefix: Optional[str] = None) -> str:
+    """
+    Gets the S3 key of a project's version index.
+    """
+
+    return f"{prefix or ''}{project}/versions.json"
+
+
 def make_key(project: str, version: VersionInfo, prefix: Optional[str] = None) -> str:
     fqn = make_fqn(project, version)
     return f"{prefix or ''}{fqn}"
@@ -14,3 +26,41 @@ def make_key(project: str, version: VersionInfo, prefix: Optional[str] = None) -
 
 def make_metadata_key(key: str) -> str:
     return f"{key}/metadata"
+
+
+def make_object_metadata(metadata: bytes) -> Optional[Dict[str, str]]:
+    """
+    Encodes an artifact's metadata as user-defined metadata for its object.
+
+    :param metadata: JSON-encoded metadata.
+    :returns: User-defined metadata, or ``None`` if the metadata is too large.
+    """
+
+    value = b64encode(metadata).decode("ascii")
+
+    if len(OBJECT_METADATA_NAME) + len(value) > MAX_OBJECT_METADATA_SIZE:
+        return None
+
+    return {OBJECT_METADATA_NAME: value}
+
+
+def make_versions_prefix(project: str, prefix: Optional[str] = None) -> str:
+    """
+    Gets the S3 key prefix shared by every version of a project's artifact.
+    """
+
+    return f"{prefix or ''}{project}@"
+
+
+def read_object_metadata(object_metadata: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """
+    Decodes an artifact's metadata from its object's user-defined metadata.
+
+    :param object_metadata: User-defined metadata from a ``HeadObject`` response.
+    :returns: Metadata, or ``None`` if the object doesn't hold it.
+    """
+
+    if (value := object_metadata.get(OBJECT_METADATA_NAME, None)) is None:
+        return None
+
+    return cast(Dict[str, str], loads(b64decode(value)))
@@ -0,0 +1,336 @@
+from functools import partial
+from json import loads
+from logging import getLogger
+from math import ceil
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Tuple, cast
+
+from ansiscape import yellow
+from ansiscape.checks import should_emit_codes
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.artifacts import make_key, make_metadata_key
+from startifact.async_transport import AsyncTransport
+from startifact.bucket_names import BucketNames
+from startifact.constants import DEFAULT_HEDGE_DELAY, DELIVERED_EMOJI, INFO_EMOJI
+from startifact.exceptions import NoRegionsAvailable
+from startifact.hedge import async_hedge
+from startifact.parameters import LatestVersionParameter
+from startifact.region_ranker import RegionRanker
+
+
+class AsyncArtifact:
+    """
+    A staged artifact, read with coroutines.
+
+    .. warning::
+        Don't create instances of this class directly! To get a staged artifact,
+        see :py:func:`startifact.async_session.AsyncSession.get`.
+
+    :param bucket_names: Bucket names.
+    :param out: Output writer.
+    :param project: Project.
+    :param region_ranker: Region ranker.
+    :param regions: Amazon Web Services regions to operate in.
+    :param transport: Transport to make requests with.
+    :param bucket_key_prefix: Optional bucket key prefix.
+    :param hedge_delay:
+        Seconds to wait for a region to answer before also asking the next
+        region. Defaults to half a second.
+    :param parameter_name_prefix:
+        Optional Systems Manager parameter name prefix.
+    :param version:
+        Optional version. Defaults to discovering the latest version.
+    """
+
+    def __init__(
+        self,
+        bucket_names: BucketNames,
+        out: IO[str],
+        project: str,
+        region_ranker: RegionRanker,
+        regions: List[str],
+        transport: AsyncTransport,
+        bucket_key_prefix: Optional[str] = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        parameter_name_prefix: Optional[str] = None,
+        version: Optional[VersionInfo] = None,
+    ) -> None:
+
+        self._any_regions_claim_no_metadata = False
+        self._bucket_key_prefix = bucket_key_prefix
+        self._bucket_names = bucket_names
+        self._cached_metadata: Optional[Dict[str, str]] = None
+        self._cached_version = version
+        self._color = should_emit_codes()
+        self._hedge_delay = hedge_delay
+        self._logger = getLogger("startifact")
+        self._out = out
+        self._parameter_name_prefix = parameter_name_prefix
+        self._project = project
+        self._region_ranker = region_ranker
+        self._regions = regions
+        self._transport = transport
+
+    async def discover(self) -> Tuple[str, str]:
+        """
+        Discovers a region from which the artifact can be downloaded.
+
+        Regions are queried as :func:`startifact.hedge.async_hedge` describes,
+        and the first region to confirm the artifact's existence wins.
+
+        :returns: Tuple describing the bucket and region.
+        :raises NoRegionsAvailable: if no regions hold the artifact.
+        """
+
+        key = await self.get_key()
+
+        found = await async_hedge(
+            partial(self.discover_in, key),
+            await self.rank_regions(),
+            lambda f: f is not None,
+            delay=self._hedge_delay,
+        )
+
+        if found:
+            return found
+
+        raise NoRegionsAvailable(self._regions)
+
+    async def discover_in(self, key: str, region: str) -> Optional[Tuple[str, str]]:
+        """
+        Checks if the artifact can be downloaded from a region.
+
+        :param key: S3 key of the artifact object.
+        :param region: Region.
+        :returns: Tuple describing the bucket and region if the artifact exists.
+        """
+
+        try:
+            bucket = await self.get_bucket(region)
+
+            with self._region_ranker.measure(region):
+                found = await self._transport.head_object(region, bucket, key)
+
+            if found is not None:
+                return bucket, region
+
+        except Exception as ex:
+            self._logger.warning("Failed to query %s: %s", region, ex)
+
+        return None
+
+    async def download(self, path: Path, load_filename: bool = False) -> None:
+        """
+        Downloads the artifact.
+
+        :param path: Path and filename to download to.
+        :param load_filename: Restore the artifact's original filename.
+        """
+
+        if load_filename:
+            metadata = await self.get_metadata()
+            path = path / metadata["startifact:filename"]
+
+        bucket, region = await self.discover()
+        key = await self.get_key()
+
+        self._logger.debug("Downloading %s/%s in %s to %s", bucket, key, region, path)
+        await self._transport.download(region, bucket, key, path)
+
+        posix = path.as_posix()
+        version = str(await self.get_version())
+
+        path_fmt = yellow(posix) if self._color else posix
+        project_fmt = yellow(self._project) if self._color else self._project
+        region_fmt = yellow(region) if self._color else region
+        version_fmt = yellow(version) if self._color else version
+
+        self._out.write(
+            f"{DELIVERED_EMOJI} Downloaded {project_fmt} {version_fmt} from "
+            + f"{region_fmt} to {path_fmt}.\n"
+        )
+
+    async def get_bucket(self, region: str) -> str:
+        """
+        Gets the name of the artifacts bucket in a region.
+
+        Bucket names shared between processes are read and written through the
+        transport so that file access never blocks the event loop.
+        """
+
+        known = partial(self._bucket_names.known, region)
+
+        if (name := await self._transport.run(known)) is not None:
+            return name
+
+        param_name = self._bucket_names.parameter_name
+        name = await self._transport.get_parameter(region, param_name)
+
+        if name is None:
+            raise Exception(f"{param_name} does not exist in {region}")
+
+        await self._transport.run(partial(self._bucket_names.add, region, name))
+        return name
+
+    async def get_key(self) -> str:
+        """
+        Gets the S3 key of the artifact object.
+        """
+
+        version = await self.get_version()
+        return make_key(self._project, version, prefix=self._bucket_key_prefix)
+
+    async def get_metadata(self) -> Dict[str, str]:
+        """
+        Gets the artifact's metadata from any available region.
+
+        Mirrors :attr:`startifact.MetadataLoader.loaded`: regions are queried
+        as :func:`startifact.hedge.async_hedge` describes, and the first region
+        to return the metadata wins.
+
+        :raises NoRegionsAvailable: if no regions are available.
+        """
+
+        if self._cached_metadata is not None:
+            return self._cached_metadata
+
+        key = make_metadata_key(await self.get_key())
+
+        metadata = await async_hedge(
+            partial(self.get_metadata_in, key),
+            await self.rank_regions(),
+            lambda m: m is not None,
+            delay=self._hedge_delay,
+        )
+
+        if metadata is None:
+            if not self._any_regions_claim_no_metadata:
+                raise NoRegionsAvailable(self._regions)
+
+            metadata = {}
+
+        self._cached_metadata = metadata
+        return self._cached_metadata
+
+    async def get_metadata_in(
+        self,
+        key: str,
+        region: str,
+    ) -> Optional[Dict[str, str]]:
+        """
+        Attempts to get the artifact's metadata from a region.
+
+        :param key: S3 key of the metadata object.
+        :param region: Region.
+        :returns: Metadata, or ``None`` if the region didn't return any.
+        """
+
+        try:
+            bucket = await self.get_bucket(region)
+
+            with self._region_ranker.measure(region):
+                body = await self._transport.get_object(region, bucket, key)
+
+        except Exception as ex:
+            self._logger.warning("Failed to get metadata from %s: %s", region, ex)
+            return None
+
+        if body is None:
+            self._logger.debug("%s claims no metadata.", region)
+            self._any_regions_claim_no_metadata = True
+            return None
+
+        return cast(Dict[str, str], loads(body))
+
+    async def get_version(self) -> VersionInfo:
+        """
+        Gets the version of this artifact.
+
+        If the version wasn't specified then at least half of the regions are
+        interrogated concurrently for the latest version, as
+        :attr:`startifact.LatestVersionLoader.version` does.
+
+        :raises NoRegionsAvailable: if not enough regions are available.
+        """
+
+        if self._cached_version is not None:
+            return self._cached_version
+
+        latest: Optional[VersionInfo] = None
+        required = ceil(len(self._regions) / 2)
+        successes = 0
+
+        def is_quorate(version: Optional[VersionInfo]) -> bool:
+            nonlocal latest, successes
+
+            if version is None:
+                return False
+
+            if latest is None or version > latest:
+                latest = version
+
+            successes += 1
+            return successes >= required
+
+        await async_hedge(
+            self.interrogate,
+            await self.rank_regions(),
+            is_quorate,
+        )
+
+        if latest is None or successes < required:
+            raise NoRegionsAvailable(self._regions)
+
+        self._cached_version = latest
+        return self._cached_version
+
+    async def interrogate(self, region: str) -> Optional[VersionInfo]:
+        """
+        Attempts to retrieve the latest version of the artifact in a region.
+
+        :returns: The latest version if it could be retrieved, otherwise
+            ``None``.
+        """
+
+        name = LatestVersionParameter.make_name(
+            self._project,
+            prefix=self._parameter_name_prefix,
+        )
+
+        try:
+            with self._region_ranker.measure(region):
+                value = await self._transport.get_parameter(region, name)
+
+            if value is None:
+                raise Exception(f"{name} does not exist")
+
+            region_fmt = yellow(region) if self._color else region
+            project_fmt = yellow(self._project) if self._color else self._project
+            version_fmt = yellow(value) if self._color else value
+
+            msg = f"{region_fmt} claims {project_fmt} at {version_fmt}.\n"
+            self._out.write(f"{INFO_EMOJI} {msg}")
+
+            # pyright: reportUnknownMemberType=false
+            return VersionInfo.parse(value)
+
+        except Exception as ex:
+            msg = f"Failed to read latest version from {region}: {ex}"
+            self._logger.warning(msg)
+            return None
+
+    @property
+    def project(self) -> str:
+        return self._project
+
+    async def rank_regions(self) -> List[str]:
+        """
+        Orders the regions by expected latency.
+
+        Ranking may read saved measurements from disk, so it runs through the
+        transport to keep file access off the event loop.
+        """
+
+        rank = partial(self._region_ranker.rank, self._regions)
+        return await self._transport.run(rank)
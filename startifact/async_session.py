@@ -0,0 +1,151 @@
+from asyncio import gather
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.async_artifact import AsyncArtifact
+from startifact.async_transport import AsyncTransport
+from startifact.configuration import Configuration
+from startifact.constants import DEFAULT_PART_SIZE
+from startifact.session import Session
+from startifact.thread_transport import ThreadTransport
+
+
+class AsyncSession:
+    """
+    A Startifact session for asyncio applications.
+
+    Mirrors :class:`startifact.Session` with coroutines. Artifact lookups and
+    downloads are made through a pluggable transport so that they never block
+    the event loop.
+
+    For example:
+
+    .. code-block:: python
+
+        from pathlib import Path
+        from startifact.async_session import AsyncSession
+
+        session = AsyncSession()
+        artifact = await session.get("SugarWater")
+
+        print(await artifact.get_version())
+        await artifact.download(Path("download.tar.gz"))
+
+    :param session:
+        :class:`startifact.Session` to take settings, the configuration and
+        caches from. Defaults to a new session.
+    :param transport:
+        :class:`startifact.async_transport.AsyncTransport` to make requests
+        with. Defaults to
+        :class:`startifact.thread_transport.ThreadTransport`.
+    """
+
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        transport: Optional[AsyncTransport] = None,
+    ) -> None:
+
+        self._session = session or Session()
+        self._transport = transport or ThreadTransport(
+            clients=self._session.clients,
+            part_concurrency=self._session.part_concurrency,
+            part_size=self._session.part_size or DEFAULT_PART_SIZE,
+        )
+
+    async def get(
+        self,
+        project: str,
+        version: Optional[VersionInfo] = None,
+    ) -> AsyncArtifact:
+        """
+        Gets an artifact.
+
+        :param project: Project.
+        :param version: Version. Omit to infer the latest version.
+        :returns: Artifact.
+        """
+
+        config = await self.get_configuration()
+
+        return AsyncArtifact(
+            bucket_key_prefix=config["bucket_key_prefix"],
+            bucket_names=self._session.bucket_names,
+            hedge_delay=self._session.hedge_delay,
+            out=self._session.out,
+            parameter_name_prefix=config["parameter_name_prefix"],
+            project=project,
+            region_ranker=self._session.region_ranker,
+            regions=self._session.regions,
+            transport=self._transport,
+            version=version,
+        )
+
+    async def get_configuration(self) -> Configuration:
+        """
+        Gets the organisation configuration.
+
+        The configuration is loaded once per session, so this blocks only the
+        first call.
+        """
+
+        return await self._transport.run(lambda: self._session.configuration.loaded)
+
+    async def get_latest_versions(self, projects: List[str]) -> Dict[str, VersionInfo]:
+        """
+        Gets the latest versions of many projects at once.
+
+        :param projects: Projects.
+        :returns: Latest version per project.
+        :raises NoRegionsAvailable: if any project's latest version is unknown.
+        """
+
+        artifacts = [await self.get(project) for project in projects]
+        versions = await gather(*[a.get_version() for a in artifacts])
+        return dict(zip(projects, versions))
+
+    @property
+    def session(self) -> Session:
+        """
+        Gets the synchronous session that this session takes settings from.
+        """
+
+        return self._session
+
+    async def stage(
+        self,
+        project: str,
+        version: VersionInfo,
+        path: Path,
+        metadata: Optional[Dict[str, str]] = None,
+        save_filename: bool = False,
+    ) -> None:
+        """
+        Stages an artifact to as many regions as possible.
+
+        Staging reads the file and uploads it to every region, so it runs via
+        the transport's :meth:`startifact.async_transport.AsyncTransport.run`.
+        See :meth:`startifact.Session.stage`.
+
+        :param project: Project.
+        :param version: Version.
+        :param path: Path to file to upload.
+        :param metadata: Optional metadata.
+        :param save_filename: Save the filename as metadata.
+        :raises ProjectNameError: if the project name is not acceptable.
+        :raises CannotStageArtifact: if the artifact could not be staged at all.
+        """
+
+        stage = partial(
+            self._session.stage,
+            project,
+            version,
+            path,
+            metadata=metadata,
+            save_filename=save_filename,
+        )
+
+        await self._transport.run(stage)
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+TResult = TypeVar("TResult")
+
+
+class AsyncTransport(ABC):
+    """
+    Performs Amazon Web Services requests for
+    :class:`startifact.async_session.AsyncSession` without blocking the event
+    loop.
+
+    Implement this to plug in an asynchronous client. Startifact provides
+    :class:`startifact.thread_transport.ThreadTransport`, which runs Boto3 in a
+    thread pool.
+    """
+
+    @abstractmethod
+    async def download(self, region: str, bucket: str, key: str, path: Path) -> None:
+        """
+        Downloads an S3 object to a file.
+        """
+
+    @abstractmethod
+    async def get_object(self, region: str, bucket: str, key: str) -> Optional[bytes]:
+        """
+        Gets an S3 object's body.
+
+        :returns: Body, or ``None`` if the object doesn't exist.
+        """
+
+    @abstractmethod
+    async def get_parameter(self, region: str, name: str) -> Optional[str]:
+        """
+        Gets a Systems Manager parameter's value.
+
+        :returns: Value, or ``None`` if the parameter doesn't exist.
+        """
+
+    @abstractmethod
+    async def head_object(
+        self,
+        region: str,
+        bucket: str,
+        key: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Describes an S3 object.
+
+        :returns: ``HeadObject`` response, or ``None`` if the object doesn't
+            exist.
+        """
+
+    @abstractmethod
+    async def run(self, func: Callable[[], TResult]) -> TResult:
+        """
+        Runs blocking work, like staging, without blocking the event loop.
+        """
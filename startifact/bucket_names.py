@@ -1,8 +1,19 @@
-from typing import Dict
+from logging import getLogger
+from pathlib import Path
+from time import time
+from typing import Any, Dict, Optional
 
 from boto3.session import Session
 
-from startifact.parameters import BucketParameter
+from startifact.cache import (
+    get_cache_dir,
+    get_cache_scope,
+    locked,
+    read_json,
+    write_json,
+)
+from startifact.constants import DEFAULT_BUCKET_NAME_TTL
+from startifact.parameters import BucketParameter, ParameterBatcher
 
 
 class BucketNames:
@@ -11,10 +22,30 @@ class BucketNames:
 
     :param bucket_parameter_name:
         Name of the Systems Manager parameter that holds the bucket's name.
+    :param batcher:
+        Optional :class:`startifact.parameters.ParameterBatcher` to coalesce
+        reads with. Defaults to reading alone.
+    :param path:
+        Optional path to share bucket names between processes through. Defaults
+        to keeping bucket names in memory only.
+    :param ttl:
+        Seconds for which a bucket name shared through ``path`` is trusted.
+        Defaults to a week.
     """
 
-    def __init__(self, bucket_parameter_name: str) -> None:
+    def __init__(
+        self,
+        bucket_parameter_name: str,
+        batcher: Optional[ParameterBatcher] = None,
+        path: Optional[Path] = None,
+        ttl: float = DEFAULT_BUCKET_NAME_TTL,
+    ) -> None:
+
+        self._batcher = batcher
+        self._logger = getLogger("startifact")
         self._parameter_name = bucket_parameter_name
+        self._path = path
+        self._ttl = ttl
         self._names: Dict[str, str] = {}
         """
         Bucket name per region.
@@ -30,6 +61,43 @@ class BucketNames:
 
         self._names[region] = bucket_name
 
+        if not self._path or not (key := self.make_key(region)):
+            return
+
+        with locked(self._path):
+            # Drop expired names, like those of rotated identities, so that the
+            # file doesn't grow forever.
+            entries = {k: v for k, v in self.entries.items() if not self.expired(v)}
+            entries[key] = {"name": bucket_name, "saved": time()}
+            write_json(self._path, entries)
+
+    @property
+    def entries(self) -> Dict[str, Any]:
+        """
+        Gets every bucket name shared between processes.
+        """
+
+        entries = read_json(self._path) if self._path else None
+        return entries if isinstance(entries, dict) else {}
+
+    def expired(self, entry: Any) -> bool:
+        """
+        Checks if a bucket name shared between processes can't be trusted.
+
+        :param entry: Shared entry.
+        :returns: ``True`` if the entry is malformed or older than the TTL.
+        """
+
+        if not isinstance(entry, dict):
+            return True
+
+        saved = entry.get("saved", None)
+
+        if isinstance(saved, bool) or not isinstance(saved, (float, int)):
+            return True
+
+        return time() - saved > self._ttl
+
     def get(self, session: Session) -> str:
         """
         Gets a bucket name from the cache.
@@ -40,8 +108,80 @@ class BucketNames:
         :returns: Bucket name.
         """
 
-        if session.region_name not in self._names:
-            param = BucketParameter(name=self._parameter_name, session=session)
-            self.add(session.region_name, param.value)
+        region = session.region_name
+
+        if (name := self.known(region)) is not None:
+            return name
+
+        param = BucketParameter(
+            batcher=self._batcher,
+            name=self._parameter_name,
+            session=session,
+        )
+
+        self.add(region, param.value)
+        return self._names[region]
+
+    def known(self, region: str) -> Optional[str]:
+        """
+        Gets a bucket name without asking Systems Manager.
+
+        :param region: Region.
+        :returns: Bucket name, or ``None`` if it's not yet known.
+        """
+
+        if region in self._names or self.load(region):
+            return self._names[region]
+
+        return None
+
+    def load(self, region: str) -> bool:
+        """
+        Loads a bucket name shared by another process.
+
+        :param region: Region.
+        :returns: ``True`` if a bucket name was loaded.
+        """
+
+        if not self._path or not (key := self.make_key(region)):
+            return False
+
+        if (entry := self.entries.get(key, None)) is None:
+            return False
+
+        if self.expired(entry):
+            self._logger.debug("Cached bucket name in %s has expired.", region)
+            return False
+
+        self._names[region] = entry["name"]
+        return True
+
+    def make_key(self, region: str) -> Optional[str]:
+        """
+        Gets the key of a bucket name shared between processes, or ``None`` if
+        it mustn't be shared.
+
+        :param region: Region.
+        """
+
+        if (scope := get_cache_scope()) is None:
+            return None
+
+        return f"{scope}:{self._parameter_name}:{region}"
+
+    @staticmethod
+    def make_path() -> Path:
+        """
+        Gets the default path to share bucket names between processes through.
+        """
+
+        return get_cache_dir() / "buckets.json"
+
+    @property
+    def parameter_name(self) -> str:
+        """
+        Gets the name of the Systems Manager parameter that holds the bucket's
+        name.
+        """
 
-        return self._names[session.region_name]
+        return self._parameter_name
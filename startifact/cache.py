@@ -0,0 +1,177 @@
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import sha256
+from json import dump, load
+from logging import getLogger
+from os import environ, replace
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO, Any, Iterator, Optional
+
+from startifact.constants import CACHE_DIR_ENVIRON, DEFAULT_STS_REGION
+
+# Windows has no advisory locks, so concurrent writers may lose updates there.
+if sys.platform != "win32":
+    from fcntl import LOCK_EX, LOCK_UN, flock
+
+logger = getLogger("startifact")
+
+
+def get_cache_dir() -> Path:
+    """
+    Gets the directory that Startifact keeps its local state in.
+
+    Defaults to ``startifact`` in the XDG cache directory, or in ``~/.cache``
+    if that's not set. Set ``STARTIFACT_CACHE_DIR`` to override.
+    """
+
+    if custom := environ.get(CACHE_DIR_ENVIRON, None):
+        return Path(custom)
+
+    if xdg := environ.get("XDG_CACHE_HOME", None):
+        return Path(xdg) / "startifact"
+
+    return Path.home() / ".cache" / "startifact"
+
+
+def get_cache_scope() -> Optional[str]:
+    """
+    Gets the scope of cached Amazon Web Services state.
+
+    Cached state is scoped by ``AWS_PROFILE`` and the identity that the
+    profile's credentials belong to, so that switching between identities
+    never serves another identity's state.
+
+    :returns: Scope, or ``None`` if the identity is unknown and nothing should
+        be cached.
+    """
+
+    profile = environ.get("AWS_PROFILE", "")
+
+    if identity := get_identity(profile):
+        return f"{profile}:{identity}"
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_identity(profile: str) -> Optional[str]:
+    """
+    Gets a digest of the identity that a profile's credentials belong to. The
+    identity is resolved once per profile per process.
+
+    Assumed roles are identified by their role rather than their session, so
+    short-lived credentials that are rotated between processes, like a CI
+    runner's, share a scope.
+
+    STS is asked through a regional endpoint with the same bounded timeouts
+    and retries as every other client, so an unreachable STS can't hold up a
+    command for long. An identity that can't be resolved isn't asked for again
+    by the same process.
+
+    :param profile: Profile name, or an empty string for the default
+        credentials.
+    :returns: Digest, or ``None`` if the identity can't be resolved.
+    """
+
+    from boto3.session import Session
+
+    from startifact.client_registry import ClientRegistry
+
+    try:
+        session = Session(profile_name=profile or None)
+        sts = session.client(
+            "sts",
+            config=ClientRegistry().config,
+            # Without a region, STS falls back to its global endpoint.
+            region_name=session.region_name or DEFAULT_STS_REGION,
+        )
+        arn: str = sts.get_caller_identity()["Arn"]
+
+    except Exception as ex:
+        logger.debug("Failed to resolve the identity for the cache scope: %s", ex)
+        return None
+
+    # arn:aws:sts::123456789012:assumed-role/{role}/{session}
+    if ":assumed-role/" in arn:
+        arn = arn.rsplit("/", 1)[0]
+
+    return sha256(arn.encode("utf-8")).hexdigest()[:16]
+
+
+@contextmanager
+def locked(path: Path) -> Iterator[None]:
+    """
+    Holds an exclusive lock on a cache file so that concurrent processes can
+    read, modify and write it without losing each other's updates.
+
+    Failing to take the lock is logged but not raised because a cache is never
+    essential.
+    """
+
+    f: Optional[IO[str]] = None
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(path.parent / f".{path.name}.lock", "a")
+        if sys.platform != "win32":
+            flock(f.fileno(), LOCK_EX)
+
+    except Exception as ex:
+        logger.warning("Failed to lock cache file %s: %s", path, ex)
+
+    try:
+        yield
+
+    finally:
+        if f:
+            if sys.platform != "win32":
+                flock(f.fileno(), LOCK_UN)
+            f.close()
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """
+    Reads a JSON cache file.
+
+    :returns: Cached value, or ``None`` if the file doesn't exist or can't be
+    read.
+    """
+
+    try:
+        with open(path, "r") as f:
+            return load(f)
+
+    except FileNotFoundError:
+        return None
+
+    except Exception as ex:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, ex)
+        return None
+
+
+def write_json(path: Path, value: Any) -> None:
+    """
+    Writes a JSON cache file.
+
+    The file is replaced atomically so that concurrent readers never see a
+    partial write. Failures are logged but not raised because a cache is never
+    essential.
+    """
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(
+            "w",
+            delete=False,
+            dir=path.parent,
+            prefix=f".{path.name}.",
+        ) as f:
+            dump(value, f, indent=2, sort_keys=True)
+
+        replace(f.name, path)
+
+    except Exception as ex:
+        logger.warning("Failed to write cache file %s: %s", path, ex)
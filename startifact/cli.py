@@ -24,6 +24,12 @@ class StartifactCLI(ArgumentParserCli):
             nargs="?",
         )
 
+        parser.add_argument(
+            "--cache",
+            help="when downloading, reuse previously-downloaded artifacts",
+            action="store_true",
+        )
+
         parser.add_argument(
             "--download",
             help="download an artifact to a local path (version is optional)",
@@ -42,6 +48,24 @@ class StartifactCLI(ArgumentParserCli):
             action="store_true",
         )
 
+        parser.add_argument(
+            "--invalidate-cache",
+            help="forget the cached organisation configuration and bucket names then exit",
+            action="store_true",
+        )
+
+        parser.add_argument(
+            "--manifest",
+            help="download every project[@version] in a JSON manifest to its path",
+            metavar="FROM",
+        )
+
+        parser.add_argument(
+            "--manifest-concurrency",
+            help="maximum number of artifacts in a manifest to download at the same time",
+            metavar="COUNT",
+        )
+
         parser.add_argument(
             "--metadata",
             help="set metadata when staging",
@@ -49,6 +73,30 @@ class StartifactCLI(ArgumentParserCli):
             action="append",
         )
 
+        parser.add_argument(
+            "--part-concurrency",
+            help="maximum number of parts to transfer at the same time to each region",
+            metavar="COUNT",
+        )
+
+        parser.add_argument(
+            "--part-size",
+            help="transfer artifacts larger than this size in parts of this size",
+            metavar="MIB",
+        )
+
+        parser.add_argument(
+            "--regional-concurrency",
+            help="maximum number of regions to operate in at the same time",
+            metavar="COUNT",
+        )
+
+        parser.add_argument(
+            "--replicate",
+            help="when staging, upload to one region then copy to the others",
+            action="store_true",
+        )
+
         parser.add_argument(
             "--setup",
             help="perform initial setup then exit",
@@ -67,6 +115,12 @@ class StartifactCLI(ArgumentParserCli):
             metavar="FROM",
         )
 
+        parser.add_argument(
+            "--stripe",
+            help="when downloading, fetch parts from every region at once",
+            action="store_true",
+        )
+
         parser.add_argument(
             "--version",
             help="show version then exit",
@@ -89,6 +143,8 @@ class StartifactCLI(ArgumentParserCli):
             startifact.tasks.DownloadTask,
             startifact.tasks.DryRunStageTask,
             startifact.tasks.InfoTask,
+            startifact.tasks.InvalidateCacheTask,
+            startifact.tasks.ManifestTask,
             startifact.tasks.StageTask,
             startifact.tasks.SetupTask,
         ]
@@ -0,0 +1,81 @@
+from logging import getLogger
+from threading import Lock
+from typing import Dict
+
+from botocore.config import Config
+
+from startifact.constants import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_READ_TIMEOUT,
+)
+from startifact.regional_session import RegionalSession
+
+
+class ClientRegistry:
+    """
+    Shares Boto3 sessions, clients and their connection pools between every
+    operation in each region.
+
+    Timeouts and retries are bounded because hedged calls that lose the race
+    are abandoned rather than interrupted. Abandoning a call hides its latency
+    from the caller but not from process exit, which waits for every worker
+    thread, so a dead region must not be able to hold up the exit for long.
+
+    :param connect_timeout:
+        Seconds to wait for a connection to open. Defaults to 5.
+    :param max_attempts:
+        Maximum number of attempts per request, including the first. Defaults
+        to 3.
+    :param max_pool_connections:
+        Maximum number of connections to keep open to each service in each
+        region. Defaults to 32.
+    :param read_timeout:
+        Seconds to wait for a response to be read. Defaults to 30.
+    :param tcp_keepalive:
+        Enable TCP keep-alive on those connections. Defaults to ``True``.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        tcp_keepalive: bool = True,
+    ) -> None:
+
+        self._config = Config(
+            connect_timeout=connect_timeout,
+            max_pool_connections=max_pool_connections,
+            read_timeout=read_timeout,
+            retries={"max_attempts": max_attempts, "mode": "standard"},
+            tcp_keepalive=tcp_keepalive,
+        )
+
+        self._lock = Lock()
+        self._logger = getLogger("startifact")
+        self._sessions: Dict[str, RegionalSession] = {}
+
+    @property
+    def config(self) -> Config:
+        """
+        Gets the configuration that every client is created with.
+        """
+
+        return self._config
+
+    def session(self, region: str) -> RegionalSession:
+        """
+        Gets the shared session for a region.
+
+        :param region: Region.
+        """
+
+        with self._lock:
+            if region not in self._sessions:
+                self._logger.debug("Creating a shared session for %s.", region)
+                self._sessions[region] = RegionalSession(region, config=self._config)
+
+            return self._sessions[region]
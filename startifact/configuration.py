@@ -21,6 +21,12 @@ class Configuration(TypedDict):
     (Optional) Artifact parameter name prefix.
     """
 
+    regional_concurrency: str
+    """
+    (Optional) Maximum number of regions to operate in at the same time.
+    Defaults to every region at once.
+    """
+
     regions: str
     """
     Comma-separated list of regions to store artifacts.
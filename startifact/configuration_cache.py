@@ -0,0 +1,181 @@
+from logging import getLogger
+from pathlib import Path
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from startifact.cache import (
+    get_cache_dir,
+    get_cache_scope,
+    locked,
+    read_json,
+    write_json,
+)
+from startifact.configuration import Configuration
+from startifact.constants import (
+    DEFAULT_CONFIGURATION_MAX_STALENESS,
+    DEFAULT_CONFIGURATION_TTL,
+)
+
+
+class ConfigurationCache:
+    """
+    On-disk cache of the organisation configuration.
+
+    Configurations are cached per AWS identity and set of regions so that
+    switching between organisations never serves the wrong configuration.
+    Nothing is cached if the identity is unknown.
+
+    :param path:
+        Optional path to the cache file. Defaults to ``configuration.json`` in
+        the cache directory.
+    :param max_staleness:
+        Seconds after which a cached configuration is discarded. Defaults to a
+        day.
+    :param ttl:
+        Seconds for which a cached configuration is fresh. A configuration
+        older than this is still used but should be revalidated. Defaults to
+        five minutes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_staleness: float = DEFAULT_CONFIGURATION_MAX_STALENESS,
+        ttl: float = DEFAULT_CONFIGURATION_TTL,
+    ) -> None:
+
+        self._logger = getLogger("startifact")
+        self._max_staleness = max_staleness
+        self._path = path or get_cache_dir() / "configuration.json"
+        self._ttl = ttl
+
+    @property
+    def entries(self) -> Dict[str, Any]:
+        """
+        Gets every cached configuration by scope.
+        """
+
+        entries = read_json(self._path)
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, regions: List[str]) -> Tuple[Optional[Configuration], bool]:
+        """
+        Gets a cached configuration.
+
+        :param regions: Regions that the configuration was loaded from.
+        :returns: Cached configuration, or ``None`` if there isn't one, and
+            ``True`` if it's fresh.
+        """
+
+        if not (scope := self.make_scope(regions)):
+            return None, False
+
+        entry = self.entries.get(scope, None)
+
+        if not isinstance(entry, dict):
+            return None, False
+
+        configuration = self.make_configuration(entry.get("configuration", None))
+        saved = entry.get("saved", None)
+
+        if configuration is None or not isinstance(saved, (float, int)):
+            self._logger.debug("Ignoring malformed cached configuration.")
+            return None, False
+
+        age = time() - saved
+
+        if age > self._max_staleness:
+            self._logger.debug("Cached configuration is too stale (%ss).", age)
+            return None, False
+
+        return configuration, age <= self._ttl
+
+    def invalidate(self) -> None:
+        """
+        Forgets every cached configuration.
+        """
+
+        self._logger.debug("Invalidating %s.", self._path)
+        self._path.unlink(missing_ok=True)
+
+    @staticmethod
+    def make_configuration(value: Any) -> Optional[Configuration]:
+        """
+        Makes a configuration from a cached value.
+
+        :returns: Configuration, or ``None`` if the value isn't a complete
+            configuration.
+        """
+
+        if not isinstance(value, dict):
+            return None
+
+        for key in Configuration.__annotations__:
+            if not isinstance(value.get(key, None), str):
+                return None
+
+        return Configuration(
+            bucket_key_prefix=value["bucket_key_prefix"],
+            bucket_name_param=value["bucket_name_param"],
+            parameter_name_prefix=value["parameter_name_prefix"],
+            regional_concurrency=value["regional_concurrency"],
+            regions=value["regions"],
+            save_ok=value["save_ok"],
+        )
+
+    @staticmethod
+    def make_scope(regions: List[str]) -> Optional[str]:
+        """
+        Gets the scope of a cached configuration, or ``None`` if it mustn't be
+        cached.
+
+        :param regions: Regions that the configuration was loaded from.
+        """
+
+        if (scope := get_cache_scope()) is None:
+            return None
+
+        return f"{scope}:{','.join(sorted(regions))}"
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def put(self, regions: List[str], configuration: Configuration) -> None:
+        """
+        Caches a configuration.
+
+        :param regions: Regions that the configuration was loaded from.
+        :param configuration: Configuration.
+        """
+
+        if not (scope := self.make_scope(regions)):
+            return
+
+        with locked(self._path):
+            # Drop discarded configurations, like those of rotated identities,
+            # so that the file doesn't grow forever.
+            entries = {k: v for k, v in self.entries.items() if not self.too_stale(v)}
+
+            entries[scope] = {
+                "configuration": configuration,
+                "saved": time(),
+            }
+
+            write_json(self._path, entries)
+
+    def too_stale(self, entry: Any) -> bool:
+        """
+        Checks if a cached entry would be discarded.
+
+        :param entry: Cached entry.
+        :returns: ``True`` if the entry's age is unknown or beyond the maximum
+            staleness.
+        """
+
+        saved = entry.get("saved", None) if isinstance(entry, dict) else None
+
+        if isinstance(saved, bool) or not isinstance(saved, (float, int)):
+            return True
+
+        return time() - saved > self._max_staleness
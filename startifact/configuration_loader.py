@@ -1,67 +1,163 @@
 from logging import getLogger
+from threading import Thread
 from typing import IO, List, Optional
 
 from ansiscape import yellow
 from ansiscape.checks import should_emit_codes
 from boto3.session import Session
 
+from startifact.client_registry import ClientRegistry
 from startifact.configuration import Configuration
+from startifact.configuration_cache import ConfigurationCache
 from startifact.constants import INFO_EMOJI
 from startifact.exceptions import NoRegionsAvailable
 from startifact.parameters import ConfigurationParameter
+from startifact.region_ranker import RegionRanker
 
 
 class ConfigurationLoader:
     """
     Loads the organisation configuration from any available region.
+
+    :param cache:
+        Optional :class:`startifact.configuration_cache.ConfigurationCache`.
+        A fresh cached configuration is used without asking Systems Manager. A
+        stale cached configuration is used while it's revalidated in the
+        background. Defaults to always asking Systems Manager.
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param region_ranker:
+        Optional :class:`startifact.region_ranker.RegionRanker` to order and
+        measure the regions with. Defaults to an in-memory ranker.
     """
 
     def __init__(
         self,
         out: IO[str],
         regions: List[str],
+        cache: Optional[ConfigurationCache] = None,
+        clients: Optional[ClientRegistry] = None,
         configuration: Optional[Configuration] = None,
+        region_ranker: Optional[RegionRanker] = None,
     ) -> None:
 
+        self._cache = cache
         self._cached_configuration = configuration
+        self._clients = clients or ClientRegistry()
         self._logger = getLogger("startifact")
         self._out = out
+        self._region_ranker = region_ranker or RegionRanker()
         self._regions = regions
+        self._revalidation: Optional[Thread] = None
+
+    def load(self, quiet: bool = False) -> Configuration:
+        """
+        Loads the configuration from the first available region.
+
+        :param quiet: Don't report which region the configuration came from.
+        :raises NoRegionsAvailable: if no regions are available.
+        """
+
+        for region in self._region_ranker.rank(self._regions):
+            session = self._clients.session(region)
+            config = self.read(session) if quiet else self.operate(session)
+            if config is not None:
+                return config
+
+        raise NoRegionsAvailable(self._regions)
+
+    def load_cached(self, cache: ConfigurationCache) -> Configuration:
+        """
+        Loads the configuration from a cache, falling back to loading from any
+        available region.
+
+        :param cache: Configuration cache.
+        """
+
+        config, fresh = cache.get(self._regions)
+
+        if config is None:
+            config = self.load()
+            cache.put(self._regions, config)
+            return config
+
+        if not fresh:
+            self._logger.debug("Revalidating stale cached configuration.")
+            self._revalidation = Thread(
+                args=(cache,),
+                name="startifact-revalidate",
+                target=self.revalidate,
+            )
+            self._revalidation.start()
+
+        self._out.write(f"{INFO_EMOJI} Configuration loaded from the cache.\n")
+        return config
 
     def operate(self, session: Session) -> Optional[Configuration]:
+        config = self.read(session)
+
+        if config is not None:
+            region = session.region_name
+            region_fmt = yellow(region) if should_emit_codes() else region
+            self._out.write(f"{INFO_EMOJI} Configuration loaded from {region_fmt}.\n")
+
+        return config
+
+    @property
+    def out(self) -> IO[str]:
+        return self._out
+
+    def read(self, session: Session) -> Optional[Configuration]:
+        """
+        Reads the configuration from a region.
+
+        :returns: Configuration, or ``None`` if the region isn't available.
+        """
+
         region = session.region_name
 
         try:
             param = ConfigurationParameter(read_only=True, session=session)
-            config = param.value
-            region_fmt = yellow(region) if should_emit_codes() else region
-            self._out.write(f"{INFO_EMOJI} Configuration loaded from {region_fmt}.\n")
-            return config
+            with self._region_ranker.measure(region):
+                return param.value
 
         except Exception as ex:
             msg = f"Failed to read configuration from {region}: {ex}"
             self._logger.warning(msg)
             return None
 
-    @property
-    def out(self) -> IO[str]:
-        return self._out
-
     @property
     def regions(self) -> List[str]:
         return self._regions
 
+    def revalidate(self, cache: ConfigurationCache) -> None:
+        """
+        Reloads the configuration into a cache.
+
+        :param cache: Configuration cache.
+        """
+
+        try:
+            cache.put(self._regions, self.load(quiet=True))
+            self._logger.debug("Revalidated cached configuration.")
+        except Exception as ex:
+            self._logger.warning("Failed to revalidate configuration: %s", ex)
+
+    @property
+    def revalidation(self) -> Optional[Thread]:
+        """
+        Gets the background revalidation thread, if one was started.
+        """
+
+        return self._revalidation
+
     @property
     def loaded(self) -> Configuration:
         if self._cached_configuration is None:
-            for region in self._regions:
-                session = Session(region_name=region)
-                config = self.operate(session)
-                if config is None:
-                    continue
-                self._cached_configuration = config
-                return self._cached_configuration
+            if self._cache:
+                self._cached_configuration = self.load_cached(self._cache)
             else:
-                raise NoRegionsAvailable(self._regions)
+                self._cached_configuration = self.load()
 
         return self._cached_configuration
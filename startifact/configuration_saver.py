@@ -1,17 +1,17 @@
 from json import dumps
 from logging import getLogger
-from multiprocessing import Queue
-from queue import Empty
-from typing import IO, List
+from typing import IO, List, Optional, Type
 
 from ansiscape import yellow
 from ansiscape.checks import should_emit_codes
 from boto3.session import Session
 
+from startifact.client_registry import ClientRegistry
 from startifact.configuration import Configuration
 from startifact.constants import INFO_EMOJI
 from startifact.regional_configuration_deleter import RegionalConfigurationDeleter
 from startifact.regional_configuration_saver import RegionalConfigurationSaver
+from startifact.regional_executors import RegionalExecutor, ThreadRegionalExecutor
 from startifact.regional_process_result import RegionalProcessResult
 from startifact.regions import make_regions
 
@@ -23,6 +23,15 @@ class ConfigurationSaver:
     Arguments:
         prev_regions: The previous set of regions. Configuration will be deleted
         from any of these regions that are not in the updated configuration.
+
+        executor_type: Type of executor to run the regional processes with.
+        Defaults to threads.
+
+        clients: Optional registry to share Boto3 clients through when the
+        executor shares clients. Defaults to a new registry.
+
+    The number of regions to operate in at the same time is limited by the
+    configuration's regional concurrency.
     """
 
     def __init__(
@@ -31,17 +40,27 @@ class ConfigurationSaver:
         out: IO[str],
         read_only: bool,
         delete_regions: List[str],
+        executor_type: Type[RegionalExecutor] = ThreadRegionalExecutor,
+        clients: Optional[ClientRegistry] = None,
     ) -> None:
 
         self._any_fails = False
+        self._clients = clients or ClientRegistry()
         self._configuration = dumps(configuration, indent=2, sort_keys=True)
         self._delete_regions = delete_regions
         self._deletes_in_progress: List[str] = []
-        self._logger = getLogger("startifact")
-        self._out = out
-        self._queue: "Queue[RegionalProcessResult]" = Queue(3)
         self._read_only = read_only
         self._save_regions = make_regions(configuration["regions"])
+
+        concurrency = configuration.get("regional_concurrency", "")
+        self._executor = executor_type(
+            max_workers=int(concurrency)
+            if concurrency
+            else len(self._save_regions) + len(delete_regions)
+        )
+
+        self._logger = getLogger("startifact")
+        self._out = out
         self._saves_in_progress: List[str] = []
         self._started = False
 
@@ -53,29 +72,25 @@ class ConfigurationSaver:
     def enqueue_delete(self, region: str) -> None:
         self._deletes_in_progress.append(region)
 
-        RegionalConfigurationDeleter(
-            queue=self._queue,
+        deleter = RegionalConfigurationDeleter(
             read_only=self._read_only,
-            session=Session(region_name=region),
-        ).start()
+            session=self.make_session(region),
+        )
+
+        self._executor.submit(deleter)
 
     def enqueue_save(self, region: str) -> None:
         self._saves_in_progress.append(region)
 
-        RegionalConfigurationSaver(
+        saver = RegionalConfigurationSaver(
             configuration=self._configuration,
-            queue=self._queue,
             read_only=self._read_only,
-            session=Session(region_name=region),
-        ).start()
+            session=self.make_session(region),
+        )
 
-    def receive_done(self) -> None:
-        try:
-            result = self._queue.get(block=True, timeout=1)
-        except Empty:
-            self._logger.debug("None of the queued processes have finished.")
-            return
+        self._executor.submit(saver)
 
+    def handle_result(self, result: RegionalProcessResult) -> None:
         region = result.region
         self._logger.debug("Finished operation in %s.", region)
 
@@ -101,6 +116,21 @@ class ConfigurationSaver:
 
         self._out.write(f"{INFO_EMOJI} Configuration saved to {region_fmt} OK!\n")
 
+    def make_session(self, region: str) -> Session:
+        if self._executor.SHARES_CLIENTS:
+            return self._clients.session(region)
+
+        return Session(region_name=region)
+
+    def receive_done(self) -> None:
+        """
+        Blocks until at least one regional process finishes then handles the
+        results of every finished process.
+        """
+
+        for result in self._executor.wait():
+            self.handle_result(result)
+
     def save(self) -> bool:
         """
         Saves the configuration.
@@ -113,19 +143,18 @@ class ConfigurationSaver:
         self._logger.info("Will save configuration to: %s", self._save_regions)
         self._logger.info("Will delete configuration from: %s", self._delete_regions)
 
-        while self.working:
-
-            if self._saves_in_progress or self._deletes_in_progress:
-                self.receive_done()
-
-            if self._delete_regions and not self._queue.full():
+        with self._executor:
+            while self._delete_regions:
                 region = self._delete_regions.pop()
                 self.enqueue_delete(region)
 
-            if self._save_regions and not self._queue.full():
+            while self._save_regions:
                 region = self._save_regions.pop()
                 self.enqueue_save(region)
 
+            while self.working:
+                self.receive_done()
+
         return not self._any_fails
 
     @property
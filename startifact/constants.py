@@ -1,5 +1,29 @@
+CACHE_DIR_ENVIRON = "STARTIFACT_CACHE_DIR"
 CONFIG_PARAM_NAME = "/startifact"
+DEFAULT_ARTIFACT_CACHE_SIZE = 10 * 1024 * 1024 * 1024
+DEFAULT_BUCKET_NAME_TTL = 7 * 24 * 60 * 60
+DEFAULT_CONFIGURATION_MAX_STALENESS = 24 * 60 * 60
+DEFAULT_CONFIGURATION_TTL = 5 * 60
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_HEDGE_DELAY = 0.5
+DEFAULT_LIST_BUFFER_SIZE = 1000
+DEFAULT_MANIFEST_CONCURRENCY = 4
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+DEFAULT_PART_CONCURRENCY = 4
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_READ_TIMEOUT = 30
+DEFAULT_STS_REGION = "us-east-1"
 DELIVERED_EMOJI = "📦"
 DELIVERING_EMOJI = "🚚"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
 INFO_EMOJI = "🌍"
+MAX_INDEX_ATTEMPTS = 5
+MAX_OBJECT_METADATA_SIZE = 2 * 1024
+MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+MAX_PARTS = 10_000
+MAX_SINGLE_PUT_SIZE = 5 * 1024 * 1024 * 1024
+MIN_PART_SIZE = 5 * 1024 * 1024
+OBJECT_METADATA_NAME = "startifact-metadata"
 REGIONS_ENVIRON = "STARTIFACT_REGIONS"
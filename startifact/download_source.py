@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class DownloadSource:
+    """
+    A region that a striped download can fetch byte ranges from.
+
+    :param bucket: Bucket name.
+    :param client: Boto3 S3 client.
+    :param region: Region.
+    """
+
+    bucket: str
+    client: Any
+    region: str
+
+    etag: Optional[str] = None
+    """
+    ETag of the object in this region.
+    """
+
+    size: Optional[int] = None
+    """
+    Size of the object in this region, if already known.
+    """
+
+    received: int = 0
+    """
+    Bytes received from this region.
+    """
+
+    seconds: float = 0.0
+    """
+    Total time spent receiving from this region, summed over connections.
+    """
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """
+        Gets the observed bytes per second per connection, or ``None`` if
+        nothing has been received yet.
+        """
+
+        if not self.received or not self.seconds:
+            return None
+
+        return self.received / self.seconds
@@ -2,8 +2,10 @@
 All the custom exceptions that Startifact can raise.
 """
 from startifact.exceptions.cannot_discover_existence import CannotDiscoverExistence
+from startifact.exceptions.cannot_download_artifacts import CannotDownloadArtifacts
 from startifact.exceptions.cannot_stage_artifact import CannotStageArtifact
 from startifact.exceptions.no_configuration import NoConfiguration
+from startifact.exceptions.no_matching_version import NoMatchingVersion
 from startifact.exceptions.no_regions_available import NoRegionsAvailable
 from startifact.exceptions.no_regions_configured import NoRegionsConfigured
 from startifact.exceptions.parameter_store import (
@@ -16,8 +18,10 @@ from startifact.exceptions.project_name import ProjectNameError
 
 __all__ = [
     "CannotDiscoverExistence",
+    "CannotDownloadArtifacts",
     "CannotStageArtifact",
     "NoConfiguration",
+    "NoMatchingVersion",
     "NoRegionsAvailable",
     "NoRegionsConfigured",
     "NotAllowedToGetParameter",
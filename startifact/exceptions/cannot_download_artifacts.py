@@ -0,0 +1,12 @@
+from typing import Dict
+
+
+class CannotDownloadArtifacts(Exception):
+    """
+    Raised when any artifacts in a manifest could not be downloaded.
+    """
+
+    def __init__(self, failures: Dict[str, Exception]) -> None:
+        self.failures = failures
+        keys = ", ".join(sorted(failures))
+        super().__init__(f"Failed to download {len(failures)} artifact(s): {keys}")
@@ -0,0 +1,7 @@
+class NoMatchingVersion(Exception):
+    """
+    Raised when no staged version of a project matches a version range.
+    """
+
+    def __init__(self, project: str, version_range: str) -> None:
+        super().__init__(f"No version of {project} matches {version_range}")
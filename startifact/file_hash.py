@@ -0,0 +1,59 @@
+from logging import getLogger
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from startifact.hash import get_b64_md5
+
+
+class FileHash:
+    """
+    Lazily calculates the MD5 hash of a file.
+
+    The file is read at most once, no matter how many regions ask for the hash,
+    and never if no region needs it. Multipart uploads hash each part instead,
+    so staging an artifact only in parts never reads the file just to hash it.
+
+    :param path: Path to the file.
+    :param b64_md5: Optional base64-encoded MD5 hash, if already known.
+    """
+
+    def __init__(self, path: Path, b64_md5: Optional[str] = None) -> None:
+        self._b64_md5 = b64_md5
+        self._lock = Lock()
+        self._path = path
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks can't be pickled into regional processes.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @property
+    def b64_md5(self) -> str:
+        """
+        Gets the base64-encoded MD5 hash of the file.
+        """
+
+        with self._lock:
+            if self._b64_md5 is None:
+                getLogger("startifact").debug("Hashing %s…", self._path)
+                self._b64_md5 = get_b64_md5(self._path)
+
+            return self._b64_md5
+
+    @property
+    def calculated(self) -> bool:
+        """
+        Returns ``True`` if the hash has already been calculated.
+        """
+
+        return self._b64_md5 is not None
+
+    @property
+    def path(self) -> Path:
+        return self._path
@@ -0,0 +1,124 @@
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Iterator, Optional, Type
+
+from startifact.constants import HASH_CHUNK_SIZE
+from startifact.file_source_reader import FileSourceReader
+
+
+class FileSource:
+    """
+    Read-only, memory-mapped file.
+
+    Views and readers are slices of the mapping rather than copies, so the file
+    can be hashed and uploaded without ever being read onto the heap.
+
+    :param path: Path to the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._file: Optional[IO[bytes]] = None
+        self._mmap: Optional[mmap] = None
+        self._path = path
+        self._size = 0
+
+    def __enter__(self) -> "FileSource":
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def assert_readable(self) -> None:
+        """
+        Reads every byte of the file to prove that it's readable.
+
+        This streams through a single reusable buffer rather than the mapping
+        because a failure to read a mapped page kills the process with SIGBUS
+        instead of raising an exception.
+
+        :raises OSError: if the file cannot be read.
+        """
+
+        buffer = bytearray(HASH_CHUNK_SIZE)
+
+        with open(self._path, "rb", buffering=0) as f:
+            while f.readinto(buffer):
+                pass
+
+    def chunks(self, size: int = HASH_CHUNK_SIZE) -> Iterator[memoryview]:
+        """
+        Iterates through the file in views of up to ``size`` bytes.
+
+        Each view is released when the iteration moves on.
+        """
+
+        for offset in range(0, self._size, size):
+            with self.view(offset, size) as view:
+                yield view
+
+    def close(self) -> None:
+        """
+        Closes the file.
+        """
+
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def open(self) -> None:
+        """
+        Opens and maps the file.
+        """
+
+        self._file = open(self._path, "rb")
+        self._size = self._path.stat().st_size
+
+        # Empty files can't be mapped.
+        if self._size:
+            self._mmap = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+
+    def reader(self, offset: int = 0, length: Optional[int] = None) -> FileSourceReader:
+        """
+        Gets a seekable file-like reader over a range of the file.
+
+        :param offset: Offset of the range.
+        :param length: Length of the range. Defaults to the rest of the file.
+        """
+
+        return FileSourceReader(self.view(offset, length))
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the size of the file.
+        """
+
+        return self._size
+
+    def view(self, offset: int = 0, length: Optional[int] = None) -> memoryview:
+        """
+        Gets a view of a range of the file.
+
+        The view must be released before the source is closed.
+
+        :param offset: Offset of the range.
+        :param length: Length of the range. Defaults to the rest of the file.
+        """
+
+        end = self._size if length is None else min(offset + length, self._size)
+
+        if not self._mmap:
+            return memoryview(b"")
+
+        return memoryview(self._mmap)[offset:end]
@@ -0,0 +1,56 @@
+from io import SEEK_CUR, SEEK_END, SEEK_SET, RawIOBase
+from typing import Any
+
+
+class FileSourceReader(RawIOBase):
+    """
+    Seekable file-like reader over a view of a file.
+
+    Reads copy only as many bytes as the caller asks for, so a reader can be
+    passed as a request body without copying the whole range onto the heap.
+    Closing the reader releases the view.
+
+    :param view: View to read.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        super().__init__()
+        self._position = 0
+        self._view = view
+
+    def close(self) -> None:
+        self._view.release()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        start = self._position
+        length = max(0, min(len(buffer), len(self._view) - start))
+        end = start + length
+        memoryview(buffer).cast("B")[:length] = self._view[start:end]
+        self._position = end
+        return length
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_SET:
+            position = offset
+        elif whence == SEEK_CUR:
+            position = self._position + offset
+        elif whence == SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        return position
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
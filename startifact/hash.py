@@ -3,17 +3,21 @@ from hashlib import md5
 from pathlib import Path
 from typing import Union
 
+from startifact.file_source import FileSource
 
-def get_b64_md5(value: Union[Path, bytes]) -> str:
+
+def get_b64_md5(value: Union[Path, bytes, memoryview]) -> str:
     """
-    Gets the MD5 hash of a file or bytes as a base64-encoded string.
+    Gets the MD5 hash of a file, bytes or view as a base64-encoded string.
+
+    Files are hashed through a memory map rather than read onto the heap.
     """
 
     hash = md5()
 
     if isinstance(value, Path):
-        with open(value, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+        with FileSource(value) as source:
+            for chunk in source.chunks():
                 hash.update(chunk)
     else:
         hash.update(value)
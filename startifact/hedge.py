@@ -0,0 +1,120 @@
+from asyncio import FIRST_COMPLETED as ASYNC_FIRST_COMPLETED
+from asyncio import Task, create_task
+from asyncio import wait as async_wait
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Coroutine, List, Optional, Set, TypeVar
+
+TResult = TypeVar("TResult")
+
+
+def hedge(
+    call: Callable[[str], TResult],
+    regions: List[str],
+    is_final: Callable[[TResult], bool],
+    concurrency: Optional[int] = None,
+    delay: float = 0,
+) -> Optional[TResult]:
+    """
+    Calls regions in order until one returns a final result.
+
+    If a region doesn't answer within the delay then the next region is called
+    too, so a delay of zero calls every region at once. Calls that haven't
+    started by the time a result is final are cancelled and any still in
+    flight are abandoned.
+
+    Abandoning a call only hides its latency from the caller. The interpreter
+    still joins the worker threads when the process exits, so clients must
+    bound their own timeouts and retries.
+
+    :param call: Calls a region.
+    :param regions: Regions, in the order to call them.
+    :param is_final: Checks if a result is final.
+    :param concurrency:
+        Maximum number of regions to call at the same time. Defaults to every
+        region.
+    :param delay: Seconds to give each call a head start. Defaults to none.
+    :returns: First final result, or ``None`` if no result was final.
+    """
+
+    concurrency = max(1, concurrency or len(regions))
+    pending: Set["Future[TResult]"] = set()
+    regions = list(regions)
+
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix="startifact",
+    )
+
+    try:
+        while regions or pending:
+            can_call = bool(regions) and len(pending) < concurrency
+
+            if can_call:
+                pending.add(executor.submit(call, regions.pop(0)))
+
+            # Call the next region immediately if every call has answered,
+            # otherwise give the calls in flight a head start.
+            done, pending = wait(
+                pending,
+                return_when=FIRST_COMPLETED,
+                timeout=delay if can_call and regions else None,
+            )
+
+            for future in done:
+                if is_final(result := future.result()):
+                    return result
+
+    finally:
+        for future in pending:
+            future.cancel()
+
+        # Don't wait for abandoned calls to finish. This only hides their
+        # latency from the caller: the interpreter still joins the worker
+        # threads before the process exits.
+        executor.shutdown(wait=False)
+
+    return None
+
+
+async def async_hedge(
+    call: Callable[[str], Coroutine[Any, Any, TResult]],
+    regions: List[str],
+    is_final: Callable[[TResult], bool],
+    delay: float = 0,
+) -> Optional[TResult]:
+    """
+    Calls regions in order until one returns a final result, as :func:`hedge`
+    does, but with tasks on the running event loop.
+
+    Calls still in flight by the time a result is final are cancelled.
+
+    :param call: Calls a region.
+    :param regions: Regions, in the order to call them.
+    :param is_final: Checks if a result is final.
+    :param delay: Seconds to give each call a head start. Defaults to none.
+    :returns: First final result, or ``None`` if no result was final.
+    """
+
+    pending: Set["Task[TResult]"] = set()
+    regions = list(regions)
+
+    try:
+        while regions or pending:
+            if regions:
+                pending.add(create_task(call(regions.pop(0))))
+
+            done, pending = await async_wait(
+                pending,
+                return_when=ASYNC_FIRST_COMPLETED,
+                timeout=delay if regions else None,
+            )
+
+            for task in done:
+                if is_final(result := task.result()):
+                    return result
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return None
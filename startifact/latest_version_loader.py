@@ -1,5 +1,6 @@
 from logging import getLogger
 from math import ceil
+from threading import Lock
 from typing import IO, List, Optional
 
 from ansiscape import yellow
@@ -7,14 +8,30 @@ from ansiscape.checks import should_emit_codes
 from boto3.session import Session
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.client_registry import ClientRegistry
 from startifact.constants import INFO_EMOJI
 from startifact.exceptions import NoRegionsAvailable
-from startifact.parameters import LatestVersionParameter
+from startifact.hedge import hedge
+from startifact.parameters import LatestVersionParameter, ParameterBatcher
+from startifact.region_ranker import RegionRanker
 
 
 class LatestVersionLoader:
     """
     Gets the latest version of a project from any available region.
+
+    :param batcher:
+        Optional :class:`startifact.parameters.ParameterBatcher` to coalesce
+        reads with other loaders'. Defaults to reading alone.
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param concurrency:
+        Maximum number of regions to interrogate at the same time. Defaults to
+        every region at once.
+    :param region_ranker:
+        Optional :class:`startifact.region_ranker.RegionRanker` to order and
+        measure the regions with. Defaults to an in-memory ranker.
     """
 
     def __init__(
@@ -22,18 +39,28 @@ class LatestVersionLoader:
         out: IO[str],
         project: str,
         regions: List[str],
+        batcher: Optional[ParameterBatcher] = None,
+        clients: Optional[ClientRegistry] = None,
+        concurrency: Optional[int] = None,
         parameter_name_prefix: Optional[str] = None,
+        region_ranker: Optional[RegionRanker] = None,
         version: Optional[VersionInfo] = None,
     ) -> None:
 
+        self._batcher = batcher
         self._cached_version = version
+        self._clients = clients or ClientRegistry()
         self._color = should_emit_codes()
+        self._concurrency = max(1, concurrency or len(regions))
+        self._decided = False
         self._logger = getLogger("startifact")
         self._parameter_name_prefix = parameter_name_prefix
         self._original_region_len = len(regions)
         self._out = out
+        self._out_lock = Lock()
         self._project = project
         self._project_fmt = yellow(project) if self._color else project
+        self._region_ranker = region_ranker or RegionRanker()
         self._regions = regions
 
     def interrogate(self, session: Session) -> Optional[VersionInfo]:
@@ -50,6 +77,7 @@ class LatestVersionLoader:
 
         try:
             param = LatestVersionParameter(
+                batcher=self._batcher,
                 prefix=self._parameter_name_prefix,
                 project=self._project,
                 read_only=True,
@@ -58,16 +86,24 @@ class LatestVersionLoader:
 
             region = session.region_name
 
+            with self._region_ranker.measure(region):
+                value = param.value
+
             region_fmt = yellow(region) if self._color else region
-            version_fmt = yellow(param.value) if self._color else param.value
+            version_fmt = yellow(value) if self._color else value
 
             msg = f"{region_fmt} claims {self._project_fmt} at {version_fmt}.\n"
-            self._out.write(INFO_EMOJI)
-            self._out.write(" ")
-            self._out.write(msg)
+
+            # Write the whole line at once so that concurrent interrogations
+            # don't interleave, and stay quiet once the version has been
+            # decided so that abandoned interrogations don't interleave with
+            # whatever is written next.
+            with self._out_lock:
+                if not self._decided:
+                    self._out.write(f"{INFO_EMOJI} {msg}")
 
             # pyright: reportUnknownMemberType=false
-            return VersionInfo.parse(param.value)
+            return VersionInfo.parse(value)
 
         except Exception as ex:
             msg = f"Failed to read latest version from {session.region_name}: {ex}"
@@ -78,46 +114,69 @@ class LatestVersionLoader:
     def successes_required(self) -> int:
         return ceil(self._original_region_len / 2)
 
+    def interrogate_region(self, region: str) -> Optional[VersionInfo]:
+        """
+        Attempts to retrieve the latest version number of the artifact in a
+        region.
+
+        :param region: Region to interrogate.
+
+        :returns: The latest version of the artifact if it could be retrieved,
+        otherwise `None`.
+        """
+
+        self._logger.debug("Interrogating %s…", region)
+        version = self.interrogate(self._clients.session(region))
+        self._logger.debug("%s returned: %s", region, version)
+        return version
+
     @property
     def version(self) -> VersionInfo:
         """
         Interrogates at least half of the regions to find the latest version
         number of the artifact.
 
+        Regions are interrogated concurrently, as :func:`startifact.hedge.hedge`
+        describes, and the answer is returned as soon as enough regions have
+        responded.
+
         :returns: Latest version number of the artifact.
 
         :raises NoRegionsAvailable: If none of the regions are available.
         """
 
-        # TODO: This could be performed by parallel multiprocessing jobs if
-        # TODO: anyone ever finds themselves with hundreds of regions. For now,
-        # TODO: though, I can't imagine anyone using so many regions that a
-        # TODO: one-by-one check is painful.
+        if self._cached_version is not None:
+            return self._cached_version
 
-        success_count = 0
         latest_version: Optional[VersionInfo] = None
+        success_count = 0
 
-        if self._cached_version is None:
-            for region in self._regions:
-                self._logger.debug("Interrogating %s…", region)
-                session = Session(region_name=region)
+        def is_quorate(version: Optional[VersionInfo]) -> bool:
+            nonlocal latest_version, success_count
 
-                version = self.interrogate(session)
-                self._logger.debug("%s returned: %s", region, version)
+            if version is None:
+                return False
 
-                if version is None:
-                    continue
+            if latest_version is None or version > latest_version:
+                latest_version = version
 
-                if latest_version is None or version > latest_version:
-                    latest_version = version
+            success_count += 1
+            return success_count >= self.successes_required
 
-                success_count += 1
-                if success_count >= self.successes_required:
-                    break
+        try:
+            hedge(
+                self.interrogate_region,
+                self._region_ranker.rank(self._regions),
+                is_quorate,
+                concurrency=self._concurrency,
+            )
 
-            else:
-                raise NoRegionsAvailable(self._regions)
+        finally:
+            with self._out_lock:
+                self._decided = True
 
-            self._cached_version = latest_version
+        if latest_version is None or success_count < self.successes_required:
+            raise NoRegionsAvailable(self._regions)
 
+        self._cached_version = latest_version
         return self._cached_version
@@ -0,0 +1,47 @@
+from json import load
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+
+def load_manifest(path: Path) -> Dict[str, Path]:
+    """
+    Loads a download manifest from a JSON file.
+
+    The file must describe an object that maps each ``project[@version]`` to
+    the path to download it to. Relative paths are relative to the working
+    directory.
+
+    :raises ValueError: if the file doesn't describe a manifest.
+    """
+
+    with open(path, "r") as f:
+        manifest = load(f)
+
+    if not isinstance(manifest, dict):
+        raise ValueError(f"{path} does not describe an object")
+
+    for key, value in manifest.items():
+        if not isinstance(value, str):
+            raise ValueError(f'{path} has a non-string path for "{key}"')
+
+    return {key: Path(value) for key, value in manifest.items()}
+
+
+def parse_manifest_key(key: str) -> Tuple[str, Optional[VersionInfo]]:
+    """
+    Parses a ``project[@version]`` manifest key.
+
+    :returns: Project and version, which is ``None`` if the key describes the
+        latest version.
+    :raises ValueError: if the version is not a valid SemVer string.
+    """
+
+    project, _, version = key.partition("@")
+
+    if not version or version == "latest":
+        return project, None
+
+    # pyright: reportUnknownMemberType=false
+    return project, VersionInfo.parse(version)
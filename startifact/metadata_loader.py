@@ -4,13 +4,31 @@ from typing import Dict, List, Optional, cast
 
 from boto3.session import Session
 
+from startifact.artifacts import read_object_metadata
 from startifact.bucket_names import BucketNames
+from startifact.client_registry import ClientRegistry
+from startifact.constants import DEFAULT_HEDGE_DELAY
 from startifact.exceptions import NoRegionsAvailable
+from startifact.hedge import hedge
+from startifact.region_ranker import RegionRanker
 
 
 class MetadataLoader:
     """
     Loads an artifact's metadata from any available region.
+
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param concurrency:
+        Maximum number of regions to query at the same time. Defaults to every
+        region.
+    :param hedge_delay:
+        Seconds to wait for a region to answer before also querying the next
+        region. Defaults to half a second.
+    :param region_ranker:
+        Optional :class:`startifact.region_ranker.RegionRanker` to order and
+        measure the regions with. Defaults to an in-memory ranker.
     """
 
     def __init__(
@@ -18,33 +36,48 @@ class MetadataLoader:
         bucket_names: BucketNames,
         key: str,
         regions: List[str],
+        clients: Optional[ClientRegistry] = None,
+        concurrency: Optional[int] = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
         metadata: Optional[Dict[str, str]] = None,
+        region_ranker: Optional[RegionRanker] = None,
     ) -> None:
 
         self._any_regions_claim_no_metadata = False
         self._bucket_names = bucket_names
         self._cached_metadata = metadata
+        self._clients = clients or ClientRegistry()
+        self._concurrency = max(1, concurrency or len(regions))
+        self._hedge_delay = hedge_delay
         self._key = key
         self._logger = getLogger("startifact")
+        self._region_ranker = region_ranker or RegionRanker()
         self._regions = regions
 
     @property
     def any_regions_claim_no_metadata(self) -> bool:
         return self._any_regions_claim_no_metadata
 
-    def operate(self, session: Session) -> Optional[Dict[str, str]]:
-        try:
-            bucket = self._bucket_names.get(session)
+    def get(self, session: Session) -> Optional[Dict[str, str]]:
+        """
+        Gets the metadata from a region.
 
-            self._logger.debug(
-                "Downloading metadata from %s/%s in %s.",
-                bucket,
-                self.key,
-                session.region_name,
-            )
+        :param session: Regional session.
+        :returns: Metadata, or ``None`` if the region claims there is none.
+        """
 
-            s3 = session.client("s3")  # pyright: reportUnknownMemberType=false
+        bucket = self._bucket_names.get(session)
 
+        self._logger.debug(
+            "Downloading metadata from %s/%s in %s.",
+            bucket,
+            self.key,
+            session.region_name,
+        )
+
+        s3 = session.client("s3")  # pyright: reportUnknownMemberType=false
+
+        with self._region_ranker.measure(session.region_name):
             try:
                 response = s3.get_object(Bucket=bucket, Key=self.key)
                 return cast(Dict[str, str], load(response["Body"]))
@@ -54,6 +87,10 @@ class MetadataLoader:
                 self._any_regions_claim_no_metadata = True
                 return None
 
+    def operate(self, session: Session) -> Optional[Dict[str, str]]:
+        try:
+            return self.get(session)
+
         except Exception as ex:
             msg = f"Failed to get metadata from {session.region_name}: {ex}"
             self._logger.warning(msg)
@@ -61,15 +98,32 @@ class MetadataLoader:
 
     @property
     def loaded(self) -> Dict[str, str]:
+        """
+        Gets the metadata.
+
+        Regions are queried as :func:`startifact.hedge.hedge` describes, and
+        the first region to return the metadata wins.
+
+        If no region returns the metadata but any region claims that there is
+        none, then the metadata is empty.
+
+        :raises NoRegionsAvailable: if no regions are available.
+        """
+
         if self._cached_metadata is not None:
             return self._cached_metadata
 
-        for region in self._regions:
-            self._logger.debug("Attempting download from %s…", region)
-            session = Session(region_name=region)
-            self._cached_metadata = self.operate(session)
-            if self._cached_metadata is not None:
-                return self._cached_metadata
+        metadata = hedge(
+            lambda region: self.operate(self._clients.session(region)),
+            self._region_ranker.rank(self._regions),
+            lambda m: m is not None,
+            concurrency=self._concurrency,
+            delay=self._hedge_delay,
+        )
+
+        if metadata is not None:
+            self._cached_metadata = metadata
+            return self._cached_metadata
 
         if not self._any_regions_claim_no_metadata:
             raise NoRegionsAvailable(self._regions)
@@ -83,6 +137,50 @@ class MetadataLoader:
         self._cached_metadata = empty
         return self._cached_metadata
 
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Checks if the metadata is already loaded.
+        """
+
+        return self._cached_metadata is not None
+
     @property
     def key(self) -> str:
         return self._key
+
+    def use_metadata(self, metadata: Dict[str, str]) -> None:
+        """
+        Takes metadata that has already been downloaded, so that it doesn't
+        need to be downloaded again.
+
+        :param metadata: Metadata.
+        """
+
+        self._cached_metadata = metadata
+
+    def use_object_metadata(self, object_metadata: Dict[str, str]) -> bool:
+        """
+        Takes the metadata from the artifact object's user-defined metadata, if
+        it holds any, so that it doesn't need to be downloaded.
+
+        :param object_metadata: User-defined metadata from a ``HeadObject``
+            response.
+        :returns: ``True`` if the metadata was taken.
+        """
+
+        if self._cached_metadata is not None:
+            return True
+
+        try:
+            metadata = read_object_metadata(object_metadata)
+        except Exception as ex:
+            self._logger.warning("Failed to read object metadata: %s", ex)
+            return False
+
+        if metadata is None:
+            return False
+
+        self._logger.debug("Took metadata from the artifact object.")
+        self._cached_metadata = metadata
+        return True
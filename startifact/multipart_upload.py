@@ -0,0 +1,267 @@
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from logging import getLogger
+from math import ceil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from startifact.constants import MAX_PART_SIZE, MAX_PARTS, MIN_PART_SIZE
+from startifact.file_source import FileSource
+from startifact.hash import get_b64_md5
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3.type_defs import CopySourceTypeDef
+
+
+def make_part_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into the byte ranges of its parts.
+
+    The part size is increased if necessary to keep the number of parts within
+    the limit that Amazon S3 allows, and reduced if necessary to keep each part
+    within the size that Amazon S3 allows.
+
+    :param size: File size.
+    :param part_size: Preferred part size.
+    :returns: Offset and length of each part.
+    """
+
+    part_size = min(max(part_size, ceil(size / MAX_PARTS)), MAX_PART_SIZE)
+    return [
+        (offset, min(part_size, size - offset)) for offset in range(0, size, part_size)
+    ]
+
+
+class MultipartUpload:
+    """
+    Uploads a file to Amazon S3 in concurrent parts.
+
+    If any part fails to upload then the multipart upload is aborted so that no
+    orphaned parts are left behind.
+
+    :param bucket: Bucket name.
+    :param client: Boto3 S3 client.
+    :param concurrency: Maximum number of parts to upload at the same time.
+    :param key: Object key.
+    :param part_size: Part size in bytes.
+    :param path: Path to the file to upload.
+    :param region: Region, for logging.
+    :param copy_source:
+        Optional bucket and key of an existing copy of the file. If set, each
+        part is copied from this object server-side rather than uploaded from
+        the local file.
+    :param metadata: Optional user-defined metadata for the object.
+    :raises ValueError: if the part size is smaller than Amazon S3 allows.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        client: Any,
+        concurrency: int,
+        key: str,
+        part_size: int,
+        path: Path,
+        region: str,
+        copy_source: Optional["CopySourceTypeDef"] = None,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> None:
+
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(
+                f"Part size {part_size} is smaller than the minimum {MIN_PART_SIZE}"
+            )
+
+        self._bucket = bucket
+        self._client = client
+        self._copy_source = copy_source
+        self._concurrency = max(1, concurrency)
+        self._key = key
+        self._logger = getLogger("startifact")
+        self._metadata = metadata
+        self._part_size = part_size
+        self._path = path
+        self._region = region
+
+    def abort(self, upload_id: str) -> None:
+        """
+        Aborts the multipart upload and discards any parts already uploaded.
+        """
+
+        self._logger.debug(
+            "Aborting multipart upload %s of s3:/%s/%s in %s.",
+            upload_id,
+            self._bucket,
+            self._key,
+            self._region,
+        )
+
+        self._client.abort_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=upload_id,
+        )
+
+    def copy_part(
+        self,
+        upload_id: str,
+        number: int,
+        offset: int,
+        length: int,
+    ) -> Dict[str, Any]:
+        """
+        Copies a single part from the copy source.
+
+        :returns: Part description for completing the multipart upload.
+        """
+
+        self._logger.debug(
+            "Copying part %s (%s bytes) of s3:/%s/%s in %s from %s…",
+            number,
+            length,
+            self._bucket,
+            self._key,
+            self._region,
+            self._copy_source,
+        )
+
+        response = self._client.upload_part_copy(
+            Bucket=self._bucket,
+            CopySource=self._copy_source,
+            CopySourceRange=f"bytes={offset}-{offset + length - 1}",
+            Key=self._key,
+            PartNumber=number,
+            UploadId=upload_id,
+        )
+
+        return {"ETag": response["CopyPartResult"]["ETag"], "PartNumber": number}
+
+    def upload(self) -> None:
+        """
+        Performs the multipart upload.
+        """
+
+        kwargs: Dict[str, Any] = {}
+
+        if self._metadata:
+            kwargs["Metadata"] = self._metadata
+
+        response = self._client.create_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            **kwargs,
+        )
+
+        upload_id: str = response["UploadId"]
+
+        try:
+            parts = self.upload_parts(upload_id)
+
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                MultipartUpload={"Parts": parts},
+                UploadId=upload_id,
+            )
+
+        except BaseException:
+            self.abort(upload_id)
+            raise
+
+    def upload_part(
+        self,
+        source: FileSource,
+        upload_id: str,
+        number: int,
+        offset: int,
+        length: int,
+    ) -> Dict[str, Any]:
+        """
+        Uploads a single part.
+
+        :returns: Part description for completing the multipart upload.
+        """
+
+        if self._copy_source:
+            return self.copy_part(upload_id, number, offset, length)
+
+        self._logger.debug(
+            "Uploading part %s (%s bytes) of s3:/%s/%s in %s…",
+            number,
+            length,
+            self._bucket,
+            self._key,
+            self._region,
+        )
+
+        with source.view(offset, length) as view:
+            content_md5 = get_b64_md5(view)
+
+        with source.reader(offset, length) as body:
+            response = self._client.upload_part(
+                Body=body,
+                Bucket=self._bucket,
+                ContentLength=length,
+                ContentMD5=content_md5,
+                Key=self._key,
+                PartNumber=number,
+                UploadId=upload_id,
+            )
+
+        return {"ETag": response["ETag"], "PartNumber": number}
+
+    def upload_parts(self, upload_id: str) -> List[Dict[str, Any]]:
+        """
+        Uploads every part of the file.
+
+        :returns: Part descriptions in part number order.
+        :raises Exception: the first exception raised by any part upload.
+        """
+
+        with FileSource(self._path) as source:
+            return self.upload_parts_from(source, upload_id)
+
+    def upload_parts_from(
+        self,
+        source: FileSource,
+        upload_id: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Uploads every part of the file from a shared source.
+
+        :returns: Part descriptions in part number order.
+        :raises Exception: the first exception raised by any part upload.
+        """
+
+        ranges = make_part_ranges(source.size, self._part_size)
+
+        self._logger.debug(
+            "Uploading %s parts of s3:/%s/%s in %s with concurrency %s.",
+            len(ranges),
+            self._bucket,
+            self._key,
+            self._region,
+            self._concurrency,
+        )
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            futures: List["Future[Dict[str, Any]]"] = [
+                executor.submit(
+                    self.upload_part,
+                    source,
+                    upload_id,
+                    index + 1,
+                    offset,
+                    length,
+                )
+                for index, (offset, length) in enumerate(ranges)
+            ]
+
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+            for future in done:
+                if ex := future.exception():
+                    for p in pending:
+                        p.cancel()
+                    raise ex
+
+        return [future.result() for future in futures]
@@ -1,3 +1,4 @@
+from startifact.parameters.batcher import ParameterBatcher
 from startifact.parameters.bucket import BucketParameter
 from startifact.parameters.configuration import ConfigurationParameter
 from startifact.parameters.latest_version import LatestVersionParameter
@@ -8,4 +9,5 @@ __all__ = [
     "ConfigurationParameter",
     "LatestVersionParameter",
     "Parameter",
+    "ParameterBatcher",
 ]
@@ -0,0 +1,155 @@
+from concurrent.futures import CancelledError, Future
+from logging import getLogger
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from boto3.session import Session
+from botocore.exceptions import ClientError
+
+PendingRead = Tuple[str, "Future[Optional[str]]"]
+
+
+class ParameterBatcher:
+    """
+    Coalesces concurrent Systems Manager parameter reads in the same region
+    into ``GetParameters`` requests.
+
+    The first read in a region is sent immediately. Reads that arrive while a
+    request is in flight are queued and sent together in the next request, so
+    batching never delays a read that could have been sent alone.
+    """
+
+    ISOLATED_ERRORS = {"AccessDeniedException", "InvalidKeyId", "ValidationException"}
+    """
+    Error codes that can be caused by a single parameter, so a batch that fails
+    with one of them is retried one parameter at a time.
+    """
+
+    MAX_NAMES = 10
+    """
+    Maximum number of parameter names per ``GetParameters`` request.
+    """
+
+    def __init__(self) -> None:
+        self._flushing: Set[str] = set()
+        self._lock = Lock()
+        self._logger = getLogger("startifact")
+        self._pending: Dict[str, List[PendingRead]] = {}
+
+    def flush(self, session: Session) -> None:
+        """
+        Sends every read queued for a session's region.
+
+        :param session: Boto3 session.
+        """
+
+        region = session.region_name
+        batch: List[PendingRead] = []
+        error: BaseException = CancelledError()
+        finished = False
+
+        try:
+            ssm = session.client("ssm")  # pyright: reportUnknownMemberType=false
+
+            while True:
+                with self._lock:
+                    pending = self._pending.get(region, [])
+                    batch = pending[: self.MAX_NAMES]
+                    del pending[: self.MAX_NAMES]
+
+                    if not batch:
+                        self._flushing.discard(region)
+                        self._pending.pop(region, None)
+                        finished = True
+                        return
+
+                self.send(ssm, region, batch)
+
+        except Exception as ex:
+            self._logger.warning("Failed to get parameters in %s: %s", region, ex)
+            error = ex
+
+        finally:
+            if not finished:
+                # Fail every read still waiting so that none blocks forever,
+                # and let the next read in this region start a new flush.
+                with self._lock:
+                    failed = [*batch, *self._pending.pop(region, [])]
+                    self._flushing.discard(region)
+
+                for _, future in failed:
+                    if not future.done():
+                        future.set_exception(error)
+
+    def get(self, session: Session, name: str) -> "Future[Optional[str]]":
+        """
+        Reads a parameter.
+
+        :param session: Boto3 session.
+        :param name: Parameter name.
+        :returns: Future value, which is ``None`` if the parameter doesn't exist.
+        """
+
+        future: "Future[Optional[str]]" = Future()
+        region = session.region_name
+
+        with self._lock:
+            self._pending.setdefault(region, []).append((name, future))
+
+            if region in self._flushing:
+                # The flushing thread will send this read in its next batch.
+                return future
+
+            self._flushing.add(region)
+
+        self.flush(session)
+        return future
+
+    @classmethod
+    def is_isolated(cls, ex: Exception) -> bool:
+        """
+        Checks if an error could have been caused by a single parameter.
+        """
+
+        if not isinstance(ex, ClientError):
+            return False
+
+        return ex.response.get("Error", {}).get("Code", None) in cls.ISOLATED_ERRORS
+
+    def send(self, ssm: Any, region: str, batch: List[PendingRead]) -> None:
+        """
+        Sends a batch of reads.
+
+        If the batch fails with an error that a single parameter can cause
+        (like being forbidden from reading it) then each read is retried alone
+        so that one parameter doesn't fail the others. Any other error, like
+        throttling, fails every read in the batch rather than multiplying the
+        requests.
+        """
+
+        names = sorted({name for name, _ in batch})
+
+        self._logger.debug(
+            "Getting %s parameter(s) in %s: %s",
+            len(names),
+            region,
+            names,
+        )
+
+        try:
+            response = ssm.get_parameters(Names=names)
+
+        except Exception as ex:
+            if len(names) == 1 or not self.is_isolated(ex):
+                for _, future in batch:
+                    future.set_exception(ex)
+                return
+
+            for name in names:
+                self.send(ssm, region, [r for r in batch if r[0] == name])
+            return
+
+        values = {p["Name"]: p["Value"] for p in response.get("Parameters", [])}
+
+        for name, future in batch:
+            future.set_result(values.get(name, None))
@@ -2,6 +2,7 @@ from typing import Optional
 
 from boto3.session import Session
 
+from startifact.parameters.batcher import ParameterBatcher
 from startifact.parameters.parameter import Parameter
 
 
@@ -17,6 +18,9 @@ class BucketParameter(Parameter[str]):
 
     :param value: Optional bucket name to preload into the cache.
     :type value: Optional[str]
+
+    :param batcher: Optional batcher to coalesce reads with.
+    :type batcher: Optional[ParameterBatcher]
     """
 
     def __init__(
@@ -24,9 +28,15 @@ class BucketParameter(Parameter[str]):
         name: str,
         session: Session,
         value: Optional[str] = None,
+        batcher: Optional[ParameterBatcher] = None,
     ) -> None:
         # This parameter is always read-only. We don't own this.
-        super().__init__(read_only=True, session=session, value=value)
+        super().__init__(
+            batcher=batcher,
+            read_only=True,
+            session=session,
+            value=value,
+        )
         self._name = name
 
     def make_value(self, value: Optional[str] = None) -> str:
@@ -21,6 +21,7 @@ class ConfigurationParameter(Parameter[Configuration]):
         c["bucket_key_prefix"] = c.get("bucket_key_prefix", "")
         c["bucket_name_param"] = c.get("bucket_name_param", "")
         c["parameter_name_prefix"] = c.get("parameter_name_prefix", "")
+        c["regional_concurrency"] = c.get("regional_concurrency", "")
         c["regions"] = c.get("regions", default_regions)
         c["save_ok"] = c.get("save_ok", "")
 
@@ -2,6 +2,7 @@ from typing import Optional
 
 from boto3.session import Session
 
+from startifact.parameters.batcher import ParameterBatcher
 from startifact.parameters.parameter import Parameter
 
 
@@ -17,9 +18,18 @@ class LatestVersionParameter(Parameter[str]):
         read_only: bool,
         session: Session,
         prefix: Optional[str] = None,
+        batcher: Optional[ParameterBatcher] = None,
     ) -> None:
-        super().__init__(read_only=read_only, session=session)
-        self._name = f"{prefix or ''}/{project}/latest"
+        super().__init__(batcher=batcher, read_only=read_only, session=session)
+        self._name = self.make_name(project, prefix=prefix)
+
+    @staticmethod
+    def make_name(project: str, prefix: Optional[str] = None) -> str:
+        """
+        Gets the name of the parameter that holds a project's latest version.
+        """
+
+        return f"{prefix or ''}/{project}/latest"
 
     def make_value(self, value: Optional[str] = None) -> str:
         return value or self.get()
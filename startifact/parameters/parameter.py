@@ -3,6 +3,7 @@ from logging import getLogger
 from typing import Generic, Optional, TypeVar
 
 from boto3.session import Session
+from botocore.exceptions import ClientError
 
 from startifact.exceptions import (
     NotAllowedToGetParameter,
@@ -10,6 +11,7 @@ from startifact.exceptions import (
     ParameterNotFound,
     ParameterStoreError,
 )
+from startifact.parameters.batcher import ParameterBatcher
 
 TParameterValue = TypeVar("TParameterValue")
 
@@ -22,6 +24,7 @@ class Parameter(ABC, Generic[TParameterValue]):
         dry_run: Prevent writes.
         session: Boto3 session.
         value: Warm cache value.
+        batcher: Optional batcher to coalesce reads with.
     """
 
     def __init__(
@@ -29,7 +32,9 @@ class Parameter(ABC, Generic[TParameterValue]):
         read_only: bool,
         session: Session,
         value: Optional[TParameterValue] = None,
+        batcher: Optional[ParameterBatcher] = None,
     ) -> None:
+        self._batcher = batcher
         self._read_only = read_only
         self._logger = getLogger("startifact")
         self._session = session
@@ -86,6 +91,9 @@ class Parameter(ABC, Generic[TParameterValue]):
             response.
         """
 
+        if self._batcher:
+            return self.get_batched(self._batcher, default)
+
         ssm = self._session.client("ssm")  # pyright: reportUnknownMemberType=false
 
         region = self._session.region_name
@@ -114,6 +122,39 @@ class Parameter(ABC, Generic[TParameterValue]):
         except KeyError as ex:
             raise ParameterStoreError(self.name, f"response missed {ex}", region)
 
+    def get_batched(
+        self,
+        batcher: ParameterBatcher,
+        default: Optional[str] = None,
+    ) -> str:
+        """
+        Gets the parameter's value via a batcher.
+
+        Arguments:
+            batcher: Batcher.
+            default: Value to return if the parameter has no value.
+
+        Returns:
+            The parameter's value.
+        """
+
+        region = self._session.region_name
+
+        try:
+            value = batcher.get(self._session, self.name).result()
+
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] == "AccessDeniedException":
+                raise NotAllowedToGetParameter(self.name, region)
+            raise ex
+
+        if value is None:
+            if default is None:
+                raise ParameterNotFound(self.name, region)
+            return default
+
+        return value
+
     @abstractmethod
     def make_value(self, value: Optional[str] = None) -> TParameterValue:
         """
@@ -0,0 +1,222 @@
+import os
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from logging import getLogger
+from os import SEEK_SET, replace
+from pathlib import Path
+from secrets import token_hex
+from threading import Lock
+from typing import IO, Any, Callable, Iterator, List, Optional
+
+from startifact.constants import DOWNLOAD_CHUNK_SIZE
+from startifact.multipart_upload import make_part_ranges
+
+# Windows has no positional writes.
+pwrite: Optional[Callable[[int, memoryview, int], int]] = getattr(os, "pwrite", None)
+
+
+@contextmanager
+def open_preallocated(path: Path, size: int) -> Iterator[IO[bytes]]:
+    """
+    Opens a preallocated temporary file beside a path to download into.
+
+    The temporary file is moved onto the path only if the block succeeds, so
+    readers never see a partial download and a failed download never deletes
+    whatever was already at the path. The temporary file is deleted on failure.
+
+    :param path: Path to download to.
+    :param size: Size to preallocate in bytes.
+    """
+
+    temporary = path.with_name(f".{path.name}.{token_hex(4)}.part")
+
+    try:
+        with open(temporary, "xb") as f:
+            f.truncate(size)
+            yield f
+
+        replace(temporary, path)
+
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+def write_at(f: IO[bytes], data: bytes, offset: int, seek_lock: Lock) -> None:
+    """
+    Writes data at an offset in a file without moving any other writer's
+    position.
+
+    :param f: File.
+    :param data: Data to write.
+    :param offset: Offset to write at.
+    :param seek_lock:
+        Lock shared by every writer to the file. Only used where positional
+        writes aren't available.
+    """
+
+    if pwrite:
+        view = memoryview(data)
+        while view:
+            written = pwrite(f.fileno(), view, offset)
+            view = view[written:]
+            offset += written
+        return
+
+    with seek_lock:
+        f.seek(offset, SEEK_SET)
+        f.write(data)
+
+
+class RangedDownload:
+    """
+    Downloads an object from Amazon S3 in concurrent byte ranges.
+
+    The file is preallocated then each range is written directly to its offset,
+    so ranges can arrive in any order without being buffered. Every range is
+    requested with the object's ETag so that a concurrent overwrite fails the
+    download rather than mixing two versions.
+
+    Ranges are written into a temporary file beside the path, which is moved
+    into place only once every range has been downloaded. If any range fails
+    then the temporary file is deleted and the path is left untouched.
+
+    :param bucket: Bucket name.
+    :param client: Boto3 S3 client.
+    :param concurrency: Maximum number of ranges to download at the same time.
+    :param key: Object key.
+    :param part_size: Range size in bytes.
+    :param path: Path to download to.
+    :param region: Region, for logging.
+    :param etag: Object's ETag, if already known.
+    :param size:
+        Object's size in bytes, if already known. Defaults to asking Amazon S3
+        for the size and ETag.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        client: Any,
+        concurrency: int,
+        key: str,
+        part_size: int,
+        path: Path,
+        region: str,
+        etag: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> None:
+
+        self._bucket = bucket
+        self._client = client
+        self._concurrency = max(1, concurrency)
+        self._etag = etag
+        self._key = key
+        self._logger = getLogger("startifact")
+        self._part_size = max(1, part_size)
+        self._path = path
+        self._region = region
+        self._size = size
+
+        # Only needed where positional writes aren't available.
+        self._seek_lock = Lock()
+
+    def download(self) -> None:
+        """
+        Performs the download.
+        """
+
+        size = self._size
+        etag = self._etag
+
+        if size is None:
+            head = self._client.head_object(Bucket=self._bucket, Key=self._key)
+            size = int(head["ContentLength"])
+            etag = head.get("ETag", None)
+
+        with open_preallocated(self._path, size) as f:
+            self.download_parts(f, size, etag)
+
+    def download_part(
+        self,
+        f: IO[bytes],
+        offset: int,
+        length: int,
+        etag: Optional[str],
+    ) -> None:
+        """
+        Downloads a single range and writes it to its offset in the file.
+        """
+
+        self._logger.debug(
+            "Downloading bytes %s-%s of s3:/%s/%s in %s…",
+            offset,
+            offset + length - 1,
+            self._bucket,
+            self._key,
+            self._region,
+        )
+
+        kwargs = {"IfMatch": etag} if etag else {}
+
+        response = self._client.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range=f"bytes={offset}-{offset + length - 1}",
+            **kwargs,
+        )
+
+        body = response["Body"]
+        position = offset
+
+        try:
+            for chunk in iter(lambda: body.read(DOWNLOAD_CHUNK_SIZE), b""):
+                self.write(f, chunk, position)
+                position += len(chunk)
+        finally:
+            body.close()
+
+        if position != offset + length:
+            raise Exception(
+                f"Expected {length} bytes from offset {offset} but received "
+                + f"{position - offset}"
+            )
+
+    def download_parts(self, f: IO[bytes], size: int, etag: Optional[str]) -> None:
+        """
+        Downloads every range of the object.
+
+        :raises Exception: the first exception raised by any range download.
+        """
+
+        ranges = make_part_ranges(size, self._part_size)
+
+        self._logger.debug(
+            "Downloading %s ranges of s3:/%s/%s in %s with concurrency %s.",
+            len(ranges),
+            self._bucket,
+            self._key,
+            self._region,
+            self._concurrency,
+        )
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            futures: List["Future[None]"] = [
+                executor.submit(self.download_part, f, offset, length, etag)
+                for offset, length in ranges
+            ]
+
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+
+            for future in done:
+                if ex := future.exception():
+                    for p in pending:
+                        p.cancel()
+                    raise ex
+
+    def write(self, f: IO[bytes], data: bytes, offset: int) -> None:
+        """
+        Writes data at an offset in the file.
+        """
+
+        write_at(f, data, offset, self._seek_lock)
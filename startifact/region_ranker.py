@@ -0,0 +1,250 @@
+from atexit import register
+from contextlib import contextmanager
+from logging import getLogger
+from pathlib import Path
+from random import uniform
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Set
+from weakref import WeakSet
+
+from startifact.cache import locked, read_json, write_json
+
+Measurements = Dict[str, Dict[str, float]]
+
+_persisted: "WeakSet[RegionRanker]" = WeakSet()
+"""
+Live rankers that persist their measurements.
+"""
+
+
+def save_all() -> None:
+    """
+    Saves the measurements recorded by every live ranker since their last saves.
+
+    Rankers that share a file are saved together in a single write.
+    """
+
+    updates: Dict[Path, Measurements] = {}
+
+    for ranker in list(_persisted):
+        if ranker.path:
+            updates.setdefault(ranker.path, {}).update(ranker.take_updates())
+
+    for path, measurements in updates.items():
+        save_measurements(path, measurements)
+
+
+def save_measurements(path: Path, updates: Measurements) -> None:
+    """
+    Merges measurements into a file.
+
+    Measurements are merged under the shared cache lock so that concurrent
+    processes don't lose each other's measurements.
+    """
+
+    if not updates:
+        return
+
+    with locked(path):
+        loaded = read_json(path)
+        measurements = loaded if isinstance(loaded, dict) else {}
+        measurements.update(updates)
+        write_json(path, measurements)
+
+
+register(save_all)
+
+
+class RegionRanker:
+    """
+    Orders regions by their expected latency.
+
+    Every measured call updates a region's moving averages of latency and error
+    rate. Regions that have never been measured are tried first so that they
+    get measured too.
+
+    :param path:
+        Optional path to persist measurements to between sessions. Defaults to
+        keeping measurements in memory only. Measurements are saved by
+        calling :meth:`save`, and every live ranker's are saved together when
+        the process exits.
+    :param jitter:
+        Fraction by which each region's score is randomly adjusted so that
+        regions with similar latencies share the load. Defaults to 0.2.
+    :param smoothing:
+        Weight of each new measurement in the moving averages. Defaults to 0.3.
+    """
+
+    ERROR_PENALTY = 4.0
+    """
+    Multiplier applied to a region's score per unit of error rate.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        jitter: float = 0.2,
+        smoothing: float = 0.3,
+    ) -> None:
+
+        self._jitter = jitter
+        self._dirty: Set[str] = set()
+        self._lock = Lock()
+        self._logger = getLogger("startifact")
+        self._measurements: Optional[Measurements] = None
+        self._path = path
+        self._smoothing = smoothing
+
+        if path:
+            _persisted.add(self)
+
+    @staticmethod
+    def make_measurement(value: Any) -> Optional[Dict[str, float]]:
+        """
+        Makes a measurement from a saved value.
+
+        :returns: Measurement, or ``None`` if the value isn't a complete
+            measurement.
+        """
+
+        if not isinstance(value, dict):
+            return None
+
+        measurement: Dict[str, float] = {}
+
+        for key in ("error_rate", "latency"):
+            number = value.get(key, None)
+            if isinstance(number, bool) or not isinstance(number, (float, int)):
+                return None
+            measurement[key] = float(number)
+
+        return measurement
+
+    @property
+    def measurements(self) -> Measurements:
+        """
+        Gets the measurements per region.
+
+        Saved measurements that are malformed, like truncated or hand-edited
+        entries, are ignored so that their regions are treated as unmeasured.
+        """
+
+        if self._measurements is None:
+            loaded = read_json(self._path) if self._path else None
+            self._measurements = {}
+
+            if isinstance(loaded, dict):
+                for region, value in loaded.items():
+                    if (measurement := self.make_measurement(value)) is not None:
+                        self._measurements[region] = measurement
+
+        return self._measurements
+
+    @contextmanager
+    def measure(self, region: str) -> Iterator[None]:
+        """
+        Measures a call to a region.
+
+        The call is recorded as an error if it raises an exception. Calls that
+        are cancelled, like hedged calls that lost the race, aren't recorded
+        at all since they say nothing about the region's health.
+
+        :param region: Region.
+        """
+
+        start = perf_counter()
+
+        try:
+            yield
+        except Exception:
+            self.record(region, perf_counter() - start, ok=False)
+            raise
+
+        self.record(region, perf_counter() - start, ok=True)
+
+    def rank(self, regions: List[str]) -> List[str]:
+        """
+        Orders regions from the lowest to highest expected latency.
+
+        :param regions: Regions.
+        :returns: Ordered copy of the regions.
+        """
+
+        with self._lock:
+            scores = {r: self.score(r) for r in regions}
+
+        ranked = sorted(regions, key=lambda r: scores[r])
+        self._logger.debug("Ranked regions: %s", ranked)
+        return ranked
+
+    def record(self, region: str, seconds: float, ok: bool) -> None:
+        """
+        Records a call to a region.
+
+        :param region: Region.
+        :param seconds: Round-trip time.
+        :param ok: Whether the call succeeded.
+        """
+
+        self._logger.debug(
+            "%s call to %s took %0.3f seconds.",
+            "Successful" if ok else "Failed",
+            region,
+            seconds,
+        )
+
+        with self._lock:
+            error = 0.0 if ok else 1.0
+
+            if previous := self.measurements.get(region, None):
+                s = self._smoothing
+                latency = (s * seconds) + ((1 - s) * previous["latency"])
+                error_rate = (s * error) + ((1 - s) * previous["error_rate"])
+            else:
+                latency = seconds
+                error_rate = error
+
+            self.measurements[region] = {
+                "error_rate": error_rate,
+                "latency": latency,
+            }
+
+            self._dirty.add(region)
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    def save(self) -> None:
+        """
+        Saves the measurements recorded since the last save.
+        """
+
+        if self._path:
+            save_measurements(self._path, self.take_updates())
+
+    def score(self, region: str) -> float:
+        """
+        Gets a region's randomised score. Lower is better.
+
+        :param region: Region.
+        """
+
+        if not (measurement := self.measurements.get(region, None)):
+            return 0.0
+
+        latency = measurement["latency"]
+        penalty = 1 + (self.ERROR_PENALTY * measurement["error_rate"])
+        return latency * penalty * uniform(1 - self._jitter, 1 + self._jitter)
+
+    def take_updates(self) -> Measurements:
+        """
+        Takes the measurements recorded since the last save.
+        """
+
+        with self._lock:
+            updates = {r: self.measurements[r] for r in self._dirty}
+            self._dirty.clear()
+
+        return updates
@@ -1,11 +1,9 @@
 from logging import getLogger
-from multiprocessing import Queue
 
 from boto3.session import Session
 
 from startifact.parameters import ConfigurationParameter
 from startifact.regional_process import RegionalProcess
-from startifact.regional_process_result import RegionalProcessResult
 
 
 class RegionalConfigurationSaver(RegionalProcess):
@@ -17,18 +15,14 @@ class RegionalConfigurationSaver(RegionalProcess):
     def __init__(
         self,
         configuration: str,
-        queue: "Queue[RegionalProcessResult]",
         read_only: bool,
         session: Session,
     ) -> None:
         super().__init__(
-            queue=queue,
             read_only=read_only,
             session=session,
         )
 
-        # Warning! The `Process` base class has a member called "_config"!
-        # Don't clobber it!
         self._configuration = configuration
 
     def operate(self) -> None:
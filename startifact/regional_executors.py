@@ -0,0 +1,182 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from logging import getLogger
+from multiprocessing import Process, Queue
+from multiprocessing.connection import wait as wait_for_sentinels
+from queue import Empty
+from types import TracebackType
+from typing import Dict, List, Optional, Set, Type
+
+from startifact.regional_process import RegionalProcess
+from startifact.regional_process_result import RegionalProcessResult
+
+
+class RegionalExecutor(ABC):
+    """
+    Runs regional processes concurrently.
+
+    :param max_workers: Maximum number of regional processes to run at once.
+    """
+
+    SHARES_CLIENTS = False
+    """
+    ``True`` if regional processes can share Boto3 clients with the caller.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._logger = getLogger("startifact")
+        self._max_workers = max(1, max_workers)
+
+    def __enter__(self) -> "RegionalExecutor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.shutdown()
+
+    @property
+    @abstractmethod
+    def in_progress(self) -> int:
+        """
+        Gets the number of submitted processes that haven't been collected by
+        :meth:`wait` yet.
+        """
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def shutdown(self) -> None:
+        """
+        Releases any resources held by the executor.
+        """
+
+    @abstractmethod
+    def submit(self, process: RegionalProcess) -> None:
+        """
+        Submits a regional process to run as soon as a worker is available.
+        """
+
+    @abstractmethod
+    def wait(self) -> List[RegionalProcessResult]:
+        """
+        Blocks until at least one submitted process finishes.
+
+        :returns: Results of every process that has finished since the last
+        wait. Empty if no processes are in progress.
+        """
+
+
+class ThreadRegionalExecutor(RegionalExecutor):
+    """
+    Runs regional processes in a pool of threads.
+
+    Regional processes spend almost all of their time waiting on Amazon Web
+    Services, so threads are cheaper than processes and share the same Boto3
+    sessions.
+    """
+
+    SHARES_CLIENTS = True
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers)
+        self._futures: Set["Future[RegionalProcessResult]"] = set()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="startifact",
+        )
+
+    @property
+    def in_progress(self) -> int:
+        return len(self._futures)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def submit(self, process: RegionalProcess) -> None:
+        self._futures.add(self._pool.submit(process.run))
+
+    def wait(self) -> List[RegionalProcessResult]:
+        if not self._futures:
+            return []
+
+        done, self._futures = wait(self._futures, return_when=FIRST_COMPLETED)
+        return [future.result() for future in done]
+
+
+def run_and_put(
+    process: RegionalProcess,
+    queue: "Queue[RegionalProcessResult]",
+) -> None:
+    """
+    Runs a regional process and puts its result into a queue.
+    """
+
+    queue.put(process.run())
+
+
+class ProcessRegionalExecutor(RegionalExecutor):
+    """
+    Runs each regional process in its own operating system process.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        super().__init__(max_workers)
+        self._pending: List[RegionalProcess] = []
+        self._processes: Dict[str, Process] = {}
+        self._queue: "Queue[RegionalProcessResult]" = Queue()
+
+    @property
+    def in_progress(self) -> int:
+        return len(self._pending) + len(self._processes)
+
+    def start_pending(self) -> None:
+        """
+        Starts pending regional processes while there are workers available.
+        """
+
+        while self._pending and len(self._processes) < self._max_workers:
+            regional = self._pending.pop(0)
+            process = Process(target=run_and_put, args=(regional, self._queue))
+            process.start()
+            self._processes[regional.region] = process
+
+    def submit(self, process: RegionalProcess) -> None:
+        self._pending.append(process)
+        self.start_pending()
+
+    def wait(self) -> List[RegionalProcessResult]:
+        if not self._processes:
+            return []
+
+        # A process's sentinel becomes ready when the process exits. A process
+        # always flushes its result into the queue before it exits.
+        ready = wait_for_sentinels([p.sentinel for p in self._processes.values()])
+
+        results: List[RegionalProcessResult] = []
+
+        while True:
+            try:
+                results.append(self._queue.get_nowait())
+            except Empty:
+                break
+
+        for result in results:
+            if process := self._processes.pop(result.region, None):
+                process.join()
+
+        for region, process in list(self._processes.items()):
+            if process.sentinel in ready:
+                # The process exited without putting a result. It must have
+                # crashed.
+                process.join()
+                del self._processes[region]
+                error = f"Process exited with code {process.exitcode}"
+                results.append(RegionalProcessResult(region, error=error))
+
+        self.start_pending()
+        return results
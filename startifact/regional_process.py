@@ -1,25 +1,25 @@
 from logging import getLogger
-from multiprocessing import Process, Queue
-from typing import Optional, TypeVar
+from typing import Optional
 
 from boto3.session import Session
 
 from startifact.regional_process_result import RegionalProcessResult
 
-TRegionalProcessResult = TypeVar("TRegionalProcessResult")
 
+class RegionalProcess:
+    """
+    An operation to perform in a single region.
+
+    Regional processes are run concurrently by a
+    :class:`startifact.regional_executors.RegionalExecutor`.
+    """
 
-class RegionalProcess(Process):
     def __init__(
         self,
-        queue: "Queue[RegionalProcessResult]",
         read_only: bool,
         session: Session,
     ) -> None:
 
-        super().__init__()
-
-        self._queue = queue
         self._read_only = read_only
         self._session = session
 
@@ -33,7 +33,18 @@ class RegionalProcess(Process):
         msg = f"{self.__class__.__name__}.operate() not implemented."
         raise NotImplementedError(msg)
 
-    def run(self) -> None:
+    @property
+    def region(self) -> str:
+        return str(self._session.region_name)
+
+    def run(self) -> RegionalProcessResult:
+        """
+        Performs the operation.
+
+        :returns: Result. Any error raised by the operation is described by the
+        result rather than raised.
+        """
+
         error: Optional[str] = None
         logger = getLogger("startifact")
 
@@ -44,5 +55,4 @@ class RegionalProcess(Process):
             logger.exception(ex)
             error = str(ex) or ex.__class__.__name__
 
-        result = RegionalProcessResult(self._session.region_name, error=error)
-        self._queue.put(result)
+        return RegionalProcessResult(self.region, error=error)
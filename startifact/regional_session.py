@@ -0,0 +1,58 @@
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+from boto3.session import Session
+from botocore.config import Config
+
+
+class RegionalSession(Session):
+    """
+    A Boto3 session for a single region that creates each client only once.
+
+    Boto3 sessions aren't thread-safe, so clients are created under a lock.
+    The clients themselves are thread-safe and are shared between every
+    operation in the region along with their connection pools.
+
+    .. warning::
+        Don't create instances of this class directly! To get a regional
+        session, see :meth:`startifact.client_registry.ClientRegistry.session`.
+
+    :param region_name: Region.
+    :param config: Optional client configuration.
+    """
+
+    def __init__(self, region_name: str, config: Optional[Config] = None) -> None:
+        super().__init__(region_name=region_name)
+        self._clients: Dict[str, Any] = {}
+        self._config = config
+        self._lock = Lock()
+
+    def client(self, service_name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Gets a shared client.
+
+        Accepts the same arguments as :meth:`boto3.session.Session.client`.
+        Clients requested with any extra arguments are created afresh and not
+        shared.
+
+        :param service_name: Service name.
+        """
+
+        # The Boto3 stubs only overload literal service names.
+        create: Callable[..., Any] = super().client
+
+        if args or kwargs:
+            # "config" is Boto3's ninth positional argument after the name.
+            if len(args) < 9:
+                kwargs.setdefault("config", self._config)
+            with self._lock:
+                return create(service_name, *args, **kwargs)
+
+        with self._lock:
+            if service_name not in self._clients:
+                self._clients[service_name] = create(
+                    service_name,
+                    config=self._config,
+                )
+
+            return self._clients[service_name]
@@ -1,40 +1,70 @@
 from logging import getLogger
-from multiprocessing import Queue
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from boto3.session import Session
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact.artifacts import make_metadata_key
+from startifact.constants import (
+    DEFAULT_PART_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    MAX_PART_SIZE,
+    MAX_SINGLE_PUT_SIZE,
+)
+from startifact.file_hash import FileHash
+from startifact.file_source import FileSource
+from startifact.multipart_upload import MultipartUpload
 from startifact.parameters import LatestVersionParameter
 from startifact.regional_process import RegionalProcess
-from startifact.regional_process_result import RegionalProcessResult
 from startifact.s3 import exists
+from startifact.version_index import VersionIndex
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3.type_defs import CopySourceTypeDef
 
 
 class RegionalStager(RegionalProcess):
     """
     :param bucket: Name of the artifacts bucket in this region.
+    :param file_hash:
+        Hash of the artifact, shared between regions and calculated only if
+        the artifact is uploaded in a single request.
+    :param object_metadata:
+        Optional user-defined metadata to store on the artifact object.
+    :param part_concurrency: Maximum number of parts to upload at the same time.
+    :param part_size:
+        Upload the artifact in parts of this size (in bytes) if it's larger.
+        Artifacts too large for a single upload are always uploaded in parts.
+    :param source_bucket:
+        Optional name of a bucket in another region that already holds the
+        artifact. If set, the artifact is copied from that bucket server-side
+        rather than uploaded from the local file.
+    :param version_index:
+        Optional :class:`startifact.version_index.VersionIndex` to add the
+        version to. Defaults to not indexing the version.
     """
 
     def __init__(
         self,
         bucket: str,
-        file_hash: str,
+        file_hash: FileHash,
         key: str,
         latest_version_parameter: LatestVersionParameter,
         path: Path,
-        queue: "Queue[RegionalProcessResult]",
         read_only: bool,
         session: Session,
         version: VersionInfo,
         metadata: Optional[bytes] = None,
         metadata_hash: Optional[str] = None,
+        object_metadata: Optional[Dict[str, str]] = None,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        part_size: Optional[int] = None,
+        source_bucket: Optional[str] = None,
+        version_index: Optional[VersionIndex] = None,
     ) -> None:
 
         super().__init__(
-            queue=queue,
             read_only=read_only,
             session=session,
         )
@@ -46,8 +76,13 @@ class RegionalStager(RegionalProcess):
         self._metadata = metadata
         self._metadata_hash = metadata_hash
         self._metadata_key = make_metadata_key(key)
+        self._object_metadata = object_metadata
+        self._part_concurrency = part_concurrency
+        self._part_size = part_size
         self._path = path.as_posix()
+        self._source_bucket = source_bucket
         self._version = version
+        self._version_index = version_index
 
     def assert_not_exists(self) -> None:
         """
@@ -62,20 +97,115 @@ class RegionalStager(RegionalProcess):
     def bucket(self) -> str:
         return self._bucket
 
+    def copy_object(self, source_bucket: str) -> None:
+        """
+        Copies the artifact from another region's bucket server-side.
+
+        :param source_bucket: Name of the bucket to copy from.
+        """
+
+        logger = getLogger("startifact")
+        copy_source: "CopySourceTypeDef" = {"Bucket": source_bucket, "Key": self._key}
+        what = (
+            f"s3:/{source_bucket}/{self._key} to s3:/{self._bucket}/{self._key} "
+            + f"in {self._session.region_name}"
+        )
+
+        if self._read_only:
+            logger.debug("Would copy %s now.", what)
+            return
+
+        s3 = self._session.client("s3")  # pyright: reportUnknownMemberType=false
+
+        if Path(self._path).stat().st_size > MAX_SINGLE_PUT_SIZE:
+            part_size = self._part_size or DEFAULT_PART_SIZE
+            logger.debug("Copying %s in parts of %s bytes…", what, part_size)
+
+            MultipartUpload(
+                bucket=self._bucket,
+                client=s3,
+                concurrency=self._part_concurrency,
+                copy_source=copy_source,
+                key=self._key,
+                metadata=self._object_metadata,
+                part_size=part_size,
+                path=Path(self._path),
+                region=self._session.region_name,
+            ).upload()
+
+        else:
+            logger.debug("Copying %s…", what)
+            s3.copy_object(Bucket=self._bucket, CopySource=copy_source, Key=self._key)
+
+        logger.debug("Successfully copied %s!", what)
+
     @property
-    def file_hash(self) -> str:
+    def file_hash(self) -> FileHash:
         return self._file_hash
 
     @property
     def key(self) -> str:
         return self._key
 
+    @property
+    def multipart_part_size(self) -> Optional[int]:
+        """
+        Gets the part size to upload the artifact with, or ``None`` if the
+        artifact should be uploaded in a single request.
+        """
+
+        size = Path(self._path).stat().st_size
+        part_size = self._part_size
+
+        if part_size is not None:
+            # Amazon S3 won't accept a part larger than this.
+            part_size = min(part_size, MAX_PART_SIZE)
+
+            if size > part_size:
+                return part_size
+
+        if size > MAX_SINGLE_PUT_SIZE:
+            return part_size or DEFAULT_PART_SIZE
+
+        return None
+
+    @property
+    def object_metadata(self) -> Optional[Dict[str, str]]:
+        return self._object_metadata
+
     def operate(self) -> None:
         self.assert_not_exists()
-        self.put_object()
+
+        if self._source_bucket:
+            self.copy_object(self._source_bucket)
+        else:
+            self.put_object()
+
         self.put_metadata()
+        self.put_index()
         self._latest_version_parameter.put(str(self._version))
 
+    def put_index(self) -> None:
+        """
+        Adds the version to the project's version index.
+
+        The artifact is usable without the index, so failing to update the
+        index is reported but doesn't fail the stage.
+        """
+
+        if not self._version_index:
+            return
+
+        try:
+            self._version_index.add(self._version)
+        except Exception as ex:
+            getLogger("startifact").warning(
+                "Failed to add %s to the version index in %s: %s",
+                self._version,
+                self._session.region_name,
+                ex,
+            )
+
     def put_metadata(self) -> None:
         """
         Uploads the metadata.
@@ -107,19 +237,50 @@ class RegionalStager(RegionalProcess):
             + f"in {self._session.region_name}"
         )
 
-        with open(self._path, "rb") as f:
-            if self._read_only:
-                logger.debug("Verifying %s is readable...", self._path)
-                f.read()
-                return
+        if not self._read_only and (part_size := self.multipart_part_size):
+            logger.debug("Uploading %s in parts of %s bytes…", what, part_size)
+
+            MultipartUpload(
+                bucket=self._bucket,
+                client=self._session.client("s3"),
+                concurrency=self._part_concurrency,
+                key=self._key,
+                metadata=self._object_metadata,
+                part_size=part_size,
+                path=Path(self._path),
+                region=self._session.region_name,
+            ).upload()
 
+            logger.debug("Successfully uploaded %s!", what)
+            return
+
+        if self._read_only:
+            logger.debug("Verifying %s is readable...", self._path)
+            FileSource(Path(self._path)).assert_readable()
+            return
+
+        with open(self._path, "rb") as f:
             logger.debug("Uploading %s…", what)
 
+            kwargs: Dict[str, Any] = {}
+
+            if self._object_metadata:
+                kwargs["Metadata"] = self._object_metadata
+
             self._session.client("s3").put_object(
                 Body=f,
                 Bucket=self._bucket,
-                ContentMD5=self._file_hash,
+                ContentMD5=self._file_hash.b64_md5,
                 Key=self._key,
+                **kwargs,
             )
 
             logger.debug("Successfully uploaded %s!", what)
+
+    @property
+    def source_bucket(self) -> Optional[str]:
+        return self._source_bucket
+
+    @property
+    def version_index(self) -> Optional[VersionIndex]:
+        return self._version_index
@@ -0,0 +1,202 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from startifact.hedge import hedge
+
+if TYPE_CHECKING:
+    from startifact.artifact import Artifact
+
+
+class ResolutionPlan:
+    """
+    Resolves everything an operation needs to know about an artifact in a
+    single concurrent pass.
+
+    Every region's bucket name is looked up while the artifact's version is
+    read. Each region is then asked whether it holds the artifact and for its
+    metadata as soon as that region's bucket name is known, and the first
+    region to answer every question wins.
+
+    Anything that can't be resolved this way is resolved again on demand by
+    the artifact's downloader and loaders, which report any failures as usual.
+
+    :param artifact: Artifact to resolve.
+    :param download: Discover a region to download the artifact from.
+    :param metadata: Load the artifact's metadata.
+    """
+
+    def __init__(
+        self,
+        artifact: "Artifact",
+        download: bool = False,
+        metadata: bool = False,
+    ) -> None:
+
+        self._artifact = artifact
+        self._buckets: Dict[str, "Future[str]"] = {}
+        self._download = download
+        self._lock = Lock()
+        self._logger = getLogger("startifact")
+        self._metadata = metadata
+        self._resolved_region: Optional[str] = None
+
+    def get_bucket(self, region: str) -> str:
+        """
+        Gets the name of the bucket in a region.
+
+        :param region: Region.
+        :returns: Bucket name.
+        """
+
+        session = self._artifact.clients.session(region)
+        return self._artifact.bucket_names.get(session)
+
+    def resolve(self) -> Optional[str]:
+        """
+        Resolves the artifact.
+
+        If no region returns the metadata but any region claims that there is
+        none, then the metadata is resolved as empty.
+
+        :returns: Region that answered every question, or ``None`` if the
+            artifact's version was all that needed resolving or no region
+            could answer everything.
+        """
+
+        if self._resolved_region:
+            return self._resolved_region
+
+        artifact = self._artifact
+        regions = artifact.region_ranker.rank(artifact.regions)
+
+        lookups = ThreadPoolExecutor(
+            max_workers=max(1, len(regions)),
+            thread_name_prefix="startifact",
+        )
+
+        try:
+            if self._download or self._metadata:
+                # Bucket names don't depend on the version, so look them up
+                # while the version is read.
+                for region in regions:
+                    self._buckets[region] = lookups.submit(self.get_bucket, region)
+
+            version = artifact.version
+            self._logger.debug("Resolved %s at %s.", artifact.project, version)
+
+            if not self.required:
+                return None
+
+            resolved = hedge(
+                self.resolve_in,
+                regions,
+                bool,
+                concurrency=artifact.concurrency,
+                delay=artifact.hedge_delay,
+            )
+
+            if resolved:
+                return self._resolved_region
+
+            # Every region has answered, so come to the same conclusion as the
+            # metadata loader would rather than have it ask them all again.
+            loader = artifact.metadata_loader
+            if self._metadata and not loader.is_loaded:
+                if loader.any_regions_claim_no_metadata:
+                    loader.use_metadata({})
+
+        finally:
+            # Lookups are left to run since every region's bucket name is
+            # worth caching.
+            lookups.shutdown(wait=False)
+
+        self._logger.debug("No region resolved all of %s.", artifact.key)
+        return None
+
+    def resolve_in(self, region: str) -> bool:
+        """
+        Resolves the artifact in a region.
+
+        The region's findings are taken only if no other region has already
+        resolved the artifact. A region that holds the artifact but claims that
+        it has no metadata resolves the metadata as empty. A region that holds
+        the artifact but fails to answer for its metadata still resolves the
+        artifact's location.
+
+        :param region: Region.
+        :returns: ``True`` if the artifact was resolved.
+        """
+
+        artifact = self._artifact
+        location: Optional[Tuple[str, str]] = None
+
+        self._logger.debug("Resolving %s in %s…", artifact.key, region)
+
+        try:
+            if (bucket := self._buckets.get(region, None)) is not None:
+                bucket.result()
+
+            if self._download:
+                location = artifact.downloader.discover_in(region)
+                if location is None:
+                    return False
+
+            metadata: Optional[Dict[str, str]] = None
+
+            if self._metadata and not artifact.metadata_loader.is_loaded:
+                session = artifact.clients.session(region)
+                metadata = artifact.metadata_loader.get(session)
+
+                if metadata is None:
+                    if location is None:
+                        # Without the artifact, the claim could just mean the
+                        # region hasn't been staged to.
+                        return False
+
+                    metadata = {}
+
+        except Exception as ex:
+            self._logger.warning("Failed to resolve in %s: %s", region, ex)
+            self.seed(location)
+            return False
+
+        with self._lock:
+            if self._resolved_region:
+                return True
+
+            if location is not None:
+                artifact.downloader.use_location(*location)
+
+            if metadata is not None:
+                artifact.metadata_loader.use_metadata(metadata)
+
+            self._resolved_region = region
+
+        return True
+
+    @property
+    def required(self) -> bool:
+        """
+        Checks if any regional resolution is still required.
+        """
+
+        if self._download and not self._artifact.downloader.is_located:
+            return True
+
+        return self._metadata and not self._artifact.metadata_loader.is_loaded
+
+    def seed(self, location: Optional[Tuple[str, str]]) -> None:
+        """
+        Seeds the downloader with a location if no location is known yet.
+
+        :param location: Bucket and region, if discovered.
+        """
+
+        if location is None:
+            return
+
+        with self._lock:
+            if not self._artifact.downloader.is_located:
+                self._artifact.downloader.use_location(*location)
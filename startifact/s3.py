@@ -1,6 +1,8 @@
 from logging import getLogger
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 from boto3.session import Session
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact.exceptions import CannotDiscoverExistence
 
@@ -8,6 +10,19 @@ logger = getLogger("startifact")
 
 
 def exists(bucket: str, key: str, session: Session) -> bool:
+    return head(bucket, key, session) is not None
+
+
+def head(bucket: str, key: str, session: Session) -> Optional[Dict[str, Any]]:
+    """
+    Describes an object.
+
+    :returns: The object's ``HeadObject`` response, or ``None`` if the object
+    does not exist.
+    :raises CannotDiscoverExistence: if the object's existence can't be
+    determined.
+    """
+
     logger.debug(
         "Checking if s3:/%s/%s exists in %s...",
         bucket,
@@ -19,14 +34,16 @@ def exists(bucket: str, key: str, session: Session) -> bool:
 
     try:
         try:
-            s3.head_object(Bucket=bucket, Key=key)
+            # Callers read the response as a plain dictionary, like the
+            # cached and ranged download paths that reuse it.
+            response = cast(Dict[str, Any], s3.head_object(Bucket=bucket, Key=key))
             logger.debug(
                 "s3:/%s/%s does exists in %s.",
                 bucket,
                 key,
                 session.region_name,
             )
-            return True
+            return response
 
         except s3.exceptions.ClientError as ex:
             if ex.response["Error"]["Code"] == "404":
@@ -36,7 +53,7 @@ def exists(bucket: str, key: str, session: Session) -> bool:
                     key,
                     session.region_name,
                 )
-                return False
+                return None
             raise ex
 
     except Exception as ex:
@@ -47,3 +64,79 @@ def exists(bucket: str, key: str, session: Session) -> bool:
             region=session.region_name,
             msg=f"({ex.__class__.__name__}) {ex}",
         )
+
+
+def list_version_groups(
+    bucket: str,
+    prefix: str,
+    session: Session,
+    version_prefix: str = "",
+) -> List[int]:
+    """
+    Lists the next numbers of the versions of a project's artifacts in a
+    bucket.
+
+    For example, lists the major versions if ``version_prefix`` is empty, or
+    the minor versions of 1.x if ``version_prefix`` is ``1.``.
+
+    :param prefix: Key prefix shared by every version, like ``SugarWater@``.
+    :param version_prefix: Optional start of the versions, like ``1.``.
+    :returns: Numbers, lowest first.
+    """
+
+    s3 = session.client("s3")  # pyright: reportUnknownMemberType=false
+    paginator = s3.get_paginator("list_objects_v2")
+    group_prefix = prefix + version_prefix
+    numbers: List[int] = []
+
+    start = len(group_prefix)
+
+    for page in paginator.paginate(
+        Bucket=bucket,
+        Delimiter=".",
+        Prefix=group_prefix,
+    ):
+        for common in page.get("CommonPrefixes", []):
+            number = common["Prefix"][start:-1]
+
+            # Versions with leading zeros aren't valid.
+            if number.isdigit() and (number == "0" or number[0] != "0"):
+                numbers.append(int(number))
+
+    return sorted(numbers)
+
+
+def list_versions(
+    bucket: str,
+    prefix: str,
+    session: Session,
+    version_prefix: str = "",
+) -> Iterator[VersionInfo]:
+    """
+    Lists the versions of a project's artifacts in a bucket.
+
+    Lists one page of keys at a time, so versions are yielded as soon as each
+    page arrives. Keys that aren't artifacts, like metadata, are ignored.
+
+    :param prefix: Key prefix shared by every version, like ``SugarWater@``.
+    :param version_prefix:
+        Optional start of the versions to list, like ``1.2.``. Defaults to
+        every version.
+    """
+
+    s3 = session.client("s3")  # pyright: reportUnknownMemberType=false
+    paginator = s3.get_paginator("list_objects_v2")
+    start = len(prefix)
+
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix + version_prefix):
+        for content in page.get("Contents", []):
+            suffix = content["Key"][start:]
+
+            if "/" in suffix:
+                continue
+
+            try:
+                # pyright: reportUnknownMemberType=false
+                yield VersionInfo.parse(suffix)
+            except ValueError:
+                logger.debug("Ignoring s3:/%s/%s.", bucket, content["Key"])
@@ -1,60 +1,184 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
 from json import dumps
 from logging import getLogger
 from pathlib import Path
 from re import match
 from sys import stdout
-from typing import IO, Dict, List, Optional
+from typing import IO, Dict, Iterator, List, Optional, Type, Union
 
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact.artifact import Artifact
-from startifact.artifacts import make_key
+from startifact.artifact_cache import ArtifactCache
+from startifact.artifacts import (
+    make_index_key,
+    make_key,
+    make_object_metadata,
+    make_versions_prefix,
+)
 from startifact.bucket_names import BucketNames
+from startifact.cache import get_cache_dir
+from startifact.client_registry import ClientRegistry
+from startifact.configuration_cache import ConfigurationCache
 from startifact.configuration_loader import ConfigurationLoader
-from startifact.exceptions import CannotStageArtifact, NoConfiguration, ProjectNameError
+from startifact.constants import (
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_MANIFEST_CONCURRENCY,
+    DEFAULT_PART_CONCURRENCY,
+    DELIVERED_EMOJI,
+)
+from startifact.exceptions import (
+    CannotDownloadArtifacts,
+    CannotStageArtifact,
+    NoConfiguration,
+    NoMatchingVersion,
+    ProjectNameError,
+)
+from startifact.file_hash import FileHash
 from startifact.hash import get_b64_md5
+from startifact.latest_version_loader import LatestVersionLoader
+from startifact.manifest import parse_manifest_key
+from startifact.parameters import ParameterBatcher
+from startifact.region_ranker import RegionRanker
+from startifact.regional_executors import RegionalExecutor, ThreadRegionalExecutor
 from startifact.regions import get_regions
 from startifact.stager import Stager
+from startifact.version_index_loader import VersionIndexLoader
+from startifact.version_lister import VersionLister
+from startifact.version_presence import VersionPresence
+from startifact.version_range import VersionRange
 
 
 class Session:
     """
     A Startifact session.
 
+    :param artifact_cache:
+        :class:`startifact.artifact_cache.ArtifactCache` to restore
+        previously-downloaded artifacts from. Defaults to always downloading.
+
     :param bucket_names:
         :class:`BucketNames` cache to use during this session. Defaults to a new
         cache.
 
+    :param clients:
+        :class:`startifact.client_registry.ClientRegistry` to share Boto3
+        clients and their connection pools through. Pass your own to configure
+        the pool size and keep-alive. Defaults to a new registry.
+
+    :param configuration_cache:
+        :class:`startifact.configuration_cache.ConfigurationCache` to cache the
+        organisation configuration in between sessions. Defaults to
+        ``configuration.json`` in the cache directory.
+
     :param configuration_loader:
         :class:`ConfigurationLoader` to use during this session. Defaults to a
         new loader.
 
+    :param hedge_delay:
+        Seconds to wait for a region to answer before also asking the next
+        region where an artifact can be downloaded from, or for its metadata.
+        Defaults to half a second.
+
+    :param metadata_headers:
+        Also store small metadata as user-defined metadata on each staged
+        artifact object, so that downloads can read it from the same request
+        that finds the artifact. Metadata too large for user-defined metadata
+        is stored only in its own object, as always. Defaults to ``False``.
+
     :param out: Output writer. Defaults to ``stdout``.
 
+    :param parameter_batcher:
+        :class:`startifact.parameters.ParameterBatcher` to coalesce concurrent
+        Systems Manager reads with. Requires ``ssm:GetParameters``. Defaults to
+        reading each parameter alone, except in :meth:`get_latest_versions`.
+
+    :param part_concurrency:
+        Maximum number of parts to upload at the same time to each region during
+        a multipart upload, and to download at the same time.
+
+    :param part_size:
+        Stage artifacts larger than this size (in bytes) via multipart uploads,
+        and download artifacts in byte ranges of this size. Defaults to
+        multipart uploads only for artifacts too large for a single upload, and
+        downloads in 64 MiB ranges.
+
     :param read_only:
         Prevents the session writing to Amazon Web Services. Defaults to
         allowing writes.
 
+    :param replicate:
+        Upload artifacts to only the first healthy region then copy them
+        server-side to the remaining regions. Defaults to uploading to every
+        region.
+
+    :param region_ranker:
+        :class:`startifact.region_ranker.RegionRanker` to order regions by
+        latency with. Defaults to a ranker that remembers measurements between
+        sessions in ``regions.json`` in the cache directory.
+
+    :param regional_concurrency:
+        Maximum number of regions to operate in at the same time. Defaults to
+        the organisation configuration, or every region at once if that's not
+        set.
+
+    :param regional_executor:
+        Type of executor to run regional operations with. Defaults to
+        :class:`startifact.regional_executors.ThreadRegionalExecutor`. Pass
+        :class:`startifact.regional_executors.ProcessRegionalExecutor` to run
+        each region in its own process.
+
     :param regions:
         Regions to operate in. Defaults to reading your ``STARTIFACT_REGIONS``
         environment variable.
+
+    :param stripe_downloads:
+        Download different byte ranges from every region that holds an artifact
+        at the same time. Defaults to downloading from one region.
     """
 
     def __init__(
         self,
+        artifact_cache: Optional[ArtifactCache] = None,
         bucket_names: Optional[BucketNames] = None,
+        clients: Optional[ClientRegistry] = None,
+        configuration_cache: Optional[ConfigurationCache] = None,
         configuration_loader: Optional[ConfigurationLoader] = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        metadata_headers: bool = False,
         out: Optional[IO[str]] = None,
+        parameter_batcher: Optional[ParameterBatcher] = None,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        part_size: Optional[int] = None,
         read_only: bool = False,
+        region_ranker: Optional[RegionRanker] = None,
+        regional_concurrency: Optional[int] = None,
+        regional_executor: Type[RegionalExecutor] = ThreadRegionalExecutor,
         regions: Optional[List[str]] = None,
+        replicate: bool = False,
+        stripe_downloads: bool = False,
     ) -> None:
 
+        self._artifact_cache = artifact_cache
         self._bucket_names = bucket_names
         self._cached_regions = regions
         self._cached_configuration_loader = configuration_loader
+        self._clients = clients
+        self._configuration_cache = configuration_cache
+        self._hedge_delay = hedge_delay
+        self._metadata_headers = metadata_headers
+        self._parameter_batcher = parameter_batcher
         self._read_only = read_only
+        self._region_ranker = region_ranker
+        self._regional_concurrency = regional_concurrency
+        self._regional_executor = regional_executor
+        self._replicate = replicate
+        self._stripe_downloads = stripe_downloads
         self._logger = getLogger("startifact")
         self._out = out or stdout
+        self._part_concurrency = part_concurrency
+        self._part_size = part_size
 
     @property
     def bucket_names(self) -> BucketNames:
@@ -69,10 +193,25 @@ class Session:
             if not param_name:
                 raise NoConfiguration("bucket_name_param")
 
-            self._bucket_names = BucketNames(param_name)
+            self._bucket_names = BucketNames(
+                param_name,
+                batcher=self._parameter_batcher,
+                path=BucketNames.make_path(),
+            )
 
         return self._bucket_names
 
+    @property
+    def clients(self) -> ClientRegistry:
+        """
+        Gets the registry of shared Boto3 clients.
+        """
+
+        if not self._clients:
+            self._clients = ClientRegistry()
+
+        return self._clients
+
     @property
     def configuration(self) -> ConfigurationLoader:
         """
@@ -81,33 +220,347 @@ class Session:
 
         if not self._cached_configuration_loader:
             self._cached_configuration_loader = ConfigurationLoader(
+                cache=self._configuration_cache or ConfigurationCache(),
+                clients=self.clients,
                 out=self._out,
+                region_ranker=self.region_ranker,
                 regions=self.regions,
             )
 
         return self._cached_configuration_loader
 
-    def get(self, project: str, version: Optional[VersionInfo] = None) -> Artifact:
+    def download_manifest(
+        self,
+        manifest: Dict[str, Path],
+        concurrency: int = DEFAULT_MANIFEST_CONCURRENCY,
+    ) -> Dict[str, VersionInfo]:
+        """
+        Downloads many artifacts.
+
+        Every latest version is resolved at once, then the artifacts are
+        downloaded concurrently. Bucket names, region measurements and the
+        configuration are shared between the downloads. Each download is
+        reported in a single line as it finishes, and a failed download doesn't
+        stop the others.
+
+        For example:
+
+        .. code-block:: python
+
+            from pathlib import Path
+            from startifact import Session
+
+            session = Session()
+            session.download_manifest(
+                {
+                    "SugarWater@1.0.9000": Path("sugar.tar.gz"),
+                    "Tea": Path("tea.zip"),
+                }
+            )
+
+        :param manifest: Path to download to per ``project[@version]``.
+        :param concurrency: Maximum number of artifacts to download at the same
+            time. Defaults to four.
+        :returns: Downloaded version per manifest key.
+        :raises CannotDownloadArtifacts: if any artifacts couldn't be
+            downloaded.
+        :raises ValueError: if any manifest key has an invalid version.
+        """
+
+        items = {key: parse_manifest_key(key) for key in manifest}
+
+        # Discover the bucket name parameter once rather than racing to in
+        # every download.
+        self.bucket_names
+
+        # Per-artifact output would interleave, so it's discarded in favour of
+        # the summary.
+        quiet = StringIO()
+
+        failures: Dict[str, Exception] = {}
+        versions: Dict[str, VersionInfo] = {}
+
+        latest_projects = sorted({p for p, v in items.values() if v is None})
+
+        try:
+            latest = self.get_latest_versions(latest_projects, out=quiet)
+        except Exception as ex:
+            # Each download will resolve its own latest version and report its
+            # own failure.
+            self._logger.warning("Failed to resolve every latest version: %s", ex)
+            latest = {}
+
+        def download(key: str) -> VersionInfo:
+            project, version = items[key]
+            version = version or latest.get(project, None)
+            artifact = self.get(project, version, out=quiet)
+            artifact.resolve(download=True)
+            artifact.downloader.download(manifest[key])
+            return artifact.version
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, concurrency),
+            thread_name_prefix="startifact",
+        ) as executor:
+            futures = {executor.submit(download, key): key for key in items}
+
+            for future in as_completed(futures):
+                key = futures[future]
+                path = manifest[key].as_posix()
+                progress = f"[{len(versions) + len(failures) + 1}/{len(items)}]"
+
+                try:
+                    version = future.result()
+                except Exception as ex:
+                    failures[key] = ex
+                    self._out.write(
+                        f"🔥 {progress} Failed to download {key} to {path}: {ex}\n"
+                    )
+                    continue
+
+                versions[key] = version
+                self._out.write(
+                    f"{DELIVERED_EMOJI} {progress} Downloaded {items[key][0]} "
+                    + f"{version} to {path}.\n"
+                )
+
+        self._out.write(
+            f"{DELIVERED_EMOJI} Downloaded {len(versions)} of {len(items)} "
+            + "artifact(s).\n"
+        )
+
+        if failures:
+            raise CannotDownloadArtifacts(failures)
+
+        return versions
+
+    def get(
+        self,
+        project: str,
+        version: Optional[Union[VersionInfo, str]] = None,
+        out: Optional[IO[str]] = None,
+    ) -> Artifact:
         """
         Gets an artifact.
 
+        The version can be a range like ``^2.3`` to get the highest matching
+        version. See :class:`startifact.version_range.VersionRange`.
+
         :param project: Project.
-        :param version: Version. Omit to infer the latest version.
+        :param version: Version or range. Omit to infer the latest version.
+        :param out: Output writer. Defaults to the session's writer.
         :returns: Artifact.
+        :raises NoMatchingVersion: if no version matches the range.
+        :raises ValueError: if the version range is not valid.
         """
 
+        if isinstance(version, str):
+            version = self.get_matching_version(project, version)
+
         config = self.configuration.loaded
 
         return Artifact(
+            artifact_cache=self._artifact_cache,
             bucket_names=self.bucket_names,
-            out=self._out,
+            clients=self.clients,
+            concurrency=self.regional_concurrency,
+            hedge_delay=self._hedge_delay,
+            out=out or self._out,
+            parameter_batcher=self._parameter_batcher,
             parameter_name_prefix=config["parameter_name_prefix"],
+            part_concurrency=self._part_concurrency,
+            part_size=self._part_size,
             project=project,
+            region_ranker=self.region_ranker,
             regions=self.regions,
+            stripe=self._stripe_downloads,
             bucket_key_prefix=config["bucket_key_prefix"],
             version=version,
         )
 
+    def get_latest_versions(
+        self,
+        projects: List[str],
+        out: Optional[IO[str]] = None,
+    ) -> Dict[str, VersionInfo]:
+        """
+        Gets the latest versions of many projects at once.
+
+        Every project is resolved concurrently and the Systems Manager reads
+        for each region are coalesced into ``GetParameters`` requests, which
+        requires ``ssm:GetParameters``.
+
+        For example:
+
+        .. code-block:: python
+
+            from startifact import Session
+
+            session = Session()
+            versions = session.get_latest_versions(["SugarWater", "Tea"])
+
+        :param projects: Projects.
+        :param out: Output writer. Defaults to the session's writer.
+        :returns: Latest version per project.
+        :raises NoRegionsAvailable: if any project's latest version is unknown.
+        """
+
+        batcher = self._parameter_batcher or ParameterBatcher()
+        config = self.configuration.loaded
+
+        def load(project: str) -> VersionInfo:
+            return LatestVersionLoader(
+                batcher=batcher,
+                clients=self.clients,
+                concurrency=self.regional_concurrency,
+                out=out or self._out,
+                parameter_name_prefix=config["parameter_name_prefix"],
+                project=project,
+                region_ranker=self.region_ranker,
+                regions=self.regions,
+            ).version
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(projects)),
+            thread_name_prefix="startifact",
+        ) as executor:
+            versions = list(executor.map(load, projects))
+
+        return dict(zip(projects, versions))
+
+    def get_matching_version(self, project: str, version_range: str) -> VersionInfo:
+        """
+        Gets the highest staged version of a project that matches a range.
+
+        Ranges that match only one version are returned without any requests.
+        Otherwise the project's version index is read from any available
+        region. Projects that have no index yet, like projects staged before
+        indexes were introduced, are listed instead, which requires
+        ``s3:ListBucket``.
+
+        For example:
+
+        .. code-block:: python
+
+            from startifact import Session
+
+            session = Session()
+            version = session.get_matching_version("SugarWater", "^2.3")
+
+        :param project: Project.
+        :param version_range: Range, like ``^2.3``.
+        :returns: Highest matching version.
+        :raises NoMatchingVersion: if no version matches the range.
+        :raises ValueError: if the range is not valid.
+        """
+
+        parsed = VersionRange.parse(version_range)
+
+        if (exact := parsed.exact) is not None:
+            return exact
+
+        prefix = self.configuration.loaded["bucket_key_prefix"]
+
+        loader = VersionIndexLoader(
+            bucket_names=self.bucket_names,
+            clients=self.clients,
+            concurrency=self.regional_concurrency,
+            hedge_delay=self._hedge_delay,
+            key=make_index_key(project, prefix=prefix),
+            region_ranker=self.region_ranker,
+            regions=self.regions,
+            versions_prefix=make_versions_prefix(project, prefix=prefix),
+        )
+
+        versions = loader.versions
+
+        if not loader.is_indexed:
+            self._logger.debug("%s has no version index, so listing.", project)
+
+            lister = VersionLister(
+                bucket_names=self.bucket_names,
+                clients=self.clients,
+                prefix=make_versions_prefix(project, prefix=prefix),
+                regions=self.regions,
+            )
+
+            versions = [presence.version for presence in lister.versions()]
+
+        if (version := parsed.best(versions)) is None:
+            raise NoMatchingVersion(project, version_range)
+
+        self._logger.debug("%s %s resolved to %s.", project, version_range, version)
+        return version
+
+    @property
+    def hedge_delay(self) -> float:
+        """
+        Gets the number of seconds to wait for a region to answer before also
+        asking the next region.
+        """
+
+        return self._hedge_delay
+
+    def list_versions(self, project: str) -> Iterator[VersionPresence]:
+        """
+        Lists every staged version of a project, lowest first, and the regions
+        that hold each one.
+
+        Nothing is downloaded: every region's bucket is listed at the same
+        time, and each version is yielded as soon as every region has listed
+        past it. Requires ``s3:ListBucket``.
+
+        For example, to find versions that haven't been staged everywhere:
+
+        .. code-block:: python
+
+            from startifact import Session
+
+            session = Session()
+
+            for presence in session.list_versions("SugarWater"):
+                if presence.missing:
+                    print(presence.version, "is missing from", presence.missing)
+
+        :param project: Project.
+        :returns: Versions and the regions that do and don't hold each one.
+        """
+
+        prefix = self.configuration.loaded["bucket_key_prefix"]
+
+        lister = VersionLister(
+            bucket_names=self.bucket_names,
+            clients=self.clients,
+            prefix=make_versions_prefix(project, prefix=prefix),
+            regions=self.regions,
+        )
+
+        yield from lister.versions()
+
+    @property
+    def out(self) -> IO[str]:
+        """
+        Gets the output writer.
+        """
+
+        return self._out
+
+    @property
+    def part_concurrency(self) -> int:
+        """
+        Gets the maximum number of parts to transfer at the same time.
+        """
+
+        return self._part_concurrency
+
+    @property
+    def part_size(self) -> Optional[int]:
+        """
+        Gets the size of each part to transfer, in bytes.
+        """
+
+        return self._part_size
+
     @property
     def read_only(self) -> bool:
         """
@@ -116,6 +569,30 @@ class Session:
 
         return self._read_only
 
+    @property
+    def region_ranker(self) -> RegionRanker:
+        """
+        Gets the region ranker.
+        """
+
+        if not self._region_ranker:
+            path = get_cache_dir() / "regions.json"
+            self._region_ranker = RegionRanker(path=path)
+
+        return self._region_ranker
+
+    @property
+    def regional_concurrency(self) -> int:
+        """
+        Gets the maximum number of regions to operate in at the same time.
+        """
+
+        if self._regional_concurrency:
+            return self._regional_concurrency
+
+        configured = self.configuration.loaded.get("regional_concurrency", "")
+        return int(configured) if configured else len(self.regions)
+
     @property
     def regions(self) -> List[str]:
         """
@@ -186,18 +663,34 @@ class Session:
             metadata_bytes = dumps(metadata, indent=2, sort_keys=True).encode("utf-8")
             metadata_hash = get_b64_md5(metadata_bytes)
 
+        object_metadata: Optional[Dict[str, str]] = None
+
+        if self._metadata_headers:
+            # Store empty metadata too, so that readers know not to look for a
+            # metadata object.
+            compact = dumps(metadata or {}, separators=(",", ":"), sort_keys=True)
+            object_metadata = make_object_metadata(compact.encode("utf-8"))
+
         stager = Stager(
+            bucket_key_prefix=config["bucket_key_prefix"],
             bucket_names=self.bucket_names,
-            file_hash=get_b64_md5(path),
+            clients=self.clients,
+            concurrency=self.regional_concurrency,
+            executor_type=self._regional_executor,
+            file_hash=FileHash(path),
             key=make_key(project, version, prefix=config["bucket_key_prefix"]),
             metadata=metadata_bytes,
             metadata_hash=metadata_hash,
+            object_metadata=object_metadata,
             out=self._out,
             parameter_name_prefix=config["parameter_name_prefix"],
+            part_concurrency=self._part_concurrency,
+            part_size=self._part_size,
             path=path,
             project=project,
             read_only=self.read_only,
             regions=self.regions,
+            replicate=self._replicate,
             version=version,
         )
 
@@ -1,30 +1,56 @@
 from logging import getLogger
-from multiprocessing import Queue
 from pathlib import Path
-from queue import Empty
-from typing import IO, List, Optional
+from typing import IO, Dict, List, Optional, Type
 
 from ansiscape import yellow
 from ansiscape.checks import should_emit_codes
 from boto3.session import Session
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.artifacts import make_index_key, make_versions_prefix
 from startifact.bucket_names import BucketNames
-from startifact.constants import DELIVERED_EMOJI, DELIVERING_EMOJI
+from startifact.client_registry import ClientRegistry
+from startifact.constants import (
+    DEFAULT_PART_CONCURRENCY,
+    DELIVERED_EMOJI,
+    DELIVERING_EMOJI,
+)
+from startifact.file_hash import FileHash
 from startifact.parameters.latest_version import LatestVersionParameter
+from startifact.regional_executors import RegionalExecutor, ThreadRegionalExecutor
 from startifact.regional_process_result import RegionalProcessResult
 from startifact.regional_stager import RegionalStager
+from startifact.version_index import VersionIndex
 
 
 class Stager:
     """
     Stages an artifact in as many regions as possible.
+
+    :param bucket_key_prefix:
+        Optional bucket key prefix. Every version is added to the project's
+        version index under this prefix.
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Used only when the
+        executor shares clients. Defaults to a new registry.
+    :param concurrency:
+        Maximum number of regions to stage to at the same time. Defaults to
+        every region at once.
+    :param executor_type:
+        Type of executor to run the regional stagers with. Defaults to threads.
+    :param object_metadata:
+        Optional user-defined metadata to store on the artifact object.
+    :param replicate:
+        Upload the artifact only to the first healthy region then copy it
+        server-side from there to the remaining regions. Defaults to uploading
+        to every region.
     """
 
     def __init__(
         self,
         bucket_names: BucketNames,
-        file_hash: str,
+        file_hash: FileHash,
         key: str,
         out: IO[str],
         path: Path,
@@ -32,25 +58,40 @@ class Stager:
         read_only: bool,
         regions: List[str],
         version: VersionInfo,
+        bucket_key_prefix: Optional[str] = None,
+        clients: Optional[ClientRegistry] = None,
+        concurrency: Optional[int] = None,
+        executor_type: Type[RegionalExecutor] = ThreadRegionalExecutor,
         metadata: Optional[bytes] = None,
         metadata_hash: Optional[str] = None,
+        object_metadata: Optional[Dict[str, str]] = None,
         parameter_name_prefix: Optional[str] = None,
-        queue: Optional["Queue[RegionalProcessResult]"] = None,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        part_size: Optional[int] = None,
+        replicate: bool = False,
     ) -> None:
 
         self._all_ok = True
+        self._bucket_key_prefix = bucket_key_prefix
         self._bucket_names = bucket_names
+        self._clients = clients or ClientRegistry()
+        self._executor = executor_type(max_workers=concurrency or len(regions))
         self._file_hash = file_hash
         self._key = key
         self._logger = getLogger("startifact")
         self._metadata = metadata
         self._metadata_hash = metadata_hash
+        self._object_metadata = object_metadata
         self._out = out
         self._parameter_name_prefix = parameter_name_prefix
+        self._part_concurrency = part_concurrency
+        self._part_size = part_size
         self._path = path
         self._project = project
-        self._queue: "Queue[RegionalProcessResult]" = queue or Queue(3)
         self._read_only = read_only
+        self._replicate = replicate
+        self._source_bucket: Optional[str] = None
+        self._succeeded_regions: List[str] = []
 
         # Take a copy so we can remove regions as/when they're done.
         self._regions = [*regions]
@@ -62,7 +103,7 @@ class Stager:
         self._regions_in_progress.append(session.region_name)
         regional = self.make_regional_stager(session)
         self._logger.debug("Handing off to regional stager in %s.", session.region_name)
-        regional.start()
+        self._executor.submit(regional)
 
     def make_regional_stager(self, session: Session) -> RegionalStager:
         latest_version_parameter = LatestVersionParameter(
@@ -72,20 +113,50 @@ class Stager:
             session=session,
         )
 
+        bucket = self._bucket_names.get(session)
+
+        version_index = VersionIndex(
+            bucket=bucket,
+            key=make_index_key(self._project, prefix=self._bucket_key_prefix),
+            read_only=self._read_only,
+            session=session,
+            versions_prefix=make_versions_prefix(
+                self._project,
+                prefix=self._bucket_key_prefix,
+            ),
+        )
+
         return RegionalStager(
-            bucket=self._bucket_names.get(session),
+            bucket=bucket,
             file_hash=self._file_hash,
             key=self._key,
             latest_version_parameter=latest_version_parameter,
             metadata=self.metadata,
             metadata_hash=self.metadata_hash,
+            object_metadata=self._object_metadata,
+            part_concurrency=self._part_concurrency,
+            part_size=self._part_size,
             path=self._path,
-            queue=self._queue,
             read_only=self._read_only,
             session=session,
+            source_bucket=self._source_bucket,
             version=self._version,
+            version_index=version_index,
         )
 
+    def make_session(self, region: str) -> Session:
+        """
+        Gets a Boto3 session for a region.
+
+        Forked processes mustn't share connection pools with their parent, so
+        each gets a new session.
+        """
+
+        if self._executor.SHARES_CLIENTS:
+            return self._clients.session(region)
+
+        return Session(region_name=region)
+
     @property
     def metadata(self) -> Optional[bytes]:
         return self._metadata
@@ -94,13 +165,7 @@ class Stager:
     def metadata_hash(self) -> Optional[str]:
         return self._metadata_hash
 
-    def receive_done(self) -> None:
-        try:
-            result = self._queue.get(block=True, timeout=1)
-        except Empty:
-            self._logger.debug("Not yet finished any regions in progress.")
-            return
-
+    def handle_result(self, result: RegionalProcessResult) -> None:
         self._logger.debug(
             "Removing done region %s from %s.",
             result.region,
@@ -116,9 +181,20 @@ class Stager:
             self._out.write(f"🔥 Failed to stage to {region}: {result.error}\n")
             return
 
+        self._succeeded_regions.append(result.region)
+
         note = " (not really)" if self._read_only else ""
         self._out.write(f"{DELIVERED_EMOJI} Staged{note} to {region}.\n")
 
+    def receive_done(self) -> None:
+        """
+        Blocks until at least one regional stager finishes then handles the
+        results of every finished stager.
+        """
+
+        for result in self._executor.wait():
+            self.handle_result(result)
+
     @property
     def regions_in_progress(self) -> List[str]:
         # Return a copy so the caller can't meddle in our affairs.
@@ -149,15 +225,47 @@ class Stager:
             f"Staging{note} {path_fmt} as {project_fmt} version {version_fmt}…\n"
         )
 
-        while self._regions or self._regions_in_progress:
-            if self._regions_in_progress:
+        with self._executor:
+            if self._replicate:
+                self.stage_source()
+
+            while self._regions:
+                region = self._regions.pop(0)
+                session = self.make_session(region)
+                self.enqueue(session)
+
+            while self._regions_in_progress:
                 self.receive_done()
 
-            if self._queue.full() or not self._regions:
-                continue
+        return self._all_ok
+
+    def stage_source(self) -> None:
+        """
+        Stages the artifact to the first healthy region so that the remaining
+        regions can copy it from there.
+        """
 
+        while self._regions and not self._source_bucket:
             region = self._regions.pop(0)
-            session = Session(region_name=region)
+            session = self.make_session(region)
             self.enqueue(session)
 
-        return self._all_ok
+            while self._regions_in_progress:
+                self.receive_done()
+
+            if region in self._succeeded_regions:
+                self._source_bucket = self._bucket_names.get(session)
+                self._logger.debug(
+                    "Will replicate from %s in %s.",
+                    self._source_bucket,
+                    region,
+                )
+
+    @property
+    def source_bucket(self) -> Optional[str]:
+        """
+        Gets the name of the bucket that the remaining regions will copy the
+        artifact from, if replicating.
+        """
+
+        return self._source_bucket
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import List, Optional
+
+
+@dataclass
+class Stripe:
+    """
+    A byte range of a striped download.
+
+    :param offset: Offset of the range.
+    :param length: Length of the range.
+    """
+
+    offset: int
+    length: int
+
+    done: bool = False
+    """
+    Whether the range has been completely written.
+    """
+
+    fetchers: List[str] = field(default_factory=list)
+    """
+    Regions currently fetching the range.
+    """
+
+    lock: Lock = field(default_factory=Lock, compare=False, repr=False)
+    """
+    Held while writing the range so that nothing is written after it's done.
+    """
+
+    progress: int = 0
+    """
+    Bytes written by the furthest fetcher.
+    """
+
+    started: Optional[float] = None
+    """
+    Time that the current fetch started.
+    """
@@ -0,0 +1,351 @@
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from pathlib import Path
+from threading import Condition, Lock
+from time import perf_counter
+from typing import IO, Dict, List, Optional, Set
+
+from startifact.constants import DOWNLOAD_CHUNK_SIZE
+from startifact.download_source import DownloadSource
+from startifact.multipart_upload import make_part_ranges
+from startifact.ranged_download import open_preallocated, write_at
+from startifact.stripe import Stripe
+
+
+class StripedDownload:
+    """
+    Downloads an object from several regions at once, fetching different byte
+    ranges from each.
+
+    Every region pulls the next range from a shared queue as soon as it has a
+    free connection, so faster regions naturally fetch more of the object.
+    When the queue is empty, an idle connection steals an in-flight range from
+    a slower region if its observed throughput means it'll finish sooner.
+    Whichever connection finishes the range first wins and the other is
+    abandoned.
+
+    A region that fails is dropped and its ranges are fetched by the others.
+    The download fails only if every region fails. Ranges are written into a
+    temporary file beside the path, which is moved into place only once every
+    range has been fetched, so a failed download leaves the path untouched.
+
+    :param concurrency: Maximum number of ranges to fetch from each region at the
+        same time.
+    :param key: Object key.
+    :param part_size: Range size in bytes.
+    :param path: Path to download to.
+    :param sources: Regions to download from.
+    """
+
+    STALL_GRACE = 1.0
+    """
+    Seconds to wait for a range to start arriving before it may be stolen.
+    """
+
+    STEAL_INTERVAL = 0.1
+    """
+    Seconds between an idle connection's attempts to steal a range.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        key: str,
+        part_size: int,
+        path: Path,
+        sources: List[DownloadSource],
+    ) -> None:
+
+        self._concurrency = max(1, concurrency)
+        self._condition = Condition()
+        self._errors: List[BaseException] = []
+        self._failed: Set[str] = set()
+        self._key = key
+        self._logger = getLogger("startifact")
+        self._part_size = max(1, part_size)
+        self._path = path
+        self._pending: List[Stripe] = []
+        self._remaining = 0
+        self._seek_lock = Lock()
+        self._sources = sources
+        self._sources_by_region: Dict[str, DownloadSource] = {
+            s.region: s for s in sources
+        }
+        self._stripes: List[Stripe] = []
+        self._workers = 0
+
+    def claim(self, source: DownloadSource) -> Optional[Stripe]:
+        """
+        Blocks until a range is available for a region to fetch.
+
+        :returns: Range to fetch, or ``None`` if there's nothing left to do.
+        """
+
+        with self._condition:
+            while self._remaining and source.region not in self._failed:
+                stripe = self._pending.pop(0) if self._pending else self.steal(source)
+
+                if not stripe:
+                    self._condition.wait(timeout=self.STEAL_INTERVAL)
+                    continue
+
+                stripe.fetchers.append(source.region)
+                stripe.started = stripe.started or perf_counter()
+                return stripe
+
+        return None
+
+    def download(self) -> None:
+        """
+        Performs the download.
+
+        :raises Exception: the last exception raised if the download failed.
+        """
+
+        size = self.head()
+        ranges = make_part_ranges(size, self._part_size)
+
+        self._stripes = [Stripe(offset=o, length=n) for o, n in ranges]
+        self._pending = [*self._stripes]
+        self._remaining = len(self._stripes)
+
+        self._logger.debug(
+            "Downloading %s ranges of %s from %s with concurrency %s each.",
+            len(self._stripes),
+            self._key,
+            [s.region for s in self._sources],
+            self._concurrency,
+        )
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(self._sources) * self._concurrency,
+            thread_name_prefix="startifact",
+        )
+
+        try:
+            with open_preallocated(self._path, size) as f:
+                with self._condition:
+                    for source in self._sources:
+                        for _ in range(self._concurrency):
+                            self._workers += 1
+                            executor.submit(self.work, f, source)
+
+                    while self._remaining and self._workers:
+                        self._condition.wait()
+
+                    if self._remaining:
+                        raise self._errors[-1]
+
+            self.log_throughput()
+
+        finally:
+            # Abandoned connections see that their ranges are done and leave
+            # without writing, so there's no need to wait for them.
+            executor.shutdown(wait=False)
+
+    def fetch(self, f: IO[bytes], source: DownloadSource, stripe: Stripe) -> None:
+        """
+        Fetches a range from a region and writes it to the file.
+        """
+
+        end = stripe.offset + stripe.length - 1
+        kwargs = {"IfMatch": source.etag} if source.etag else {}
+
+        response = source.client.get_object(
+            Bucket=source.bucket,
+            Key=self._key,
+            Range=f"bytes={stripe.offset}-{end}",
+            **kwargs,
+        )
+
+        body = response["Body"]
+        position = stripe.offset
+        last = perf_counter()
+
+        try:
+            while chunk := body.read(DOWNLOAD_CHUNK_SIZE):
+                with stripe.lock:
+                    if stripe.done:
+                        self._logger.debug(
+                            "Abandoning bytes %s-%s from %s.",
+                            stripe.offset,
+                            end,
+                            source.region,
+                        )
+                        return
+
+                    write_at(f, chunk, position, self._seek_lock)
+
+                position += len(chunk)
+                now = perf_counter()
+
+                with self._condition:
+                    source.received += len(chunk)
+                    source.seconds += now - last
+                    stripe.progress = max(stripe.progress, position - stripe.offset)
+
+                last = now
+
+        finally:
+            body.close()
+
+        if position != end + 1:
+            raise Exception(
+                f"Expected {stripe.length} bytes from offset {stripe.offset} "
+                + f"but received {position - stripe.offset}"
+            )
+
+        with stripe.lock:
+            if stripe.done:
+                return
+            stripe.done = True
+
+        with self._condition:
+            self._remaining -= 1
+            self._condition.notify_all()
+
+    def head(self) -> int:
+        """
+        Gets the object's size and each region's ETag. Regions that can't
+        describe the object, or describe a different size, are dropped.
+
+        Regions whose size is already known aren't asked again.
+
+        :returns: Object size.
+        :raises Exception: the last exception raised if no regions can describe
+        the object.
+        """
+
+        sizes: Dict[str, int] = {}
+
+        def head_source(source: DownloadSource) -> None:
+            try:
+                head = source.client.head_object(Bucket=source.bucket, Key=self._key)
+                source.etag = head.get("ETag", None)
+                source.size = head["ContentLength"]
+            except Exception as ex:
+                self._logger.warning("Dropping %s: %s", source.region, ex)
+                self._errors.append(ex)
+
+        unknown = [s for s in self._sources if s.size is None]
+
+        if unknown:
+            with ThreadPoolExecutor(max_workers=len(unknown)) as executor:
+                list(executor.map(head_source, unknown))
+
+        for source in self._sources:
+            if source.size is not None:
+                sizes[source.region] = source.size
+
+        if not sizes:
+            raise self._errors[-1]
+
+        size = sizes[next(s.region for s in self._sources if s.region in sizes)]
+
+        for region, other in sizes.items():
+            if other != size:
+                self._logger.warning(
+                    "Dropping %s: object is %s bytes, not %s.",
+                    region,
+                    other,
+                    size,
+                )
+
+        self._sources = [s for s in self._sources if sizes.get(s.region) == size]
+        return size
+
+    def log_throughput(self) -> None:
+        for source in self._sources:
+            self._logger.debug(
+                "Received %s bytes from %s at %s bytes/second/connection.",
+                source.received,
+                source.region,
+                source.throughput,
+            )
+
+    def steal(self, thief: DownloadSource) -> Optional[Stripe]:
+        """
+        Finds an in-flight range that a region would finish sooner than the
+        region currently fetching it. Must be called with the condition held.
+
+        :returns: Range to steal, if any.
+        """
+
+        if not (thief_throughput := thief.throughput):
+            return None
+
+        best: Optional[Stripe] = None
+        best_eta = 0.0
+        now = perf_counter()
+
+        for stripe in self._stripes:
+            if stripe.done or len(stripe.fetchers) != 1:
+                continue
+
+            if stripe.fetchers[0] == thief.region:
+                continue
+
+            elapsed = now - (stripe.started or now)
+
+            if stripe.progress:
+                rate = stripe.progress / elapsed if elapsed else None
+            else:
+                rate = self._sources_by_region[stripe.fetchers[0]].throughput
+
+            if rate:
+                eta = (stripe.length - stripe.progress) / rate
+            elif elapsed > self.STALL_GRACE:
+                eta = float("inf")
+            else:
+                continue
+
+            if stripe.length / thief_throughput < eta and eta > best_eta:
+                best = stripe
+                best_eta = eta
+
+        if best:
+            self._logger.debug(
+                "%s is stealing bytes %s-%s from %s.",
+                thief.region,
+                best.offset,
+                best.offset + best.length - 1,
+                best.fetchers[0],
+            )
+
+        return best
+
+    def work(self, f: IO[bytes], source: DownloadSource) -> None:
+        """
+        Fetches ranges from a region until there are none left or the region
+        fails.
+        """
+
+        try:
+            while stripe := self.claim(source):
+                try:
+                    self.fetch(f, source, stripe)
+
+                except Exception as ex:
+                    self._logger.warning("Dropping %s: %s", source.region, ex)
+
+                    with self._condition:
+                        self._errors.append(ex)
+                        self._failed.add(source.region)
+                        stripe.fetchers.remove(source.region)
+
+                        if not stripe.done and not stripe.fetchers:
+                            stripe.progress = 0
+                            stripe.started = None
+                            self._pending.insert(0, stripe)
+
+                        self._condition.notify_all()
+
+                    return
+
+                with self._condition:
+                    stripe.fetchers.remove(source.region)
+
+        finally:
+            with self._condition:
+                self._workers -= 1
+                self._condition.notify_all()
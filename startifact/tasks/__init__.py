@@ -1,13 +1,60 @@
-from startifact.tasks.download import DownloadTask
-from startifact.tasks.dry_run import DryRunStageTask
-from startifact.tasks.info import InfoTask
-from startifact.tasks.setup import SetupTask
-from startifact.tasks.stage import StageTask
+"""
+Command line tasks.
+
+The command line interface asks every task whether it can handle the arguments,
+so task modules import Boto3 and other heavy dependencies only when a task is
+invoked.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from startifact.tasks.download import DownloadTask
+    from startifact.tasks.dry_run import DryRunStageTask
+    from startifact.tasks.info import InfoTask
+    from startifact.tasks.invalidate_cache import InvalidateCacheTask
+    from startifact.tasks.manifest import ManifestTask
+    from startifact.tasks.setup import SetupTask
+    from startifact.tasks.stage import StageTask
+
+_modules: Dict[str, str] = {
+    "DownloadTask": "startifact.tasks.download",
+    "DryRunStageTask": "startifact.tasks.dry_run",
+    "InfoTask": "startifact.tasks.info",
+    "InvalidateCacheTask": "startifact.tasks.invalidate_cache",
+    "ManifestTask": "startifact.tasks.manifest",
+    "SetupTask": "startifact.tasks.setup",
+    "StageTask": "startifact.tasks.stage",
+}
+"""
+Module that defines each task.
+"""
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_modules})
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a task on first use.
+    """
+
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_modules[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "DownloadTask",
     "DryRunStageTask",
     "InfoTask",
+    "InvalidateCacheTask",
+    "ManifestTask",
     "SetupTask",
     "StageTask",
 ]
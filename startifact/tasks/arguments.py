@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+from cline import CannotMakeArguments, CommandLineArguments
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
-from startifact.session import Session
+from startifact.constants import DEFAULT_PART_CONCURRENCY, MIN_PART_SIZE
+
+if TYPE_CHECKING:
+    from startifact.session import Session
 
 
 @dataclass
@@ -15,8 +19,49 @@ class StageTaskArguments:
     version: VersionInfo
     log_level: str = "CRITICAL"
     metadata: Optional[Dict[str, str]] = None
+    part_concurrency: int = DEFAULT_PART_CONCURRENCY
+    part_size: Optional[int] = None
+    regional_concurrency: Optional[int] = None
+    replicate: bool = False
     save_filename: bool = False
-    session: Optional[Session] = None
+    session: Optional["Session"] = None
+
+
+def get_optional_integer(args: CommandLineArguments, arg: str) -> Optional[int]:
+    """
+    Gets an optional positive integer command line argument.
+
+    :raises CannotMakeArguments: if the value is not a positive integer.
+    """
+
+    if not args.get_string(arg, ""):
+        return None
+
+    value = args.get_integer(arg)
+    if value < 1:
+        raise CannotMakeArguments(f"{arg} must be a positive integer")
+
+    return value
+
+
+def get_part_size(args: CommandLineArguments) -> Optional[int]:
+    """
+    Gets the optional part size to upload with, in bytes.
+
+    :raises CannotMakeArguments: if the part size is smaller than Amazon S3
+    allows.
+    """
+
+    part_size_mib = get_optional_integer(args, "part_size")
+    if part_size_mib is None:
+        return None
+
+    part_size = part_size_mib * 1024 * 1024
+    if part_size < MIN_PART_SIZE:
+        min_mib = MIN_PART_SIZE // 1024 // 1024
+        raise CannotMakeArguments(f"part_size must be at least {min_mib} MiB")
+
+    return part_size
 
 
 def make_metadata(pairs: List[str]) -> Optional[Dict[str, str]]:
@@ -1,12 +1,18 @@
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import TYPE_CHECKING, Literal, Optional, Union
 
 from cline import CannotMakeArguments, CommandLineArguments, Task
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
-from startifact.session import Session
+from startifact.artifact_cache import ArtifactCache
+from startifact.cache import get_cache_dir
+from startifact.constants import DEFAULT_PART_CONCURRENCY
+from startifact.tasks.arguments import get_optional_integer
+
+if TYPE_CHECKING:
+    from startifact.session import Session
 
 
 @dataclass
@@ -17,9 +23,14 @@ class DownloadTaskArguments:
 
     path: Path
     project: str
+    cache: bool = False
     load_filename: bool = False
     log_level: str = "CRITICAL"
-    session: Optional[Session] = None
+    part_concurrency: int = DEFAULT_PART_CONCURRENCY
+    part_size: Optional[int] = None
+    regional_concurrency: Optional[int] = None
+    session: Optional["Session"] = None
+    stripe: bool = False
     version: Union[VersionInfo, Literal["latest"]] = "latest"
 
 
@@ -29,10 +40,23 @@ class DownloadTask(Task[DownloadTaskArguments]):
     """
 
     def invoke(self) -> int:
+        from startifact.session import Session
+
         getLogger("startifact").setLevel(self.args.log_level)
-        session = self.args.session or Session()
+        cache = (
+            ArtifactCache(get_cache_dir() / "artifacts") if self.args.cache else None
+        )
+
+        session = self.args.session or Session(
+            artifact_cache=cache,
+            part_concurrency=self.args.part_concurrency,
+            part_size=self.args.part_size,
+            regional_concurrency=self.args.regional_concurrency,
+            stripe_downloads=self.args.stripe,
+        )
         version = None if isinstance(self.args.version, str) else self.args.version
         artifact = session.get(project=self.args.project, version=version)
+        artifact.resolve(download=True, metadata=self.args.load_filename)
 
         artifact.downloader.download(
             self.args.path,
@@ -53,10 +77,18 @@ class DownloadTask(Task[DownloadTaskArguments]):
             except ValueError as ex:
                 raise CannotMakeArguments(str(ex))
 
+        part_concurrency = get_optional_integer(args, "part_concurrency")
+        part_size_mib = get_optional_integer(args, "part_size")
+
         return DownloadTaskArguments(
+            cache=args.get_bool("cache", False),
             load_filename=args.get_bool("filename", False),
             log_level=args.get_string("log_level", "CRITICAL").upper(),
+            part_concurrency=part_concurrency or DEFAULT_PART_CONCURRENCY,
+            part_size=part_size_mib * 1024 * 1024 if part_size_mib else None,
             path=Path(args.get_string("download")),
             project=args.get_string("project"),
+            regional_concurrency=get_optional_integer(args, "regional_concurrency"),
+            stripe=args.get_bool("stripe", False),
             version=version or "latest",
         )
@@ -4,19 +4,32 @@ from pathlib import Path
 from cline import CannotMakeArguments, CommandLineArguments, Task
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.constants import DEFAULT_PART_CONCURRENCY
 from startifact.exceptions import CannotStageArtifact, NoConfiguration
-from startifact.session import Session
-from startifact.tasks.arguments import StageTaskArguments, make_metadata
+from startifact.tasks.arguments import (
+    StageTaskArguments,
+    get_optional_integer,
+    get_part_size,
+    make_metadata,
+)
 
 
 class DryRunStageTask(Task[StageTaskArguments]):
     """Performs a staging dry-run."""
 
     def invoke(self) -> int:
+        from startifact.session import Session
+
         logger = getLogger("startifact")
         logger.setLevel(self.args.log_level)
 
-        session = self.args.session or Session(read_only=True)
+        session = self.args.session or Session(
+            part_concurrency=self.args.part_concurrency,
+            part_size=self.args.part_size,
+            regional_concurrency=self.args.regional_concurrency,
+            replicate=self.args.replicate,
+            read_only=True,
+        )
 
         if not session.read_only:
             self.out.write("🔥 Startifact was not given a read-only session.\n")
@@ -47,11 +60,17 @@ class DryRunStageTask(Task[StageTaskArguments]):
         except ValueError as ex:
             raise CannotMakeArguments(str(ex))
 
+        part_concurrency = get_optional_integer(args, "part_concurrency")
+
         return StageTaskArguments(
             log_level=args.get_string("log_level", "CRITICAL").upper(),
             metadata=make_metadata(args.get_list("metadata", [])),
+            part_concurrency=part_concurrency or DEFAULT_PART_CONCURRENCY,
+            part_size=get_part_size(args),
             path=Path(args.get_string("dry_run")),
             project=args.get_string("project"),
+            regional_concurrency=get_optional_integer(args, "regional_concurrency"),
+            replicate=args.get_bool("replicate", False),
             save_filename=args.get_bool("filename", False),
             version=version,
         )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from ansiscape import green, yellow
 from ansiscape.checks import should_emit_codes
@@ -8,7 +8,10 @@ from cline import CannotMakeArguments, CommandLineArguments, Task
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact.constants import INFO_EMOJI
-from startifact.session import Session
+from startifact.tasks.arguments import get_optional_integer
+
+if TYPE_CHECKING:
+    from startifact.session import Session
 
 
 @dataclass
@@ -19,7 +22,8 @@ class GetTaskArguments:
 
     project: str
     log_level: str = "WARNING"
-    session: Optional[Session] = None
+    regional_concurrency: Optional[int] = None
+    session: Optional["Session"] = None
     version: Optional[VersionInfo] = None
 
 
@@ -35,9 +39,15 @@ class InfoTask(Task[GetTaskArguments]):
         self.out.write("\n")
 
     def invoke(self) -> int:
+        from startifact.session import Session
+
         getLogger("startifact").setLevel(self.args.log_level)
-        session = self.args.session or Session(read_only=True)
+        session = self.args.session or Session(
+            read_only=True,
+            regional_concurrency=self.args.regional_concurrency,
+        )
         artifact = session.get(self.args.project, self.args.version)
+        artifact.resolve(metadata=True)
 
         version_str = str(artifact.version)
 
@@ -81,5 +91,6 @@ class InfoTask(Task[GetTaskArguments]):
         return GetTaskArguments(
             log_level=args.get_string("log_level", "CRITICAL").upper(),
             project=args.get_string("project"),
+            regional_concurrency=get_optional_integer(args, "regional_concurrency"),
             version=version,
         )
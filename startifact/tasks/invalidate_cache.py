@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Optional
+
+from cline import CommandLineArguments, Task
+
+from startifact.configuration_cache import ConfigurationCache
+from startifact.constants import INFO_EMOJI
+
+
+@dataclass
+class InvalidateCacheTaskArguments:
+    """
+    Cache invalidation arguments.
+    """
+
+    configuration_cache: Optional[ConfigurationCache] = None
+    log_level: str = "CRITICAL"
+
+
+class InvalidateCacheTask(Task[InvalidateCacheTaskArguments]):
+    """
+    Forgets the cached organisation configuration and bucket names.
+    """
+
+    def invoke(self) -> int:
+        from startifact.bucket_names import BucketNames
+
+        getLogger("startifact").setLevel(self.args.log_level)
+        cache = self.args.configuration_cache or ConfigurationCache()
+        cache.invalidate()
+        BucketNames.make_path().unlink(missing_ok=True)
+        self.out.write(
+            f"{INFO_EMOJI} Invalidated the cached configuration and bucket names.\n"
+        )
+        return 0
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> InvalidateCacheTaskArguments:
+        args.assert_true("invalidate_cache")
+
+        return InvalidateCacheTaskArguments(
+            log_level=args.get_string("log_level", "CRITICAL").upper(),
+        )
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from cline import CannotMakeArguments, CommandLineArguments, Task
+
+from startifact.artifact_cache import ArtifactCache
+from startifact.cache import get_cache_dir
+from startifact.constants import DEFAULT_MANIFEST_CONCURRENCY, DEFAULT_PART_CONCURRENCY
+from startifact.exceptions import CannotDownloadArtifacts
+from startifact.manifest import load_manifest
+from startifact.tasks.arguments import get_optional_integer
+
+if TYPE_CHECKING:
+    from startifact.session import Session
+
+
+@dataclass
+class ManifestTaskArguments:
+    """
+    Manifest download arguments.
+    """
+
+    path: Path
+    cache: bool = False
+    concurrency: int = DEFAULT_MANIFEST_CONCURRENCY
+    log_level: str = "CRITICAL"
+    part_concurrency: int = DEFAULT_PART_CONCURRENCY
+    part_size: Optional[int] = None
+    regional_concurrency: Optional[int] = None
+    session: Optional["Session"] = None
+    stripe: bool = False
+
+
+class ManifestTask(Task[ManifestTaskArguments]):
+    """
+    Downloads every artifact in a manifest.
+    """
+
+    def invoke(self) -> int:
+        from startifact.session import Session
+
+        getLogger("startifact").setLevel(self.args.log_level)
+
+        try:
+            manifest = load_manifest(self.args.path)
+        except Exception as ex:
+            self.out.write(f"🔥 Failed to load manifest: {ex}\n")
+            return 1
+
+        cache = (
+            ArtifactCache(get_cache_dir() / "artifacts") if self.args.cache else None
+        )
+
+        session = self.args.session or Session(
+            artifact_cache=cache,
+            out=self.out,
+            part_concurrency=self.args.part_concurrency,
+            part_size=self.args.part_size,
+            regional_concurrency=self.args.regional_concurrency,
+            stripe_downloads=self.args.stripe,
+        )
+
+        try:
+            session.download_manifest(manifest, concurrency=self.args.concurrency)
+        except (CannotDownloadArtifacts, ValueError) as ex:
+            self.out.write(f"🔥 {ex}\n")
+            return 1
+
+        return 0
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> ManifestTaskArguments:
+        manifest = args.get_string("manifest", "")
+        if not manifest:
+            raise CannotMakeArguments("manifest is required")
+
+        concurrency = get_optional_integer(args, "manifest_concurrency")
+        part_concurrency = get_optional_integer(args, "part_concurrency")
+        part_size_mib = get_optional_integer(args, "part_size")
+
+        return ManifestTaskArguments(
+            cache=args.get_bool("cache", False),
+            concurrency=concurrency or DEFAULT_MANIFEST_CONCURRENCY,
+            log_level=args.get_string("log_level", "CRITICAL").upper(),
+            part_concurrency=part_concurrency or DEFAULT_PART_CONCURRENCY,
+            part_size=part_size_mib * 1024 * 1024 if part_size_mib else None,
+            path=Path(manifest),
+            regional_concurrency=get_optional_integer(args, "regional_concurrency"),
+            stripe=args.get_bool("stripe", False),
+        )
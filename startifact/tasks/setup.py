@@ -1,19 +1,21 @@
 from dataclasses import dataclass
 from logging import getLogger
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from ansiscape import bright_yellow
-from asking import Script, State
-from asking.loaders import YamlResourceLoader
 from cline import CommandLineArguments, Task
 
 from startifact.configuration import Configuration
-from startifact.configuration_loader import ConfigurationLoader
-from startifact.configuration_saver import ConfigurationSaver
+from startifact.configuration_cache import ConfigurationCache
 from startifact.constants import CONFIG_PARAM_NAME
 from startifact.exceptions import NoRegionsAvailable
 from startifact.regions import get_regions, make_regions
 
+if TYPE_CHECKING:
+    from asking import Script, State
+
+    from startifact.configuration_loader import ConfigurationLoader
+
 
 @dataclass
 class SetupTaskArguments:
@@ -26,7 +28,8 @@ class SetupTaskArguments:
     Non-interactive directions. Intended only for testing.
     """
 
-    configuration_loader: Optional[ConfigurationLoader] = None
+    configuration_cache: Optional[ConfigurationCache] = None
+    configuration_loader: Optional["ConfigurationLoader"] = None
     log_level: str = "CRITICAL"
     regions: Optional[List[str]] = None
 
@@ -37,7 +40,10 @@ class SetupTask(Task[SetupTaskArguments]):
     """
 
     @staticmethod
-    def make_script(state: State) -> Script:
+    def make_script(state: "State") -> "Script":
+        from asking import Script
+        from asking.loaders import YamlResourceLoader
+
         return Script(
             loader=YamlResourceLoader(__package__, "setup.asking.yml"),
             state=state,
@@ -47,7 +53,9 @@ class SetupTask(Task[SetupTaskArguments]):
     def make_state(
         config: Configuration,
         directions: Optional[Configuration] = None,
-    ) -> State:
+    ) -> "State":
+        from asking import State
+
         return State(
             config,
             directions=directions,
@@ -60,6 +68,9 @@ class SetupTask(Task[SetupTaskArguments]):
         )
 
     def invoke(self) -> int:
+        from startifact.configuration_loader import ConfigurationLoader
+        from startifact.configuration_saver import ConfigurationSaver
+
         logger = getLogger("startifact")
         logger.setLevel(self.args.log_level)
 
@@ -108,6 +119,10 @@ class SetupTask(Task[SetupTaskArguments]):
 
         all_ok = saver.save()
 
+        # Even a partial save leaves the cached configuration out of date.
+        cache = self.args.configuration_cache or ConfigurationCache()
+        cache.invalidate()
+
         if not all_ok:
             self.out.write("🔥 Failed to save the configuration to every region.\n")
             self.out.write("🔥 Configuration may be inconsistent between regions.\n")
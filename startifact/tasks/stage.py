@@ -4,9 +4,14 @@ from pathlib import Path
 from cline import CannotMakeArguments, CommandLineArguments, Task
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.constants import DEFAULT_PART_CONCURRENCY
 from startifact.exceptions import CannotStageArtifact, NoConfiguration
-from startifact.session import Session
-from startifact.tasks.arguments import StageTaskArguments, make_metadata
+from startifact.tasks.arguments import (
+    StageTaskArguments,
+    get_optional_integer,
+    get_part_size,
+    make_metadata,
+)
 
 
 class StageTask(Task[StageTaskArguments]):
@@ -15,10 +20,17 @@ class StageTask(Task[StageTaskArguments]):
     """
 
     def invoke(self) -> int:
+        from startifact.session import Session
+
         getLogger("startifact").setLevel(self.args.log_level)
 
         project = self.args.project
-        session = self.args.session or Session()
+        session = self.args.session or Session(
+            part_concurrency=self.args.part_concurrency,
+            part_size=self.args.part_size,
+            regional_concurrency=self.args.regional_concurrency,
+            replicate=self.args.replicate,
+        )
         version = self.args.version
 
         try:
@@ -51,11 +63,17 @@ class StageTask(Task[StageTaskArguments]):
         except ValueError as ex:
             raise CannotMakeArguments(str(ex))
 
+        part_concurrency = get_optional_integer(args, "part_concurrency")
+
         return StageTaskArguments(
             log_level=args.get_string("log_level", "CRITICAL").upper(),
             metadata=make_metadata(args.get_list("metadata", [])),
+            part_concurrency=part_concurrency or DEFAULT_PART_CONCURRENCY,
+            part_size=get_part_size(args),
             path=Path(args.get_string("stage")),
             project=args.get_string("project"),
+            regional_concurrency=get_optional_integer(args, "regional_concurrency"),
+            replicate=args.get_bool("replicate", False),
             save_filename=args.get_bool("filename", False),
             version=version,
         )
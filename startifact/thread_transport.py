@@ -0,0 +1,127 @@
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar, cast
+
+from startifact.async_transport import AsyncTransport
+from startifact.client_registry import ClientRegistry
+from startifact.constants import DEFAULT_PART_CONCURRENCY, DEFAULT_PART_SIZE
+from startifact.exceptions import CannotDiscoverExistence
+from startifact.ranged_download import RangedDownload
+
+TResult = TypeVar("TResult")
+
+
+class ThreadTransport(AsyncTransport):
+    """
+    Runs Boto3 requests in a thread pool so that they don't block the event
+    loop.
+
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param max_workers:
+        Maximum number of requests to run at the same time. Further requests
+        wait for a free thread without blocking the event loop. Defaults to the
+        thread pool's default.
+    :param part_concurrency:
+        Maximum number of byte ranges to download at the same time.
+    :param part_size:
+        Size of each byte range to download, in bytes.
+    """
+
+    def __init__(
+        self,
+        clients: Optional[ClientRegistry] = None,
+        max_workers: Optional[int] = None,
+        part_concurrency: int = DEFAULT_PART_CONCURRENCY,
+        part_size: int = DEFAULT_PART_SIZE,
+    ) -> None:
+
+        self._clients = clients or ClientRegistry()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="startifact",
+        )
+        self._part_concurrency = part_concurrency
+        self._part_size = part_size
+
+    def client(self, service: str, region: str) -> Any:
+        """
+        Gets a shared Boto3 client.
+
+        Creating a client can read files and take a lock, so this is called
+        only from the thread pool and never on the event loop.
+        """
+
+        return self._clients.session(region).client(service)
+
+    async def download(self, region: str, bucket: str, key: str, path: Path) -> None:
+        def download() -> None:
+            RangedDownload(
+                bucket=bucket,
+                client=self.client("s3", region),
+                concurrency=self._part_concurrency,
+                key=key,
+                part_size=self._part_size,
+                path=path,
+                region=region,
+            ).download()
+
+        await self.run(download)
+
+    async def get_object(self, region: str, bucket: str, key: str) -> Optional[bytes]:
+        def get_object() -> Optional[bytes]:
+            s3 = self.client("s3", region)
+
+            try:
+                response = s3.get_object(Bucket=bucket, Key=key)
+            except s3.exceptions.NoSuchKey:
+                return None
+
+            with response["Body"] as body:
+                return cast(bytes, body.read())
+
+        return await self.run(get_object)
+
+    async def get_parameter(self, region: str, name: str) -> Optional[str]:
+        def get_parameter() -> Optional[str]:
+            ssm = self.client("ssm", region)
+
+            try:
+                response = ssm.get_parameter(Name=name)
+            except ssm.exceptions.ParameterNotFound:
+                return None
+
+            return cast(str, response["Parameter"]["Value"])
+
+        return await self.run(get_parameter)
+
+    async def head_object(
+        self,
+        region: str,
+        bucket: str,
+        key: str,
+    ) -> Optional[Dict[str, Any]]:
+        def head_object() -> Optional[Dict[str, Any]]:
+            s3 = self.client("s3", region)
+
+            try:
+                response: Dict[str, Any] = s3.head_object(Bucket=bucket, Key=key)
+                return response
+
+            except s3.exceptions.ClientError as ex:
+                if ex.response["Error"]["Code"] == "404":
+                    return None
+
+                raise CannotDiscoverExistence(
+                    bucket=bucket,
+                    key=key,
+                    region=region,
+                    msg=f"({ex.__class__.__name__}) {ex}",
+                )
+
+        return await self.run(head_object)
+
+    async def run(self, func: Callable[[], TResult]) -> TResult:
+        return await get_running_loop().run_in_executor(self._executor, func)
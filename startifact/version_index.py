@@ -0,0 +1,140 @@
+from json import dumps, loads
+from logging import getLogger
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from boto3.session import Session
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.constants import MAX_INDEX_ATTEMPTS
+from startifact.hash import get_b64_md5
+from startifact.s3 import list_versions
+
+
+class VersionIndex:
+    """
+    S3 object that lists every staged version of a project in one bucket.
+
+    The index is updated with conditional writes, so versions staged at the
+    same time are never lost. An index is created from the bucket's existing
+    artifacts the first time a version is added.
+
+    :param bucket: Bucket name.
+    :param key: Key of the index object.
+    :param read_only: Prevent writes.
+    :param session: Boto3 session.
+    :param versions_prefix:
+        Key prefix shared by every version of the project's artifact, like
+        ``SugarWater@``.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        read_only: bool,
+        session: Session,
+        versions_prefix: str,
+    ) -> None:
+
+        self._bucket = bucket
+        self._key = key
+        self._logger = getLogger("startifact")
+        self._read_only = read_only
+        self._session = session
+        self._versions_prefix = versions_prefix
+
+    def add(self, version: VersionInfo) -> None:
+        """
+        Adds a version to the index.
+
+        :param version: Version.
+        :raises Exception: if the index keeps changing while it's updated.
+        """
+
+        what = f"{version} to s3:/{self._bucket}/{self._key}"
+
+        if self._read_only:
+            self._logger.debug("Would add %s now.", what)
+            return
+
+        s3 = self._session.client("s3")  # pyright: reportUnknownMemberType=false
+
+        for _ in range(MAX_INDEX_ATTEMPTS):
+            versions, etag = self.get()
+            condition: Dict[str, Any] = {}
+
+            if etag is None:
+                self._logger.debug("Creating s3:/%s/%s…", self._bucket, self._key)
+                versions = list(
+                    list_versions(self._bucket, self._versions_prefix, self._session)
+                )
+                condition["IfNoneMatch"] = "*"
+            else:
+                condition["IfMatch"] = etag
+
+            body = self.dumps([*versions, version])
+
+            try:
+                s3.put_object(
+                    Body=body,
+                    Bucket=self._bucket,
+                    ContentMD5=get_b64_md5(body),
+                    ContentType="application/json",
+                    Key=self._key,
+                    **condition,
+                )
+
+                self._logger.debug("Added %s.", what)
+                return
+
+            except s3.exceptions.ClientError as ex:
+                code = ex.response["Error"]["Code"]
+
+                if code not in ("ConditionalRequestConflict", "PreconditionFailed"):
+                    raise
+
+                self._logger.debug("%s changed while adding %s.", self._key, version)
+
+        raise Exception(f"Failed to add {what} after {MAX_INDEX_ATTEMPTS} attempts")
+
+    @staticmethod
+    def dumps(versions: Iterable[VersionInfo]) -> bytes:
+        """
+        Encodes versions as an index.
+
+        :param versions: Versions, in any order and with any duplicates.
+        :returns: Index body.
+        """
+
+        unique = {str(v): v for v in versions}
+        ordered = [str(v) for v in sorted(unique.values())]
+        return dumps({"versions": ordered}, separators=(",", ":")).encode("utf-8")
+
+    def get(self) -> Tuple[List[VersionInfo], Optional[str]]:
+        """
+        Gets the index.
+
+        :returns: Versions in the index and the index object's ETag, or an
+            empty list and ``None`` if there's no index.
+        """
+
+        s3 = self._session.client("s3")  # pyright: reportUnknownMemberType=false
+
+        try:
+            response = s3.get_object(Bucket=self._bucket, Key=self._key)
+        except s3.exceptions.NoSuchKey:
+            return [], None
+
+        return self.loads(response["Body"].read()), response["ETag"]
+
+    @staticmethod
+    def loads(body: bytes) -> List[VersionInfo]:
+        """
+        Decodes an index.
+
+        :param body: Index body.
+        :returns: Versions, lowest first.
+        """
+
+        # pyright: reportUnknownMemberType=false
+        return [VersionInfo.parse(v) for v in loads(body)["versions"]]
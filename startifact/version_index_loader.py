@@ -0,0 +1,131 @@
+from logging import getLogger
+from typing import List, Optional
+
+from boto3.session import Session
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.bucket_names import BucketNames
+from startifact.client_registry import ClientRegistry
+from startifact.constants import DEFAULT_HEDGE_DELAY
+from startifact.exceptions import NoRegionsAvailable
+from startifact.hedge import hedge
+from startifact.region_ranker import RegionRanker
+from startifact.version_index import VersionIndex
+
+
+class VersionIndexLoader:
+    """
+    Loads a project's version index from any available region.
+
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    :param concurrency:
+        Maximum number of regions to query at the same time. Defaults to every
+        region.
+    :param hedge_delay:
+        Seconds to wait for a region to answer before also querying the next
+        region. Defaults to half a second.
+    :param region_ranker:
+        Optional :class:`startifact.region_ranker.RegionRanker` to order and
+        measure the regions with. Defaults to an in-memory ranker.
+    """
+
+    def __init__(
+        self,
+        bucket_names: BucketNames,
+        key: str,
+        regions: List[str],
+        versions_prefix: str,
+        clients: Optional[ClientRegistry] = None,
+        concurrency: Optional[int] = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        region_ranker: Optional[RegionRanker] = None,
+    ) -> None:
+
+        self._any_regions_claim_no_index = False
+        self._bucket_names = bucket_names
+        self._cached_versions: Optional[List[VersionInfo]] = None
+        self._clients = clients or ClientRegistry()
+        self._concurrency = max(1, concurrency or len(regions))
+        self._hedge_delay = hedge_delay
+        self._indexed = False
+        self._key = key
+        self._logger = getLogger("startifact")
+        self._region_ranker = region_ranker or RegionRanker()
+        self._regions = regions
+        self._versions_prefix = versions_prefix
+
+    @property
+    def is_indexed(self) -> bool:
+        """
+        Checks if the versions were read from an index. Loads the versions if
+        they haven't been loaded yet.
+
+        :raises NoRegionsAvailable: if no regions are available.
+        """
+
+        self.versions
+        return self._indexed
+
+    def operate(self, session: Session) -> Optional[List[VersionInfo]]:
+        try:
+            index = VersionIndex(
+                bucket=self._bucket_names.get(session),
+                key=self._key,
+                read_only=True,
+                session=session,
+                versions_prefix=self._versions_prefix,
+            )
+
+            with self._region_ranker.measure(session.region_name):
+                versions, etag = index.get()
+
+            if etag is None:
+                self._logger.debug("%s claims no index.", session.region_name)
+                self._any_regions_claim_no_index = True
+                return None
+
+            return versions
+
+        except Exception as ex:
+            msg = f"Failed to get version index from {session.region_name}: {ex}"
+            self._logger.warning(msg)
+            return None
+
+    @property
+    def versions(self) -> List[VersionInfo]:
+        """
+        Gets every version in the index, lowest first.
+
+        Regions are queried as :func:`startifact.hedge.hedge` describes, and
+        the first region to return the index wins.
+
+        If no region returns the index but any region claims that there is
+        none, then there are no versions and :attr:`is_indexed` is ``False``.
+
+        :raises NoRegionsAvailable: if no regions are available.
+        """
+
+        if self._cached_versions is not None:
+            return self._cached_versions
+
+        versions = hedge(
+            lambda region: self.operate(self._clients.session(region)),
+            self._region_ranker.rank(self._regions),
+            lambda v: v is not None,
+            concurrency=self._concurrency,
+            delay=self._hedge_delay,
+        )
+
+        if versions is not None:
+            self._cached_versions = versions
+            self._indexed = True
+            return self._cached_versions
+
+        if not self._any_regions_claim_no_index:
+            raise NoRegionsAvailable(self._regions)
+
+        self._logger.debug("No version index was found.")
+        self._cached_versions = []
+        return self._cached_versions
@@ -0,0 +1,171 @@
+from heapq import merge
+from logging import getLogger
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Generator, Iterator, List, Optional, Set, Tuple, Union
+
+from boto3.session import Session
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.bucket_names import BucketNames
+from startifact.client_registry import ClientRegistry
+from startifact.constants import DEFAULT_LIST_BUFFER_SIZE
+from startifact.s3 import list_version_groups, list_versions
+from startifact.version_presence import VersionPresence
+
+Listed = Union[VersionInfo, Exception, None]
+
+
+class VersionLister:
+    """
+    Lists the versions of a project that are staged in every region.
+
+    :param bucket_names: Bucket names.
+    :param prefix: Key prefix shared by every version, like ``SugarWater@``.
+    :param regions: Regions to list.
+    :param buffer_size:
+        Maximum number of versions to list ahead of the reader per region.
+    :param clients:
+        Optional :class:`startifact.client_registry.ClientRegistry` to share
+        Boto3 clients through. Defaults to a new registry.
+    """
+
+    def __init__(
+        self,
+        bucket_names: BucketNames,
+        prefix: str,
+        regions: List[str],
+        buffer_size: int = DEFAULT_LIST_BUFFER_SIZE,
+        clients: Optional[ClientRegistry] = None,
+    ) -> None:
+
+        self._bucket_names = bucket_names
+        self._buffer_size = buffer_size
+        self._clients = clients or ClientRegistry()
+        self._logger = getLogger("startifact")
+        self._prefix = prefix
+        self._regions = regions
+
+    def list_in(self, bucket: str, session: Session) -> Iterator[VersionInfo]:
+        """
+        Lists the versions in a bucket, lowest first.
+
+        S3 lists keys in lexical order, which puts 10.0.0 before 2.0.0. To
+        list in version order without reading every key first, the major and
+        minor versions are listed first, and only one minor version's keys
+        are held and sorted at a time.
+
+        :param bucket: Bucket name.
+        :param session: Boto3 session.
+        """
+
+        for major in list_version_groups(bucket, self._prefix, session):
+            for minor in list_version_groups(
+                bucket,
+                self._prefix,
+                session,
+                version_prefix=f"{major}.",
+            ):
+                yield from sorted(
+                    list_versions(
+                        bucket,
+                        self._prefix,
+                        session,
+                        version_prefix=f"{major}.{minor}.",
+                    )
+                )
+
+    def versions(self) -> Generator[VersionPresence, None, None]:
+        """
+        Lists the versions in every region, lowest first.
+
+        Every region is listed at the same time, and each version is yielded
+        as soon as every region has listed past it. Regions are never more
+        than the buffer size ahead of the reader, so any number of versions
+        can be listed without holding them all.
+
+        Regions that fail are logged and left out of every version listed
+        after the failure.
+
+        Close the generator to stop listing early.
+        """
+
+        failed: Set[str] = set()
+        stop = Event()
+
+        def put(queue: "Queue[Listed]", item: Listed) -> bool:
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce(region: str, queue: "Queue[Listed]") -> None:
+            item: Listed = None
+
+            try:
+                session = self._clients.session(region)
+                bucket = self._bucket_names.get(session)
+
+                for version in self.list_in(bucket, session):
+                    if not put(queue, version):
+                        return
+
+            except Exception as ex:
+                item = ex
+
+            put(queue, item)
+
+        def consume(region: str) -> Iterator[Tuple[VersionInfo, str]]:
+            queue: "Queue[Listed]" = Queue(maxsize=self._buffer_size)
+
+            Thread(
+                args=(region, queue),
+                daemon=True,
+                name=f"startifact-{region}",
+                target=produce,
+            ).start()
+
+            while (item := queue.get()) is not None:
+                if isinstance(item, Exception):
+                    self._logger.warning("Failed to list %s: %s", region, item)
+                    failed.add(region)
+                    return
+
+                yield item, region
+
+        presence: Optional[VersionPresence] = None
+
+        try:
+            for version, region in merge(*[consume(r) for r in self._regions]):
+                if presence and presence.version == version:
+                    if region not in presence.regions:
+                        presence.regions.append(region)
+                    continue
+
+                if presence:
+                    yield self.finish(presence, failed)
+
+                presence = VersionPresence(version=version, regions=[region])
+
+            if presence:
+                yield self.finish(presence, failed)
+
+        finally:
+            # Stop any regions still listing if the reader stops early.
+            stop.set()
+
+    def finish(self, presence: VersionPresence, failed: Set[str]) -> VersionPresence:
+        """
+        Records the regions that don't hold a version.
+
+        :param presence: Version and the regions that hold it.
+        :param failed: Regions that failed to list.
+        :returns: Version and the regions that do and don't hold it.
+        """
+
+        listed = [r for r in self._regions if r not in failed]
+        presence.missing = [r for r in listed if r not in presence.regions]
+        return presence
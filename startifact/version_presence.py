@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+
+@dataclass
+class VersionPresence:
+    """
+    The regions that a version of a project is staged in.
+
+    Regions that couldn't be listed are in neither ``regions`` nor
+    ``missing``.
+
+    :param version: Version.
+    :param regions: Regions that hold the version.
+    :param missing: Regions that were listed and don't hold the version.
+    """
+
+    version: VersionInfo
+    regions: List[str]
+    missing: List[str] = field(default_factory=list)
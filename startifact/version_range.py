@@ -0,0 +1,116 @@
+from typing import Iterable, Optional
+
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+
+class VersionRange:
+    """
+    A range of versions.
+
+    - ``1.2.3`` matches only 1.2.3.
+    - ``1.2`` matches any 1.2.x and ``1`` matches any 1.x.x.
+    - ``~1.2.3`` matches 1.2.3 up to but not including 1.3.0. ``~1.2`` is
+      the same as ``1.2`` and ``~1`` is the same as ``1``.
+    - ``^1.2.3`` matches 1.2.3 up to but not including 2.0.0. Below 1.0.0 the
+      left-most non-zero number is fixed instead, so ``^0.2.3`` matches up to
+      0.3.0 and ``^0.0.3`` matches only 0.0.3.
+
+    Pre-releases match only a range that names a pre-release of the same
+    version, so ``^1.2.3-beta`` matches 1.2.3-rc but not 1.3.0-beta.
+
+    :param lower: Lowest matching version.
+    :param upper:
+        Lowest version above the range. Omit to match only the lowest
+        version.
+    """
+
+    def __init__(
+        self,
+        lower: VersionInfo,
+        upper: Optional[VersionInfo] = None,
+    ) -> None:
+
+        self._lower = lower
+        self._upper = upper
+
+    def __contains__(self, version: VersionInfo) -> bool:
+        if version.prerelease and not (
+            self._lower.prerelease
+            and version.finalize_version() == self._lower.finalize_version()
+        ):
+            return False
+
+        if self._upper is None:
+            return bool(version == self._lower)
+
+        return bool(self._lower <= version < self._upper)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VersionRange):
+            return False
+
+        return self._lower == other._lower and self._upper == other._upper
+
+    def __repr__(self) -> str:
+        if self._upper is None:
+            return f"=={self._lower}"
+
+        return f">={self._lower} <{self._upper}"
+
+    def best(self, versions: Iterable[VersionInfo]) -> Optional[VersionInfo]:
+        """
+        Gets the highest matching version.
+
+        :param versions: Versions.
+        :returns: Highest matching version, or ``None`` if none match.
+        """
+
+        return max((v for v in versions if v in self), default=None)
+
+    @property
+    def exact(self) -> Optional[VersionInfo]:
+        """
+        Gets the only matching version, or ``None`` if the range matches many.
+        """
+
+        return self._lower if self._upper is None else None
+
+    @classmethod
+    def parse(cls, value: str) -> "VersionRange":
+        """
+        Parses a range like ``^2.3``.
+
+        :param value: Range.
+        :returns: Range.
+        :raises ValueError: if the range is not valid.
+        """
+
+        operator = value[:1] if value[:1] in ("^", "~") else ""
+        start = len(operator)
+        version = value[start:]
+        parts = version.split(".", 2)
+
+        # pyright: reportUnknownMemberType=false
+        if len(parts) == 3:
+            lower = VersionInfo.parse(version)
+        elif all(p.isdigit() and (p == "0" or p[0] != "0") for p in parts):
+            lower = VersionInfo(*[int(p) for p in parts])
+        else:
+            raise ValueError(f"{value} is not a valid version range")
+
+        if len(parts) == 1:
+            return cls(lower, lower.bump_major())
+
+        if operator == "^":
+            if lower.major > 0:
+                return cls(lower, lower.bump_major())
+
+            if lower.minor > 0 or len(parts) == 2:
+                return cls(lower, lower.bump_minor())
+
+            return cls(lower, lower.bump_patch())
+
+        if operator == "~" or len(parts) == 2:
+            return cls(lower, lower.bump_minor())
+
+        return cls(lower)
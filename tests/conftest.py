@@ -1,20 +1,36 @@
 from io import StringIO
-from multiprocessing import Queue
 from pathlib import Path
+from typing import Iterator
 
-from mock import Mock
+from _pytest.monkeypatch import MonkeyPatch
+from mock import Mock, patch
 from pytest import fixture
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact import BucketNames
 from startifact.configuration import Configuration
 from startifact.configuration_loader import ConfigurationLoader
+from startifact.file_hash import FileHash
 from startifact.metadata_loader import MetadataLoader
 from startifact.parameters import BucketParameter, LatestVersionParameter
-from startifact.regional_process_result import RegionalProcessResult
 from startifact.regional_stager import RegionalStager
 
 
+@fixture(autouse=True)
+def cache_dir(monkeypatch: MonkeyPatch, tmp_path: Path) -> Path:
+    # Never touch the real cache during tests.
+    path = tmp_path / "cache"
+    monkeypatch.setenv("STARTIFACT_CACHE_DIR", path.as_posix())
+    return path
+
+
+@fixture(autouse=True)
+def cache_identity() -> Iterator[Mock]:
+    # Never resolve real credentials during tests.
+    with patch("startifact.cache.get_identity", return_value="identity") as mock:
+        yield mock
+
+
 @fixture
 def bucket_name_parameter(session: Mock) -> BucketParameter:
     return BucketParameter(
@@ -33,6 +49,26 @@ def bucket_names() -> BucketNames:
     return names
 
 
+@fixture
+def clients(session: Mock) -> Mock:
+    clients = Mock()
+    clients.session = Mock(return_value=session)
+    return clients
+
+
+@fixture
+def regional_clients() -> Mock:
+    # Hands out a distinct session per region.
+    def make_session(region: str) -> Mock:
+        session = Mock()
+        session.region_name = region
+        return session
+
+    clients = Mock()
+    clients.session = Mock(side_effect=make_session)
+    return clients
+
+
 @fixture
 def configuration_loader(
     empty_config: Configuration,
@@ -52,6 +88,7 @@ def empty_config() -> Configuration:
         bucket_key_prefix="",
         bucket_name_param="",
         parameter_name_prefix="",
+        regional_concurrency="",
         regions="",
         save_ok="",
     )
@@ -83,26 +120,18 @@ def out() -> StringIO:
     return StringIO()
 
 
-@fixture
-def queue() -> "Queue[RegionalProcessResult]":
-    queue: "Queue[RegionalProcessResult]" = Queue(1)
-    return queue
-
-
 @fixture
 def regional_stager(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> RegionalStager:
 
     return RegionalStager(
         bucket="bucket-10",
-        file_hash="who knows?",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="who knows?"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         path=Path("LICENSE"),
-        queue=queue,
         read_only=True,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -0,0 +1,135 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event
+from typing import Any, Callable, Dict, List
+
+from botocore.exceptions import ClientError
+from mock import Mock, patch
+from pytest import raises
+
+from startifact.parameters import ParameterBatcher
+from startifact.parameters.batcher import PendingRead
+
+
+def make_ssm(values: Dict[str, str]) -> Mock:
+    def get_parameters(Names: List[str]) -> Dict[str, Any]:
+        return {
+            "InvalidParameters": [n for n in Names if n not in values],
+            "Parameters": [
+                {"Name": n, "Value": values[n]} for n in Names if n in values
+            ],
+        }
+
+    ssm = Mock()
+    ssm.get_parameters = Mock(side_effect=get_parameters)
+    return ssm
+
+
+def test_get(session: Mock) -> None:
+    ssm = make_ssm({"/foo": "bar"})
+    session.client = Mock(return_value=ssm)
+
+    batcher = ParameterBatcher()
+
+    assert batcher.get(session, "/foo").result() == "bar"
+    assert batcher.get(session, "/missing").result() is None
+    assert ssm.get_parameters.call_count == 2
+
+
+def test_get__coalesced(session: Mock) -> None:
+    values = {f"/{i}": str(i) for i in range(25)}
+    ssm = make_ssm(values)
+
+    batcher = ParameterBatcher()
+    blocked = Event()
+    release = Event()
+    get_parameters: Callable[[List[str]], Dict[str, Any]]
+    get_parameters = ssm.get_parameters.side_effect
+
+    def slow_get_parameters(Names: List[str]) -> Dict[str, Any]:
+        # Hold the first request in flight while the others queue up.
+        if not blocked.is_set():
+            blocked.set()
+            release.wait(timeout=10)
+        return get_parameters(Names)
+
+    ssm.get_parameters.side_effect = slow_get_parameters
+    session.client = Mock(return_value=ssm)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = executor.submit(lambda: batcher.get(session, "/0").result())
+        blocked.wait(timeout=10)
+
+        queued = [batcher.get(session, f"/{i}") for i in range(1, 25)]
+        release.set()
+
+        assert first.result() == "0"
+
+    assert [f.result() for f in queued] == [str(i) for i in range(1, 25)]
+
+    sizes = [len(c.kwargs["Names"]) for c in ssm.get_parameters.call_args_list]
+    assert sizes == [1, 10, 10, 4]
+
+
+def test_send__fail_isolated(session: Mock) -> None:
+    error = ClientError({"Error": {"Code": "AccessDeniedException"}}, "GetParameters")
+
+    def get_parameters(Names: List[str]) -> Dict[str, Any]:
+        if "/secret" in Names:
+            raise error
+        return {"Parameters": [{"Name": n, "Value": "ok"} for n in Names]}
+
+    ssm = Mock()
+    ssm.get_parameters = Mock(side_effect=get_parameters)
+    session.client = Mock(return_value=ssm)
+
+    batcher = ParameterBatcher()
+    batch: List[PendingRead] = [("/foo", Future()), ("/secret", Future())]
+    batcher.send(ssm, "eu-west-10", batch)
+
+    assert batch[0][1].result() == "ok"
+    assert batch[1][1].exception() is error
+
+
+def test_send__fail_throttled(session: Mock) -> None:
+    error = ClientError({"Error": {"Code": "ThrottlingException"}}, "GetParameters")
+
+    ssm = Mock()
+    ssm.get_parameters = Mock(side_effect=error)
+
+    batcher = ParameterBatcher()
+    batch: List[PendingRead] = [("/foo", Future()), ("/bar", Future())]
+    batcher.send(ssm, "eu-west-10", batch)
+
+    # Throttling isn't made worse by retrying each parameter alone.
+    assert ssm.get_parameters.call_count == 1
+    assert batch[0][1].exception() is error
+    assert batch[1][1].exception() is error
+
+
+def test_get__send_raises(session: Mock) -> None:
+    ssm = make_ssm({"/foo": "bar"})
+    session.client = Mock(return_value=ssm)
+    batcher = ParameterBatcher()
+
+    with patch.object(batcher, "send", side_effect=Exception("fire")):
+        with raises(Exception) as ex:
+            batcher.get(session, "/foo").result(timeout=10)
+
+    assert str(ex.value) == "fire"
+
+    # The region isn't left stuck.
+    assert batcher.get(session, "/foo").result(timeout=10) == "bar"
+
+
+def test_get__no_client(session: Mock) -> None:
+    session.client = Mock(side_effect=Exception("fire"))
+    batcher = ParameterBatcher()
+
+    with raises(Exception) as ex:
+        batcher.get(session, "/foo").result()
+
+    assert str(ex.value) == "fire"
+
+    # The region isn't left stuck.
+    with raises(Exception):
+        batcher.get(session, "/foo").result()
@@ -63,6 +63,7 @@ def test_make_value(session: Mock, monkeypatch: MonkeyPatch) -> None:
         bucket_key_prefix="",
         bucket_name_param="",
         parameter_name_prefix="",
+        regional_concurrency="",
         regions="eu-west-6,us-east-7",
         save_ok="",
     )
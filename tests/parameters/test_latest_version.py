@@ -7,7 +7,7 @@ from startifact.exceptions.parameter_store import (
     NotAllowedToPutParameter,
     ParameterStoreError,
 )
-from startifact.parameters import LatestVersionParameter
+from startifact.parameters import LatestVersionParameter, ParameterBatcher
 
 
 def test_get(session: Mock) -> None:
@@ -33,6 +33,65 @@ def test_get(session: Mock) -> None:
     assert actual == "1.2.3"
 
 
+def test_get__batched(session: Mock) -> None:
+    ssm = Mock()
+    ssm.get_parameters = Mock(
+        return_value={"Parameters": [{"Name": "/foo/latest", "Value": "1.2.3"}]}
+    )
+
+    session.client = Mock(return_value=ssm)
+
+    param = LatestVersionParameter(
+        batcher=ParameterBatcher(),
+        prefix="",
+        project="foo",
+        read_only=False,
+        session=session,
+    )
+
+    assert param.get() == "1.2.3"
+    ssm.get_parameters.assert_called_once_with(Names=["/foo/latest"])
+    ssm.get_parameter.assert_not_called()
+
+
+def test_get__batched_denied(session: Mock) -> None:
+    error = ClientError({"Error": {"Code": "AccessDeniedException"}}, "")
+
+    ssm = Mock()
+    ssm.get_parameters = Mock(side_effect=error)
+    session.client = Mock(return_value=ssm)
+
+    param = LatestVersionParameter(
+        batcher=ParameterBatcher(),
+        prefix="",
+        project="foo",
+        read_only=False,
+        session=session,
+    )
+
+    with raises(NotAllowedToGetParameter):
+        param.get()
+
+
+def test_get__batched_not_found(session: Mock) -> None:
+    ssm = Mock()
+    ssm.get_parameters = Mock(return_value={"InvalidParameters": ["/foo/latest"]})
+    session.client = Mock(return_value=ssm)
+
+    param = LatestVersionParameter(
+        batcher=ParameterBatcher(),
+        prefix="",
+        project="foo",
+        read_only=False,
+        session=session,
+    )
+
+    with raises(ParameterNotFound):
+        param.get()
+
+    assert param.get("0.0.0") == "0.0.0"
+
+
 def test_get__invalid_response(session: Mock) -> None:
     ssm = Mock()
     ssm.get_parameter = Mock(return_value={})
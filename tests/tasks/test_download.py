@@ -48,14 +48,16 @@ def test_invoke(
     task = DownloadTask(args, out)
 
     with patch.object(session, "get", return_value=artifact) as get:
-        with patch.object(artifact_downloader, "download") as download:
-            exit_code = task.invoke()
+        with patch.object(artifact, "resolve") as resolve:
+            with patch.object(artifact_downloader, "download") as download:
+                exit_code = task.invoke()
 
     get.assert_called_once_with(
         project="SugarWater",
         version=VersionInfo(1, 2, 3),
     )
 
+    resolve.assert_called_once_with(download=True, metadata=False)
     download.assert_called_once_with(Path("download.zip"), load_filename=False)
 
     assert out.getvalue() == ""
@@ -78,6 +80,57 @@ def test_make_args() -> None:
     )
 
 
+def test_make_args__cache() -> None:
+    args = CommandLineArguments(
+        {
+            "cache": True,
+            "download": "dist.zip",
+            "project": "foo",
+        }
+    )
+    assert DownloadTask.make_args(args) == DownloadTaskArguments(
+        cache=True,
+        path=Path("dist.zip"),
+        project="foo",
+    )
+
+
+def test_make_args__parts() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "1.2.3",
+            "download": "dist.zip",
+            "part_concurrency": "8",
+            "part_size": "16",
+            "project": "foo",
+        }
+    )
+    assert DownloadTask.make_args(args) == DownloadTaskArguments(
+        part_concurrency=8,
+        part_size=16 * 1024 * 1024,
+        path=Path("dist.zip"),
+        project="foo",
+        version=VersionInfo(1, 2, 3),
+    )
+
+
+def test_make_args__regional_concurrency() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "1.2.3",
+            "download": "dist.zip",
+            "project": "foo",
+            "regional_concurrency": "2",
+        }
+    )
+    assert DownloadTask.make_args(args) == DownloadTaskArguments(
+        path=Path("dist.zip"),
+        project="foo",
+        regional_concurrency=2,
+        version=VersionInfo(1, 2, 3),
+    )
+
+
 def test_make_args__invalid_version() -> None:
     args = CommandLineArguments(
         {
@@ -95,6 +95,22 @@ def test_make_args__latest() -> None:
     )
 
 
+def test_make_args__regional_concurrency() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "latest",
+            "info": True,
+            "project": "SugarWater",
+            "regional_concurrency": "2",
+        }
+    )
+    assert InfoTask.make_args(args) == GetTaskArguments(
+        log_level="CRITICAL",
+        project="SugarWater",
+        regional_concurrency=2,
+    )
+
+
 def test_make_args__invalid_version() -> None:
     args = CommandLineArguments(
         {
@@ -0,0 +1,17 @@
+from pytest import raises
+
+import startifact.tasks
+from startifact.tasks.download import DownloadTask
+
+
+def test_dir() -> None:
+    assert "DownloadTask" in dir(startifact.tasks)
+
+
+def test_getattr() -> None:
+    assert startifact.tasks.DownloadTask is DownloadTask
+
+
+def test_getattr__unknown() -> None:
+    with raises(AttributeError):
+        getattr(startifact.tasks, "Nope")
@@ -0,0 +1,33 @@
+from io import StringIO
+from pathlib import Path
+
+from cline import CommandLineArguments
+from mock import Mock
+
+from startifact.tasks.invalidate_cache import (
+    InvalidateCacheTask,
+    InvalidateCacheTaskArguments,
+)
+
+
+def test_invoke(cache_dir: Path, out: StringIO) -> None:
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "buckets.json").write_text("{}")
+
+    cache = Mock()
+    args = InvalidateCacheTaskArguments(configuration_cache=cache)
+    task = InvalidateCacheTask(args, out)
+
+    exit_code = task.invoke()
+
+    cache.invalidate.assert_called_once_with()
+    assert not (cache_dir / "buckets.json").exists()
+    assert (
+        out.getvalue() == "🌍 Invalidated the cached configuration and bucket names.\n"
+    )
+    assert exit_code == 0
+
+
+def test_make_args() -> None:
+    args = CommandLineArguments({"invalidate_cache": True})
+    assert InvalidateCacheTask.make_args(args) == InvalidateCacheTaskArguments()
@@ -0,0 +1,94 @@
+from io import StringIO
+from pathlib import Path
+
+from cline import CannotMakeArguments, CommandLineArguments
+from mock import Mock
+from pytest import raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.exceptions import CannotDownloadArtifacts
+from startifact.tasks.manifest import ManifestTask, ManifestTaskArguments
+
+
+def test_invoke(out: StringIO, tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text('{"SugarWater": "sugar.zip"}')
+
+    session = Mock()
+    session.download_manifest = Mock(return_value={"SugarWater": VersionInfo(1)})
+
+    args = ManifestTaskArguments(concurrency=2, path=path, session=session)
+    task = ManifestTask(args, out)
+
+    assert task.invoke() == 0
+
+    session.download_manifest.assert_called_once_with(
+        {"SugarWater": Path("sugar.zip")},
+        concurrency=2,
+    )
+
+
+def test_invoke__fail(out: StringIO, tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text('{"SugarWater": "sugar.zip"}')
+
+    session = Mock()
+    session.download_manifest = Mock(
+        side_effect=CannotDownloadArtifacts({"SugarWater": Exception("fire")})
+    )
+
+    args = ManifestTaskArguments(path=path, session=session)
+    task = ManifestTask(args, out)
+
+    assert task.invoke() == 1
+    assert out.getvalue() == "🔥 Failed to download 1 artifact(s): SugarWater\n"
+
+
+def test_invoke__invalid_manifest(out: StringIO, tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text("[]")
+
+    session = Mock()
+    args = ManifestTaskArguments(path=path, session=session)
+    task = ManifestTask(args, out)
+
+    assert task.invoke() == 1
+    session.download_manifest.assert_not_called()
+
+    expect = f"🔥 Failed to load manifest: {path} does not describe an object\n"
+    assert out.getvalue() == expect
+
+
+def test_make_args() -> None:
+    args = CommandLineArguments(
+        {
+            "cache": True,
+            "manifest": "manifest.json",
+            "manifest_concurrency": "8",
+        }
+    )
+
+    assert ManifestTask.make_args(args) == ManifestTaskArguments(
+        cache=True,
+        concurrency=8,
+        path=Path("manifest.json"),
+    )
+
+
+def test_make_args__regional_concurrency() -> None:
+    args = CommandLineArguments(
+        {
+            "manifest": "manifest.json",
+            "regional_concurrency": "2",
+        }
+    )
+
+    assert ManifestTask.make_args(args) == ManifestTaskArguments(
+        path=Path("manifest.json"),
+        regional_concurrency=2,
+    )
+
+
+def test_make_args__no_manifest() -> None:
+    with raises(CannotMakeArguments):
+        ManifestTask.make_args(CommandLineArguments({"project": "SugarWater"}))
@@ -16,13 +16,17 @@ def test_invoke() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-8",
         save_ok="y",
     )
 
     out = StringIO()
 
+    cache = Mock()
+
     args = SetupTaskArguments(
+        configuration_cache=cache,
         directions=directions,
         regions=["us-east-8"],
     )
@@ -38,10 +42,11 @@ def test_invoke() -> None:
         "regions": "us-east-8",
     }
 
-    ns = "startifact.tasks.setup"
+    loader_path = "startifact.configuration_loader.ConfigurationLoader"
+    saver_path = "startifact.configuration_saver.ConfigurationSaver"
 
-    with patch(f"{ns}.ConfigurationLoader", return_value=loader) as loader_cls:
-        with patch(f"{ns}.ConfigurationSaver", return_value=saver) as saver_cls:
+    with patch(loader_path, return_value=loader) as loader_cls:
+        with patch(saver_path, return_value=saver) as saver_cls:
             exit_code = task.invoke()
 
     loader_cls.assert_called_once_with(
@@ -53,6 +58,7 @@ def test_invoke() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-8",
         save_ok="y",
     )
@@ -65,6 +71,7 @@ def test_invoke() -> None:
     )
 
     save.assert_called_once_with()
+    cache.invalidate.assert_called_once_with()
     assert exit_code == 0
     assert (
         out.getvalue()
@@ -85,13 +92,17 @@ def test_invoke__delete_from_regions() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-7",
         save_ok="y",
     )
 
     out = StringIO()
 
+    cache = Mock()
+
     args = SetupTaskArguments(
+        configuration_cache=cache,
         directions=directions,
         regions=["us-east-8"],
     )
@@ -107,10 +118,11 @@ def test_invoke__delete_from_regions() -> None:
         "regions": "us-east-8",
     }
 
-    ns = "startifact.tasks.setup"
+    loader_path = "startifact.configuration_loader.ConfigurationLoader"
+    saver_path = "startifact.configuration_saver.ConfigurationSaver"
 
-    with patch(f"{ns}.ConfigurationLoader", return_value=loader) as loader_cls:
-        with patch(f"{ns}.ConfigurationSaver", return_value=saver) as saver_cls:
+    with patch(loader_path, return_value=loader) as loader_cls:
+        with patch(saver_path, return_value=saver) as saver_cls:
             exit_code = task.invoke()
 
     loader_cls.assert_called_once_with(
@@ -122,6 +134,7 @@ def test_invoke__delete_from_regions() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-7",
         save_ok="y",
     )
@@ -134,6 +147,7 @@ def test_invoke__delete_from_regions() -> None:
     )
 
     save.assert_called_once_with()
+    cache.invalidate.assert_called_once_with()
     assert exit_code == 0
     assert (
         out.getvalue()
@@ -154,13 +168,17 @@ def test_invoke__not_all_ok() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-7",
         save_ok="y",
     )
 
     out = StringIO()
 
+    cache = Mock()
+
     args = SetupTaskArguments(
+        configuration_cache=cache,
         directions=directions,
         regions=["us-east-8"],
     )
@@ -176,10 +194,11 @@ def test_invoke__not_all_ok() -> None:
         "regions": "us-east-8",
     }
 
-    ns = "startifact.tasks.setup"
+    loader_path = "startifact.configuration_loader.ConfigurationLoader"
+    saver_path = "startifact.configuration_saver.ConfigurationSaver"
 
-    with patch(f"{ns}.ConfigurationLoader", return_value=loader) as loader_cls:
-        with patch(f"{ns}.ConfigurationSaver", return_value=saver) as saver_cls:
+    with patch(loader_path, return_value=loader) as loader_cls:
+        with patch(saver_path, return_value=saver) as saver_cls:
             exit_code = task.invoke()
 
     loader_cls.assert_called_once_with(
@@ -191,6 +210,7 @@ def test_invoke__not_all_ok() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-7",
         save_ok="y",
     )
@@ -203,6 +223,7 @@ def test_invoke__not_all_ok() -> None:
     )
 
     save.assert_called_once_with()
+    cache.invalidate.assert_called_once_with()
     assert exit_code == 1
     assert (
         out.getvalue()
@@ -218,6 +239,7 @@ def test_invoke__no_regions_available() -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-7,eu-west-4",
         save_ok="n",
     )
@@ -237,6 +259,7 @@ def test_invoke__no_save(empty_config: Configuration, out: StringIO) -> None:
         bucket_key_prefix="key/",
         bucket_name_param="/bucket",
         parameter_name_prefix="/param",
+        regional_concurrency="",
         regions="us-east-7,eu-west-4",
         save_ok="n",
     )
@@ -129,3 +129,73 @@ def test_make_args__metadata() -> None:
         project="foo",
         version=VersionInfo.parse("1.2.3"),
     )
+
+
+def test_make_args__parts() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "1.2.3",
+            "part_concurrency": "8",
+            "part_size": "16",
+            "project": "foo",
+            "stage": "foo.zip",
+        }
+    )
+
+    assert StageTask.make_args(args) == StageTaskArguments(
+        part_concurrency=8,
+        part_size=16 * 1024 * 1024,
+        path=Path("foo.zip"),
+        project="foo",
+        version=VersionInfo.parse("1.2.3"),
+    )
+
+
+def test_make_args__regional_concurrency() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "1.2.3",
+            "project": "foo",
+            "regional_concurrency": "2",
+            "stage": "foo.zip",
+        }
+    )
+
+    assert StageTask.make_args(args) == StageTaskArguments(
+        path=Path("foo.zip"),
+        project="foo",
+        regional_concurrency=2,
+        version=VersionInfo.parse("1.2.3"),
+    )
+
+
+def test_make_args__invalid_part_size() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "1.2.3",
+            "part_size": "0",
+            "project": "foo",
+            "stage": "foo.zip",
+        }
+    )
+
+    with raises(CannotMakeArguments) as ex:
+        StageTask.make_args(args)
+
+    assert str(ex.value) == "part_size must be a positive integer"
+
+
+def test_make_args__part_size_too_small() -> None:
+    args = CommandLineArguments(
+        {
+            "artifact_version": "1.2.3",
+            "part_size": "4",
+            "project": "foo",
+            "stage": "foo.zip",
+        }
+    )
+
+    with raises(CannotMakeArguments) as ex:
+        StageTask.make_args(args)
+
+    assert str(ex.value) == "part_size must be at least 5 MiB"
@@ -1,5 +1,6 @@
 from io import StringIO
 
+from mock import patch
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact import Artifact, BucketNames, LatestVersionLoader, MetadataLoader
@@ -133,6 +134,22 @@ def test_metadata_key__cache(bucket_names: BucketNames, out: StringIO) -> None:
     assert key1 is key2
 
 
+def test_resolve(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = Artifact(
+        bucket_names=bucket_names,
+        out=out,
+        project="SugarWater",
+        regions=[],
+        version=VersionInfo(1, 2, 3),
+    )
+
+    with patch("startifact.artifact.ResolutionPlan") as plan_cls:
+        artifact.resolve(download=True)
+
+    plan_cls.assert_called_once_with(artifact, download=True, metadata=False)
+    plan_cls.return_value.resolve.assert_called_once_with()
+
+
 def test_version(bucket_names: BucketNames, out: StringIO) -> None:
     loader = LatestVersionLoader(
         out=out,
@@ -0,0 +1,127 @@
+from os import utime
+from pathlib import Path
+
+from mock import patch
+
+from startifact.artifact_cache import ArtifactCache
+
+
+def put(cache: ArtifactCache, key: str, etag: str, body: bytes) -> None:
+    temporary = cache.make_temporary_path()
+    temporary.write_bytes(body)
+    cache.commit(temporary, key, etag)
+
+
+def test_commit(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path)
+    put(cache, "SugarWater@1.0.0", '"etag"', b"sugar")
+
+    entry = cache.make_path("SugarWater@1.0.0", '"etag"')
+    assert entry.read_bytes() == b"sugar"
+    assert not list((tmp_path / "incoming").iterdir())
+
+
+def test_evict(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path, max_size=10)
+
+    put(cache, "a", "1", b"aaaa")
+    put(cache, "b", "1", b"bbbb")
+
+    # Make "a" the least recently used.
+    utime(cache.make_path("a", "1"), (0, 0))
+
+    put(cache, "c", "1", b"cccc")
+
+    assert not cache.make_path("a", "1").exists()
+    assert cache.make_path("b", "1").exists()
+    assert cache.make_path("c", "1").exists()
+
+
+def test_evict__abandoned(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path)
+
+    abandoned = cache.make_temporary_path()
+    utime(abandoned, (0, 0))
+    downloading = cache.make_temporary_path()
+
+    put(cache, "a", "1", b"aaaa")
+
+    assert not abandoned.exists()
+    assert downloading.exists()
+
+
+def test_get(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path / "cache")
+    put(cache, "SugarWater@1.0.0", '"etag"', b"sugar")
+
+    path = tmp_path / "download.zip"
+    path.write_bytes(b"old")
+
+    assert cache.get("SugarWater@1.0.0", '"etag"', path)
+    assert path.read_bytes() == b"sugar"
+
+    # The restored file is the user's own, so modifying it is safe.
+    entry = cache.make_path("SugarWater@1.0.0", '"etag"')
+    assert path.stat().st_ino != entry.stat().st_ino
+
+    path.write_bytes(b"water")
+    assert entry.read_bytes() == b"sugar"
+
+
+def test_get__copy(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path / "cache", hardlink=True)
+    put(cache, "SugarWater@1.0.0", '"etag"', b"sugar")
+
+    path = tmp_path / "download.zip"
+
+    with patch("startifact.artifact_cache.link", side_effect=OSError("cross-device")):
+        with patch.object(ArtifactCache, "reflink", return_value=False):
+            assert cache.get("SugarWater@1.0.0", '"etag"', path)
+
+    assert path.read_bytes() == b"sugar"
+    assert (
+        path.stat().st_ino
+        != cache.make_path("SugarWater@1.0.0", '"etag"').stat().st_ino
+    )
+
+
+def test_get__hardlink(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path / "cache", hardlink=True)
+    put(cache, "SugarWater@1.0.0", '"etag"', b"sugar")
+
+    path = tmp_path / "download.zip"
+
+    assert cache.get("SugarWater@1.0.0", '"etag"', path)
+    assert path.read_bytes() == b"sugar"
+    assert (
+        path.stat().st_ino
+        == cache.make_path("SugarWater@1.0.0", '"etag"').stat().st_ino
+    )
+
+
+def test_get__miss(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path / "cache")
+    put(cache, "SugarWater@1.0.0", '"etag"', b"sugar")
+
+    path = tmp_path / "download.zip"
+
+    assert not cache.get("SugarWater@1.0.0", '"other"', path)
+    assert not path.exists()
+
+
+def test_get__evicted_while_restoring(tmp_path: Path) -> None:
+    cache = ArtifactCache(tmp_path / "cache")
+    put(cache, "SugarWater@1.0.0", '"etag"', b"sugar")
+
+    path = tmp_path / "download.zip"
+    path.write_bytes(b"old")
+
+    with patch(
+        "startifact.artifact_cache.copyfile",
+        side_effect=FileNotFoundError(),
+    ):
+        with patch.object(ArtifactCache, "reflink", return_value=False):
+            assert not cache.get("SugarWater@1.0.0", '"etag"', path)
+
+    assert path.read_bytes() == b"old"
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "cache", path]
@@ -1,5 +1,6 @@
 from io import StringIO
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from mock import ANY, call, patch
 from mock.mock import Mock
@@ -7,6 +8,7 @@ from pytest import fixture, raises
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact import ArtifactDownloader, BucketNames
+from startifact.artifact_cache import ArtifactCache
 from startifact.exceptions import CannotDiscoverExistence, NoRegionsAvailable
 from startifact.metadata_loader import MetadataLoader
 
@@ -30,23 +32,23 @@ def artifact_downloader(
 
 
 def test_discover__cache(artifact_downloader: ArtifactDownloader) -> None:
-    with patch("startifact.artifact_downloader.exists", return_value=True) as exists:
+    with patch("startifact.artifact_downloader.head", return_value={}) as head:
         bucket1, region1 = artifact_downloader.discover()
         bucket2, region2 = artifact_downloader.discover()
 
-    assert exists.call_count == 1
+    assert head.call_count == 1
     assert bucket1 is bucket2
     assert region1 is region2
 
 
 def test_discover__fail_then_ok(artifact_downloader: ArtifactDownloader) -> None:
-    effect = [False, True]
+    effect: List[Optional[Dict[str, Any]]] = [None, {}]
 
-    with patch("startifact.artifact_downloader.exists", side_effect=effect) as exists:
+    with patch("startifact.artifact_downloader.head", side_effect=effect) as head:
         bucket, region = artifact_downloader.discover()
 
-    assert exists.call_count == 2
-    exists.assert_has_calls(
+    assert head.call_count == 2
+    head.assert_has_calls(
         [
             call("bucket-10", "SugarWater@1.0.0", ANY),
             call("bucket-11", "SugarWater@1.0.0", ANY),
@@ -57,50 +59,103 @@ def test_discover__fail_then_ok(artifact_downloader: ArtifactDownloader) -> None
     assert region == "eu-west-11"
 
 
-def test_download(artifact_downloader: ArtifactDownloader, session: Mock) -> None:
+def test_discover__raise_then_ok(artifact_downloader: ArtifactDownloader) -> None:
+    effect: List[Any] = [Exception("fire"), {}]
 
-    download_file = Mock()
+    with patch("startifact.artifact_downloader.head", side_effect=effect) as head:
+        bucket, region = artifact_downloader.discover()
+
+    assert head.call_count == 2
+    assert bucket == "bucket-11"
+    assert region == "eu-west-11"
 
-    s3 = Mock()
-    s3.download_file = download_file
 
+def test_download(artifact_downloader: ArtifactDownloader, session: Mock) -> None:
+    s3 = Mock()
     client = Mock(return_value=s3)
     session.client = client
 
-    with patch("startifact.artifact_downloader.exists", return_value=True):
-        artifact_downloader.download(Path("download.zip"), session=session)
+    ns = "startifact.artifact_downloader"
+    response = {"ContentLength": 26, "ETag": '"etag"'}
+
+    with patch(f"{ns}.head", return_value=response) as head:
+        with patch(f"{ns}.RangedDownload") as ranged_download_cls:
+            artifact_downloader.download(Path("download.zip"), session=session)
+
+    # The download reuses the discovery's response rather than asking again.
+    assert head.call_count == 1
 
     client.assert_called_once_with("s3")
-    download_file.assert_called_once_with(
-        Bucket="bucket-10",
-        Filename="download.zip",
-        Key="SugarWater@1.0.0",
+    ranged_download_cls.assert_called_once_with(
+        bucket="bucket-10",
+        client=s3,
+        concurrency=4,
+        etag='"etag"',
+        key="SugarWater@1.0.0",
+        part_size=64 * 1024 * 1024,
+        path=Path("download.zip"),
+        region="eu-west-10",
+        size=26,
     )
 
+    ranged_download_cls.return_value.download.assert_called_once_with()
 
-def test_download__fail(
-    artifact_downloader: ArtifactDownloader,
+
+def test_download__cached(
+    bucket_names: BucketNames,
+    metadata_loader: MetadataLoader,
+    out: StringIO,
     session: Mock,
+    tmp_path: Path,
 ) -> None:
+    downloader = ArtifactDownloader(
+        artifact_cache=ArtifactCache(tmp_path / "cache"),
+        bucket_names=bucket_names,
+        key="SugarWater@1.0.0",
+        metadata_loader=metadata_loader,
+        out=out,
+        project="SugarWater",
+        regions=["eu-west-10", "eu-west-11"],
+        version=VersionInfo(1, 0),
+    )
 
-    download_file = Mock(side_effect=Exception("fire"))
+    def ranged_download(path: Path, **kwargs: str) -> Mock:
+        path.write_bytes(b"sugar")
+        return Mock()
 
-    s3 = Mock()
-    s3.download_file = download_file
+    ns = "startifact.artifact_downloader"
+    response = {"ContentLength": 5, "ETag": '"etag"'}
 
-    client = Mock(return_value=s3)
-    session.client = client
+    with patch(f"{ns}.head", return_value=response) as head:
+        with patch(f"{ns}.RangedDownload", side_effect=ranged_download) as rd:
+            downloader.download(tmp_path / "a.zip", session=session)
+            downloader.download(tmp_path / "b.zip", session=session)
 
-    with patch("startifact.artifact_downloader.exists", return_value=True):
-        with raises(Exception):
-            artifact_downloader.download(Path("download.zip"), session=session)
+    # Only discovery asks for the ETag.
+    assert head.call_count == 1
+    assert rd.call_count == 1
+    assert (tmp_path / "a.zip").read_bytes() == b"sugar"
+    assert (tmp_path / "b.zip").read_bytes() == b"sugar"
+
+    lines = out.getvalue().splitlines()
+    assert lines[0].startswith("📦 Downloaded SugarWater 1.0.0 from eu-west-10")
+    assert lines[1].startswith("📦 Restored SugarWater 1.0.0 from the cache")
 
-    client.assert_called_once_with("s3")
-    download_file.assert_called_once_with(
-        Bucket="bucket-10",
-        Filename="download.zip",
-        Key="SugarWater@1.0.0",
-    )
+
+def test_download__fail(
+    artifact_downloader: ArtifactDownloader,
+    session: Mock,
+) -> None:
+
+    ns = "startifact.artifact_downloader"
+    with patch(f"{ns}.head", return_value={}):
+        with patch(f"{ns}.RangedDownload") as ranged_download_cls:
+            ranged_download_cls.return_value.download.side_effect = Exception("fire")
+
+            with raises(Exception) as ex:
+                artifact_downloader.download(Path("download.zip"), session=session)
+
+    assert str(ex.value) == "fire"
 
 
 def test_download__filename(
@@ -108,37 +163,127 @@ def test_download__filename(
     session: Mock,
 ) -> None:
 
-    download_file = Mock()
+    ns = "startifact.artifact_downloader"
+    with patch(f"{ns}.head", return_value={}):
+        with patch(f"{ns}.RangedDownload") as ranged_download_cls:
+            artifact_downloader.download(
+                Path("downloads"),
+                load_filename=True,
+                session=session,
+            )
 
-    s3 = Mock()
-    s3.download_file = download_file
+    path = ranged_download_cls.call_args.kwargs["path"]
+    assert path == Path("downloads/sugarwater-1.0.9000-py3-none-any.whl")
 
-    client = Mock(return_value=s3)
-    session.client = client
 
-    with patch("startifact.artifact_downloader.exists", return_value=True):
-        artifact_downloader.download(
-            Path("downloads"),
-            load_filename=True,
-            session=session,
-        )
+def test_download__filename_from_object(
+    bucket_names: BucketNames,
+    out: StringIO,
+    session: Mock,
+) -> None:
 
-    client.assert_called_once_with("s3")
-    download_file.assert_called_once_with(
-        Bucket="bucket-10",
-        Filename="downloads/sugarwater-1.0.9000-py3-none-any.whl",
-        Key="SugarWater@1.0.0",
+    metadata_loader = MetadataLoader(
+        bucket_names=bucket_names,
+        key="SugarWater@1.0.0/metadata",
+        regions=["eu-west-10"],
+    )
+
+    artifact_downloader = ArtifactDownloader(
+        bucket_names=bucket_names,
+        key="SugarWater@1.0.0",
+        metadata_loader=metadata_loader,
+        out=out,
+        project="SugarWater",
+        regions=["eu-west-10"],
+        version=VersionInfo(1, 0),
+    )
+
+    # {"startifact:filename":"sugarwater.whl"}
+    value = "eyJzdGFydGlmYWN0OmZpbGVuYW1lIjoic3VnYXJ3YXRlci53aGwifQ=="
+    response = {"Metadata": {"startifact-metadata": value}}
+
+    ns = "startifact.artifact_downloader"
+    with patch(f"{ns}.head", return_value=response):
+        with patch(f"{ns}.RangedDownload") as ranged_download_cls:
+            with patch.object(metadata_loader, "operate") as operate:
+                artifact_downloader.download(
+                    Path("downloads"),
+                    load_filename=True,
+                    session=session,
+                )
+
+    operate.assert_not_called()
+    path = ranged_download_cls.call_args.kwargs["path"]
+    assert path == Path("downloads/sugarwater.whl")
+
+
+def test_download__stripe(
+    bucket_names: BucketNames,
+    metadata_loader: MetadataLoader,
+    out: StringIO,
+) -> None:
+    downloader = ArtifactDownloader(
+        bucket_names=bucket_names,
+        key="SugarWater@1.0.0",
+        metadata_loader=metadata_loader,
+        out=out,
+        project="SugarWater",
+        regions=["eu-west-10", "eu-west-11", "eu-west-12"],
+        stripe=True,
+        version=VersionInfo(1, 0),
+    )
+
+    def head(bucket: str, key: str, session: Mock) -> Optional[Dict[str, Any]]:
+        if bucket == "bucket-11":
+            return None
+        return {"ContentLength": 26, "ETag": f'"{bucket}"'}
+
+    ns = "startifact.artifact_downloader"
+    with patch(f"{ns}.head", side_effect=head):
+        with patch(f"{ns}.StripedDownload") as striped_download_cls:
+            downloader.download(Path("download.zip"))
+
+    sources = striped_download_cls.call_args.kwargs["sources"]
+    assert [s.region for s in sources] == ["eu-west-10", "eu-west-12"]
+    assert [s.bucket for s in sources] == ["bucket-10", "bucket-12"]
+    assert [s.etag for s in sources] == ['"bucket-10"', '"bucket-12"']
+    assert [s.size for s in sources] == [26, 26]
+    striped_download_cls.return_value.download.assert_called_once_with()
+
+    expect = (
+        "📦 Downloaded SugarWater 1.0.0 from eu-west-10, eu-west-12 to download.zip.\n"
     )
+    assert out.getvalue() == expect
+
+
+def test_discover_all__none(artifact_downloader: ArtifactDownloader) -> None:
+    with patch("startifact.artifact_downloader.head", return_value=None):
+        with raises(NoRegionsAvailable):
+            artifact_downloader.discover_all()
+
+
+def test_discover_all__raise_then_ok(
+    artifact_downloader: ArtifactDownloader,
+) -> None:
+    def head(bucket: str, key: str, session: Mock) -> Dict[str, Any]:
+        if bucket == "bucket-10":
+            raise Exception("fire")
+        return {}
+
+    with patch("startifact.artifact_downloader.head", side_effect=head):
+        found = artifact_downloader.discover_all()
+
+    assert found == [("bucket-11", "eu-west-11")]
 
 
 def test_download__none(artifact_downloader: ArtifactDownloader) -> None:
-    effect = [False, False]
+    effect = [None, None]
 
-    with patch("startifact.artifact_downloader.exists", side_effect=effect) as exists:
+    with patch("startifact.artifact_downloader.head", side_effect=effect) as head:
         with raises(NoRegionsAvailable) as ex:
             artifact_downloader.discover()
 
-    assert exists.call_count == 2
+    assert head.call_count == 2
 
     expect = (
         "None of the configured regions are available: "
@@ -151,11 +296,11 @@ def test_download__none(artifact_downloader: ArtifactDownloader) -> None:
 def test_download__regions_down(artifact_downloader: ArtifactDownloader) -> None:
     effect = CannotDiscoverExistence(bucket="", key="", region="", msg="")
 
-    with patch("startifact.artifact_downloader.exists", side_effect=effect) as exists:
+    with patch("startifact.artifact_downloader.head", side_effect=effect) as head:
         with raises(NoRegionsAvailable) as ex:
             artifact_downloader.discover()
 
-    assert exists.call_count == 2
+    assert head.call_count == 2
 
     expect = (
         "None of the configured regions are available: "
@@ -166,10 +311,10 @@ def test_download__regions_down(artifact_downloader: ArtifactDownloader) -> None
 
 
 def test_bucket(artifact_downloader: ArtifactDownloader) -> None:
-    with patch("startifact.artifact_downloader.exists", return_value=True):
+    with patch("startifact.artifact_downloader.head", return_value={}):
         assert artifact_downloader.bucket == "bucket-10"
 
 
 def test_region(artifact_downloader: ArtifactDownloader) -> None:
-    with patch("startifact.artifact_downloader.exists", return_value=True):
+    with patch("startifact.artifact_downloader.head", return_value={}):
         assert artifact_downloader.region == "eu-west-10"
@@ -1,15 +1,28 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from pytest import mark
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
-from startifact.artifacts import make_fqn, make_key, make_metadata_key
+from startifact.artifacts import (
+    make_fqn,
+    make_index_key,
+    make_key,
+    make_metadata_key,
+    make_object_metadata,
+    make_versions_prefix,
+    read_object_metadata,
+)
 
 
 def test_make_fqn() -> None:
     assert make_fqn("SugarWater", VersionInfo(1, 0)) == "SugarWater@1.0.0"
 
 
+def test_make_index_key() -> None:
+    assert make_index_key("SugarWater") == "SugarWater/versions.json"
+    assert make_index_key("SugarWater", "pre/") == "pre/SugarWater/versions.json"
+
+
 @mark.parametrize(
     "project, version, prefix, expect",
     [
@@ -30,3 +43,35 @@ def test_make_key(
 
 def test_make_metadata_key() -> None:
     assert make_metadata_key("SugarWater@1.0.0") == "SugarWater@1.0.0/metadata"
+
+
+def test_make_object_metadata() -> None:
+    assert make_object_metadata(b'{"foo":"bar"}') == {
+        "startifact-metadata": "eyJmb28iOiJiYXIifQ==",
+    }
+
+
+def test_make_object_metadata__too_large() -> None:
+    assert make_object_metadata(b"x" * 2048) is None
+
+
+def test_make_versions_prefix() -> None:
+    assert make_versions_prefix("SugarWater") == "SugarWater@"
+    assert make_versions_prefix("SugarWater", "pre/") == "pre/SugarWater@"
+
+
+@mark.parametrize(
+    "object_metadata, expect",
+    [
+        ({}, None),
+        ({"other": "value"}, None),
+        ({"startifact-metadata": "e30="}, {}),
+        ({"startifact-metadata": "eyJmb28iOiJiYXIifQ=="}, {"foo": "bar"}),
+    ],
+)
+def test_read_object_metadata(
+    object_metadata: Dict[str, str],
+    expect: Optional[Dict[str, str]],
+) -> None:
+
+    assert read_object_metadata(object_metadata) == expect
@@ -0,0 +1,227 @@
+from asyncio import run
+from io import StringIO
+from json import dumps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from pytest import raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact import BucketNames
+from startifact.async_artifact import AsyncArtifact
+from startifact.async_transport import AsyncTransport
+from startifact.exceptions import NoRegionsAvailable
+from startifact.region_ranker import RegionRanker
+
+TResult = TypeVar("TResult")
+
+
+class FakeTransport(AsyncTransport):
+    def __init__(
+        self,
+        objects: Optional[Dict[str, Dict[str, bytes]]] = None,
+        parameters: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> None:
+        self.downloads: List[Any] = []
+        self.objects = objects or {}
+        self.parameters = parameters or {}
+        self.runs = 0
+
+    async def download(self, region: str, bucket: str, key: str, path: Path) -> None:
+        self.downloads.append((region, bucket, key, path))
+
+    async def get_object(self, region: str, bucket: str, key: str) -> Optional[bytes]:
+        return self.objects.get(region, {}).get(key, None)
+
+    async def get_parameter(self, region: str, name: str) -> Optional[str]:
+        if region == "us-broken-1":
+            raise Exception("broken")
+        return self.parameters.get(region, {}).get(name, None)
+
+    async def head_object(
+        self,
+        region: str,
+        bucket: str,
+        key: str,
+    ) -> Optional[Dict[str, Any]]:
+        return {} if key in self.objects.get(region, {}) else None
+
+    async def run(self, func: Callable[[], TResult]) -> TResult:
+        self.runs += 1
+        return func()
+
+
+def make_artifact(
+    bucket_names: BucketNames,
+    out: StringIO,
+    regions: List[str],
+    transport: FakeTransport,
+    version: Optional[VersionInfo] = None,
+) -> AsyncArtifact:
+
+    return AsyncArtifact(
+        bucket_names=bucket_names,
+        hedge_delay=0.01,
+        out=out,
+        project="SugarWater",
+        region_ranker=RegionRanker(jitter=0),
+        regions=regions,
+        transport=transport,
+        version=version,
+    )
+
+
+def test_discover__unavailable(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-10", "eu-west-11", "us-broken-1"],
+        FakeTransport(),
+        version=VersionInfo(1, 2, 3),
+    )
+
+    with raises(NoRegionsAvailable):
+        run(artifact.discover())
+
+
+def test_download(bucket_names: BucketNames, out: StringIO) -> None:
+    transport = FakeTransport(
+        objects={
+            "eu-west-11": {
+                "SugarWater@1.2.3": b"",
+                "SugarWater@1.2.3/metadata": b'{"startifact:filename": "a.whl"}',
+            },
+        },
+    )
+
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-10", "eu-west-11"],
+        transport,
+        version=VersionInfo(1, 2, 3),
+    )
+
+    run(artifact.download(Path("dir"), load_filename=True))
+
+    assert transport.downloads == [
+        ("eu-west-11", "bucket-11", "SugarWater@1.2.3", Path("dir") / "a.whl"),
+    ]
+
+    assert "Downloaded SugarWater 1.2.3 from eu-west-11 to dir/a.whl." in (
+        out.getvalue()
+    )
+
+
+def test_download__unavailable(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-10"],
+        FakeTransport(),
+        version=VersionInfo(1, 2, 3),
+    )
+
+    with raises(NoRegionsAvailable):
+        run(artifact.download(Path("a.whl")))
+
+
+def test_get_bucket__discovered(out: StringIO) -> None:
+    bucket_names = BucketNames("/buckets/staging")
+    transport = FakeTransport(
+        parameters={"eu-west-9": {"/buckets/staging": "bucket-9"}},
+    )
+
+    artifact = make_artifact(bucket_names, out, ["eu-west-9"], transport)
+
+    assert run(artifact.get_bucket("eu-west-9")) == "bucket-9"
+    assert bucket_names.known("eu-west-9") == "bucket-9"
+    assert transport.runs == 2
+
+
+def test_get_bucket__known(bucket_names: BucketNames, out: StringIO) -> None:
+    transport = FakeTransport()
+    artifact = make_artifact(bucket_names, out, ["eu-west-10"], transport)
+
+    assert run(artifact.get_bucket("eu-west-10")) == "bucket-10"
+    assert transport.runs == 1
+
+
+def test_get_metadata(bucket_names: BucketNames, out: StringIO) -> None:
+    metadata = {"foo": "bar"}
+    transport = FakeTransport(
+        objects={
+            "eu-west-12": {"SugarWater@1.2.3/metadata": dumps(metadata).encode()},
+        },
+    )
+
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-12"],
+        transport,
+        version=VersionInfo(1, 2, 3),
+    )
+
+    assert run(artifact.get_metadata()) == metadata
+
+
+def test_get_metadata__none(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-12"],
+        FakeTransport(),
+        version=VersionInfo(1, 2, 3),
+    )
+
+    assert run(artifact.get_metadata()) == {}
+
+
+def test_get_version(bucket_names: BucketNames, out: StringIO) -> None:
+    transport = FakeTransport(
+        parameters={
+            "eu-west-10": {"/SugarWater/latest": "1.2.3"},
+            "eu-west-11": {"/SugarWater/latest": "1.2.4"},
+        },
+    )
+
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-10", "eu-west-11", "us-broken-1"],
+        transport,
+    )
+
+    assert run(artifact.get_version()) == VersionInfo(1, 2, 4)
+    assert run(artifact.get_key()) == "SugarWater@1.2.4"
+
+
+def test_get_version__no_quorum(bucket_names: BucketNames, out: StringIO) -> None:
+    transport = FakeTransport(
+        parameters={"eu-west-10": {"/SugarWater/latest": "1.2.3"}},
+    )
+
+    artifact = make_artifact(
+        bucket_names,
+        out,
+        ["eu-west-10", "us-broken-1", "us-broken-1"],
+        transport,
+    )
+
+    with raises(NoRegionsAvailable):
+        run(artifact.get_version())
+
+
+def test_project(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out, [], FakeTransport())
+    assert artifact.project == "SugarWater"
+
+
+def test_rank_regions(bucket_names: BucketNames, out: StringIO) -> None:
+    transport = FakeTransport()
+    regions = ["eu-west-10", "eu-west-11"]
+    artifact = make_artifact(bucket_names, out, regions, transport)
+
+    assert run(artifact.rank_regions()) == regions
+    assert transport.runs == 1
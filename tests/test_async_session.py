@@ -0,0 +1,101 @@
+from asyncio import run
+from io import StringIO
+from pathlib import Path
+
+from mock import Mock
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact import BucketNames, ConfigurationLoader, Session
+from startifact.async_session import AsyncSession
+from startifact.region_ranker import RegionRanker
+from startifact.thread_transport import ThreadTransport
+from tests.test_async_artifact import FakeTransport
+
+
+def make_session(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+    out: StringIO,
+) -> Session:
+
+    return Session(
+        bucket_names=bucket_names,
+        configuration_loader=configuration_loader,
+        out=out,
+        region_ranker=RegionRanker(jitter=0),
+        regions=["eu-west-10", "eu-west-11"],
+    )
+
+
+def test_get(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+    out: StringIO,
+) -> None:
+
+    configuration_loader.loaded["bucket_key_prefix"] = "prefix/"
+    session = make_session(bucket_names, configuration_loader, out)
+    transport = FakeTransport(objects={"eu-west-11": {"prefix/SugarWater@1.2.3": b""}})
+    async_session = AsyncSession(session=session, transport=transport)
+
+    async def download() -> None:
+        artifact = await async_session.get("SugarWater", VersionInfo(1, 2, 3))
+        await artifact.download(Path("a.whl"))
+
+    run(download())
+
+    assert transport.downloads == [
+        ("eu-west-11", "bucket-11", "prefix/SugarWater@1.2.3", Path("a.whl")),
+    ]
+
+
+def test_get_latest_versions(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+    out: StringIO,
+) -> None:
+
+    session = make_session(bucket_names, configuration_loader, out)
+    transport = FakeTransport(
+        parameters={
+            "eu-west-10": {"/SugarWater/latest": "1.2.3", "/Foo/latest": "0.1.0"},
+            "eu-west-11": {"/SugarWater/latest": "1.2.3", "/Foo/latest": "0.1.0"},
+        },
+    )
+
+    async_session = AsyncSession(session=session, transport=transport)
+    versions = run(async_session.get_latest_versions(["SugarWater", "Foo"]))
+
+    assert versions == {
+        "Foo": VersionInfo(0, 1, 0),
+        "SugarWater": VersionInfo(1, 2, 3),
+    }
+
+
+def test_init__default_transport() -> None:
+    session = Session(part_concurrency=3, part_size=1024)
+    async_session = AsyncSession(session=session)
+    assert async_session.session is session
+    assert isinstance(async_session._transport, ThreadTransport)
+
+
+def test_stage() -> None:
+    session = Mock()
+    async_session = AsyncSession(session=session, transport=FakeTransport())
+
+    run(
+        async_session.stage(
+            "SugarWater",
+            VersionInfo(1, 2, 3),
+            Path("LICENSE"),
+            metadata={"foo": "bar"},
+        )
+    )
+
+    session.stage.assert_called_once_with(
+        "SugarWater",
+        VersionInfo(1, 2, 3),
+        Path("LICENSE"),
+        metadata={"foo": "bar"},
+        save_filename=False,
+    )
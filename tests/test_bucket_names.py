@@ -1,6 +1,9 @@
+from pathlib import Path
+
 from mock import Mock, patch
 
 from startifact import BucketNames
+from startifact.cache import read_json
 from startifact.parameters import BucketParameter
 
 
@@ -16,5 +19,97 @@ def test_get(session: Mock) -> None:
     with patch("startifact.bucket_names.BucketParameter", return_value=bp) as bp_cls:
         name = bucket_names.get(session)
 
-    bp_cls.assert_called_once_with(name="/buckets/staging", session=session)
+    bp_cls.assert_called_once_with(
+        batcher=None,
+        name="/buckets/staging",
+        session=session,
+    )
+    assert name == "buck"
+
+
+def test_get__shared(session: Mock, tmp_path: Path) -> None:
+    path = tmp_path / "buckets.json"
+    BucketNames("/buckets/staging", path=path).add("eu-west-10", "buck")
+
+    bucket_names = BucketNames("/buckets/staging", path=path)
+
+    with patch("startifact.bucket_names.BucketParameter") as bp_cls:
+        name = bucket_names.get(session)
+
+    bp_cls.assert_not_called()
     assert name == "buck"
+
+
+def test_get__unknown_identity(
+    cache_identity: Mock,
+    session: Mock,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "buckets.json"
+    cache_identity.return_value = None
+
+    BucketNames("/buckets/staging", path=path).add("eu-west-10", "buck")
+
+    assert not path.exists()
+
+
+def test_get__shared_expired(session: Mock, tmp_path: Path) -> None:
+    path = tmp_path / "buckets.json"
+
+    with patch("startifact.bucket_names.time", return_value=1000):
+        BucketNames("/buckets/staging", path=path).add("eu-west-10", "old")
+
+    bucket_names = BucketNames("/buckets/staging", path=path, ttl=60)
+
+    bp = BucketParameter(
+        name="",
+        session=session,
+        value="new",
+    )
+
+    with patch("startifact.bucket_names.time", return_value=1061):
+        with patch("startifact.bucket_names.BucketParameter", return_value=bp):
+            name = bucket_names.get(session)
+
+        # The refreshed name is shared too.
+        assert BucketNames("/buckets/staging", path=path).get(session) == "new"
+
+    assert name == "new"
+
+
+def test_add__prunes_expired(cache_identity: Mock, tmp_path: Path) -> None:
+    path = tmp_path / "buckets.json"
+
+    with patch("startifact.bucket_names.time", return_value=1000):
+        BucketNames("/buckets/staging", path=path).add("eu-west-10", "old")
+
+    cache_identity.return_value = "rotated"
+
+    with patch("startifact.bucket_names.time", return_value=1061):
+        BucketNames("/buckets/staging", path=path, ttl=60).add("eu-west-10", "new")
+
+    entries = read_json(path)
+    assert entries
+    assert list(entries.values()) == [{"name": "new", "saved": 1061}]
+
+
+def test_get__shared_other_parameter(session: Mock, tmp_path: Path) -> None:
+    path = tmp_path / "buckets.json"
+    BucketNames("/buckets/other", path=path).add("eu-west-10", "other")
+
+    bucket_names = BucketNames("/buckets/staging", path=path)
+
+    bp = BucketParameter(
+        name="",
+        session=session,
+        value="buck",
+    )
+
+    with patch("startifact.bucket_names.BucketParameter", return_value=bp):
+        name = bucket_names.get(session)
+
+    assert name == "buck"
+
+
+def test_make_path(cache_dir: Path) -> None:
+    assert BucketNames.make_path() == cache_dir / "buckets.json"
@@ -0,0 +1,150 @@
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from pathlib import Path
+from typing import Optional
+
+from _pytest.monkeypatch import MonkeyPatch
+from botocore.exceptions import ConnectTimeoutError
+from mock import Mock, patch
+
+from startifact.cache import (
+    get_cache_dir,
+    get_cache_scope,
+    get_identity,
+    locked,
+    read_json,
+    write_json,
+)
+
+
+def test_get_cache_dir(cache_dir: Path) -> None:
+    assert get_cache_dir() == cache_dir
+
+
+def test_get_cache_dir__xdg(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("STARTIFACT_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+    assert get_cache_dir() == Path("/xdg/startifact")
+
+
+def test_get_cache_dir__home(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("STARTIFACT_CACHE_DIR")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    assert get_cache_dir() == Path.home() / ".cache" / "startifact"
+
+
+def test_get_cache_scope(cache_identity: Mock, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("AWS_PROFILE", "dev")
+    assert get_cache_scope() == "dev:identity"
+    cache_identity.assert_called_once_with("dev")
+
+
+def test_get_cache_scope__unknown(cache_identity: Mock) -> None:
+    cache_identity.return_value = None
+    assert get_cache_scope() is None
+
+
+def get_identity_for(arn: str) -> Optional[str]:
+    # The real function, imported before the fixture patched it.
+    get_identity.cache_clear()
+
+    with patch("boto3.session.Session") as session_cls:
+        sts = session_cls.return_value.client.return_value
+        sts.get_caller_identity = Mock(return_value={"Arn": arn})
+
+        try:
+            identity = get_identity("dev")
+            cached = get_identity("dev")
+        finally:
+            get_identity.cache_clear()
+
+    session_cls.assert_called_once_with(profile_name="dev")
+    assert cached == identity
+    return identity
+
+
+def test_get_identity() -> None:
+    identity = get_identity_for("arn:aws:iam::123456789012:user/bob")
+    assert identity == sha256(b"arn:aws:iam::123456789012:user/bob").hexdigest()[:16]
+
+
+def test_get_identity__assumed_role() -> None:
+    arn = "arn:aws:sts::123456789012:assumed-role/deploy/"
+
+    # Rotated sessions of the same role share an identity.
+    assert get_identity_for(arn + "run-1") == get_identity_for(arn + "run-2")
+    assert get_identity_for(arn + "run-1") != get_identity_for(
+        "arn:aws:sts::123456789012:assumed-role/other/run-1"
+    )
+
+
+def test_get_identity__timeout() -> None:
+    get_identity.cache_clear()
+
+    with patch("boto3.session.Session") as session_cls:
+        session_cls.return_value.region_name = None
+        sts = session_cls.return_value.client.return_value
+        sts.get_caller_identity = Mock(
+            side_effect=ConnectTimeoutError(endpoint_url="https://sts.amazonaws.com")
+        )
+
+        try:
+            assert get_identity("dev") is None
+            assert get_identity("dev") is None
+        finally:
+            get_identity.cache_clear()
+
+    # STS isn't asked again after failing.
+    sts.get_caller_identity.assert_called_once_with()
+
+    kwargs = session_cls.return_value.client.call_args.kwargs
+    assert kwargs["region_name"] == "us-east-1"
+    assert getattr(kwargs["config"], "connect_timeout") == 5
+    assert getattr(kwargs["config"], "retries")["max_attempts"] == 3
+
+
+def test_get_identity__unknown_profile() -> None:
+    get_identity.cache_clear()
+
+    try:
+        assert get_identity("no-such-profile") is None
+    finally:
+        get_identity.cache_clear()
+
+
+def test_read_json__invalid(tmp_path: Path) -> None:
+    path = tmp_path / "invalid.json"
+    path.write_text("{")
+    assert read_json(path) is None
+
+
+def test_read_json__missing(tmp_path: Path) -> None:
+    assert read_json(tmp_path / "missing.json") is None
+
+
+def test_write_json(cache_dir: Path) -> None:
+    path = cache_dir / "deep" / "foo.json"
+    write_json(path, {"foo": "bar"})
+    assert read_json(path) == {"foo": "bar"}
+    assert [p.name for p in path.parent.iterdir()] == ["foo.json"]
+
+
+def test_write_json__fail(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    # Can't create a directory beneath a file, but shouldn't raise.
+    write_json(blocker / "foo.json", {"foo": "bar"})
+
+
+def test_locked(tmp_path: Path) -> None:
+    path = tmp_path / "counter.json"
+
+    def increment(_: int) -> None:
+        with locked(path):
+            write_json(path, (read_json(path) or 0) + 1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(increment, range(50)))
+
+    assert read_json(path) == 50
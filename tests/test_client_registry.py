@@ -0,0 +1,36 @@
+from startifact.client_registry import ClientRegistry
+
+
+def test_config() -> None:
+    # Config's attributes are set dynamically, so they're read by name.
+    registry = ClientRegistry(
+        connect_timeout=2,
+        max_attempts=4,
+        max_pool_connections=7,
+        read_timeout=9,
+        tcp_keepalive=False,
+    )
+
+    assert getattr(registry.config, "connect_timeout") == 2
+    assert getattr(registry.config, "max_pool_connections") == 7
+    assert getattr(registry.config, "read_timeout") == 9
+    retries = getattr(registry.config, "retries")
+    assert retries == {"max_attempts": 4, "mode": "standard"}
+    assert getattr(registry.config, "tcp_keepalive") is False
+
+
+def test_config__bounded() -> None:
+    config = ClientRegistry().config
+
+    assert getattr(config, "connect_timeout") == 5
+    assert getattr(config, "read_timeout") == 30
+    assert getattr(config, "retries") == {"max_attempts": 3, "mode": "standard"}
+
+
+def test_session() -> None:
+    registry = ClientRegistry()
+    session = registry.session("eu-west-10")
+
+    assert session.region_name == "eu-west-10"
+    assert registry.session("eu-west-10") is session
+    assert registry.session("eu-west-11") is not session
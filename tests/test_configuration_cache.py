@@ -0,0 +1,152 @@
+from pathlib import Path
+from typing import Any
+
+from _pytest.monkeypatch import MonkeyPatch
+from mock import Mock, patch
+from pytest import mark
+
+from startifact.cache import read_json, write_json
+from startifact.configuration import Configuration
+from startifact.configuration_cache import ConfigurationCache
+
+
+def test_get__empty(tmp_path: Path) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    assert cache.get(["eu-west-10"]) == (None, False)
+
+
+def test_get__fresh(empty_config: Configuration, tmp_path: Path) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    cache.put(["eu-west-10"], empty_config)
+    assert cache.get(["eu-west-10"]) == (empty_config, True)
+
+
+def test_get__shuffled_regions(empty_config: Configuration, tmp_path: Path) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    cache.put(["eu-west-10", "eu-west-11", "eu-west-12"], empty_config)
+
+    regions = ["eu-west-12", "eu-west-10", "eu-west-11"]
+    assert cache.get(regions) == (empty_config, True)
+
+
+@mark.parametrize(
+    "entry",
+    [
+        "nonsense",
+        {"saved": 1000},
+        {"configuration": None, "saved": 1000},
+        {"configuration": {"regions": "eu-west-10"}, "saved": 1000},
+        {"configuration": {}, "saved": "yesterday"},
+    ],
+)
+def test_get__malformed(entry: Any, tmp_path: Path) -> None:
+    path = tmp_path / "configuration.json"
+    cache = ConfigurationCache(path)
+    write_json(path, {cache.make_scope(["eu-west-10"]): entry})
+
+    with patch("startifact.configuration_cache.time", return_value=1030):
+        assert cache.get(["eu-west-10"]) == (None, False)
+
+
+def test_get__other_identity(
+    cache_identity: Mock,
+    empty_config: Configuration,
+    tmp_path: Path,
+) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    cache.put(["eu-west-10"], empty_config)
+
+    cache_identity.return_value = "other"
+    assert cache.get(["eu-west-10"]) == (None, False)
+
+
+def test_get__other_profile(
+    empty_config: Configuration,
+    monkeypatch: MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    cache.put(["eu-west-10"], empty_config)
+
+    monkeypatch.setenv("AWS_PROFILE", "other")
+    assert cache.get(["eu-west-10"]) == (None, False)
+
+
+def test_put__unknown_identity(
+    cache_identity: Mock,
+    empty_config: Configuration,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "configuration.json"
+    cache = ConfigurationCache(path)
+    cache_identity.return_value = None
+
+    cache.put(["eu-west-10"], empty_config)
+
+    assert not path.exists()
+    assert cache.get(["eu-west-10"]) == (None, False)
+
+
+def test_get__other_regions(empty_config: Configuration, tmp_path: Path) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    cache.put(["eu-west-10"], empty_config)
+    assert cache.get(["eu-west-11"]) == (None, False)
+
+
+def test_get__stale(empty_config: Configuration, tmp_path: Path) -> None:
+    cache = ConfigurationCache(
+        tmp_path / "configuration.json",
+        max_staleness=60,
+        ttl=10,
+    )
+
+    with patch("startifact.configuration_cache.time", return_value=1000):
+        cache.put(["eu-west-10"], empty_config)
+
+    with patch("startifact.configuration_cache.time", return_value=1030):
+        assert cache.get(["eu-west-10"]) == (empty_config, False)
+
+    with patch("startifact.configuration_cache.time", return_value=1070):
+        assert cache.get(["eu-west-10"]) == (None, False)
+
+
+def test_put__prunes_stale(
+    cache_identity: Mock,
+    empty_config: Configuration,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "configuration.json"
+    cache = ConfigurationCache(path, max_staleness=60)
+
+    with patch("startifact.configuration_cache.time", return_value=1000):
+        cache.put(["eu-west-10"], empty_config)
+
+    cache_identity.return_value = "recent"
+
+    with patch("startifact.configuration_cache.time", return_value=1030):
+        cache.put(["eu-west-10"], empty_config)
+
+    cache_identity.return_value = "rotated"
+
+    with patch("startifact.configuration_cache.time", return_value=1061):
+        cache.put(["eu-west-10"], empty_config)
+
+    entries = read_json(path)
+    assert entries
+    assert sorted(e["saved"] for e in entries.values()) == [1030, 1061]
+
+
+def test_invalidate(empty_config: Configuration, tmp_path: Path) -> None:
+    cache = ConfigurationCache(tmp_path / "configuration.json")
+    cache.put(["eu-west-10"], empty_config)
+    cache.invalidate()
+
+    assert not cache.path.exists()
+    assert cache.get(["eu-west-10"]) == (None, False)
+
+    # Invalidating an empty cache is fine too.
+    cache.invalidate()
+
+
+def test_path__default(cache_dir: Path) -> None:
+    assert ConfigurationCache().path == cache_dir / "configuration.json"
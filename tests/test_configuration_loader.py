@@ -65,3 +65,68 @@ def test_loaded__fail_then_success(empty_config: Configuration, out: StringIO) -
 
     assert config is empty_config
     assert out.getvalue() == ""
+
+
+def test_loaded__cache_fresh(empty_config: Configuration, out: StringIO) -> None:
+    cache = Mock()
+    cache.get = Mock(return_value=(empty_config, True))
+
+    loader = ConfigurationLoader(cache=cache, out=out, regions=["eu-east-7"])
+
+    with patch.object(loader, "operate") as operate:
+        config = loader.loaded
+
+    operate.assert_not_called()
+    cache.put.assert_not_called()
+    assert config is empty_config
+    assert loader.revalidation is None
+    assert out.getvalue() == "🌍 Configuration loaded from the cache.\n"
+
+
+def test_loaded__cache_miss(empty_config: Configuration, out: StringIO) -> None:
+    cache = Mock()
+    cache.get = Mock(return_value=(None, False))
+
+    loader = ConfigurationLoader(cache=cache, out=out, regions=["eu-east-7"])
+
+    with patch.object(loader, "operate", return_value=empty_config):
+        config = loader.loaded
+
+    cache.put.assert_called_once_with(["eu-east-7"], empty_config)
+    assert config is empty_config
+
+
+def test_loaded__cache_stale(empty_config: Configuration, out: StringIO) -> None:
+    stale = Configuration(**{**empty_config, "bucket_key_prefix": "stale/"})
+
+    cache = Mock()
+    cache.get = Mock(return_value=(stale, False))
+
+    loader = ConfigurationLoader(cache=cache, out=out, regions=["eu-east-7"])
+
+    with patch.object(loader, "read", return_value=empty_config) as read:
+        config = loader.loaded
+        assert loader.revalidation
+        loader.revalidation.join()
+
+    assert config is stale
+    read.assert_called_once()
+    cache.put.assert_called_once_with(["eu-east-7"], empty_config)
+
+    # The revalidation mustn't interrupt the output.
+    assert out.getvalue() == "🌍 Configuration loaded from the cache.\n"
+
+
+def test_loaded__cache_stale_fail(empty_config: Configuration, out: StringIO) -> None:
+    cache = Mock()
+    cache.get = Mock(return_value=(empty_config, False))
+
+    loader = ConfigurationLoader(cache=cache, out=out, regions=["eu-east-7"])
+
+    with patch.object(loader, "read", return_value=None):
+        config = loader.loaded
+        assert loader.revalidation
+        loader.revalidation.join()
+
+    assert config is empty_config
+    cache.put.assert_not_called()
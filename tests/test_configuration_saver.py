@@ -86,8 +86,8 @@ def test_receive_done__error(empty_config: Configuration, out: StringIO) -> None
     ns = "startifact.configuration_saver.RegionalConfigurationSaver.operate"
     with patch(ns, side_effect=Exception("fire")):
         saver.enqueue_save("us-west-12")
+        saver.receive_done()
 
-    saver.receive_done()
     assert not saver.saves_in_progress
     assert out.getvalue() == "fire\n"
 
@@ -0,0 +1,32 @@
+from pathlib import Path
+from pickle import dumps, loads
+
+from mock import patch
+
+from startifact.file_hash import FileHash
+
+
+def test_b64_md5() -> None:
+    file_hash = FileHash(Path("LICENSE"))
+    assert not file_hash.calculated
+
+    with patch("startifact.file_hash.get_b64_md5", return_value="hash") as get:
+        assert file_hash.b64_md5 == "hash"
+        assert file_hash.b64_md5 == "hash"
+
+    get.assert_called_once_with(Path("LICENSE"))
+    assert file_hash.calculated
+
+
+def test_b64_md5__known() -> None:
+    file_hash = FileHash(Path("LICENSE"), b64_md5="hash")
+
+    with patch("startifact.file_hash.get_b64_md5") as get:
+        assert file_hash.b64_md5 == "hash"
+
+    get.assert_not_called()
+
+
+def test_pickle() -> None:
+    file_hash = loads(dumps(FileHash(Path("LICENSE"))))
+    assert file_hash.b64_md5 == "6xhIwkLW8kCvybESBUX1iA=="  # cspell:disable-line
@@ -0,0 +1,69 @@
+from io import SEEK_CUR, SEEK_END
+from pathlib import Path
+
+from pytest import raises
+
+from startifact.file_source import FileSource
+
+
+def test_assert_readable(tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abc")
+    FileSource(path).assert_readable()
+
+
+def test_assert_readable__missing(tmp_path: Path) -> None:
+    with raises(FileNotFoundError):
+        FileSource(tmp_path / "missing.bin").assert_readable()
+
+
+def test_chunks(tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abcdefg")
+
+    with FileSource(path) as source:
+        chunks = [bytes(chunk) for chunk in source.chunks(3)]
+
+    assert chunks == [b"abc", b"def", b"g"]
+
+
+def test_empty(tmp_path: Path) -> None:
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    with FileSource(path) as source:
+        assert source.size == 0
+        assert list(source.chunks()) == []
+        assert source.reader().read() == b""
+
+
+def test_reader(tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abcdefg")
+
+    with FileSource(path) as source:
+        with source.reader(2, 4) as reader:
+            assert reader.read(3) == b"cde"
+            assert reader.tell() == 3
+            assert reader.read() == b"f"
+            assert reader.read() == b""
+
+            assert reader.seek(1) == 1
+            assert reader.read(1) == b"d"
+            assert reader.seek(-1, SEEK_CUR) == 1
+            assert reader.seek(-2, SEEK_END) == 2
+            assert reader.read() == b"ef"
+
+            with raises(ValueError):
+                reader.seek(-1)
+
+
+def test_view(tmp_path: Path) -> None:
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"abcdefg")
+
+    with FileSource(path) as source:
+        assert source.size == 7
+
+        with source.view(5, 10) as view:
+            assert bytes(view) == b"fg"
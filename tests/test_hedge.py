@@ -0,0 +1,96 @@
+from asyncio import CancelledError, Event, run, sleep
+from threading import Event as ThreadEvent
+from typing import List, Optional
+
+from startifact.hedge import async_hedge, hedge
+
+
+def test_async_hedge() -> None:
+    cancelled: List[str] = []
+
+    async def call(region: str) -> Optional[str]:
+        if region == "eu-west-10":
+            try:
+                # Never answers.
+                await Event().wait()
+            except CancelledError:
+                cancelled.append(region)
+                raise
+        return region
+
+    async def run_hedge() -> Optional[str]:
+        result = await async_hedge(
+            call,
+            ["eu-west-10", "eu-west-11"],
+            lambda r: r is not None,
+            delay=0.01,
+        )
+        # Give the cancelled task a chance to finish.
+        await sleep(0)
+        return result
+
+    assert run(run_hedge()) == "eu-west-11"
+    assert cancelled == ["eu-west-10"]
+
+
+def test_async_hedge__none_final() -> None:
+    async def call(region: str) -> Optional[str]:
+        return None
+
+    assert run(async_hedge(call, ["eu-west-10", "eu-west-11"], bool)) is None
+
+
+def test_hedge() -> None:
+    # The first region hangs, so the second region should be called after the
+    # delay and win.
+    slow = ThreadEvent()
+
+    def call(region: str) -> str:
+        if region == "eu-west-10":
+            slow.wait(timeout=10)
+        return region
+
+    try:
+        result = hedge(call, ["eu-west-10", "eu-west-11"], bool, delay=0.01)
+    finally:
+        slow.set()
+
+    assert result == "eu-west-11"
+
+
+def test_hedge__concurrency() -> None:
+    called: List[str] = []
+
+    def call(region: str) -> Optional[str]:
+        called.append(region)
+        return None if region == "eu-west-10" else region
+
+    # With only one call allowed at a time, the second region must wait for
+    # the first to answer no matter how short the delay.
+    result = hedge(
+        call,
+        ["eu-west-10", "eu-west-11", "eu-west-12"],
+        lambda r: r is not None,
+        concurrency=1,
+    )
+
+    assert called == ["eu-west-10", "eu-west-11"]
+    assert result == "eu-west-11"
+
+
+def test_hedge__none_final() -> None:
+    result = hedge(lambda r: None, ["eu-west-10", "eu-west-11"], bool)
+    assert result is None
+
+
+def test_hedge__quorum() -> None:
+    answers: List[int] = []
+
+    def is_quorate(answer: int) -> bool:
+        answers.append(answer)
+        return len(answers) >= 2
+
+    regions = ["eu-west-10", "eu-west-11", "eu-west-12"]
+
+    assert hedge(lambda r: int(r[-2:]), regions, is_quorate, concurrency=1) == 11
+    assert answers == [10, 11]
@@ -1,5 +1,28 @@
+from subprocess import run
+from sys import executable
+
+from pytest import raises
+
+import startifact
 from startifact import Session
 
 
+def test_dir() -> None:
+    assert "Session" in dir(startifact)
+
+
+def test_getattr__unknown() -> None:
+    with raises(AttributeError) as ex:
+        getattr(startifact, "Nope")
+
+    assert str(ex.value) == "module 'startifact' has no attribute 'Nope'"
+
+
+def test_lazy() -> None:
+    code = "import sys, startifact.cli; print('boto3' in sys.modules)"
+    result = run([executable, "-c", code], capture_output=True, check=True, text=True)
+    assert result.stdout == "False\n"
+
+
 def test_session() -> None:
     assert Session()
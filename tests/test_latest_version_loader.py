@@ -1,5 +1,8 @@
 from io import StringIO
+from threading import Event
+from typing import Dict, Optional
 
+from boto3.session import Session
 from mock import Mock, patch
 from pytest import mark, raises
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
@@ -76,8 +79,8 @@ def test_successes_required(
 
 def test_version__exclude_fails(out: StringIO) -> None:
     # This loader is given five regions, so it'll take the latest version
-    # returned by three successful interrogations. The second region will fail,
-    # so we should see four interrogations.
+    # returned by the first three successful interrogations. The second region
+    # will fail and the last region won't answer until we're done.
 
     loader = LatestVersionLoader(
         out=out,
@@ -91,22 +94,86 @@ def test_version__exclude_fails(out: StringIO) -> None:
         ],
     )
 
-    effects = [
-        VersionInfo(1, 0),
-        None,
-        VersionInfo(0, 9),
-        VersionInfo(1, 1),
-        VersionInfo(9, 0),  # Shouldn't get this far.
-    ]
+    slow = Event()
 
-    with patch.object(loader, "interrogate", side_effect=effects) as i:
-        version = loader.version
+    effects = {
+        "us-east-5": VersionInfo(1, 0),
+        "us-east-6": None,
+        "us-east-7": VersionInfo(0, 9),
+        "us-east-8": VersionInfo(1, 1),
+        "us-east-9": VersionInfo(9, 0),  # Shouldn't be counted.
+    }
+
+    def interrogate(session: Session) -> Optional[VersionInfo]:
+        if session.region_name == "us-east-9":
+            slow.wait(timeout=10)
+        return effects[session.region_name]
+
+    try:
+        with patch.object(loader, "interrogate", side_effect=interrogate):
+            version = loader.version
+    finally:
+        slow.set()
 
-    assert i.call_count == 4
     assert version == VersionInfo(1, 1)
     assert out.getvalue() == ""
 
 
+def test_version__quiet_after_decided(out: StringIO) -> None:
+    # One of the two regions is enough, so the slow region is abandoned and
+    # mustn't write its claim after the version has been returned.
+
+    finished = Event()
+    released = Event()
+    started = Event()
+
+    def make_session(region: str) -> Mock:
+        def get_parameter(**_: str) -> Dict[str, Dict[str, str]]:
+            if region == "us-east-6":
+                started.set()
+                released.wait(timeout=10)
+            else:
+                started.wait(timeout=10)
+            return {"Parameter": {"Value": "1.0.0"}}
+
+        ssm = Mock()
+        ssm.get_parameter = Mock(side_effect=get_parameter)
+
+        session = Mock()
+        session.client = Mock(return_value=ssm)
+        session.region_name = region
+        return session
+
+    clients = Mock()
+    clients.session = Mock(side_effect=make_session)
+
+    loader = LatestVersionLoader(
+        clients=clients,
+        out=out,
+        project="SugarWater",
+        regions=["us-east-5", "us-east-6"],
+    )
+
+    interrogate_region = loader.interrogate_region
+
+    def interrogate_slowly(region: str) -> Optional[VersionInfo]:
+        try:
+            return interrogate_region(region)
+        finally:
+            if region == "us-east-6":
+                finished.set()
+
+    try:
+        with patch.object(loader, "interrogate_region", interrogate_slowly):
+            version = loader.version
+    finally:
+        released.set()
+
+    assert finished.wait(timeout=10)
+    assert version == VersionInfo(1, 0)
+    assert out.getvalue() == "🌍 us-east-5 claims SugarWater at 1.0.0.\n"
+
+
 def test_version__no_regions_available(out: StringIO) -> None:
     loader = LatestVersionLoader(
         out=out,
@@ -0,0 +1,55 @@
+from pathlib import Path
+from typing import Optional
+
+from pytest import mark, raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.manifest import load_manifest, parse_manifest_key
+
+
+def test_load_manifest(tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text('{"SugarWater@1.0.0": "sugar.zip", "Tea": "dist/tea.zip"}')
+
+    assert load_manifest(path) == {
+        "SugarWater@1.0.0": Path("sugar.zip"),
+        "Tea": Path("dist/tea.zip"),
+    }
+
+
+@mark.parametrize(
+    "body, expect",
+    [
+        ("[]", "does not describe an object"),
+        ('{"Tea": 1}', 'has a non-string path for "Tea"'),
+    ],
+)
+def test_load_manifest__invalid(body: str, expect: str, tmp_path: Path) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text(body)
+
+    with raises(ValueError) as ex:
+        load_manifest(path)
+
+    assert str(ex.value) == f"{path} {expect}"
+
+
+@mark.parametrize(
+    "key, expect_project, expect_version",
+    [
+        ("SugarWater", "SugarWater", None),
+        ("SugarWater@latest", "SugarWater", None),
+        ("SugarWater@1.2.3", "SugarWater", VersionInfo(1, 2, 3)),
+    ],
+)
+def test_parse_manifest_key(
+    key: str,
+    expect_project: str,
+    expect_version: Optional[VersionInfo],
+) -> None:
+    assert parse_manifest_key(key) == (expect_project, expect_version)
+
+
+def test_parse_manifest_key__invalid() -> None:
+    with raises(ValueError):
+        parse_manifest_key("SugarWater@cheese")
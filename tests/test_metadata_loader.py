@@ -1,4 +1,5 @@
 from io import StringIO
+from typing import Dict, Optional
 
 from mock import Mock, patch
 from pytest import raises
@@ -7,25 +8,33 @@ from startifact import BucketNames, MetadataLoader
 from startifact.exceptions import NoRegionsAvailable
 
 
-def test_loaded(bucket_names: BucketNames, session: Mock) -> None:
+def test_loaded(
+    bucket_names: BucketNames,
+    clients: Mock,
+    session: Mock,
+) -> None:
+
     loader = MetadataLoader(
         bucket_names=bucket_names,
+        clients=clients,
         key="SugarWater@1.2.3",
         regions=["us-west-14"],
     )
 
-    ns = "startifact.metadata_loader"
-
-    with patch(f"{ns}.Session", return_value=session) as session_cls:
-        with patch.object(loader, "operate", return_value={"foo": "bar"}) as op:
-            metadata = loader.loaded
+    with patch.object(loader, "operate", return_value={"foo": "bar"}) as op:
+        metadata = loader.loaded
 
-    session_cls.assert_called_once_with(region_name="us-west-14")
+    clients.session.assert_called_once_with("us-west-14")
     op.assert_called_once_with(session)
     assert metadata == {"foo": "bar"}
 
 
-def test_loaded__all_fail(bucket_names: BucketNames, session: Mock) -> None:
+def test_loaded__all_fail(
+    bucket_names: BucketNames,
+    clients: Mock,
+    session: Mock,
+) -> None:
+
     get_object = Mock(side_effect=Exception("nope"))
 
     exceptions = Mock()
@@ -40,43 +49,49 @@ def test_loaded__all_fail(bucket_names: BucketNames, session: Mock) -> None:
 
     loader = MetadataLoader(
         bucket_names=bucket_names,
+        clients=clients,
         key="SugarWater@1.2.3",
         regions=["us-west-14"],
     )
 
-    ns = "startifact.metadata_loader"
+    with raises(NoRegionsAvailable) as ex:
+        loader.loaded
 
-    with patch(f"{ns}.Session", return_value=session) as session_cls:
-        with raises(NoRegionsAvailable) as ex:
-            loader.loaded
-
-    session_cls.assert_called_once_with(region_name="us-west-14")
+    clients.session.assert_called_once_with("us-west-14")
 
     expect = "None of the configured regions are available: ['us-west-14']"
     assert str(ex.value) == expect
 
 
-def test_loaded__cache(bucket_names: BucketNames, session: Mock) -> None:
+def test_loaded__cache(
+    bucket_names: BucketNames,
+    clients: Mock,
+    session: Mock,
+) -> None:
+
     loader = MetadataLoader(
         bucket_names=bucket_names,
+        clients=clients,
         key="SugarWater@1.2.3",
         regions=["us-west-14"],
     )
 
-    ns = "startifact.metadata_loader"
-
-    with patch(f"{ns}.Session", return_value=session) as session_cls:
-        with patch.object(loader, "operate", return_value={"foo": "bar"}) as op:
-            metadata1 = loader.loaded
-            metadata2 = loader.loaded
+    with patch.object(loader, "operate", return_value={"foo": "bar"}) as op:
+        metadata1 = loader.loaded
+        metadata2 = loader.loaded
 
-    session_cls.assert_called_once_with(region_name="us-west-14")
+    clients.session.assert_called_once_with("us-west-14")
     op.assert_called_once_with(session)
     assert metadata1 == {"foo": "bar"}
     assert metadata1 is metadata2
 
 
-def test_loaded__no_metadata(bucket_names: BucketNames, session: Mock) -> None:
+def test_loaded__no_metadata(
+    bucket_names: BucketNames,
+    clients: Mock,
+    session: Mock,
+) -> None:
+
     get_object = Mock(side_effect=Exception("nope"))
 
     exceptions = Mock()
@@ -91,16 +106,14 @@ def test_loaded__no_metadata(bucket_names: BucketNames, session: Mock) -> None:
 
     loader = MetadataLoader(
         bucket_names=bucket_names,
+        clients=clients,
         key="SugarWater@1.2.3",
         regions=["us-west-14"],
     )
 
-    ns = "startifact.metadata_loader"
-
-    with patch(f"{ns}.Session", return_value=session) as session_cls:
-        metadata = loader.loaded
+    metadata = loader.loaded
 
-    session_cls.assert_called_once_with(region_name="us-west-14")
+    clients.session.assert_called_once_with("us-west-14")
     assert not metadata
 
 
@@ -188,3 +201,71 @@ def test_operate__no_metadata(bucket_names: BucketNames, session: Mock) -> None:
 
     assert metadata is None
     assert loader.any_regions_claim_no_metadata
+
+
+def test_loaded__no_metadata_anywhere(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    loader = MetadataLoader(
+        bucket_names=bucket_names,
+        clients=regional_clients,
+        key="SugarWater@1.2.3",
+        regions=["us-west-14", "us-west-15", "us-west-16"],
+    )
+
+    def operate(session: Mock) -> Optional[Dict[str, str]]:
+        if session.region_name == "us-west-15":
+            loader._any_regions_claim_no_metadata = True
+        return None
+
+    with patch.object(loader, "operate", side_effect=operate) as op:
+        metadata = loader.loaded
+
+    assert op.call_count == 3
+    assert metadata == {}
+
+
+def test_use_object_metadata(bucket_names: BucketNames, clients: Mock) -> None:
+    loader = MetadataLoader(
+        bucket_names=bucket_names,
+        clients=clients,
+        key="SugarWater@1.2.3",
+        regions=["us-west-14"],
+    )
+
+    object_metadata = {"startifact-metadata": "eyJmb28iOiJiYXIifQ=="}
+    assert loader.use_object_metadata(object_metadata)
+
+    with patch.object(loader, "operate") as op:
+        metadata = loader.loaded
+
+    op.assert_not_called()
+    assert metadata == {"foo": "bar"}
+
+
+def test_use_object_metadata__absent(bucket_names: BucketNames) -> None:
+    loader = MetadataLoader(
+        bucket_names=bucket_names,
+        key="SugarWater@1.2.3",
+        regions=["us-west-14"],
+    )
+
+    assert not loader.use_object_metadata({})
+
+
+def test_use_object_metadata__cached(metadata_loader: MetadataLoader) -> None:
+    assert metadata_loader.use_object_metadata({})
+    assert metadata_loader.loaded == {
+        "startifact:filename": "sugarwater-1.0.9000-py3-none-any.whl",
+    }
+
+
+def test_use_object_metadata__invalid(bucket_names: BucketNames) -> None:
+    loader = MetadataLoader(
+        bucket_names=bucket_names,
+        key="SugarWater@1.2.3",
+        regions=["us-west-14"],
+    )
+
+    assert not loader.use_object_metadata({"startifact-metadata": "!"})
@@ -0,0 +1,199 @@
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from mock import Mock, call
+from pytest import fixture, mark, raises
+
+from startifact.multipart_upload import MultipartUpload, make_part_ranges
+
+MIB = 1024 * 1024
+GIB = 1024 * MIB
+
+
+@fixture
+def large_file(tmp_path: Path) -> Path:
+    path = tmp_path / "large.bin"
+    path.write_bytes(b"a" * (5 * MIB) + b"b" * (5 * MIB) + b"c")
+    return path
+
+
+@fixture
+def s3() -> Mock:
+    s3 = Mock()
+    s3.create_multipart_upload = Mock(return_value={"UploadId": "upload-1"})
+    s3.bodies = {}
+
+    def upload_part(**kwargs: Any) -> Dict[str, str]:
+        # Read the body while it's still open.
+        s3.bodies[kwargs["PartNumber"]] = kwargs["Body"].read()
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    s3.upload_part = Mock(side_effect=upload_part)
+    return s3
+
+
+@mark.parametrize(
+    "size, part_size, expect",
+    [
+        (0, 10, []),
+        (10, 10, [(0, 10)]),
+        (11, 10, [(0, 10), (10, 1)]),
+        (25, 10, [(0, 10), (10, 10), (20, 5)]),
+        (30_000, 1, [(i * 3, 3) for i in range(10_000)]),
+        (
+            12 * GIB,
+            8 * GIB,
+            [(0, 5 * GIB), (5 * GIB, 5 * GIB), (10 * GIB, 2 * GIB)],
+        ),
+    ],
+)
+def test_make_part_ranges(
+    size: int,
+    part_size: int,
+    expect: List[Tuple[int, int]],
+) -> None:
+    assert make_part_ranges(size, part_size) == expect
+
+
+def test_init__part_too_small(large_file: Path, s3: Mock) -> None:
+    with raises(ValueError) as ex:
+        MultipartUpload(
+            bucket="buck",
+            client=s3,
+            concurrency=2,
+            key="SugarWater@1.2.3",
+            part_size=MIB,
+            path=large_file,
+            region="eu-west-10",
+        )
+
+    expect = f"Part size {MIB} is smaller than the minimum {5 * MIB}"
+    assert str(ex.value) == expect
+
+
+def test_upload(large_file: Path, s3: Mock) -> None:
+    upload = MultipartUpload(
+        bucket="buck",
+        client=s3,
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5 * MIB,
+        path=large_file,
+        region="eu-west-10",
+    )
+
+    upload.upload()
+
+    s3.create_multipart_upload.assert_called_once_with(
+        Bucket="buck",
+        Key="SugarWater@1.2.3",
+    )
+
+    assert s3.upload_part.call_count == 3
+
+    lengths = sorted(c.kwargs["ContentLength"] for c in s3.upload_part.call_args_list)
+    assert lengths == [1, 5 * MIB, 5 * MIB]
+
+    last_part = [
+        c.kwargs for c in s3.upload_part.call_args_list if c.kwargs["PartNumber"] == 3
+    ][0]
+
+    assert last_part["Body"].closed
+    assert s3.bodies[3] == b"c"
+    assert last_part["ContentMD5"] == "SooI8J03tzeVZJA4QItfMw=="  # cspell:disable-line
+
+    s3.complete_multipart_upload.assert_called_once_with(
+        Bucket="buck",
+        Key="SugarWater@1.2.3",
+        MultipartUpload={
+            "Parts": [
+                {"ETag": "etag-1", "PartNumber": 1},
+                {"ETag": "etag-2", "PartNumber": 2},
+                {"ETag": "etag-3", "PartNumber": 3},
+            ]
+        },
+        UploadId="upload-1",
+    )
+
+    s3.abort_multipart_upload.assert_not_called()
+
+
+def test_upload__metadata(large_file: Path, s3: Mock) -> None:
+    upload = MultipartUpload(
+        bucket="buck",
+        client=s3,
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        metadata={"startifact-metadata": "e30="},
+        part_size=5 * MIB,
+        path=large_file,
+        region="eu-west-10",
+    )
+
+    upload.upload()
+
+    s3.create_multipart_upload.assert_called_once_with(
+        Bucket="buck",
+        Key="SugarWater@1.2.3",
+        Metadata={"startifact-metadata": "e30="},
+    )
+
+
+def test_upload__fail(large_file: Path, s3: Mock) -> None:
+    s3.upload_part = Mock(side_effect=Exception("fire"))
+
+    upload = MultipartUpload(
+        bucket="buck",
+        client=s3,
+        concurrency=1,
+        key="SugarWater@1.2.3",
+        part_size=5 * MIB,
+        path=large_file,
+        region="eu-west-10",
+    )
+
+    with raises(Exception) as ex:
+        upload.upload()
+
+    assert str(ex.value) == "fire"
+    s3.complete_multipart_upload.assert_not_called()
+
+    assert s3.abort_multipart_upload.call_args_list == [
+        call(Bucket="buck", Key="SugarWater@1.2.3", UploadId="upload-1"),
+    ]
+
+
+def test_upload__copy(large_file: Path, s3: Mock) -> None:
+    s3.upload_part_copy = Mock(
+        side_effect=lambda **kw: {
+            "CopyPartResult": {"ETag": f"etag-{kw['PartNumber']}"},
+        }
+    )
+
+    upload = MultipartUpload(
+        bucket="buck",
+        client=s3,
+        concurrency=2,
+        copy_source={"Bucket": "source", "Key": "SugarWater@1.2.3"},
+        key="SugarWater@1.2.3",
+        part_size=5 * MIB,
+        path=large_file,
+        region="eu-west-10",
+    )
+
+    upload.upload()
+
+    s3.upload_part.assert_not_called()
+
+    ranges = sorted(
+        c.kwargs["CopySourceRange"] for c in s3.upload_part_copy.call_args_list
+    )
+
+    assert ranges == [
+        f"bytes=0-{5 * MIB - 1}",
+        f"bytes={10 * MIB}-{10 * MIB}",
+        f"bytes={5 * MIB}-{10 * MIB - 1}",
+    ]
+
+    parts = s3.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+    assert [p["ETag"] for p in parts] == ["etag-1", "etag-2", "etag-3"]
@@ -0,0 +1,150 @@
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict
+
+from mock import Mock
+from pytest import fixture, raises
+
+from startifact.ranged_download import RangedDownload
+
+CONTENT = b"abcdefghijklmnopqrstuvwxyz"
+
+
+def get_object(**kwargs: Any) -> Dict[str, Any]:
+    start, end = [int(n) for n in kwargs["Range"].split("=")[1].split("-")]
+    end += 1
+    return {"Body": BytesIO(CONTENT[start:end])}
+
+
+@fixture
+def s3() -> Mock:
+    s3 = Mock()
+    s3.head_object = Mock(return_value={"ContentLength": 26, "ETag": '"etag"'})
+    s3.get_object = Mock(side_effect=get_object)
+    return s3
+
+
+def test_download(s3: Mock, tmp_path: Path) -> None:
+    path = tmp_path / "download.bin"
+
+    RangedDownload(
+        bucket="buck",
+        client=s3,
+        concurrency=3,
+        key="SugarWater@1.2.3",
+        part_size=10,
+        path=path,
+        region="eu-west-10",
+    ).download()
+
+    assert path.read_bytes() == CONTENT
+
+    s3.head_object.assert_called_once_with(Bucket="buck", Key="SugarWater@1.2.3")
+
+    ranges = sorted(c.kwargs["Range"] for c in s3.get_object.call_args_list)
+    assert ranges == ["bytes=0-9", "bytes=10-19", "bytes=20-25"]
+
+    assert {c.kwargs["IfMatch"] for c in s3.get_object.call_args_list} == {'"etag"'}
+
+
+def test_download__known(s3: Mock, tmp_path: Path) -> None:
+    path = tmp_path / "download.bin"
+
+    RangedDownload(
+        bucket="buck",
+        client=s3,
+        concurrency=3,
+        etag='"known"',
+        key="SugarWater@1.2.3",
+        part_size=10,
+        path=path,
+        region="eu-west-10",
+        size=26,
+    ).download()
+
+    assert path.read_bytes() == CONTENT
+    s3.head_object.assert_not_called()
+    assert {c.kwargs["IfMatch"] for c in s3.get_object.call_args_list} == {'"known"'}
+
+
+def test_download__empty(s3: Mock, tmp_path: Path) -> None:
+    s3.head_object = Mock(return_value={"ContentLength": 0})
+    path = tmp_path / "download.bin"
+
+    RangedDownload(
+        bucket="buck",
+        client=s3,
+        concurrency=3,
+        key="SugarWater@1.2.3",
+        part_size=10,
+        path=path,
+        region="eu-west-10",
+    ).download()
+
+    assert path.read_bytes() == b""
+    s3.get_object.assert_not_called()
+
+
+def test_download__fail(s3: Mock, tmp_path: Path) -> None:
+    s3.get_object = Mock(side_effect=Exception("fire"))
+    path = tmp_path / "download.bin"
+
+    download = RangedDownload(
+        bucket="buck",
+        client=s3,
+        concurrency=1,
+        key="SugarWater@1.2.3",
+        part_size=10,
+        path=path,
+        region="eu-west-10",
+    )
+
+    with raises(Exception) as ex:
+        download.download()
+
+    assert str(ex.value) == "fire"
+    assert not path.exists()
+
+
+def test_download__short(s3: Mock, tmp_path: Path) -> None:
+    s3.head_object = Mock(return_value={"ContentLength": 10})
+    s3.get_object = Mock(return_value={"Body": BytesIO(b"abc")})
+    path = tmp_path / "download.bin"
+
+    download = RangedDownload(
+        bucket="buck",
+        client=s3,
+        concurrency=1,
+        key="SugarWater@1.2.3",
+        part_size=10,
+        path=path,
+        region="eu-west-10",
+    )
+
+    with raises(Exception) as ex:
+        download.download()
+
+    assert str(ex.value) == "Expected 10 bytes from offset 0 but received 3"
+    assert not path.exists()
+
+
+def test_download__fail__keeps_existing(s3: Mock, tmp_path: Path) -> None:
+    s3.get_object = Mock(side_effect=Exception("fire"))
+    path = tmp_path / "download.bin"
+    path.write_bytes(b"existing")
+
+    download = RangedDownload(
+        bucket="buck",
+        client=s3,
+        concurrency=1,
+        key="SugarWater@1.2.3",
+        part_size=10,
+        path=path,
+        region="eu-west-10",
+    )
+
+    with raises(Exception):
+        download.download()
+
+    assert path.read_bytes() == b"existing"
+    assert list(tmp_path.iterdir()) == [path]
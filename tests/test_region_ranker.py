@@ -0,0 +1,200 @@
+from asyncio import CancelledError, Event, create_task, run, sleep
+from pathlib import Path
+from typing import Any
+from weakref import WeakSet
+
+from mock import patch
+from pytest import approx, mark, raises
+
+from startifact.cache import read_json, write_json
+from startifact.region_ranker import RegionRanker, save_all
+
+
+def test_measure() -> None:
+    ranker = RegionRanker()
+
+    with ranker.measure("eu-west-10"):
+        pass
+
+    assert ranker.measurements["eu-west-10"]["error_rate"] == 0
+
+
+def test_measure__fail() -> None:
+    ranker = RegionRanker()
+
+    with raises(ValueError):
+        with ranker.measure("eu-west-10"):
+            raise ValueError("fire")
+
+    assert ranker.measurements["eu-west-10"]["error_rate"] == 1
+
+
+def test_measure__cancelled() -> None:
+    ranker = RegionRanker()
+    ranker.record("eu-west-10", 0.1, ok=True)
+    before = dict(ranker.measurements["eu-west-10"])
+
+    async def measure() -> None:
+        with ranker.measure("eu-west-10"):
+            await Event().wait()
+
+    async def cancel() -> None:
+        task = create_task(measure())
+        await sleep(0)
+        task.cancel()
+
+        with raises(CancelledError):
+            await task
+
+    run(cancel())
+
+    assert ranker.measurements["eu-west-10"] == before
+
+
+@mark.parametrize(
+    "saved",
+    [
+        "nonsense",
+        {"eu-west-10": "nonsense"},
+        {"eu-west-10": {"latency": 1.0}},
+        {"eu-west-10": {"error_rate": 0.0, "latency": "slow"}},
+        {"eu-west-10": {"error_rate": None, "latency": 1.0}},
+    ],
+)
+def test_measurements__malformed(cache_dir: Path, saved: Any) -> None:
+    path = cache_dir / "regions.json"
+    write_json(path, saved)
+
+    with patch("startifact.region_ranker._persisted", WeakSet()):
+        ranker = RegionRanker(jitter=0, path=path)
+
+    assert ranker.rank(["eu-west-11", "eu-west-10"]) == ["eu-west-11", "eu-west-10"]
+    assert ranker.measurements == {}
+
+    ranker.record("eu-west-10", 1.0, ok=True)
+    assert ranker.measurements["eu-west-10"] == {"error_rate": 0.0, "latency": 1.0}
+
+
+def test_rank() -> None:
+    ranker = RegionRanker(jitter=0)
+    ranker.record("eu-west-10", 0.3, ok=True)
+    ranker.record("eu-west-11", 0.1, ok=True)
+    ranker.record("eu-west-12", 0.07, ok=False)
+
+    # Unmeasured regions go first, then by latency with errors penalised.
+    regions = ["eu-west-10", "eu-west-11", "eu-west-12", "eu-west-13"]
+    expect = ["eu-west-13", "eu-west-11", "eu-west-10", "eu-west-12"]
+    assert ranker.rank(regions) == expect
+
+
+def test_rank__jitter() -> None:
+    ranker = RegionRanker(jitter=0.5)
+    ranker.record("eu-west-10", 0.1, ok=True)
+    ranker.record("eu-west-11", 0.1, ok=True)
+
+    with patch("startifact.region_ranker.uniform", side_effect=[1.5, 0.5]):
+        assert ranker.rank(["eu-west-10", "eu-west-11"]) == [
+            "eu-west-11",
+            "eu-west-10",
+        ]
+
+
+def test_rank__unmeasured() -> None:
+    regions = ["eu-west-12", "eu-west-10", "eu-west-11"]
+    assert RegionRanker().rank(regions) == regions
+
+
+def test_record__smoothing() -> None:
+    ranker = RegionRanker(smoothing=0.5)
+    ranker.record("eu-west-10", 1.0, ok=True)
+    ranker.record("eu-west-10", 3.0, ok=False)
+
+    assert ranker.measurements["eu-west-10"] == {
+        "error_rate": approx(0.5),
+        "latency": approx(2.0),
+    }
+
+
+def test_persist(cache_dir: Path) -> None:
+    path = cache_dir / "regions.json"
+
+    persisted: "WeakSet[RegionRanker]" = WeakSet()
+
+    with patch("startifact.region_ranker._persisted", persisted):
+        ranker = RegionRanker(path=path)
+
+    assert list(persisted) == [ranker]
+
+    ranker.record("eu-west-10", 1.0, ok=True)
+    assert read_json(path) is None
+
+    ranker.save()
+
+    assert read_json(path) == {"eu-west-10": {"error_rate": 0.0, "latency": 1.0}}
+    assert RegionRanker(path=path).measurements == ranker.measurements
+
+
+def test_save__merges(cache_dir: Path) -> None:
+    path = cache_dir / "regions.json"
+
+    with patch("startifact.region_ranker._persisted", WeakSet()):
+        ranker = RegionRanker(path=path)
+        ranker.record("eu-west-10", 1.0, ok=True)
+
+        # Another process saves its own measurements in the meantime.
+        other = RegionRanker(path=path)
+        other.record("eu-west-11", 2.0, ok=True)
+        other.save()
+
+    ranker.save()
+
+    assert read_json(path) == {
+        "eu-west-10": {"error_rate": 0.0, "latency": 1.0},
+        "eu-west-11": {"error_rate": 0.0, "latency": 2.0},
+    }
+
+
+def test_save__nothing_recorded(cache_dir: Path) -> None:
+    path = cache_dir / "regions.json"
+
+    with patch("startifact.region_ranker._persisted", WeakSet()):
+        RegionRanker(path=path).save()
+
+    assert not path.exists()
+
+
+def test_save_all(cache_dir: Path) -> None:
+    path = cache_dir / "regions.json"
+
+    with patch("startifact.region_ranker._persisted", WeakSet()):
+        first = RegionRanker(path=path)
+        first.record("eu-west-10", 1.0, ok=True)
+
+        second = RegionRanker(path=path)
+        second.record("eu-west-11", 2.0, ok=True)
+
+        # Rankers that aren't persisted aren't saved.
+        RegionRanker().record("eu-west-12", 3.0, ok=True)
+
+        with patch(
+            "startifact.region_ranker.write_json",
+            wraps=write_json,
+        ) as write:
+            save_all()
+
+    write.assert_called_once()
+
+    assert read_json(path) == {
+        "eu-west-10": {"error_rate": 0.0, "latency": 1.0},
+        "eu-west-11": {"error_rate": 0.0, "latency": 2.0},
+    }
+
+
+def test_save_all__collected(cache_dir: Path) -> None:
+    path = cache_dir / "regions.json"
+
+    persisted: "WeakSet[RegionRanker]" = WeakSet()
+
+    with patch("startifact.region_ranker._persisted", persisted):
+        RegionRanker(path=path)
+        assert not list(persisted)
@@ -12,7 +12,6 @@ def test(session: Mock) -> None:
     session.client = Mock(return_value=ssm)
 
     deleter = RegionalConfigurationDeleter(
-        queue=Mock(),
         read_only=False,
         session=session,
     )
@@ -13,7 +13,6 @@ def test(session: Mock) -> None:
 
     saver = RegionalConfigurationSaver(
         configuration="{}",
-        queue=Mock(),
         read_only=False,
         session=session,
     )
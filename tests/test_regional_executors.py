@@ -0,0 +1,89 @@
+from os import _exit
+from threading import Event
+from typing import List, Type
+
+from mock import Mock, patch
+from pytest import mark
+
+from startifact.regional_executors import (
+    ProcessRegionalExecutor,
+    RegionalExecutor,
+    ThreadRegionalExecutor,
+)
+from startifact.regional_process import RegionalProcess
+from startifact.regional_process_result import RegionalProcessResult
+
+
+def make_process(region: str) -> RegionalProcess:
+    session = Mock()
+    session.region_name = region
+    return RegionalProcess(read_only=True, session=session)
+
+
+@mark.parametrize("executor_type", [ProcessRegionalExecutor, ThreadRegionalExecutor])
+def test_wait(executor_type: Type[RegionalExecutor]) -> None:
+    regions = ["eu-west-10", "eu-west-11", "eu-west-12"]
+    results: List[RegionalProcessResult] = []
+
+    with patch.object(RegionalProcess, "operate"):
+        with executor_type(max_workers=2) as executor:
+            for region in regions:
+                executor.submit(make_process(region))
+
+            assert executor.in_progress == 3
+
+            while executor.in_progress:
+                results.extend(executor.wait())
+
+    assert sorted(results, key=lambda r: r.region) == [
+        RegionalProcessResult(region) for region in regions
+    ]
+
+
+@mark.parametrize("executor_type", [ProcessRegionalExecutor, ThreadRegionalExecutor])
+def test_wait__none(executor_type: Type[RegionalExecutor]) -> None:
+    with executor_type(max_workers=2) as executor:
+        assert executor.wait() == []
+
+
+def test_wait__process_crash() -> None:
+    process = make_process("eu-west-10")
+
+    with patch.object(process, "run", new=lambda: _exit(3)):
+        with ProcessRegionalExecutor(max_workers=1) as executor:
+            executor.submit(process)
+            results = executor.wait()
+
+    expect = RegionalProcessResult(
+        "eu-west-10",
+        error="Process exited with code 3",
+    )
+
+    assert results == [expect]
+    assert executor.in_progress == 0
+
+
+def test_thread_max_workers() -> None:
+    release = Event()
+    running: List[str] = []
+    started = Event()
+
+    def operate(self: RegionalProcess) -> None:
+        running.append(self.region)
+        started.set()
+        release.wait(timeout=5)
+
+    with patch.object(RegionalProcess, "operate", new=operate):
+        with ThreadRegionalExecutor(max_workers=1) as executor:
+            executor.submit(make_process("eu-west-10"))
+            executor.submit(make_process("eu-west-11"))
+
+            started.wait(timeout=5)
+            assert running == ["eu-west-10"]
+
+            release.set()
+
+            while executor.in_progress:
+                executor.wait()
+
+    assert running == ["eu-west-10", "eu-west-11"]
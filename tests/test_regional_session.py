@@ -0,0 +1,32 @@
+from botocore.config import Config
+
+from startifact.regional_session import RegionalSession
+
+
+def test_client() -> None:
+    session = RegionalSession("eu-west-10", config=Config(max_pool_connections=7))
+    s3 = session.client("s3")
+
+    assert session.client("s3") is s3
+    assert session.client("ssm") is not s3
+    assert s3.meta.config.max_pool_connections == 7
+    assert s3.meta.region_name == "eu-west-10"
+
+
+def test_client__kwargs() -> None:
+    session = RegionalSession("eu-west-10")
+    s3 = session.client("s3")
+    other = session.client("s3", region_name="eu-west-11")
+
+    assert other is not s3
+    assert other.meta.region_name == "eu-west-11"
+
+
+def test_client__positional() -> None:
+    session = RegionalSession("eu-west-10", config=Config(max_pool_connections=7))
+    s3 = session.client("s3")
+    other = session.client("s3", "eu-west-11")
+
+    assert other is not s3
+    assert other.meta.config.max_pool_connections == 7
+    assert other.meta.region_name == "eu-west-11"
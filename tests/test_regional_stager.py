@@ -1,12 +1,12 @@
-from multiprocessing import Queue
 from pathlib import Path
+from typing import Optional
 
 from mock import ANY, Mock, patch
-from pytest import raises
+from pytest import mark, raises
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
+from startifact.file_hash import FileHash
 from startifact.parameters.latest_version import LatestVersionParameter
-from startifact.regional_process_result import RegionalProcessResult
 from startifact.regional_stager import RegionalStager
 
 
@@ -36,16 +36,14 @@ def test_assert_not_exists__true(
 
 def test_operate(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> None:
     uploader = RegionalStager(
         bucket="buck",
-        file_hash="file_hash",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         path=Path("LICENSE"),
-        queue=queue,
         read_only=False,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -54,17 +52,66 @@ def test_operate(
     with patch.object(uploader, "assert_not_exists") as assert_not_exists:
         with patch.object(uploader, "put_object") as put_object:
             with patch.object(uploader, "put_metadata") as put_metadata:
-                uploader.operate()
+                with patch.object(uploader, "put_index") as put_index:
+                    uploader.operate()
 
     assert_not_exists.assert_called_once_with()
     put_object.assert_called_once_with()
     put_metadata.assert_called_once_with()
+    put_index.assert_called_once_with()
     assert latest_version_parameter.value == "1.2.3"
 
 
+def test_put_index(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    version_index = Mock()
+
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        version=VersionInfo(1, 2, 3),
+        version_index=version_index,
+    )
+
+    uploader.put_index()
+
+    version_index.add.assert_called_once_with(VersionInfo(1, 2, 3))
+
+
+def test_put_index__fail(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    version_index = Mock()
+    version_index.add = Mock(side_effect=Exception("fire"))
+
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        version=VersionInfo(1, 2, 3),
+        version_index=version_index,
+    )
+
+    # The artifact is usable without the index.
+    uploader.put_index()
+
+    version_index.add.assert_called_once_with(VersionInfo(1, 2, 3))
+
+
 def test_put_metadata(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> None:
     put_object = Mock()
@@ -77,13 +124,12 @@ def test_put_metadata(
 
     uploader = RegionalStager(
         bucket="buck",
-        file_hash="file_hash",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         metadata=b"metadata",
         metadata_hash="metadata_hash",
         path=Path("upload.zip"),
-        queue=queue,
         read_only=False,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -102,7 +148,6 @@ def test_put_metadata(
 
 def test_put_metadata__no_metadata(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> None:
     put_object = Mock()
@@ -115,11 +160,10 @@ def test_put_metadata__no_metadata(
 
     uploader = RegionalStager(
         bucket="buck",
-        file_hash="file_hash",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         path=Path("upload.zip"),
-        queue=queue,
         read_only=False,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -133,7 +177,6 @@ def test_put_metadata__no_metadata(
 
 def test_put_metadata__read_only(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> None:
     put_object = Mock()
@@ -146,13 +189,12 @@ def test_put_metadata__read_only(
 
     uploader = RegionalStager(
         bucket="buck",
-        file_hash="file_hash",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         metadata=b"metadata",
         metadata_hash="metadata_hash",
         path=Path("upload.zip"),
-        queue=queue,
         read_only=True,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -166,7 +208,6 @@ def test_put_metadata__read_only(
 
 def test_put_object(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> None:
     put_object = Mock()
@@ -179,13 +220,12 @@ def test_put_object(
 
     uploader = RegionalStager(
         bucket="buck",
-        file_hash="file_hash",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         metadata=b"metadata",
         metadata_hash="metadata_hash",
         path=Path("LICENSE"),
-        queue=queue,
         read_only=False,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -202,9 +242,45 @@ def test_put_object(
     )
 
 
+def test_put_object__object_metadata(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    put_object = Mock()
+
+    s3 = Mock()
+    s3.put_object = put_object
+
+    client = Mock(return_value=s3)
+    session.client = client
+
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        object_metadata={"startifact-metadata": "e30="},
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        version=VersionInfo(1, 2, 3),
+    )
+
+    uploader.put_object()
+
+    assert uploader.object_metadata == {"startifact-metadata": "e30="}
+
+    put_object.assert_called_once_with(
+        Body=ANY,
+        Bucket="buck",
+        ContentMD5="file_hash",
+        Key="SugarWater@1.2.3",
+        Metadata={"startifact-metadata": "e30="},
+    )
+
+
 def test_put_object__read_only(
     latest_version_parameter: LatestVersionParameter,
-    queue: "Queue[RegionalProcessResult]",
     session: Mock,
 ) -> None:
     put_object = Mock()
@@ -217,13 +293,12 @@ def test_put_object__read_only(
 
     uploader = RegionalStager(
         bucket="buck",
-        file_hash="file_hash",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
         key="SugarWater@1.2.3",
         latest_version_parameter=latest_version_parameter,
         metadata=b"metadata",
         metadata_hash="metadata_hash",
         path=Path("LICENSE"),
-        queue=queue,
         read_only=True,
         session=session,
         version=VersionInfo(1, 2, 3),
@@ -233,3 +308,182 @@ def test_put_object__read_only(
 
     client.assert_not_called()
     put_object.assert_not_called()
+
+
+def test_put_object__multipart(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    s3 = Mock()
+    client = Mock(return_value=s3)
+    session.client = client
+
+    file_hash = FileHash(Path("LICENSE"))
+
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=file_hash,
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        part_concurrency=3,
+        part_size=100,
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        version=VersionInfo(1, 2, 3),
+    )
+
+    ns = "startifact.regional_stager.MultipartUpload"
+    with patch(ns) as multipart_upload_cls:
+        uploader.put_object()
+
+    multipart_upload_cls.assert_called_once_with(
+        bucket="buck",
+        client=s3,
+        concurrency=3,
+        key="SugarWater@1.2.3",
+        metadata=None,
+        part_size=100,
+        path=Path("LICENSE"),
+        region="eu-west-10",
+    )
+
+    multipart_upload_cls.return_value.upload.assert_called_once_with()
+    s3.put_object.assert_not_called()
+    assert not file_hash.calculated
+
+
+@mark.parametrize(
+    "part_size, file_size, expect",
+    [
+        (None, 100, None),
+        (None, 6 * 1024 * 1024 * 1024, 64 * 1024 * 1024),
+        (100, 100, None),
+        (100, 101, 100),
+        (100, 6 * 1024 * 1024 * 1024, 100),
+        (8 * 1024 * 1024 * 1024, 100, None),
+        (8 * 1024 * 1024 * 1024, 6 * 1024 * 1024 * 1024, 5 * 1024 * 1024 * 1024),
+    ],
+)
+def test_multipart_part_size(
+    part_size: Optional[int],
+    file_size: int,
+    expect: Optional[int],
+    regional_stager: RegionalStager,
+) -> None:
+    regional_stager._part_size = part_size
+
+    stat = Mock()
+    stat.return_value.st_size = file_size
+
+    with patch("startifact.regional_stager.Path.stat", stat):
+        assert regional_stager.multipart_part_size == expect
+
+
+def test_copy_object(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    s3 = Mock()
+    client = Mock(return_value=s3)
+    session.client = client
+
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        source_bucket="source",
+        version=VersionInfo(1, 2, 3),
+    )
+
+    uploader.copy_object("source")
+
+    client.assert_called_once_with("s3")
+    s3.copy_object.assert_called_once_with(
+        Bucket="buck",
+        CopySource={"Bucket": "source", "Key": "SugarWater@1.2.3"},
+        Key="SugarWater@1.2.3",
+    )
+
+
+def test_copy_object__multipart(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    s3 = Mock()
+    session.client = Mock(return_value=s3)
+
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        part_concurrency=2,
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        version=VersionInfo(1, 2, 3),
+    )
+
+    stat = Mock()
+    stat.return_value.st_size = 6 * 1024 * 1024 * 1024
+
+    with patch("startifact.regional_stager.Path.stat", stat):
+        with patch("startifact.regional_stager.MultipartUpload") as upload_cls:
+            uploader.copy_object("source")
+
+    upload_cls.assert_called_once_with(
+        bucket="buck",
+        client=s3,
+        concurrency=2,
+        copy_source={"Bucket": "source", "Key": "SugarWater@1.2.3"},
+        key="SugarWater@1.2.3",
+        metadata=None,
+        part_size=64 * 1024 * 1024,
+        path=Path("LICENSE"),
+        region="eu-west-10",
+    )
+
+    upload_cls.return_value.upload.assert_called_once_with()
+    s3.copy_object.assert_not_called()
+
+
+def test_copy_object__read_only(
+    regional_stager: RegionalStager,
+    session: Mock,
+) -> None:
+    client = Mock()
+    session.client = client
+    regional_stager.copy_object("source")
+    client.assert_not_called()
+
+
+def test_operate__replicate(
+    latest_version_parameter: LatestVersionParameter,
+    session: Mock,
+) -> None:
+    uploader = RegionalStager(
+        bucket="buck",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="file_hash"),
+        key="SugarWater@1.2.3",
+        latest_version_parameter=latest_version_parameter,
+        path=Path("LICENSE"),
+        read_only=False,
+        session=session,
+        source_bucket="source",
+        version=VersionInfo(1, 2, 3),
+    )
+
+    with patch.object(uploader, "assert_not_exists"):
+        with patch.object(uploader, "copy_object") as copy_object:
+            with patch.object(uploader, "put_object") as put_object:
+                with patch.object(uploader, "put_metadata"):
+                    uploader.operate()
+
+    copy_object.assert_called_once_with("source")
+    put_object.assert_not_called()
+    assert latest_version_parameter.value == "1.2.3"
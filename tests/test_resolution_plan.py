@@ -0,0 +1,158 @@
+from io import StringIO
+from typing import Any, Dict, Optional
+
+from mock import Mock, patch
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact import Artifact, BucketNames
+from startifact.region_ranker import RegionRanker
+from startifact.resolution_plan import ResolutionPlan
+
+
+def make_artifact(bucket_names: BucketNames, out: StringIO) -> Artifact:
+    def make_session(region: str) -> Mock:
+        session = Mock()
+        session.region_name = region
+        return session
+
+    clients = Mock()
+    clients.session = Mock(side_effect=make_session)
+
+    return Artifact(
+        bucket_names=bucket_names,
+        clients=clients,
+        hedge_delay=0.01,
+        out=out,
+        project="SugarWater",
+        region_ranker=RegionRanker(jitter=0),
+        regions=["eu-west-10", "eu-west-11", "eu-west-12"],
+        version=VersionInfo(1, 2, 3),
+    )
+
+
+def test_resolve(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+
+    def head(bucket: str, key: str, session: Mock) -> Optional[Dict[str, Any]]:
+        return None if bucket == "bucket-10" else {}
+
+    def get(session: Mock) -> Optional[Dict[str, str]]:
+        return {"from": session.region_name}
+
+    plan = ResolutionPlan(artifact, download=True, metadata=True)
+
+    with patch("startifact.artifact_downloader.head", side_effect=head):
+        with patch.object(artifact.metadata_loader, "get", side_effect=get):
+            region = plan.resolve()
+
+    assert region in ["eu-west-11", "eu-west-12"]
+    assert artifact.downloader.region == region
+    assert artifact.downloader.bucket == f"bucket-{region[-2:]}"
+    assert artifact.metadata_loader.loaded == {"from": region}
+
+
+def test_resolve__bucket_name_fails(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+    plan = ResolutionPlan(artifact, download=True)
+
+    def get_bucket(region: str) -> str:
+        if region == "eu-west-10":
+            raise Exception("fire")
+        return f"bucket-{region[-2:]}"
+
+    with patch.object(plan, "get_bucket", side_effect=get_bucket):
+        with patch("startifact.artifact_downloader.head", return_value={}) as head:
+            region = plan.resolve()
+
+    assert region in ["eu-west-11", "eu-west-12"]
+    assert all(c.args[0] != "bucket-10" for c in head.call_args_list)
+
+
+def test_resolve__no_metadata_anywhere(
+    bucket_names: BucketNames,
+    out: StringIO,
+) -> None:
+    artifact = make_artifact(bucket_names, out)
+
+    s3 = Mock()
+    s3.exceptions.NoSuchKey = type("NoSuchKey", (Exception,), {})
+    s3.get_object.side_effect = s3.exceptions.NoSuchKey()
+
+    def make_session(region: str) -> Mock:
+        session = Mock()
+        session.client = Mock(return_value=s3)
+        session.region_name = region
+        return session
+
+    with patch.object(artifact.clients, "session", side_effect=make_session):
+        assert ResolutionPlan(artifact, metadata=True).resolve() is None
+
+    assert artifact.metadata_loader.loaded == {}
+    assert s3.get_object.call_count == 3
+
+
+def test_resolve__object_metadata(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+    plan = ResolutionPlan(artifact, download=True, metadata=True)
+
+    response = {"Metadata": {"startifact-metadata": "eyJmb28iOiJiYXIifQ=="}}
+
+    with patch("startifact.artifact_downloader.head", return_value=response):
+        with patch.object(artifact.metadata_loader, "get") as get:
+            assert plan.resolve()
+
+    get.assert_not_called()
+    assert artifact.metadata_loader.loaded == {"foo": "bar"}
+
+
+def test_resolve__no_metadata(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+    plan = ResolutionPlan(artifact, download=True, metadata=True)
+
+    with patch("startifact.artifact_downloader.head", return_value={}):
+        with patch.object(artifact.metadata_loader, "get", return_value=None):
+            region = plan.resolve()
+
+    assert region is not None
+    assert artifact.downloader.region == region
+    assert artifact.metadata_loader.loaded == {}
+
+
+def test_resolve__resolved(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+    artifact.downloader.use_location("bucket-12", "eu-west-12")
+    artifact.metadata_loader.use_metadata({"foo": "bar"})
+
+    plan = ResolutionPlan(artifact, download=True, metadata=True)
+
+    with patch("startifact.artifact_downloader.head") as head:
+        assert plan.resolve() is None
+
+    head.assert_not_called()
+
+
+def test_resolve__unresolved(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+    plan = ResolutionPlan(artifact, download=True, metadata=True)
+
+    with patch("startifact.artifact_downloader.head", return_value={}) as head:
+        with patch.object(
+            artifact.metadata_loader,
+            "get",
+            side_effect=Exception("fire"),
+        ):
+            assert plan.resolve() is None
+
+    assert head.call_count == 3
+    assert artifact.downloader.is_located
+    assert not artifact.metadata_loader.is_loaded
+
+
+def test_resolve__version_only(bucket_names: BucketNames, out: StringIO) -> None:
+    artifact = make_artifact(bucket_names, out)
+    plan = ResolutionPlan(artifact)
+
+    with patch.object(plan, "get_bucket") as get_bucket:
+        assert plan.resolve() is None
+
+    get_bucket.assert_not_called()
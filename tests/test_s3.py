@@ -1,9 +1,10 @@
 from botocore.exceptions import ClientError
 from mock import Mock
 from pytest import raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact.exceptions import CannotDiscoverExistence
-from startifact.s3 import exists
+from startifact.s3 import exists, head, list_version_groups, list_versions
 
 
 def test_exists__client_error() -> None:
@@ -88,3 +89,91 @@ def test_exists__true() -> None:
     client.assert_called_once_with("s3")
     head_object.assert_called_once_with(Bucket="bucket", Key="key")
     assert e
+
+
+def test_head() -> None:
+    s3 = Mock()
+    s3.exceptions.ClientError = ClientError
+    s3.head_object = Mock(return_value={"ETag": '"etag"'})
+
+    session = Mock()
+    session.client = Mock(return_value=s3)
+
+    assert head("bucket", "key", session) == {"ETag": '"etag"'}
+    s3.head_object.assert_called_once_with(Bucket="bucket", Key="key")
+
+
+def test_list_version_groups() -> None:
+    pages = [
+        {
+            "CommonPrefixes": [
+                {"Prefix": "prefix/SugarWater@1.10."},
+                {"Prefix": "prefix/SugarWater@1.2."},
+            ]
+        },
+        {},
+        {
+            "CommonPrefixes": [
+                {"Prefix": "prefix/SugarWater@1.02."},
+                {"Prefix": "prefix/SugarWater@1.0."},
+                {"Prefix": "prefix/SugarWater@1.jelly."},
+            ]
+        },
+    ]
+
+    paginator = Mock()
+    paginator.paginate = Mock(return_value=pages)
+
+    s3 = Mock()
+    s3.get_paginator = Mock(return_value=paginator)
+
+    session = Mock()
+    session.client = Mock(return_value=s3)
+
+    groups = list_version_groups(
+        "buck",
+        "prefix/SugarWater@",
+        session,
+        version_prefix="1.",
+    )
+
+    paginator.paginate.assert_called_once_with(
+        Bucket="buck",
+        Delimiter=".",
+        Prefix="prefix/SugarWater@1.",
+    )
+
+    assert groups == [0, 2, 10]
+
+
+def test_list_versions() -> None:
+    pages = [
+        {
+            "Contents": [
+                {"Key": "prefix/SugarWater@1.0.0"},
+                {"Key": "prefix/SugarWater@1.0.0/metadata"},
+                {"Key": "prefix/SugarWater@jelly"},
+            ]
+        },
+        {},
+        {"Contents": [{"Key": "prefix/SugarWater@2.0.0-beta"}]},
+    ]
+
+    paginator = Mock()
+    paginator.paginate = Mock(return_value=pages)
+
+    s3 = Mock()
+    s3.get_paginator = Mock(return_value=paginator)
+
+    session = Mock()
+    session.client = Mock(return_value=s3)
+
+    versions = list(list_versions("buck", "prefix/SugarWater@", session))
+
+    s3.get_paginator.assert_called_once_with("list_objects_v2")
+    paginator.paginate.assert_called_once_with(
+        Bucket="buck",
+        Prefix="prefix/SugarWater@",
+    )
+
+    assert versions == [VersionInfo(1, 0, 0), VersionInfo(2, 0, 0, "beta")]
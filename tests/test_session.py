@@ -1,14 +1,23 @@
 from io import StringIO
 from pathlib import Path
+from typing import Any, Dict, List
 
 from _pytest.monkeypatch import MonkeyPatch
-from mock import patch
+from mock import ANY, patch
 from mock.mock import Mock
 from pytest import raises
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact import Artifact, BucketNames, ConfigurationLoader, Session
-from startifact.exceptions import CannotStageArtifact, NoConfiguration, ProjectNameError
+from startifact.exceptions import (
+    CannotDownloadArtifacts,
+    CannotStageArtifact,
+    NoConfiguration,
+    NoMatchingVersion,
+    ProjectNameError,
+)
+from startifact.regional_executors import ThreadRegionalExecutor
+from startifact.version_presence import VersionPresence
 
 
 def test_configuration_loader(out: StringIO) -> None:
@@ -54,6 +63,43 @@ def test_get(
     assert artifact == expect
 
 
+def test_download_manifest(bucket_names: BucketNames, out: StringIO) -> None:
+    session = Session(bucket_names=bucket_names, out=out, regions=["us-east-3"])
+
+    def get(project: str, version: VersionInfo, out: StringIO) -> Mock:
+        artifact = Mock()
+        artifact.version = version
+        if project == "Coffee":
+            artifact.downloader.download = Mock(side_effect=Exception("fire"))
+        return artifact
+
+    manifest = {
+        "Coffee@2.0.0": Path("coffee.zip"),
+        "SugarWater@1.0.0": Path("sugar.zip"),
+        "Tea": Path("tea.zip"),
+    }
+
+    latest = {"Tea": VersionInfo(3)}
+
+    with patch.object(session, "get_latest_versions", return_value=latest) as glv:
+        with patch.object(session, "get", side_effect=get) as get_artifact:
+            with raises(CannotDownloadArtifacts) as ex:
+                session.download_manifest(manifest, concurrency=2)
+
+    glv.assert_called_once_with(["Tea"], out=ANY)
+    assert get_artifact.call_count == 3
+    get_artifact.assert_any_call("Tea", VersionInfo(3), out=ANY)
+
+    assert list(ex.value.failures) == ["Coffee@2.0.0"]
+
+    lines = sorted(out.getvalue().splitlines())
+    assert len(lines) == 4
+    assert lines[-1].startswith("🔥 [")
+    assert "Failed to download Coffee@2.0.0 to coffee.zip: fire" in lines[-1]
+    assert "📦 Downloaded 2 of 3 artifact(s)." in lines
+    assert any(line.endswith("Downloaded Tea 3.0.0 to tea.zip.") for line in lines)
+
+
 def test_get__no_configuration(
     configuration_loader: ConfigurationLoader,
     out: StringIO,
@@ -71,6 +117,174 @@ def test_get__no_configuration(
     assert str(ex.value) == expect
 
 
+def test_get__range(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+    out: StringIO,
+) -> None:
+    configuration_loader.loaded["bucket_key_prefix"] = "prefix/"
+    configuration_loader.loaded["bucket_name_param"] = "bucket-name-param"
+
+    session = Session(
+        bucket_names=bucket_names,
+        configuration_loader=configuration_loader,
+        out=out,
+        regions=["us-east-3"],
+    )
+
+    versions = [VersionInfo(2, 2, 0), VersionInfo(2, 4, 1), VersionInfo(3, 0, 0)]
+
+    with patch("startifact.session.VersionIndexLoader") as loader_cls:
+        loader_cls.return_value.versions = versions
+        artifact = session.get("SugarWater", "^2.3")
+
+    loader_cls.assert_called_once_with(
+        bucket_names=bucket_names,
+        clients=session.clients,
+        concurrency=1,
+        hedge_delay=0.5,
+        key="prefix/SugarWater/versions.json",
+        region_ranker=session.region_ranker,
+        regions=["us-east-3"],
+        versions_prefix="prefix/SugarWater@",
+    )
+
+    assert artifact.version == VersionInfo(2, 4, 1)
+
+
+def test_get_matching_version__exact(configuration_loader: ConfigurationLoader) -> None:
+    session = Session(configuration_loader=configuration_loader, regions=["us-east-3"])
+
+    with patch("startifact.session.VersionIndexLoader") as loader_cls:
+        version = session.get_matching_version("SugarWater", "2.3.4")
+
+    loader_cls.assert_not_called()
+    assert version == VersionInfo(2, 3, 4)
+
+
+def test_get_matching_version__no_index(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+) -> None:
+
+    session = Session(
+        bucket_names=bucket_names,
+        configuration_loader=configuration_loader,
+        regions=["us-east-3"],
+    )
+
+    presences = [
+        VersionPresence(regions=["us-east-3"], version=VersionInfo(2, 3, 0)),
+        VersionPresence(regions=["us-east-3"], version=VersionInfo(2, 5, 0)),
+    ]
+
+    with patch("startifact.session.VersionIndexLoader") as loader_cls:
+        loader_cls.return_value.is_indexed = False
+        loader_cls.return_value.versions = []
+
+        with patch("startifact.session.VersionLister") as lister_cls:
+            lister_cls.return_value.versions = Mock(return_value=iter(presences))
+            version = session.get_matching_version("SugarWater", "^2.3")
+
+    lister_cls.assert_called_once_with(
+        bucket_names=bucket_names,
+        clients=session.clients,
+        prefix="SugarWater@",
+        regions=["us-east-3"],
+    )
+
+    assert version == VersionInfo(2, 5, 0)
+
+
+def test_get_matching_version__none(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+) -> None:
+
+    session = Session(
+        bucket_names=bucket_names,
+        configuration_loader=configuration_loader,
+        regions=["us-east-3"],
+    )
+
+    with patch("startifact.session.VersionIndexLoader") as loader_cls:
+        loader_cls.return_value.versions = [VersionInfo(1, 9, 0)]
+
+        with raises(NoMatchingVersion) as ex:
+            session.get_matching_version("SugarWater", "^2.3")
+
+    assert str(ex.value) == "No version of SugarWater matches ^2.3"
+
+
+def test_get_latest_versions(
+    configuration_loader: ConfigurationLoader,
+    out: StringIO,
+) -> None:
+    configuration_loader.loaded["parameter_name_prefix"] = "/prefix"
+
+    def get_parameters(Names: List[str]) -> Dict[str, Any]:
+        return {
+            "Parameters": [
+                {"Name": n, "Value": f"1.0.{n.split('/')[2][1:]}"} for n in Names
+            ]
+        }
+
+    ssm = Mock()
+    ssm.get_parameters = Mock(side_effect=get_parameters)
+
+    boto_session = Mock()
+    boto_session.client = Mock(return_value=ssm)
+    boto_session.region_name = "us-east-3"
+
+    clients = Mock()
+    clients.session = Mock(return_value=boto_session)
+
+    session = Session(
+        clients=clients,
+        configuration_loader=configuration_loader,
+        out=out,
+        regions=["us-east-3"],
+    )
+
+    projects = [f"P{i}" for i in range(30)]
+    versions = session.get_latest_versions(projects)
+
+    assert versions == {p: VersionInfo(1, 0, int(p[1:])) for p in projects}
+
+    names = [n for c in ssm.get_parameters.call_args_list for n in c.kwargs["Names"]]
+    assert sorted(names) == sorted(f"/prefix/{p}/latest" for p in projects)
+    assert all(len(c.kwargs["Names"]) <= 10 for c in ssm.get_parameters.call_args_list)
+
+
+def test_list_versions(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+) -> None:
+
+    configuration_loader.loaded["bucket_key_prefix"] = "bucket-key-prefix/"
+
+    session = Session(
+        bucket_names=bucket_names,
+        configuration_loader=configuration_loader,
+        regions=["us-east-3"],
+    )
+
+    presence = VersionPresence(regions=["us-east-3"], version=VersionInfo(1))
+
+    with patch("startifact.session.VersionLister") as lister_cls:
+        lister_cls.return_value.versions = Mock(return_value=iter([presence]))
+        versions = list(session.list_versions("SugarWater"))
+
+    lister_cls.assert_called_once_with(
+        bucket_names=bucket_names,
+        clients=session.clients,
+        prefix="bucket-key-prefix/SugarWater@",
+        regions=["us-east-3"],
+    )
+
+    assert versions == [presence]
+
+
 def test_regions(monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setenv("STARTIFACT_REGIONS", "us-east-7")
     assert Session().regions == ["us-east-7"]
@@ -101,20 +315,31 @@ def test_stage(
         session.stage("SugarWater", VersionInfo(1, 2, 3), Path("LICENSE"))
 
     stager_cls.assert_called_once_with(
+        bucket_key_prefix="bucket-key-prefix",
         bucket_names=bucket_names,
-        file_hash="6xhIwkLW8kCvybESBUX1iA==",  # cspell:disable-line
+        clients=session.clients,
+        concurrency=1,
+        executor_type=ThreadRegionalExecutor,
+        file_hash=ANY,
         key="bucket-key-prefixSugarWater@1.2.3",
         metadata=None,
         metadata_hash=None,
+        object_metadata=None,
         out=out,
         parameter_name_prefix="parameter-name-prefix",
+        part_concurrency=4,
+        part_size=None,
         path=Path("LICENSE"),
         project="SugarWater",
         read_only=False,
         regions=["us-east-7"],
+        replicate=False,
         version=VersionInfo(1, 2, 3),
     )
 
+    file_hash = stager_cls.call_args.kwargs["file_hash"]
+    assert file_hash.b64_md5 == "6xhIwkLW8kCvybESBUX1iA=="  # cspell:disable-line
+
     stage.assert_called_once_with()
 
 
@@ -172,20 +397,31 @@ def test_stage__filename(
         )
 
     stager_cls.assert_called_once_with(
+        bucket_key_prefix="bucket-key-prefix",
         bucket_names=bucket_names,
-        file_hash="6xhIwkLW8kCvybESBUX1iA==",  # cspell:disable-line
+        clients=session.clients,
+        concurrency=1,
+        executor_type=ThreadRegionalExecutor,
+        file_hash=ANY,
         key="bucket-key-prefixSugarWater@1.2.3",
         metadata=b'{\n  "startifact:filename": "LICENSE"\n}',
         metadata_hash="VRixfq0fOJlMwTVSuJBGiA==",  # cspell:disable-line
+        object_metadata=None,
         out=out,
         parameter_name_prefix="parameter-name-prefix",
+        part_concurrency=4,
+        part_size=None,
         path=Path("LICENSE"),
         project="SugarWater",
         read_only=False,
         regions=["us-east-7"],
+        replicate=False,
         version=VersionInfo(1, 2, 3),
     )
 
+    file_hash = stager_cls.call_args.kwargs["file_hash"]
+    assert file_hash.b64_md5 == "6xhIwkLW8kCvybESBUX1iA=="  # cspell:disable-line
+
     stage.assert_called_once_with()
 
 
@@ -242,18 +478,89 @@ def test_stage__with_metadata(
         )
 
     stager_cls.assert_called_once_with(
+        bucket_key_prefix="bucket-key-prefix",
         bucket_names=bucket_names,
-        file_hash="6xhIwkLW8kCvybESBUX1iA==",  # cspell:disable-line
+        clients=session.clients,
+        concurrency=1,
+        executor_type=ThreadRegionalExecutor,
+        file_hash=ANY,
         key="bucket-key-prefixSugarWater@1.2.3",
         metadata=b'{\n  "foo": "bar"\n}',
         metadata_hash="lyF5YnqQQ1fG3mw0blDExg==",
+        object_metadata=None,
         out=out,
         parameter_name_prefix="parameter-name-prefix",
+        part_concurrency=4,
+        part_size=None,
         path=Path("LICENSE"),
         project="SugarWater",
         read_only=False,
         regions=["us-east-7"],
+        replicate=False,
         version=VersionInfo(1, 2, 3),
     )
 
+    file_hash = stager_cls.call_args.kwargs["file_hash"]
+    assert file_hash.b64_md5 == "6xhIwkLW8kCvybESBUX1iA=="  # cspell:disable-line
+
     stage.assert_called_once_with()
+
+
+def test_stage__metadata_headers(
+    bucket_names: BucketNames,
+    configuration_loader: ConfigurationLoader,
+    out: StringIO,
+) -> None:
+    configuration_loader.loaded["bucket_name_param"] = "bucket-name-param"
+
+    session = Session(
+        bucket_names=bucket_names,
+        configuration_loader=configuration_loader,
+        metadata_headers=True,
+        out=out,
+        regions=["us-east-7"],
+    )
+
+    stager = Mock()
+    stager.stage = Mock(return_value=True)
+
+    with patch("startifact.session.Stager", return_value=stager) as stager_cls:
+        session.stage(
+            "SugarWater",
+            VersionInfo(1, 2, 3),
+            Path("LICENSE"),
+            metadata={"foo": "bar"},
+        )
+
+    object_metadata = stager_cls.call_args.kwargs["object_metadata"]
+    assert object_metadata == {"startifact-metadata": "eyJmb28iOiJiYXIifQ=="}
+
+
+def test_regional_concurrency(configuration_loader: ConfigurationLoader) -> None:
+    session = Session(
+        configuration_loader=configuration_loader,
+        regional_concurrency=2,
+        regions=["us-east-7", "us-east-8", "us-east-9"],
+    )
+    assert session.regional_concurrency == 2
+
+
+def test_regional_concurrency__configured(
+    configuration_loader: ConfigurationLoader,
+) -> None:
+    configuration_loader.loaded["regional_concurrency"] = "2"
+    session = Session(
+        configuration_loader=configuration_loader,
+        regions=["us-east-7", "us-east-8", "us-east-9"],
+    )
+    assert session.regional_concurrency == 2
+
+
+def test_regional_concurrency__default(
+    configuration_loader: ConfigurationLoader,
+) -> None:
+    session = Session(
+        configuration_loader=configuration_loader,
+        regions=["us-east-7", "us-east-8", "us-east-9"],
+    )
+    assert session.regional_concurrency == 3
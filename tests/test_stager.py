@@ -1,5 +1,4 @@
 from io import StringIO
-from multiprocessing import Queue
 from pathlib import Path
 
 from mock import Mock, patch
@@ -7,7 +6,7 @@ from pytest import fixture
 from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
 
 from startifact import BucketNames
-from startifact.regional_process_result import RegionalProcessResult
+from startifact.file_hash import FileHash
 from startifact.regional_stager import RegionalStager
 from startifact.stager import Stager
 
@@ -16,16 +15,14 @@ from startifact.stager import Stager
 def stager(
     bucket_names: BucketNames,
     out: StringIO,
-    queue: "Queue[RegionalProcessResult]",
 ) -> Stager:
     return Stager(
         bucket_names=bucket_names,
-        file_hash="who knows?",
+        file_hash=FileHash(Path("LICENSE"), b64_md5="who knows?"),
         key="SugarWater@1.2.3",
         out=out,
         path=Path("LICENSE"),
         project="SugarWater",
-        queue=queue,
         read_only=True,
         regions=["eu-west-10", "eu-west-11", "eu-west-12"],
         version=VersionInfo(1, 2, 3),
@@ -42,10 +39,25 @@ def test_make_regional_stager(session: Mock, stager: Stager) -> None:
     regional = stager.make_regional_stager(session)
 
     assert regional.bucket == "bucket-10"
-    assert regional.file_hash == "who knows?"
+    assert regional.file_hash.b64_md5 == "who knows?"
     assert regional.key == "SugarWater@1.2.3"
 
 
+def test_make_regional_stager__version_index(session: Mock, stager: Stager) -> None:
+    with patch("startifact.stager.VersionIndex") as version_index_cls:
+        regional = stager.make_regional_stager(session)
+
+    version_index_cls.assert_called_once_with(
+        bucket="bucket-10",
+        key="SugarWater/versions.json",
+        read_only=True,
+        session=session,
+        versions_prefix="SugarWater@",
+    )
+
+    assert regional.version_index is version_index_cls.return_value
+
+
 def test_receive_done(
     out: StringIO,
     regional_stager: RegionalStager,
@@ -56,8 +68,8 @@ def test_receive_done(
     with patch("startifact.regional_stager.RegionalStager.assert_not_exists"):
         with patch.object(stager, "make_regional_stager", return_value=regional_stager):
             stager.enqueue(session)
+            stager.receive_done()
 
-    stager.receive_done()
     assert not stager.regions_in_progress
     assert out.getvalue() == "📦 Staged (not really) to eu-west-10.\n"
 
@@ -75,8 +87,8 @@ def test_receive_done__error(
                 regional_stager, "operate", side_effect=Exception("fire")
             ):
                 stager.enqueue(session)
+                stager.receive_done()
 
-    stager.receive_done()
     assert not stager.regions_in_progress
     assert out.getvalue() == "🔥 Failed to stage to eu-west-10: fire\n"
 
@@ -100,6 +112,50 @@ def test_stage(stager: Stager, out: StringIO) -> None:
     assert actuals[0].startswith("🚚 Staging (not really) ")
     assert actuals[0].endswith("/LICENSE as SugarWater version 1.2.3…")
 
+    # Regions are staged concurrently so can finish in any order.
+    assert sorted(actuals[1:]) == [
+        "📦 Staged (not really) to eu-west-10.",
+        "📦 Staged (not really) to eu-west-11.",
+        "📦 Staged (not really) to eu-west-12.",
+    ]
+
+
+def test_stage__replicate(
+    bucket_names: BucketNames,
+    out: StringIO,
+) -> None:
+    stager = Stager(
+        bucket_names=bucket_names,
+        file_hash=FileHash(Path("LICENSE"), b64_md5="who knows?"),
+        key="SugarWater@1.2.3",
+        out=out,
+        path=Path("LICENSE"),
+        project="SugarWater",
+        read_only=True,
+        regions=["eu-west-10", "eu-west-11", "eu-west-12"],
+        replicate=True,
+        version=VersionInfo(1, 2, 3),
+    )
+
+    with patch("startifact.regional_stager.RegionalStager.assert_not_exists"):
+        with patch(
+            "startifact.parameters.BucketParameter.make_value",
+            return_value="foo",
+        ):
+            assert stager.stage()
+
+    assert stager.source_bucket == "bucket-10"
+
+    actuals = out.getvalue().splitlines()
+
     assert actuals[1] == "📦 Staged (not really) to eu-west-10."
-    assert actuals[2] == "📦 Staged (not really) to eu-west-11."
-    assert actuals[3] == "📦 Staged (not really) to eu-west-12."
+    assert sorted(actuals[2:]) == [
+        "📦 Staged (not really) to eu-west-11.",
+        "📦 Staged (not really) to eu-west-12.",
+    ]
+
+
+def test_make_regional_stager__replicate(session: Mock, stager: Stager) -> None:
+    stager._source_bucket = "bucket-11"
+    regional = stager.make_regional_stager(session)
+    assert regional.source_bucket == "bucket-11"
@@ -0,0 +1,231 @@
+from io import BytesIO
+from pathlib import Path
+from threading import Event
+from typing import Any, Dict, List
+
+from mock import Mock
+from pytest import raises
+
+from startifact.download_source import DownloadSource
+from startifact.striped_download import StripedDownload
+
+CONTENT = b"abcdefghijklmnopqrstuvwxyz"
+
+
+class SlowBody:
+    def __init__(self, body: bytes, release: Event) -> None:
+        self._body = BytesIO(body)
+        self._release = release
+
+    def close(self) -> None:
+        pass
+
+    def read(self, size: int) -> bytes:
+        self._release.wait(timeout=10)
+        return self._body.read(size)
+
+
+def make_client(
+    content: bytes = CONTENT,
+    release: Event = None,  # type: ignore
+) -> Mock:
+    def get_object(**kwargs: Any) -> Dict[str, Any]:
+        start, end = [int(n) for n in kwargs["Range"].split("=")[1].split("-")]
+        end += 1
+        body = content[start:end]
+        return {"Body": SlowBody(body, release) if release else BytesIO(body)}
+
+    client = Mock()
+    client.head_object = Mock(
+        return_value={"ContentLength": len(content), "ETag": '"etag"'}
+    )
+    client.get_object = Mock(side_effect=get_object)
+    return client
+
+
+def ranges(client: Mock) -> List[str]:
+    return sorted(c.kwargs["Range"] for c in client.get_object.call_args_list)
+
+
+def test_download(tmp_path: Path) -> None:
+    path = tmp_path / "download.bin"
+    sources = [
+        DownloadSource(bucket="bucket-10", client=make_client(), region="eu-west-10"),
+        DownloadSource(bucket="bucket-11", client=make_client(), region="eu-west-11"),
+    ]
+
+    StripedDownload(
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=sources,
+    ).download()
+
+    assert path.read_bytes() == CONTENT
+    # A stolen range can be fetched by both regions.
+    assert sum(s.received for s in sources) >= len(CONTENT)
+
+    for source in sources:
+        assert source.etag == '"etag"'
+
+
+def test_download__known_sizes(tmp_path: Path) -> None:
+    path = tmp_path / "download.bin"
+    known = make_client()
+    unknown = make_client()
+
+    sources = [
+        DownloadSource(
+            bucket="bucket-10",
+            client=known,
+            etag='"known"',
+            region="eu-west-10",
+            size=len(CONTENT),
+        ),
+        DownloadSource(bucket="bucket-11", client=unknown, region="eu-west-11"),
+    ]
+
+    StripedDownload(
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=sources,
+    ).download()
+
+    assert path.read_bytes() == CONTENT
+    known.head_object.assert_not_called()
+    unknown.head_object.assert_called_once_with(
+        Bucket="bucket-11",
+        Key="SugarWater@1.2.3",
+    )
+
+
+def test_download__one_region_fails(tmp_path: Path) -> None:
+    broken = make_client()
+    broken.get_object = Mock(side_effect=Exception("fire"))
+
+    path = tmp_path / "download.bin"
+    sources = [
+        DownloadSource(bucket="bucket-10", client=broken, region="eu-west-10"),
+        DownloadSource(bucket="bucket-11", client=make_client(), region="eu-west-11"),
+    ]
+
+    StripedDownload(
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=sources,
+    ).download()
+
+    assert path.read_bytes() == CONTENT
+
+
+def test_download__all_regions_fail(tmp_path: Path) -> None:
+    broken = make_client()
+    broken.get_object = Mock(side_effect=Exception("fire"))
+
+    path = tmp_path / "download.bin"
+    sources = [
+        DownloadSource(bucket="bucket-10", client=broken, region="eu-west-10"),
+        DownloadSource(bucket="bucket-11", client=broken, region="eu-west-11"),
+    ]
+
+    download = StripedDownload(
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=sources,
+    )
+
+    with raises(Exception) as ex:
+        download.download()
+
+    assert str(ex.value) == "fire"
+    assert not path.exists()
+
+
+def test_download__all_regions_fail__keeps_existing(tmp_path: Path) -> None:
+    broken = make_client()
+    broken.get_object = Mock(side_effect=Exception("fire"))
+
+    path = tmp_path / "download.bin"
+    path.write_bytes(b"existing")
+
+    download = StripedDownload(
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=[
+            DownloadSource(bucket="bucket-10", client=broken, region="eu-west-10"),
+        ],
+    )
+
+    with raises(Exception):
+        download.download()
+
+    assert path.read_bytes() == b"existing"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_download__size_mismatch(tmp_path: Path) -> None:
+    path = tmp_path / "download.bin"
+    other = make_client(content=b"different")
+
+    sources = [
+        DownloadSource(bucket="bucket-10", client=make_client(), region="eu-west-10"),
+        DownloadSource(bucket="bucket-11", client=other, region="eu-west-11"),
+    ]
+
+    StripedDownload(
+        concurrency=2,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=sources,
+    ).download()
+
+    assert path.read_bytes() == CONTENT
+    other.get_object.assert_not_called()
+
+
+def test_download__steal(tmp_path: Path) -> None:
+    # The first region never answers, so the second region should steal every
+    # range that the first region claimed.
+    release = Event()
+    slow = make_client(release=release)
+
+    path = tmp_path / "download.bin"
+    sources = [
+        DownloadSource(bucket="bucket-10", client=slow, region="eu-west-10"),
+        DownloadSource(bucket="bucket-11", client=make_client(), region="eu-west-11"),
+    ]
+
+    download = StripedDownload(
+        concurrency=1,
+        key="SugarWater@1.2.3",
+        part_size=5,
+        path=path,
+        sources=sources,
+    )
+
+    download.STALL_GRACE = 0.1
+
+    try:
+        download.download()
+    finally:
+        release.set()
+
+    assert path.read_bytes() == CONTENT
+    assert ranges(sources[1].client) == [
+        "bytes=0-4",
+        "bytes=10-14",
+        "bytes=15-19",
+        "bytes=20-24",
+        "bytes=25-25",
+        "bytes=5-9",
+    ]
@@ -0,0 +1,128 @@
+from asyncio import run
+from io import BytesIO
+from pathlib import Path
+from threading import current_thread
+from typing import List
+
+from botocore.exceptions import ClientError
+from mock import Mock, patch
+from pytest import raises
+
+from startifact.exceptions import CannotDiscoverExistence
+from startifact.thread_transport import ThreadTransport
+
+
+def make_client() -> Mock:
+    client = Mock()
+    client.exceptions.ClientError = ClientError
+    client.exceptions.NoSuchKey = KeyError
+    client.exceptions.ParameterNotFound = KeyError
+    return client
+
+
+def test_client() -> None:
+    s3 = make_client()
+    session = Mock()
+    session.client = Mock(return_value=s3)
+
+    clients = Mock()
+    clients.session = Mock(return_value=session)
+
+    transport = ThreadTransport(clients=clients)
+
+    assert transport.client("s3", "eu-west-10") is s3
+    clients.session.assert_called_once_with("eu-west-10")
+    session.client.assert_called_once_with("s3")
+
+
+def test_download(tmp_path: Path) -> None:
+    s3 = make_client()
+    threads: List[str] = []
+
+    def client(service: str, region: str) -> Mock:
+        threads.append(current_thread().name)
+        return s3
+
+    transport = ThreadTransport(part_concurrency=2, part_size=5)
+    path = tmp_path / "download.bin"
+
+    with patch.object(transport, "client", side_effect=client):
+        with patch("startifact.thread_transport.RangedDownload") as download_cls:
+            run(transport.download("eu-west-10", "buck", "key", path))
+
+    download_cls.assert_called_once_with(
+        bucket="buck",
+        client=s3,
+        concurrency=2,
+        key="key",
+        part_size=5,
+        path=path,
+        region="eu-west-10",
+    )
+
+    download_cls.return_value.download.assert_called_once_with()
+
+    # The client is created in the thread pool, not on the event loop.
+    assert len(threads) == 1
+    assert threads[0].startswith("startifact")
+
+
+def test_get_object() -> None:
+    s3 = make_client()
+    s3.get_object = Mock(return_value={"Body": BytesIO(b"body")})
+    transport = ThreadTransport()
+
+    with patch.object(transport, "client", return_value=s3):
+        assert run(transport.get_object("eu-west-10", "buck", "key")) == b"body"
+
+    s3.get_object.assert_called_once_with(Bucket="buck", Key="key")
+
+
+def test_get_object__none() -> None:
+    s3 = make_client()
+    s3.get_object = Mock(side_effect=KeyError())
+    transport = ThreadTransport()
+
+    with patch.object(transport, "client", return_value=s3):
+        assert run(transport.get_object("eu-west-10", "buck", "key")) is None
+
+
+def test_get_parameter() -> None:
+    ssm = make_client()
+    ssm.get_parameter = Mock(return_value={"Parameter": {"Value": "1.2.3"}})
+    transport = ThreadTransport()
+
+    with patch.object(transport, "client", return_value=ssm):
+        assert run(transport.get_parameter("eu-west-10", "/latest")) == "1.2.3"
+
+
+def test_get_parameter__none() -> None:
+    ssm = make_client()
+    ssm.get_parameter = Mock(side_effect=KeyError())
+    transport = ThreadTransport()
+
+    with patch.object(transport, "client", return_value=ssm):
+        assert run(transport.get_parameter("eu-west-10", "/latest")) is None
+
+
+def test_head_object__not_found() -> None:
+    s3 = make_client()
+    s3.head_object = Mock(
+        side_effect=ClientError({"Error": {"Code": "404"}}, "HeadObject"),
+    )
+    transport = ThreadTransport()
+
+    with patch.object(transport, "client", return_value=s3):
+        assert run(transport.head_object("eu-west-10", "buck", "key")) is None
+
+
+def test_head_object__error() -> None:
+    s3 = make_client()
+    s3.head_object = Mock(
+        side_effect=ClientError({"Error": {"Code": "403"}}, "HeadObject"),
+    )
+    transport = ThreadTransport()
+
+    with patch.object(transport, "client", return_value=s3):
+        with raises(CannotDiscoverExistence):
+            run(transport.head_object("eu-west-10", "buck", "key"))
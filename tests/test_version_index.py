@@ -0,0 +1,139 @@
+from io import BytesIO
+from typing import Any, List
+
+from botocore.exceptions import ClientError
+from mock import Mock, patch
+from pytest import fixture, raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.version_index import VersionIndex
+
+
+class NoSuchKey(Exception):
+    pass
+
+
+@fixture
+def s3(session: Mock) -> Mock:
+    exceptions = Mock()
+    exceptions.ClientError = ClientError
+    exceptions.NoSuchKey = NoSuchKey
+
+    s3 = Mock()
+    s3.exceptions = exceptions
+    session.client = Mock(return_value=s3)
+    return s3
+
+
+@fixture
+def version_index(session: Mock) -> VersionIndex:
+    return VersionIndex(
+        bucket="buck",
+        key="SugarWater/versions.json",
+        read_only=False,
+        session=session,
+        versions_prefix="SugarWater@",
+    )
+
+
+def make_response(*versions: str) -> Any:
+    body = VersionIndex.dumps([VersionInfo.parse(v) for v in versions])
+    return {"Body": BytesIO(body), "ETag": '"etag"'}
+
+
+def precondition_failed() -> ClientError:
+    return ClientError({"Error": {"Code": "PreconditionFailed"}}, "put_object")
+
+
+def test_add(s3: Mock, version_index: VersionIndex) -> None:
+    s3.get_object = Mock(return_value=make_response("1.0.0", "1.2.0"))
+
+    version_index.add(VersionInfo(1, 1, 0))
+
+    s3.put_object.assert_called_once_with(
+        Body=b'{"versions":["1.0.0","1.1.0","1.2.0"]}',
+        Bucket="buck",
+        ContentMD5="fhX19MOZFs5UojjXfmuYlQ==",
+        ContentType="application/json",
+        IfMatch='"etag"',
+        Key="SugarWater/versions.json",
+    )
+
+
+def test_add__create(s3: Mock, session: Mock, version_index: VersionIndex) -> None:
+    s3.get_object = Mock(side_effect=NoSuchKey())
+    existing = [VersionInfo(0, 9, 0), VersionInfo(1, 0, 0)]
+
+    with patch("startifact.version_index.list_versions", return_value=existing) as lv:
+        version_index.add(VersionInfo(1, 0, 0))
+
+    lv.assert_called_once_with("buck", "SugarWater@", session)
+
+    kwargs = s3.put_object.call_args.kwargs
+    assert kwargs["Body"] == b'{"versions":["0.9.0","1.0.0"]}'
+    assert kwargs["IfNoneMatch"] == "*"
+
+
+def test_add__error(s3: Mock, version_index: VersionIndex) -> None:
+    s3.get_object = Mock(return_value=make_response("1.0.0"))
+    error = ClientError({"Error": {"Code": "AccessDenied"}}, "put_object")
+    s3.put_object = Mock(side_effect=error)
+
+    with raises(ClientError):
+        version_index.add(VersionInfo(1, 1, 0))
+
+    assert s3.put_object.call_count == 1
+
+
+def test_add__gives_up(s3: Mock, version_index: VersionIndex) -> None:
+    s3.get_object = Mock(side_effect=lambda **_: make_response("1.0.0"))
+    s3.put_object = Mock(side_effect=precondition_failed())
+
+    with raises(Exception) as ex:
+        version_index.add(VersionInfo(1, 1, 0))
+
+    expect = "Failed to add 1.1.0 to s3:/buck/SugarWater/versions.json after 5 attempts"
+    assert str(ex.value) == expect
+    assert s3.put_object.call_count == 5
+
+
+def test_add__read_only(s3: Mock, session: Mock) -> None:
+    version_index = VersionIndex(
+        bucket="buck",
+        key="SugarWater/versions.json",
+        read_only=True,
+        session=session,
+        versions_prefix="SugarWater@",
+    )
+
+    version_index.add(VersionInfo(1, 1, 0))
+
+    s3.get_object.assert_not_called()
+    s3.put_object.assert_not_called()
+
+
+def test_add__retry(s3: Mock, version_index: VersionIndex) -> None:
+    responses = [make_response("1.0.0"), make_response("1.0.0", "1.0.1")]
+    s3.get_object = Mock(side_effect=responses)
+    s3.put_object = Mock(side_effect=[precondition_failed(), None])
+
+    version_index.add(VersionInfo(1, 1, 0))
+
+    bodies: List[bytes] = [c.kwargs["Body"] for c in s3.put_object.call_args_list]
+
+    assert bodies == [
+        b'{"versions":["1.0.0","1.1.0"]}',
+        b'{"versions":["1.0.0","1.0.1","1.1.0"]}',
+    ]
+
+
+def test_get__none(s3: Mock, version_index: VersionIndex) -> None:
+    s3.get_object = Mock(side_effect=NoSuchKey())
+    assert version_index.get() == ([], None)
+
+
+def test_loads() -> None:
+    assert VersionIndex.loads(b'{"versions":["1.0.0","2.0.0-beta"]}') == [
+        VersionInfo(1, 0, 0),
+        VersionInfo(2, 0, 0, "beta"),
+    ]
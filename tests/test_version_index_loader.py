@@ -0,0 +1,96 @@
+from mock import Mock, patch
+from pytest import raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact import BucketNames
+from startifact.exceptions import NoRegionsAvailable
+from startifact.region_ranker import RegionRanker
+from startifact.version_index_loader import VersionIndexLoader
+
+
+def make_loader(
+    bucket_names: BucketNames,
+    clients: Mock,
+    hedge_delay: float,
+) -> VersionIndexLoader:
+    return VersionIndexLoader(
+        bucket_names=bucket_names,
+        clients=clients,
+        hedge_delay=hedge_delay,
+        key="SugarWater/versions.json",
+        region_ranker=RegionRanker(jitter=0),
+        regions=["eu-west-10", "eu-west-11", "eu-west-12"],
+        versions_prefix="SugarWater@",
+    )
+
+
+def test_operate(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+    session: Mock,
+) -> None:
+    loader = make_loader(bucket_names, regional_clients, 0.5)
+    versions = [VersionInfo(1, 0, 0)]
+
+    with patch("startifact.version_index_loader.VersionIndex") as index_cls:
+        index_cls.return_value.get = Mock(return_value=(versions, '"etag"'))
+        assert loader.operate(session) == versions
+
+    index_cls.assert_called_once_with(
+        bucket="bucket-10",
+        key="SugarWater/versions.json",
+        read_only=True,
+        session=session,
+        versions_prefix="SugarWater@",
+    )
+
+
+def test_operate__fail(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+    session: Mock,
+) -> None:
+    loader = make_loader(bucket_names, regional_clients, 0.5)
+
+    with patch("startifact.version_index_loader.VersionIndex") as index_cls:
+        index_cls.return_value.get = Mock(side_effect=Exception("fire"))
+        assert loader.operate(session) is None
+
+
+def test_versions__all_fail(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    loader = make_loader(bucket_names, regional_clients, 0.01)
+
+    with patch.object(loader, "operate", return_value=None):
+        with raises(NoRegionsAvailable):
+            loader.versions
+
+
+def test_versions(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    loader = make_loader(bucket_names, regional_clients, 0.01)
+
+    with patch.object(loader, "operate", return_value=[VersionInfo(11)]):
+        versions = loader.versions
+
+    assert versions == [VersionInfo(11)]
+    assert loader.versions is versions
+    assert loader.is_indexed
+
+
+def test_versions__no_index(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    loader = make_loader(bucket_names, regional_clients, 0.01)
+
+    with patch("startifact.version_index_loader.VersionIndex") as index_cls:
+        index_cls.return_value.get = Mock(return_value=([], None))
+        versions = loader.versions
+
+    assert versions == []
+    assert not loader.is_indexed
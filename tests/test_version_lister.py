@@ -0,0 +1,149 @@
+from typing import Dict, Iterator, List
+
+from mock import Mock, call, patch
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact import BucketNames
+from startifact.version_lister import VersionLister
+from startifact.version_presence import VersionPresence
+
+
+def make_lister(bucket_names: BucketNames, clients: Mock) -> VersionLister:
+    return VersionLister(
+        bucket_names=bucket_names,
+        buffer_size=1,
+        clients=clients,
+        prefix="SugarWater@",
+        regions=["eu-west-10", "eu-west-11", "eu-west-12"],
+    )
+
+
+def parse(*versions: str) -> List[VersionInfo]:
+    return [VersionInfo.parse(v) for v in versions]
+
+
+def test_list_in(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+    session: Mock,
+) -> None:
+    lister = make_lister(bucket_names, regional_clients)
+
+    groups: Dict[str, List[int]] = {"": [1, 10], "1.": [2, 10], "10.": [0]}
+
+    versions = {
+        "1.2.": parse("1.2.10", "1.2.9"),
+        "1.10.": parse("1.10.0", "1.10.0-beta"),
+        "10.0.": parse("10.0.0"),
+    }
+
+    with patch(
+        "startifact.version_lister.list_version_groups",
+        side_effect=lambda b, p, s, version_prefix="": groups[version_prefix],
+    ) as list_version_groups:
+        with patch(
+            "startifact.version_lister.list_versions",
+            side_effect=lambda b, p, s, version_prefix="": versions[version_prefix],
+        ):
+            listed = list(lister.list_in("buck", session))
+
+    assert listed == parse(
+        "1.2.9",
+        "1.2.10",
+        "1.10.0-beta",
+        "1.10.0",
+        "10.0.0",
+    )
+
+    assert list_version_groups.call_args_list == [
+        call("buck", "SugarWater@", session),
+        call("buck", "SugarWater@", session, version_prefix="1."),
+        call("buck", "SugarWater@", session, version_prefix="10."),
+    ]
+
+
+def test_versions(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    lister = make_lister(bucket_names, regional_clients)
+
+    listed = {
+        "bucket-10": parse("1.0.0", "1.1.0", "2.0.0"),
+        "bucket-11": parse("1.1.0", "2.0.0"),
+        "bucket-12": parse("1.0.0", "2.0.0", "10.0.0"),
+    }
+
+    def list_in(bucket: str, session: Mock) -> Iterator[VersionInfo]:
+        yield from listed[bucket]
+
+    with patch.object(lister, "list_in", side_effect=list_in):
+        versions = list(lister.versions())
+
+    assert versions == [
+        VersionPresence(
+            missing=["eu-west-11"],
+            regions=["eu-west-10", "eu-west-12"],
+            version=VersionInfo(1, 0, 0),
+        ),
+        VersionPresence(
+            missing=["eu-west-12"],
+            regions=["eu-west-10", "eu-west-11"],
+            version=VersionInfo(1, 1, 0),
+        ),
+        VersionPresence(
+            missing=[],
+            regions=["eu-west-10", "eu-west-11", "eu-west-12"],
+            version=VersionInfo(2, 0, 0),
+        ),
+        VersionPresence(
+            missing=["eu-west-10", "eu-west-11"],
+            regions=["eu-west-12"],
+            version=VersionInfo(10, 0, 0),
+        ),
+    ]
+
+
+def test_versions__fail(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    lister = make_lister(bucket_names, regional_clients)
+
+    def list_in(bucket: str, session: Mock) -> Iterator[VersionInfo]:
+        if bucket == "bucket-11":
+            raise Exception("fire")
+        yield from parse("1.0.0")
+
+    with patch.object(lister, "list_in", side_effect=list_in):
+        versions = list(lister.versions())
+
+    assert versions == [
+        VersionPresence(
+            missing=[],
+            regions=["eu-west-10", "eu-west-12"],
+            version=VersionInfo(1, 0, 0),
+        ),
+    ]
+
+
+def test_versions__stop_early(
+    bucket_names: BucketNames,
+    regional_clients: Mock,
+) -> None:
+    lister = make_lister(bucket_names, regional_clients)
+    listed: List[VersionInfo] = []
+
+    def list_in(bucket: str, session: Mock) -> Iterator[VersionInfo]:
+        for major in range(1000):
+            version = VersionInfo(major)
+            listed.append(version)
+            yield version
+
+    with patch.object(lister, "list_in", side_effect=list_in):
+        versions = lister.versions()
+        first = next(versions)
+        versions.close()
+
+    assert first.version == VersionInfo(0)
+    assert len(listed) < 3000
@@ -0,0 +1,77 @@
+from typing import Optional
+
+from pytest import mark, raises
+from semver import VersionInfo  # pyright: reportMissingTypeStubs=false
+
+from startifact.version_range import VersionRange
+
+
+@mark.parametrize(
+    "value, version, expect",
+    [
+        ("1.2.3", "1.2.3", True),
+        ("1.2.3", "1.2.4", False),
+        ("1.2", "1.2.9", True),
+        ("1.2", "1.3.0", False),
+        ("1", "1.9.9", True),
+        ("1", "2.0.0", False),
+        ("~1.2.3", "1.2.9", True),
+        ("~1.2.3", "1.2.2", False),
+        ("~1.2.3", "1.3.0", False),
+        ("~1", "1.9.0", True),
+        ("^1.2.3", "1.9.0", True),
+        ("^1.2.3", "1.2.2", False),
+        ("^1.2.3", "2.0.0", False),
+        ("^0.2.3", "0.2.9", True),
+        ("^0.2.3", "0.3.0", False),
+        ("^0.0.3", "0.0.3", True),
+        ("^0.0.3", "0.0.4", False),
+        ("^0.0", "0.0.9", True),
+        ("^0.0", "0.1.0", False),
+        ("^0", "0.9.0", True),
+        ("^2.3", "2.9.0-beta", False),
+        ("^2.3.0-beta", "2.3.0-rc", True),
+        ("^2.3.0-beta", "2.4.0-rc", False),
+        ("^2.3.0-beta", "2.4.0", True),
+        ("2.3.0-beta", "2.3.0-beta", True),
+    ],
+)
+def test_contains(value: str, version: str, expect: bool) -> None:
+    # pyright: reportUnknownMemberType=false
+    assert (VersionInfo.parse(version) in VersionRange.parse(value)) is expect
+
+
+def test_best() -> None:
+    versions = [
+        VersionInfo(1, 9, 0),
+        VersionInfo(2, 3, 1),
+        VersionInfo(2, 4, 0),
+        VersionInfo(3, 0, 0),
+    ]
+
+    assert VersionRange.parse("^2.3").best(versions) == VersionInfo(2, 4, 0)
+    assert VersionRange.parse("~2.3").best(versions) == VersionInfo(2, 3, 1)
+    assert VersionRange.parse("^4").best(versions) is None
+
+
+@mark.parametrize(
+    "value, expect",
+    [
+        ("1.2.3", VersionInfo(1, 2, 3)),
+        ("1.2", None),
+        ("^1.2.3", None),
+    ],
+)
+def test_exact(value: str, expect: Optional[VersionInfo]) -> None:
+    assert VersionRange.parse(value).exact == expect
+
+
+@mark.parametrize("value", ["", "^", "latest", "1.x", "01", "~1.2.3.4"])
+def test_parse__invalid(value: str) -> None:
+    with raises(ValueError):
+        VersionRange.parse(value)
+
+
+def test_repr() -> None:
+    assert repr(VersionRange.parse("^2.3")) == ">=2.3.0 <3.0.0"
+    assert repr(VersionRange.parse("2.3.1")) == "==2.3.1"